@@ -1,5 +1,4 @@
 import asyncio
-import json
 import time
 import traceback
 import uuid
@@ -22,17 +21,21 @@ from langflow.api.utils import (
     format_exception_message,
     get_top_level_vertices,
     parse_exception,
+    update_graph_of_previous_build,
 )
 from langflow.api.v1.schemas import FlowDataRequest, ResultDataResponse, VertexBuildResponse
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, RawJSON
 from langflow.exceptions.component import ComponentBuildError
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
-from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
+from langflow.services.deps import get_chat_service, get_settings_service, get_telemetry_service, session_scope
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
+# Seconds a read of forwarded job events waits before checking again that the job still exists
+FORWARDED_EVENTS_READ_TIMEOUT = 1.0
+
 
 async def start_flow_build(
     *,
@@ -70,6 +73,7 @@ async def start_flow_build(
             flow_name=flow_name,
         )
         queue_service.start_job(job_id, task_coro)
+        await queue_service.register_job(job_id)
     except Exception as e:
         await logger.aexception("Failed to create queue and start task")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -84,6 +88,10 @@ async def get_flow_events_response(
 ):
     """Get events for a specific build job, either as a stream or single event."""
     try:
+        if queue_service.forwards_events:
+            return await get_forwarded_flow_events_response(
+                job_id=job_id, queue_service=queue_service, event_delivery=event_delivery
+            )
         main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
             if event_task is None:
@@ -101,6 +109,7 @@ async def get_flow_events_response(
             # Get all available events from the queue without blocking
             while not main_queue.empty():
                 _, value, _ = await main_queue.get()
+                event_manager.notify_consumed()
                 if value is None:
                     # End of stream, trigger end event
                     if event_task is not None:
@@ -114,6 +123,7 @@ async def get_flow_events_response(
             # If no events were available, wait for one (with timeout)
             if not events:
                 _, value, _ = await main_queue.get()
+                event_manager.notify_consumed()
                 if value is None:
                     # End of stream, trigger end event
                     if event_task is not None:
@@ -153,6 +163,7 @@ async def create_flow_response(
         while True:
             try:
                 event_id, value, put_time = await queue.get()
+                event_manager.notify_consumed()
                 if value is None:
                     break
                 get_time = time.time()
@@ -174,6 +185,49 @@ async def create_flow_response(
     )
 
 
+async def get_forwarded_flow_events_response(
+    *,
+    job_id: str,
+    queue_service: JobQueueService,
+    event_delivery: EventDeliveryType,
+) -> Response:
+    """Get the events of a build job from the job queue backend, whichever worker runs the job."""
+    # Read once before responding, so that an unknown job is reported as not found
+    first_events = await queue_service.read_job_events(job_id)
+
+    if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
+
+        async def consume_and_yield() -> AsyncIterator[str]:
+            events = first_events
+            while True:
+                for value in events:
+                    if value is None:
+                        return
+                    yield value.decode("utf-8")
+                try:
+                    events = await queue_service.read_job_events(job_id, timeout=FORWARDED_EVENTS_READ_TIMEOUT)
+                except Exception as exc:  # noqa: BLE001
+                    await logger.aexception(f"Error consuming events of job {job_id}: {exc}")
+                    return
+
+        def on_disconnect() -> None:
+            logger.debug("Client disconnected, cancelling job")
+            queue_service.cancel_job_soon(job_id)
+
+        return DisconnectHandlerStreamingResponse(
+            consume_and_yield(),
+            media_type="application/x-ndjson",
+            on_disconnect=on_disconnect,
+        )
+
+    # Polling mode - return the available events, or wait for at least one
+    events = first_events
+    while not events:
+        events = await queue_service.read_job_events(job_id, timeout=FORWARDED_EVENTS_READ_TIMEOUT)
+    content = "\n".join(value.decode("utf-8") for value in events if value is not None)
+    return Response(content=content, media_type="application/x-ndjson")
+
+
 async def generate_flow_events(
     *,
     flow_id: uuid.UUID,
@@ -223,7 +277,9 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            # Drop the snapshot and checkpoints of the previous run before caching the new one
+            await chat_service.clear_cache(flow_id_str)
+            await graph.cache_run_state(chat_service.set_cache, flow_id_str)
             await log_telemetry(start_time, components_count, run_id=run_id, success=True)
 
         except Exception as exc:
@@ -260,6 +316,11 @@ async def generate_flow_events(
         else:
             effective_session_id = flow_id_str
 
+        if get_settings_service().settings.incremental_playground_builds:
+            graph = await update_previous_graph(fresh_session, flow_id_str, flow_name, effective_session_id)
+            if graph is not None:
+                return graph
+
         if not data:
             return await build_graph_from_db(
                 flow_id=flow_id,
@@ -281,6 +342,28 @@ async def generate_flow_events(
             session_id=effective_session_id,
         )
 
+    async def update_previous_graph(
+        fresh_session, flow_id_str: str, flow_name: str | None, session_id: str
+    ) -> Graph | None:
+        if data:
+            payload = data.model_dump()
+            if not flow_name:
+                result = await fresh_session.exec(select(Flow.name).where(Flow.id == flow_id))
+                flow_name = result.first()
+        else:
+            flow = await fresh_session.get(Flow, flow_id)
+            if not flow or not flow.data:
+                return None
+            payload, flow_name = flow.data, flow.name
+        return await update_graph_of_previous_build(
+            flow_id_str,
+            payload,
+            chat_service,
+            user_id=str(current_user.id),
+            session_id=session_id,
+            flow_name=flow_name,
+        )
+
     def sort_vertices(graph: Graph) -> list[str]:
         try:
             return graph.sort_vertices(stop_component_id, start_component_id)
@@ -346,7 +429,7 @@ async def generate_flow_events(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await graph.cache_run_state(chat_service.set_cache, flow_id_str)
 
             timedelta = time.perf_counter() - start_time
 
@@ -435,8 +518,8 @@ async def generate_flow_events(
 
         # send built event or error event
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            # Encoded once and spliced into the event as is
+            build_data = RawJSON.from_model(vertex_build_response)
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
@@ -491,6 +574,7 @@ async def generate_flow_events(
         raise
 
     event_manager.on_end(data={})
+    await graph.compact_checkpoint(chat_service.set_cache, chat_service.delete_cache)
     await graph.end_all_traces()
     await event_manager.queue.put((None, None, time.time()))
 
@@ -515,7 +599,14 @@ async def cancel_flow_build(
         asyncio.CancelledError: If the task cancellation failed
     """
     # Get the event task and event manager for the job
-    _, _, event_task, _ = queue_service.get_queue_data(job_id)
+    try:
+        _, _, event_task, _ = queue_service.get_queue_data(job_id)
+    except JobQueueNotFoundError:
+        if not queue_service.forwards_events:
+            raise
+        # The job runs in another worker, which stops it once it sees the request
+        await queue_service.cancel_job(job_id)
+        return True
 
     if event_task is None:
         await logger.awarning(f"No event task found for job_id {job_id}")
@@ -26,6 +26,7 @@ from langflow.api.utils.core import (
     format_elapsed_time,
     format_exception_message,
     format_syntax_error_message,
+    get_cached_graph,
     get_causing_exception,
     get_is_component_from_data,
     get_suggestion_message,
@@ -34,6 +35,7 @@ from langflow.api.utils.core import (
     parse_exception,
     parse_value,
     remove_api_keys,
+    update_graph_of_previous_build,
     validate_is_component,
     verify_public_flow_and_get_user,
 )
@@ -62,6 +64,7 @@ __all__ = [
     "format_elapsed_time",
     "format_exception_message",
     "format_syntax_error_message",
+    "get_cached_graph",
     "get_causing_exception",
     "get_is_component_from_data",
     "get_suggestion_message",
@@ -71,6 +74,7 @@ __all__ = [
     "parse_exception",
     "parse_value",
     "remove_api_keys",
+    "update_graph_of_previous_build",
     "validate_is_component",
     "verify_public_flow_and_get_user",
 ]
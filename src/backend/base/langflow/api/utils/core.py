@@ -19,7 +19,7 @@ from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session, session_scope
+from langflow.services.deps import get_session, get_settings_service, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
 from langflow.utils.constants import LANGFLOW_GLOBAL_VAR_HEADER_PREFIX
 
@@ -170,6 +170,12 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
     session_id = kwargs.get("session_id") or str_flow_id
 
     graph = Graph.from_payload(payload, str_flow_id, flow_name, kwargs.get("user_id"))
+    _set_graph_session_id(graph, session_id)
+    await graph.initialize_run()
+    return graph
+
+
+def _set_graph_session_id(graph: Graph, session_id: str) -> None:
     for vertex_id in graph.has_session_id_vertices:
         vertex = graph.get_vertex(vertex_id)
         if vertex is None:
@@ -179,6 +185,60 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
             vertex.update_raw_params({"session_id": session_id}, overwrite=True)
 
     graph.session_id = session_id
+
+
+async def get_cached_graph(flow_id: str, chat_service: ChatService) -> Any:
+    """Returns the cache entry of the graph of a flow.
+
+    In delta checkpoint mode the incremental checkpoint of a run is read first: it is updated after every
+    step, while a full snapshot under the same key may be left over from an earlier run.
+    """
+    if get_settings_service().settings.graph_checkpoint_mode == "delta":
+        graph = await chat_service.load_checkpoint(flow_id)
+        if graph is not None:
+            return {"result": graph}
+    return await chat_service.get_cache(flow_id)
+
+
+async def update_graph_of_previous_build(
+    flow_id: str,
+    payload: dict,
+    chat_service: ChatService,
+    *,
+    user_id: str,
+    session_id: str,
+    flow_name: str | None = None,
+) -> Graph | None:
+    """Updates the cached graph of the previous build of a flow to match `payload`.
+
+    Only the components that changed, and the ones downstream of them, are built again by the next
+    build; see `Graph.update_from_payload`. Returns None if there is no graph that can be reused, in
+    which case the caller builds a new one.
+    """
+    cached = await get_cached_graph(flow_id, chat_service)
+    graph = cached.get("result") if isinstance(cached, dict) else None
+    if not isinstance(graph, Graph):
+        return None
+    try:
+        # A graph that is still running, or was taken by another build that has not sorted it yet, is not reused
+        run_manager = graph.run_manager
+        if run_manager.vertices_being_run or not run_manager.vertices_to_run:
+            return None
+        if graph.user_id != user_id or graph.session_id != session_id or graph.is_cyclic:
+            return None
+        graph.reset_run_state()
+        diff = graph.update_from_payload(payload)
+    except Exception:  # noqa: BLE001
+        await logger.adebug(f"Could not update the graph of the previous build of flow {flow_id}", exc_info=True)
+        return None
+
+    await logger.adebug(
+        f"Updated the graph of flow {flow_id}: {len(diff.invalidated_vertex_ids)} components to rebuild, "
+        f"{len(graph.reusable_vertex_ids)} reused"
+    )
+    graph.flow_name = flow_name
+    _set_graph_session_id(graph, session_id)
+    graph.set_run_id()
     await graph.initialize_run()
     return graph
 
@@ -195,7 +255,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await graph.cache_run_state(chat_service.set_cache, str(flow_id))
     return graph
 
 
@@ -208,7 +268,7 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    await graph.cache_run_state(chat_service.set_cache, str_flow_id)
     return graph
 
 
@@ -24,6 +24,7 @@ from langflow.api.utils import (
     build_graph_from_db,
     format_elapsed_time,
     format_exception_message,
+    get_cached_graph,
     get_top_level_vertices,
     parse_exception,
     verify_public_flow_and_get_user,
@@ -101,7 +102,7 @@ async def retrieve_vertices_order(
         # and return the same structure but only with the ids
         components_count = len(graph.vertices)
         vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-        await chat_service.set_cache(str(flow_id), graph)
+        await graph.cache_run_state(chat_service.set_cache, str(flow_id))
         background_tasks.add_task(
             telemetry_service.log_package_playground,
             PlaygroundPayload(
@@ -212,6 +213,18 @@ async def get_build_events(
     )
 
 
+@router.get("/build/{job_id}/stats")
+async def get_build_stats(
+    job_id: str,
+    queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
+) -> dict:
+    """Get the event queue and token streaming metrics of a build job."""
+    try:
+        return queue_service.get_job_stats(job_id)
+    except JobQueueNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job not found: {exc!s}") from exc
+
+
 @router.post("/build/{job_id}/cancel", response_model=CancelFlowResponse)
 async def cancel_build(
     job_id: str,
@@ -285,7 +298,7 @@ async def build_vertex(
         raise HTTPException(status_code=404, detail="Graph not found") from exc
 
     try:
-        cache = await chat_service.get_cache(flow_id_str)
+        cache = await get_cached_graph(flow_id_str, chat_service)
         if isinstance(cache, CacheMiss):
             # If there's no cache
             await logger.awarning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
@@ -371,7 +384,7 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
+        await graph.cache_run_state(chat_service.set_cache, flow_id_str)
 
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
@@ -424,7 +437,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            cache = await get_cached_graph(flow_id, chat_service)
         except Exception as exc:  # noqa: BLE001
             await logger.aexception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
@@ -498,7 +511,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     finally:
         await logger.adebug("Closing stream")
         if graph:
-            await chat_service.set_cache(flow_id, graph)
+            await graph.cache_run_state(chat_service.set_cache, flow_id)
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
@@ -37,11 +37,12 @@ from langflow.api.v1.schemas import (
     UpdateCustomComponentRequest,
     UploadFileResponse,
 )
-from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_manager import create_stream_tokens_event_manager, get_streaming_options
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.graph_template_cache import get_graph_template_cache
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user, get_webhook_user
@@ -51,7 +52,7 @@ from langflow.services.database.models.flow.utils import get_all_webhook_compone
 from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import PrecompressedPayload
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -83,18 +84,39 @@ async def parse_input_request_from_body(http_request: Request) -> SimplifiedAPIR
         return SimplifiedAPIRequest()
 
 
+_component_catalog: tuple[int, PrecompressedPayload] | None = None
+_component_catalog_lock = asyncio.Lock()
+
+
+async def get_component_catalog(settings_service: SettingsService) -> PrecompressedPayload:
+    """Return the encoded and compressed component catalog, encoding it once per catalog version."""
+    global _component_catalog  # noqa: PLW0603
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
+
+    all_types = await get_and_cache_all_types_dict(settings_service=settings_service)
+    version = component_cache.version
+    catalog = _component_catalog
+    if catalog is not None and catalog[0] == version:
+        return catalog[1]
+    async with _component_catalog_lock:
+        # Another request may have encoded this version while we waited
+        catalog = _component_catalog
+        if catalog is None or catalog[0] != version:
+            payload = await asyncio.to_thread(PrecompressedPayload, all_types)
+            catalog = _component_catalog = (version, payload)
+        return catalog[1]
+
+
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    The catalog is encoded and compressed once per version of the component cache and served with an
+    ETag, so clients that already hold the current catalog get a 304 Not Modified.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
-
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        catalog = await get_component_catalog(get_settings_service())
+        return catalog.response(request)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -150,11 +172,8 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(
-            graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name, context=context
-        )
+        template = get_graph_template_cache().get_or_create(flow, input_request.tweaks or {}, stream=stream)
+        graph = template.build(user_id=str(user_id), context=context)
         if run_id is None:
             run_id = str(uuid4())
         graph.set_run_id(run_id)
@@ -243,7 +262,9 @@ async def simple_run_flow_task(
         return None
 
 
-async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
+async def consume_and_yield(
+    queue: asyncio.Queue, client_consumed_queue: asyncio.Queue, event_manager: EventManager | None = None
+) -> AsyncGenerator:
     """Consumes events from a queue and yields them to the client while tracking timing metrics.
 
     This coroutine continuously pulls events from the input queue and yields them to the client.
@@ -253,6 +274,7 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
     Args:
         queue (asyncio.Queue): The queue containing events to be consumed and yielded
         client_consumed_queue (asyncio.Queue): A queue for tracking when the client has consumed events
+        event_manager (EventManager | None): The event manager writing to the queue, notified of consumed events
 
     Yields:
         The value from each event in the queue
@@ -265,6 +287,8 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
     """
     while True:
         event_id, value, put_time = await queue.get()
+        if event_manager is not None:
+            event_manager.notify_consumed()
         if value is None:
             break
         get_time = time.time()
@@ -419,7 +443,9 @@ async def simplified_run_flow(
     if stream:
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        event_manager = create_stream_tokens_event_manager(
+            queue=asyncio_queue, **get_streaming_options(get_settings_service().settings)
+        )
         main_task = asyncio.create_task(
             run_flow_generator(
                 flow=flow,
@@ -436,7 +462,7 @@ async def simplified_run_flow(
             main_task.cancel()
 
         return StreamingResponse(
-            consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
+            consume_and_yield(asyncio_queue, asyncio_queue_client_consumed, event_manager),
             background=on_disconnect,
             media_type="text/event-stream",
         )
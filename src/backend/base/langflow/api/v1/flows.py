@@ -16,14 +16,17 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
+from lfx.custom.class_cache import invalidate_flow_component_classes
 from lfx.log import logger
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
 from langflow.api.v1.schemas import FlowListCreate
+from langflow.helpers.mcp_tool_catalog import invalidate_flow_tools, notify_tools_changed
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
+from langflow.processing.graph_template_cache import invalidate_flow_graph_templates
 from langflow.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -164,6 +167,7 @@ async def create_flow(
         await session.refresh(db_flow)
 
         await _save_flow_to_fs(db_flow)
+        notify_tools_changed(db_flow.folder_id)
 
     except Exception as e:
         if "UNIQUE constraint failed" in str(e):
@@ -343,6 +347,8 @@ async def update_flow(
         if settings_service.settings.remove_api_keys:
             update_data = remove_api_keys(update_data)
 
+        previous_data = db_flow.data
+        previous_folder_id = db_flow.folder_id
         for key, value in update_data.items():
             setattr(db_flow, key, value)
 
@@ -363,6 +369,11 @@ async def update_flow(
 
         await _save_flow_to_fs(db_flow)
 
+        if "data" in update_data:
+            invalidate_flow_component_classes(previous_data, db_flow.data)
+        invalidate_flow_graph_templates(db_flow.id)
+        invalidate_flow_tools(db_flow.id, previous_folder_id, db_flow.folder_id)
+
     except Exception as e:
         if "UNIQUE constraint failed" in str(e):
             # Get the name of the column that failed
@@ -397,8 +408,12 @@ async def delete_flow(
     )
     if not flow:
         raise HTTPException(status_code=404, detail="Flow not found")
+    flow_data = flow.data
     await cascade_delete_flow(session, flow.id)
     await session.commit()
+    invalidate_flow_component_classes(flow_data)
+    invalidate_flow_graph_templates(flow_id)
+    invalidate_flow_tools(flow_id, flow.folder_id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -419,6 +434,7 @@ async def create_flows(
     await session.commit()
     for db_flow in db_flows:
         await session.refresh(db_flow)
+    notify_tools_changed(*{db_flow.folder_id for db_flow in db_flows})
     return db_flows
 
 
@@ -448,6 +464,7 @@ async def upload_file(
         for db_flow in response_list:
             await session.refresh(db_flow)
             await _save_flow_to_fs(db_flow)
+        notify_tools_changed(*{db_flow.folder_id for db_flow in response_list})
     except Exception as e:
         if "UNIQUE constraint failed" in str(e):
             # Get the name of the column that failed
@@ -492,6 +509,8 @@ async def delete_multiple_flows(
             await cascade_delete_flow(db, flow.id)
 
         await db.commit()
+        for flow in flows_to_delete:
+            invalidate_flow_tools(flow.id, flow.folder_id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -18,6 +18,7 @@ from langflow.api.v1.mcp_utils import (
     handle_mcp_errors,
     handle_read_resource,
 )
+from langflow.helpers.mcp_tool_catalog import subscribe_to_tool_list_changes
 from langflow.services.deps import get_settings_service
 
 router = APIRouter(prefix="/mcp", tags=["mcp"])
@@ -53,6 +54,7 @@ async def handle_global_read_resource(uri: str) -> bytes:
 @server.list_tools()
 async def handle_global_tools():
     """Handle listing tools for global MCP server."""
+    subscribe_to_tool_list_changes(None, server)
     return await handle_list_tools()
 
 
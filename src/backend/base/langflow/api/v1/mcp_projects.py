@@ -46,6 +46,11 @@ from langflow.api.v1.schemas import (
     MCPProjectUpdateRequest,
     MCPSettings,
 )
+from langflow.helpers.mcp_tool_catalog import (
+    TOOL_COLUMNS,
+    invalidate_flow_tools,
+    subscribe_to_tool_list_changes,
+)
 from langflow.services.auth.mcp_encryption import decrypt_auth_settings, encrypt_auth_settings
 from langflow.services.auth.utils import AUTO_LOGIN_WARNING
 from langflow.services.database.models import Flow, Folder
@@ -208,18 +213,17 @@ async def list_project_tools(
         async with session_scope() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
-            # Query flows in the project
-            flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+            # Query flows in the project, without their data
+            flows_query = select(*TOOL_COLUMNS, Flow.mcp_enabled).where(
+                Flow.folder_id == project_id,
+                Flow.is_component == False,  # noqa: E712
+            )
 
             # Optionally filter for MCP-enabled flows only
             if mcp_enabled:
@@ -440,6 +444,8 @@ async def update_project_mcp_settings(
                     updated_flows.append(flow)
 
             await session.commit()
+            for flow in updated_flows:
+                invalidate_flow_tools(flow.id, project_id)
 
             response: dict[str, Any] = {
                 "message": f"Updated MCP settings for {len(updated_flows)} flows and project auth settings"
@@ -1019,6 +1025,7 @@ class ProjectMCPServer:
         @handle_mcp_errors
         async def handle_list_project_tools():
             """Handle listing tools for this specific project."""
+            subscribe_to_tool_list_changes(self.project_id, self.server)
             return await handle_list_tools(project_id=self.project_id, mcp_enabled_only=True)
 
         @self.server.list_prompts()
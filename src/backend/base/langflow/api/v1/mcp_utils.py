@@ -21,7 +21,7 @@ from sqlmodel import select
 
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.helpers.mcp_tool_catalog import TOOL_COLUMNS, get_flow_tool_schemas
 from langflow.schema.message import Message
 from langflow.services.database.models import Flow
 from langflow.services.database.models.user.model import User
@@ -30,6 +30,9 @@ from langflow.services.deps import get_settings_service, get_storage_service, se
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# Chunk size for reading MCP resources, a multiple of 3 so each chunk base64 encodes without padding
+RESOURCE_READ_CHUNK_SIZE = 3 * 64 * 1024
+
 # Create context variables
 current_user_ctx: ContextVar[User] = ContextVar("current_user_ctx")
 # Carries per-request variables injected via HTTP headers (e.g., X-Langflow-Global-Var-*)
@@ -142,16 +145,22 @@ async def handle_read_resource(uri: str) -> bytes:
 
         storage_service = get_storage_service()
 
-        # Read the file content
-        content = await storage_service.get_file(flow_id=flow_id, file_name=filename)
-        if not content:
+        # Stream the file and base64 encode it chunk by chunk, so only the encoded copy is held in memory.
+        # Chunks can be of any size, bytes past a multiple of 3 are carried over so no padding ends up mid-stream.
+        encoded = bytearray()
+        pending = b""
+        async for chunk in storage_service.open_read(
+            flow_id=flow_id, file_name=filename, chunk_size=RESOURCE_READ_CHUNK_SIZE
+        ):
+            pending += chunk
+            complete = len(pending) - len(pending) % 3
+            encoded += base64.b64encode(pending[:complete])
+            pending = pending[complete:]
+        encoded += base64.b64encode(pending)
+        if not encoded:
             msg = f"File {filename} not found in flow {flow_id}"
             raise ValueError(msg)
-
-        # Ensure content is base64 encoded
-        if isinstance(content, str):
-            content = content.encode()
-        return base64.b64encode(content)
+        return bytes(encoded)
     except Exception as e:
         msg = f"Error reading resource {uri}: {e!s}"
         await logger.aexception(msg)
@@ -293,21 +302,23 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     tools = []
     try:
         async with session_scope() as session:
-            # Build query based on parameters
+            # Build query based on parameters. Only the tool metadata is read, the schemas come from the catalog
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = select(*TOOL_COLUMNS).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
             else:
                 # Get all flows
-                flows_query = select(Flow)
+                flows_query = select(*TOOL_COLUMNS)
 
-            flows = (await session.exec(flows_query)).all()
+            flows = [flow for flow in (await session.exec(flows_query)).all() if flow.user_id is not None]
+            schemas = await get_flow_tool_schemas(session, flows)
 
             existing_names = set()
             for flow in flows:
-                if flow.user_id is None:
+                # Flows whose schema could not be computed are not listed
+                if str(flow.id) not in schemas:
                     continue
 
                 # For project-specific tools, use action names if available
@@ -341,7 +352,7 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                     tool = types.Tool(
                         name=name,
                         description=description,
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=schemas[str(flow.id)],
                     )
                     tools.append(tool)
                     existing_names.add(name)
@@ -133,7 +133,7 @@ async def run_flow_for_openai_responses(
                 processed_tools = set()  # Track processed tool calls to avoid duplicates
                 previous_content = ""  # Track content already sent to calculate deltas
 
-                async for event_data in consume_and_yield(asyncio_queue, asyncio_queue_client_consumed):
+                async for event_data in consume_and_yield(asyncio_queue, asyncio_queue_client_consumed, event_manager):
                     if event_data is None:
                         await logger.adebug("[OpenAIResponses][stream] received None event_data; breaking loop")
                         break
@@ -27,6 +27,7 @@ from langflow.api.v1.schemas import FlowListCreate
 from langflow.api.v2.mcp import update_server
 from langflow.helpers.flow import generate_unique_flow_name
 from langflow.helpers.folders import generate_unique_folder_name
+from langflow.helpers.mcp_tool_catalog import invalidate_flow_tools, notify_tools_changed
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.auth.mcp_encryption import encrypt_auth_settings
 from langflow.services.database.models.api_key.crud import create_api_key
@@ -455,12 +456,20 @@ async def update_project(
             await session.exec(update_statement_my_collection)
             await session.commit()
 
+        changed_project_ids = {existing_project.id}
+        if my_collection_project and excluded_flows:
+            changed_project_ids.add(my_collection_project.id)
         if concat_project_components:
+            previous_project_ids = await session.exec(
+                select(Flow.folder_id).where(Flow.id.in_(concat_project_components)).distinct()  # type: ignore[attr-defined]
+            )
+            changed_project_ids.update(previous_project_ids.all())
             update_statement_components = (
                 update(Flow).where(Flow.id.in_(concat_project_components)).values(folder_id=existing_project.id)  # type: ignore[attr-defined]
             )
             await session.exec(update_statement_components)
             await session.commit()
+        notify_tools_changed(*changed_project_ids)
 
     except HTTPException:
         # Re-raise HTTP exceptions (like 409 conflicts) without modification
@@ -485,6 +494,7 @@ async def delete_project(
         if len(flows) > 0:
             for flow in flows:
                 await cascade_delete_flow(session, flow.id)
+                invalidate_flow_tools(flow.id, project_id)
 
         project = (
             await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
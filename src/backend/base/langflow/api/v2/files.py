@@ -1,15 +1,15 @@
-import io
+import asyncio
 import re
 import uuid
-import zipfile
 from collections.abc import AsyncGenerator, AsyncIterable
 from datetime import datetime
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from lfx.log.logger import logger
 from sqlmodel import col, select
@@ -20,6 +20,7 @@ from langflow.services.database.models.file.model import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.settings.service import SettingsService
 from langflow.services.storage.service import StorageService
+from langflow.utils.zip_stream import ZipMember, stream_zip
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -52,6 +53,41 @@ async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGene
             yield chunk
 
 
+def parse_range_header(range_header: str | None, file_size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range of a Range header into inclusive start and end offsets.
+
+    Returns None when the whole file should be sent, which is also the answer to multiple ranges.
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied.
+    """
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    start_str, _, end_str = range_header.removeprefix("bytes=").strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = min(int(end_str), file_size - 1) if end_str else file_size - 1
+        else:
+            # Suffix range: the last N bytes
+            start, end = max(0, file_size - int(end_str)), file_size - 1
+    except ValueError:
+        return None
+    if start > end or start >= file_size:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    return start, end
+
+
+async def upload_file_chunks(file: UploadFile, chunk_size: int = 1024 * 1024) -> AsyncGenerator[bytes, None]:
+    """Read an uploaded file in chunks."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -73,13 +109,16 @@ async def save_file_routine(file, storage_service, current_user: CurrentActiveUs
     """Routine to save the file content to the storage service."""
     file_id = uuid.uuid4()
 
-    if not file_content:
-        file_content = await file.read()
     if not file_name:
         file_name = file.filename
 
-    # Save the file using the storage service.
-    await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+    # Save the file using the storage service, streaming uploads instead of reading them whole
+    if file_content:
+        await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+    else:
+        await storage_service.open_write(
+            flow_id=str(current_user.id), file_name=file_name, chunks=upload_file_chunks(file)
+        )
 
     return file_id, file_name
 
@@ -320,34 +359,29 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
+        # Look up the sizes up front so missing files fail the request before the archive starts
+        user_folder = str(current_user.id)
+        storage_names = [file.path.split("/")[-1] for file in files]
+        sizes = await asyncio.gather(
+            *(storage_service.get_file_size(flow_id=user_folder, file_name=name) for name in storage_names)
+        )
 
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # Stream the ZIP file as it is written, with the proper extension for each file
+        members = [
+            ZipMember(
+                name=f"{file.name}{Path(file.path).suffix}",
+                open_chunks=partial(storage_service.open_read, flow_id=user_folder, file_name=name),
+                size=size,
+            )
+            for file, name, size in zip(files, storage_names, sizes, strict=True)
+        ]
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
+            stream_zip(members),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -400,6 +434,7 @@ async def download_file(
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
     *,
     return_content: bool = False,
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     """Download a file by its ID or return its content as a string/bytes.
 
@@ -409,6 +444,7 @@ async def download_file(
         session: Database session.
         storage_service: File storage service.
         return_content: If True, return raw content (str) instead of StreamingResponse.
+        range_header: Optional HTTP Range header to download a single byte range.
 
     Returns:
         StreamingResponse for client downloads or str for internal use.
@@ -422,32 +458,46 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        if file_stream is None:
-            raise HTTPException(status_code=404, detail="File stream not available")
+        flow_id = str(current_user.id)
 
         # If return_content is True, read the file content and return it
         if return_content:
-            return await read_file_content(file_stream, decode=True)
+            return await read_file_content(storage_service.open_read(flow_id=flow_id, file_name=file_name), decode=True)
 
-        # For streaming, ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        file_size = await storage_service.get_file_size(flow_id=flow_id, file_name=file_name)
+        byte_range = parse_range_header(range_header, file_size)
 
         # Create the filename with extension
         file_extension = Path(file.path).suffix
         filename_with_extension = f"{file.name}{file_extension}"
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename_with_extension}"',
+            "Accept-Ranges": "bytes",
+        }
+
+        # Return the file as a streaming response, read from storage chunk by chunk
+        if byte_range is None:
+            headers["Content-Length"] = str(file_size)
+            return StreamingResponse(
+                storage_service.open_read(flow_id=flow_id, file_name=file_name),
+                media_type="application/octet-stream",
+                headers=headers,
+            )
 
-        # Return the file as a streaming response
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        headers["Content-Length"] = str(end - start + 1)
         return StreamingResponse(
-            byte_stream,
+            storage_service.open_read(flow_id=flow_id, file_name=file_name, start=start, end=end),
+            status_code=HTTPStatus.PARTIAL_CONTENT,
             media_type="application/octet-stream",
-            headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
+            headers=headers,
         )
 
     except HTTPException:
         raise
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail="File not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
@@ -5,14 +5,18 @@ from lfx.events.event_manager import (
     EventCallback,
     EventManager,
     PartialEventCallback,
+    RawJSON,
     create_default_event_manager,
     create_stream_tokens_event_manager,
+    get_streaming_options,
 )
 
 __all__ = [
     "EventCallback",
     "EventManager",
     "PartialEventCallback",
+    "RawJSON",
     "create_default_event_manager",
     "create_stream_tokens_event_manager",
+    "get_streaming_options",
 ]
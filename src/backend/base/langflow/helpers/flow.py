@@ -320,12 +320,15 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from lfx.graph.graph.base import Graph
-
     # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
+    return json_schema_from_flow_data(flow.data)
+
+
+def json_schema_from_flow_data(flow_data: dict | None) -> dict:
+    """Generate JSON schema from the input nodes of a flow's data."""
+    from lfx.graph.graph.base import Graph
 
-    graph = Graph.from_payload(flow_data)
+    graph = Graph.from_payload(flow_data or {})
     input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
 
     properties = {}
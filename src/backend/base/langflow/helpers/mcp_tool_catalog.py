@@ -0,0 +1,214 @@
+"""Materialized catalog of the MCP tools generated from flows.
+
+Listing the tools of a project used to load every flow with its data and build a
+graph for each one to find its inputs, on every ``tools/list`` request. The input
+schema of a flow only changes when the flow is saved, so it is computed once per
+flow version (the flow's ``updated_at``) and kept here. Saving a flow only drops
+its schema; listing reads the columns the tool metadata needs and loads the data
+of the flows whose schema is missing or stale.
+
+MCP sessions that listed tools get a ``notifications/tools/list_changed`` when a
+flow of their project is saved or deleted, or its MCP settings change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+from sqlmodel import col, select
+
+from langflow.helpers.flow import json_schema_from_flow_data
+from langflow.services.database.models import Flow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import datetime
+    from uuid import UUID
+
+    from mcp.server.session import ServerSession
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Columns of a flow that listing tools needs, everything but the data
+TOOL_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.description,
+    Flow.action_name,
+    Flow.action_description,
+    Flow.user_id,
+    Flow.folder_id,
+    Flow.updated_at,
+)
+
+
+def flow_version(updated_at: datetime | None) -> str:
+    return updated_at.isoformat() if updated_at else ""
+
+
+class ToolSchemaCache:
+    """The input schemas of flows as MCP tools, one per flow, stamped with the flow version they were computed for.
+
+    Attributes:
+        hits (int): Number of lookups that found the schema of the current flow version.
+        misses (int): Number of lookups that found no schema or the one of an older version.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[str, dict]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, flow_id: str | UUID, version: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(str(flow_id))
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def set(self, flow_id: str | UUID, version: str, schema: dict) -> None:
+        with self._lock:
+            self._entries[str(flow_id)] = (version, schema)
+
+    def invalidate_flow(self, flow_id: str | UUID) -> bool:
+        """Drop the schema of a flow. Returns whether there was one."""
+        with self._lock:
+            return self._entries.pop(str(flow_id), None) is not None
+
+    def clear(self) -> None:
+        """Drop all schemas and reset the metrics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ToolListSubscribers:
+    """The MCP sessions that listed tools, by project. Sessions of the global server are under None."""
+
+    def __init__(self):
+        self._sessions: defaultdict[str | None, weakref.WeakSet[ServerSession]] = defaultdict(weakref.WeakSet)
+        self._tasks: set[asyncio.Task] = set()
+
+    def add(self, project_id: str | UUID | None, session: ServerSession) -> None:
+        self._sessions[str(project_id) if project_id else None].add(session)
+
+    async def notify(self, project_ids: Iterable[str | UUID | None]) -> int:
+        """Send tools/list_changed to the sessions of the projects and of the global server.
+
+        Sessions whose connection is gone are dropped. Returns the number of notified sessions.
+        """
+        keys = {str(project_id) for project_id in project_ids if project_id} | {None}
+        sessions = {session for key in keys for session in list(self._sessions.get(key, ()))}
+        notified = 0
+        for session in sessions:
+            try:
+                await session.send_tool_list_changed()
+                notified += 1
+            except Exception:  # noqa: BLE001
+                for subscribed in self._sessions.values():
+                    subscribed.discard(session)
+        return notified
+
+    def notify_soon(self, project_ids: Iterable[str | UUID | None]) -> None:
+        """Schedule `notify` on the running event loop, if there is any session to notify."""
+        if not any(self._sessions.values()):
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self.notify(list(project_ids)))
+        except RuntimeError:
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+
+_schema_cache = ToolSchemaCache()
+_subscribers = ToolListSubscribers()
+
+
+def get_tool_schema_cache() -> ToolSchemaCache:
+    return _schema_cache
+
+
+def get_tool_list_subscribers() -> ToolListSubscribers:
+    return _subscribers
+
+
+def subscribe_to_tool_list_changes(project_id: str | UUID | None, server) -> None:
+    """Register the session of the current request of `server` for tools/list_changed notifications."""
+    try:
+        session = server.request_context.session
+    except LookupError:
+        return
+    _subscribers.add(project_id, session)
+
+
+def invalidate_flow_tools(flow_id: str | UUID, *project_ids: str | UUID | None) -> None:
+    """Drop the tool schema of a flow that was updated or deleted and tell the sessions of its projects."""
+    _schema_cache.invalidate_flow(flow_id)
+    _subscribers.notify_soon(project_ids)
+
+
+def notify_tools_changed(*project_ids: str | UUID | None) -> None:
+    """Tell the sessions of the projects that their tools changed, without touching the schemas."""
+    _subscribers.notify_soon(project_ids)
+
+
+async def get_flow_tool_schemas(session: AsyncSession, flows: Sequence[Any]) -> dict[str, dict]:
+    """Return the tool schemas of flows by flow id, loading the data only of flows without a current schema.
+
+    `flows` are rows with at least the `id` and `updated_at` of each flow. Flows whose
+    schema cannot be computed are left out.
+    """
+    schemas: dict[str, dict] = {}
+    stale: dict[str, str] = {}
+    for flow in flows:
+        version = flow_version(flow.updated_at)
+        schema = _schema_cache.get(flow.id, version)
+        if schema is None:
+            stale[str(flow.id)] = version
+        else:
+            schemas[str(flow.id)] = schema
+    if not stale:
+        return schemas
+
+    rows = (
+        await session.exec(
+            select(Flow.id, Flow.name, Flow.data).where(
+                col(Flow.id).in_([flow.id for flow in flows if str(flow.id) in stale])
+            )
+        )
+    ).all()
+    for flow_id, name, data in rows:
+        try:
+            schema = json_schema_from_flow_data(data)
+        except Exception as e:  # noqa: BLE001
+            await logger.awarning(f"Error in listing tools: {e!s} from flow: {name}")
+            continue
+        schemas[str(flow_id)] = schema
+        _schema_cache.set(flow_id, stale[str(flow_id)], schema)
+    return schemas
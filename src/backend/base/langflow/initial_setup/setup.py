@@ -34,7 +34,9 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.helpers.mcp_tool_catalog import invalidate_flow_tools
 from langflow.initial_setup.constants import STARTER_FOLDER_DESCRIPTION, STARTER_FOLDER_NAME
+from langflow.processing.graph_template_cache import invalidate_flow_graph_templates
 from langflow.services.auth.utils import create_super_user
 from langflow.services.database.models.flow.model import Flow, FlowCreate
 from langflow.services.database.models.folder.constants import (
@@ -1112,14 +1114,19 @@ async def sync_flows_from_fs():
                                 new_mtime = (await path.stat()).st_mtime
                                 if new_mtime > mtime:
                                     update_data = orjson.loads(await path.read_text(encoding="utf-8"))
+                                    previous_folder_id = flow.folder_id
                                     try:
                                         for field_name in ("name", "description", "data", "locked"):
                                             if new_value := update_data.get(field_name):
                                                 setattr(flow, field_name, new_value)
                                         if folder_id := update_data.get("folder_id"):
                                             flow.folder_id = UUID(folder_id)
+                                        # Other workers tell a changed flow apart by its updated_at
+                                        flow.updated_at = datetime.now(tz=timezone.utc)
                                         await session.commit()
                                         await session.refresh(flow)
+                                        invalidate_flow_graph_templates(flow.id)
+                                        invalidate_flow_tools(flow.id, previous_folder_id, flow.folder_id)
                                     except Exception:  # noqa: BLE001
                                         await logger.aexception(
                                             f"Couldn't update flow {flow.id} in database from path {path}"
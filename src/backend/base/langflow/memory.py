@@ -7,7 +7,7 @@ from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from lfx.log.logger import logger
 from lfx.utils.async_helpers import run_until_complete
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -144,13 +144,21 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
     try:
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
-            messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+            messages_reads = await aadd_messagetables(messages_models, session)
+        return await _messages_from_reads(messages_reads)
     except Exception as e:
         await logger.aexception(e)
         raise
 
 
+async def _messages_from_reads(messages_reads: list[MessageRead]) -> list[Message]:
+    message_dumps = [message.model_dump() for message in messages_reads]
+    # Building a Message with files checks them on disk, so do it for the whole batch in one thread
+    if any(dump["files"] for dump in message_dumps):
+        return await asyncio.to_thread(lambda: [Message(**dump) for dump in message_dumps])
+    return [Message(**dump) for dump in message_dumps]
+
+
 async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
@@ -181,11 +189,21 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
         return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
 
 
-async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
+MESSAGE_COLUMNS = tuple(column.key for column in MessageTable.__table__.columns)
+
+
+async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession) -> list[MessageRead]:
+    """Insert messages in a single batch and return them as read models.
+
+    Every column, including the id and timestamp, is generated client-side, so the returned
+    messages are built from the inserted values instead of refreshing each row from the database.
+    """
+    if not messages:
+        return []
+    rows = [{column: getattr(message, column) for column in MESSAGE_COLUMNS} for message in messages]
     try:
         try:
-            for message in messages:
-                session.add(message)
+            await _insert_message_rows(rows, session)
             await session.commit()
             # This is a hack.
             # We are doing this because build_public_tmp causes the CancelledError to be raised
@@ -193,8 +211,6 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         except asyncio.CancelledError:
             await session.rollback()
             return await aadd_messagetables(messages, session)
-        for message in messages:
-            await session.refresh(message)
     except asyncio.CancelledError as e:
         await logger.aexception(e)
         error_msg = "Operation cancelled"
@@ -203,14 +219,31 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         await logger.aexception(e)
         raise
 
-    new_messages = []
-    for msg in messages:
-        msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
-        msg.content_blocks = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]  # type: ignore[arg-type]
-        msg.category = msg.category or ""
-        new_messages.append(msg)
-
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    return [_message_read_from_row(row) for row in rows]
+
+
+async def _insert_message_rows(rows: list[dict], session: AsyncSession) -> None:
+    stmt = insert(MessageTable)
+    if session.get_bind().dialect.insert_executemany_returning:
+        # Dialects with RETURNING support batch the rows into multi-row INSERT ... RETURNING statements
+        inserted_ids = (await session.exec(stmt.returning(MessageTable.id), params=rows)).all()
+        if len(inserted_ids) != len(rows):
+            msg = f"Expected to insert {len(rows)} messages, inserted {len(inserted_ids)}"
+            raise RuntimeError(msg)
+    else:
+        await session.exec(stmt, params=rows)
+
+
+def _message_read_from_row(row: dict) -> MessageRead:
+    properties = row["properties"]
+    return MessageRead.model_validate(
+        {
+            **row,
+            "properties": json.loads(properties) if isinstance(properties, str) else properties,
+            "content_blocks": [json.loads(j) if isinstance(j, str) else j for j in row["content_blocks"]],
+            "category": row["category"] or "",
+        }
+    )
 
 
 def delete_messages(session_id: str | None = None, context_id: str | None = None) -> None:
@@ -304,23 +337,54 @@ async def astore_message(
     if not message:
         await logger.awarning("No message provided.")
         return []
+    return await astore_messages([message], flow_id=flow_id)
 
-    if not message.session_id or not message.sender or not message.sender_name:
-        msg = (
-            f"All of session_id, sender, and sender_name must be provided. Session ID: {message.session_id},"
-            f" Sender: {message.sender}, Sender Name: {message.sender_name}"
-        )
-        raise ValueError(msg)
-    if hasattr(message, "id") and message.id:
-        # if message has an id and exist in the database, update it
-        # if not raise an error and add the message to the database
-        try:
-            return await aupdate_messages([message])
-        except ValueError as e:
-            await logger.aerror(e)
-    if flow_id and not isinstance(flow_id, UUID):
-        flow_id = UUID(flow_id)
-    return await aadd_messages([message], flow_id=flow_id)
+
+async def astore_messages(
+    messages: Sequence[Message],
+    flow_id: str | UUID | None = None,
+) -> list[Message]:
+    """Stores several messages in the memory.
+
+    Messages that already exist in the database are updated, the others are inserted in a single batch.
+
+    Args:
+        messages (Sequence[Message]): The messages to store.
+        flow_id (Optional[str]): The flow ID associated with the messages.
+
+    Returns:
+        List[Message]: The stored messages, in the order they were given.
+
+    Raises:
+        ValueError: If any of the required parameters (session_id, sender, sender_name) is not provided.
+    """
+    for message in messages:
+        if not message.session_id or not message.sender or not message.sender_name:
+            msg = (
+                f"All of session_id, sender, and sender_name must be provided. Session ID: {message.session_id},"
+                f" Sender: {message.sender}, Sender Name: {message.sender_name}"
+            )
+            raise ValueError(msg)
+
+    stored_messages: list[Message | None] = [None] * len(messages)
+    new_indices: list[int] = []
+    for index, message in enumerate(messages):
+        if hasattr(message, "id") and message.id:
+            # if message has an id and exist in the database, update it
+            # if not raise an error and add the message to the database
+            try:
+                stored_messages[index] = (await aupdate_messages([message]))[0]
+                continue
+            except ValueError as e:
+                await logger.aerror(e)
+        new_indices.append(index)
+    if new_indices:
+        if flow_id and not isinstance(flow_id, UUID):
+            flow_id = UUID(flow_id)
+        added_messages = await aadd_messages([messages[index] for index in new_indices], flow_id=flow_id)
+        for index, added_message in zip(new_indices, added_messages, strict=True):
+            stored_messages[index] = added_message
+    return [message for message in stored_messages if message is not None]
 
 
 class LCBuiltinChatMemory(BaseChatMessageHistory):
@@ -352,18 +416,18 @@ class LCBuiltinChatMemory(BaseChatMessageHistory):
         return [m.to_lc_message() for m in messages if not m.error]  # Exclude error messages
 
     def add_messages(self, messages: Sequence[BaseMessage]) -> None:
-        for lc_message in messages:
-            message = Message.from_lc_message(lc_message)
-            message.session_id = self.session_id
-            message.context_id = self.context_id
-            store_message(message, flow_id=self.flow_id)
+        run_until_complete(self.aadd_messages(messages))
 
     async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        if not messages:
+            return
+        stored_messages = []
         for lc_message in messages:
             message = Message.from_lc_message(lc_message)
             message.session_id = self.session_id
             message.context_id = self.context_id
-            await astore_message(message, flow_id=self.flow_id)
+            stored_messages.append(message)
+        await astore_messages(stored_messages, flow_id=self.flow_id)
 
     def clear(self) -> None:
         delete_messages(self.session_id, self.context_id)
@@ -0,0 +1,158 @@
+"""Process-wide cache of prepared graph templates for the run and webhook endpoints.
+
+Every run of a flow through the API copies the flow data, applies the tweaks of
+the request and processes the payload before building the graph. For a flow
+that does not change, that work only depends on the flow version and the
+tweaks, so the prepared payload is kept here as a ``GraphTemplate`` keyed by
+flow id, flow ``updated_at``, stream flag and a hash of the tweaks. Each request
+builds its own graph from the template.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from lfx.graph.graph.template import GraphTemplate
+from lfx.log.logger import logger
+
+from langflow.processing.process import process_tweaks
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.flow.model import Flow
+
+DEFAULT_MAX_ENTRIES = 128
+
+TemplateKey = tuple[str, str, bool, str]
+
+
+def hash_tweaks(tweaks: Any) -> str:
+    """Return a stable hash of the tweaks of a request."""
+    if hasattr(tweaks, "model_dump"):
+        tweaks = tweaks.model_dump()
+    try:
+        serialized = orjson.dumps(tweaks or {}, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        serialized = repr(tweaks).encode()
+    return hashlib.sha256(serialized).hexdigest()
+
+
+class GraphTemplateCache:
+    """A bounded LRU cache of graph templates.
+
+    Entries are keyed by the flow version, so an updated flow never hits a stale
+    template; invalidating a flow only releases the memory of its old versions.
+
+    Attributes:
+        max_entries (int): Maximum number of templates to keep.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required preparing a template.
+        evictions (int): Number of entries dropped to respect the bound.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[TemplateKey, GraphTemplate] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(flow: Flow, tweaks: Any, *, stream: bool) -> TemplateKey:
+        updated_at = flow.updated_at.isoformat() if flow.updated_at else ""
+        return str(flow.id), updated_at, stream, hash_tweaks(tweaks)
+
+    def get_or_create(self, flow: Flow, tweaks: Any, *, stream: bool = False) -> GraphTemplate:
+        """Return the template of the flow with the tweaks applied, preparing it on a miss."""
+        key = self.make_key(flow, tweaks, stream=stream)
+        with self._lock:
+            template = self._entries.get(key)
+            if template is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        if flow.data is None:
+            msg = f"Flow {flow.id} has no data"
+            raise ValueError(msg)
+        graph_data = process_tweaks(copy.deepcopy(flow.data), tweaks or {}, stream=stream)
+        template = GraphTemplate(graph_data, flow_id=str(flow.id), flow_name=flow.name)
+        self.set(key, template)
+        return template
+
+    def set(self, key: TemplateKey, template: GraphTemplate) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = template
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_flow(self, flow_id: str | UUID) -> int:
+        """Drop every template of a flow. Returns the number of dropped templates."""
+        flow_id = str(flow_id)
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == flow_id]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all templates and reset the metrics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_template_cache: GraphTemplateCache | None = None
+_template_cache_lock = threading.Lock()
+
+
+def get_graph_template_cache() -> GraphTemplateCache:
+    """Return the process-wide graph template cache, creating it from the settings on first use."""
+    global _template_cache  # noqa: PLW0603
+    if _template_cache is None:
+        with _template_cache_lock:
+            if _template_cache is None:
+                max_entries = DEFAULT_MAX_ENTRIES
+                try:
+                    from langflow.services.deps import get_settings_service
+
+                    max_entries = get_settings_service().settings.graph_template_cache_max_entries
+                except Exception:  # noqa: BLE001
+                    logger.debug("Could not read graph template cache settings, using defaults", exc_info=True)
+                _template_cache = GraphTemplateCache(max_entries=max_entries)
+    return _template_cache
+
+
+def invalidate_flow_graph_templates(flow_id: str | UUID) -> int:
+    """Drop the templates of a flow that was updated or deleted."""
+    return get_graph_template_cache().invalidate_flow(flow_id)
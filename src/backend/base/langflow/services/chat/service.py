@@ -3,6 +3,9 @@ from collections import defaultdict
 from threading import RLock
 from typing import Any
 
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.checkpoint import clear_graph_checkpoint
+
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
 from langflow.services.deps import get_cache_service
@@ -17,6 +20,7 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        self._checkpoint_graphs: dict[str, Graph] = {}
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -56,7 +60,18 @@ class ChatService(Service):
         return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
-        """Clear the cache for a client.
+        """Clear the cache for a client, including the checkpoints of a graph run cached under the key.
+
+        Args:
+            key (str): The cache key.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+        """
+        await self.delete_cache(key, lock=lock)
+        self._checkpoint_graphs.pop(str(key), None)
+        await clear_graph_checkpoint(str(key), self.get_cache, self.delete_cache)
+
+    async def delete_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
+        """Delete a single cache entry.
 
         Args:
             key (str): The cache key.
@@ -65,3 +80,22 @@ class ChatService(Service):
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    async def load_checkpoint(self, key: str) -> Graph | None:
+        """Rehydrate the graph whose run is checkpointed under a key.
+
+        The graph is kept in memory, later calls during the same run only replay the deltas written since.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Graph | None: The graph, or None if there is no complete checkpoint.
+        """
+        key = str(key)
+        graph = await Graph.load_checkpoint(key, self.get_cache, self._checkpoint_graphs.get(key))
+        if graph is None:
+            self._checkpoint_graphs.pop(key, None)
+        else:
+            self._checkpoint_graphs[key] = graph
+        return graph
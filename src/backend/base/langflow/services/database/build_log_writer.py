@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+
+from langflow.services.database.models.transactions.crud import delete_transactions_over_limit, log_transactions
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.crud import delete_vertex_builds_over_limits, log_vertex_builds
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+
+if TYPE_CHECKING:
+    from lfx.services.settings.base import Settings
+
+    from langflow.services.database.service import DatabaseService
+
+
+class BuildLogWriter:
+    """Write-behind writer for vertex builds and transactions.
+
+    Rows are buffered in memory and inserted in batches, either when `batch_size` rows are pending
+    or every `flush_interval` seconds. Retention limits are enforced by a periodic compaction
+    instead of on every insert. Pending rows are flushed when the writer is stopped.
+
+    The background task runs on the event loop that enqueued first. Rows enqueued from other loops,
+    such as worker or bridge threads, go to the same buffer and are written by that task, so the
+    database is only used from one loop. If that loop stops, the next enqueue moves the task to the
+    caller's loop.
+    """
+
+    def __init__(
+        self,
+        database_service: DatabaseService,
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        compaction_interval: float = 60.0,
+    ) -> None:
+        self.database_service = database_service
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.compaction_interval = compaction_interval
+        self._vertex_builds: list[VertexBuildBase] = []
+        self._transactions: list[TransactionBase] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_event: asyncio.Event | None = None
+        self._flush_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._stop_requested = False
+        self._last_compaction = time.monotonic()
+        self._needs_compaction = False
+        self.written_rows = 0
+        self.dropped_rows = 0
+        self.failed_rows = 0
+        self.flushes = 0
+        self.compactions = 0
+
+    @classmethod
+    def from_settings(cls, database_service: DatabaseService, settings: Settings) -> BuildLogWriter:
+        return cls(
+            database_service,
+            batch_size=settings.build_log_batch_size,
+            flush_interval=settings.build_log_flush_interval,
+            max_queue_size=settings.build_log_max_queue_size,
+            compaction_interval=settings.build_log_compaction_interval,
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._vertex_builds) + len(self._transactions)
+
+    def is_started(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "queue_depth": self.queue_depth,
+            "written_rows": self.written_rows,
+            "dropped_rows": self.dropped_rows,
+            "failed_rows": self.failed_rows,
+            "flushes": self.flushes,
+            "compactions": self.compactions,
+        }
+
+    def enqueue_vertex_build(self, vertex_build: VertexBuildBase | dict) -> bool:
+        """Buffer a vertex build. Returns False if the row was dropped because the queue is full."""
+        if isinstance(vertex_build, dict):
+            vertex_build = VertexBuildBase(**vertex_build)
+        with self._buffer_lock:
+            if self._is_full():
+                return False
+            self._vertex_builds.append(vertex_build)
+        self._after_enqueue()
+        return True
+
+    def enqueue_transaction(self, transaction: TransactionBase | dict) -> bool:
+        """Buffer a transaction. Returns False if the row was dropped because the queue is full."""
+        if isinstance(transaction, dict):
+            transaction = TransactionBase(**transaction)
+        with self._buffer_lock:
+            if self._is_full():
+                return False
+            self._transactions.append(transaction)
+        self._after_enqueue()
+        return True
+
+    def _is_full(self) -> bool:
+        if self.queue_depth >= self.max_queue_size:
+            self.dropped_rows += 1
+            return True
+        return False
+
+    def _after_enqueue(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._runs_on_other_loop(loop):
+            if self.queue_depth >= self.batch_size:
+                self._loop.call_soon_threadsafe(self._flush_event.set)
+            return
+        self._ensure_started(loop)
+        if self.queue_depth >= self.batch_size:
+            self._flush_event.set()
+
+    def _runs_on_other_loop(self, loop: asyncio.AbstractEventLoop) -> bool:
+        return self._loop is not None and self._loop is not loop and self._loop.is_running() and self.is_started()
+
+    def _ensure_started(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self.is_started() and self._loop is loop:
+            return
+        # Either never started or the owning loop is gone, the previous task exits on its next wake-up
+        self._loop = loop
+        self._flush_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="build_log_writer")
+
+    async def _run(self) -> None:
+        while not self._stop_requested and self._task is asyncio.current_task():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            self._flush_event.clear()
+            try:
+                await self.flush()
+                if time.monotonic() - self._last_compaction >= self.compaction_interval:
+                    await self.compact()
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(f"Error in build log writer: {exc!s}")
+
+    async def flush(self) -> int:
+        """Insert all buffered rows. Returns the number of rows written."""
+        loop = asyncio.get_running_loop()
+        flush_lock = self._flush_locks.get(loop)
+        if flush_lock is None:
+            flush_lock = self._flush_locks[loop] = asyncio.Lock()
+        async with flush_lock:
+            with self._buffer_lock:
+                vertex_builds, self._vertex_builds = self._vertex_builds, []
+                transactions, self._transactions = self._transactions, []
+            if not vertex_builds and not transactions:
+                return 0
+            written = 0
+            async with self.database_service.with_session() as session:
+                for insert_batch, rows in ((log_vertex_builds, vertex_builds), (log_transactions, transactions)):
+                    if not rows:
+                        continue
+                    try:
+                        written += len(await insert_batch(session, rows))
+                    except Exception as exc:  # noqa: BLE001
+                        self.failed_rows += len(rows)
+                        await logger.aerror(f"Error writing {len(rows)} rows with {insert_batch.__name__}: {exc!s}")
+            self.written_rows += written
+            self.flushes += 1
+            self._needs_compaction = self._needs_compaction or written > 0
+            return written
+
+    async def compact(self) -> None:
+        """Enforce the retention limits for vertex builds and transactions."""
+        self._last_compaction = time.monotonic()
+        if not self._needs_compaction:
+            return
+        async with self.database_service.with_session() as session:
+            await delete_vertex_builds_over_limits(session)
+            await delete_transactions_over_limit(session)
+        self._needs_compaction = False
+        self.compactions += 1
+
+    async def stop(self) -> None:
+        """Stop the background task and flush and compact every pending row."""
+        if self._task is not None:
+            self._stop_requested = True
+            if self._runs_on_other_loop(asyncio.get_running_loop()):
+                future = asyncio.run_coroutine_threadsafe(self._stop_task(), self._loop)
+                await asyncio.wrap_future(future)
+            elif self._loop is asyncio.get_running_loop():
+                await self._stop_task()
+            self._task = None
+            self._loop = None
+            self._stop_requested = False
+        try:
+            await self.flush()
+            await self.compact()
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Error flushing build log writer")
+
+    async def _stop_task(self) -> None:
+        self._flush_event.set()
+        await self._task
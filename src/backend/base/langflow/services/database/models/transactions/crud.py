@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from lfx.log.logger import logger
-from sqlmodel import col, delete, select
+from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.transactions.model import (
@@ -74,6 +74,56 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionBase]) -> list[TransactionTable]:
+    """Insert several transactions in a single batch without enforcing retention limits.
+
+    Retention is enforced separately by `delete_transactions_over_limit`.
+
+    Args:
+        db: Database session
+        transactions: Transaction data to log. Entries without a flow_id are skipped.
+
+    Returns:
+        The created TransactionTable entries
+    """
+    tables = [TransactionTable(**transaction.model_dump()) for transaction in transactions if transaction.flow_id]
+    if not tables:
+        return tables
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def delete_transactions_over_limit(db: AsyncSession, max_entries: int | None = None) -> None:
+    """Delete the oldest transactions of every flow exceeding the retention limit.
+
+    Args:
+        db: Database session
+        max_entries: Maximum number of transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    try:
+        ranked = select(
+            TransactionTable.id,
+            func.row_number()
+            .over(partition_by=TransactionTable.flow_id, order_by=col(TransactionTable.timestamp).desc())
+            .label("row_number"),
+        ).subquery()
+        await db.exec(
+            delete(TransactionTable).where(
+                col(TransactionTable.id).in_(select(ranked.c.id).where(ranked.c.row_number > max_entries))
+            )
+        )
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
@@ -26,6 +26,7 @@ from tenacity import retry, stop_after_attempt, wait_fixed
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.base import Service
 from langflow.services.database import models
+from langflow.services.database.build_log_writer import BuildLogWriter
 from langflow.services.database.models.user.crud import get_user_by_username
 from langflow.services.database.session import NoopSession
 from langflow.services.database.utils import Result, TableResults
@@ -62,6 +63,10 @@ class DatabaseService(Service):
         else:
             self.engine = self._create_engine()
 
+        self.build_log_writer: BuildLogWriter | None = None
+        if not self.settings_service.settings.use_noop_database:
+            self.build_log_writer = BuildLogWriter.from_settings(self, self.settings_service.settings)
+
         alembic_log_file = self.settings_service.settings.alembic_log_file
         # Check if the provided path is absolute, cross-platform.
         if Path(alembic_log_file).is_absolute():
@@ -474,6 +479,8 @@ class DatabaseService(Service):
 
     async def teardown(self) -> None:
         await logger.adebug("Tearing down database")
+        if self.build_log_writer is not None:
+            await self.build_log_writer.stop()
         try:
             settings_service = get_settings_service()
             # remove the default superuser if auto_login is enabled
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lfx.services.settings.base import Settings
+    from redis.asyncio import Redis
+
+
+class JobQueueBackend(ABC):
+    """Registry and event transport of flow build jobs.
+
+    The worker that runs a job publishes the job's events to the backend. Backends shared between workers
+    set `forwards_events` to True: events are then always read back from the backend, so any worker can
+    serve them, and cancellation requests are picked up by the worker that runs the job. Backends local to
+    one worker leave it to False, and the events are read straight from the job's local queue.
+
+    Events are the encoded event bytes, or None to mark the end of the job's events.
+    """
+
+    forwards_events: bool = False
+
+    @abstractmethod
+    async def register_job(self, job_id: str) -> None:
+        """Register a new job so that its events can be published and read."""
+
+    @abstractmethod
+    async def job_exists(self, job_id: str) -> bool:
+        """Return whether the job is registered."""
+
+    @abstractmethod
+    async def publish_events(self, job_id: str, events: list[bytes | None]) -> None:
+        """Append events to the job's events."""
+
+    @abstractmethod
+    async def read_events(self, job_id: str, *, count: int = 100, timeout: float = 0.0) -> list[bytes | None]:
+        """Consume up to `count` events of the job.
+
+        Each event is delivered to a single reader. If there are no events, waits up to `timeout` seconds
+        for one.
+        """
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> None:
+        """Ask the worker running the job to cancel it."""
+
+    @abstractmethod
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        """Return whether cancelling the job was requested."""
+
+    @abstractmethod
+    async def delete_job(self, job_id: str) -> None:
+        """Remove the job and its pending events."""
+
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+        return
+
+
+class InMemoryJobQueueBackend(JobQueueBackend):
+    """Backend keeping jobs in the memory of the current worker.
+
+    Events are read from the jobs' local queues, so the event queue of a job is only created once events
+    are published or read through the backend.
+    """
+
+    forwards_events = False
+
+    def __init__(self) -> None:
+        self._jobs: set[str] = set()
+        self._events: dict[str, asyncio.Queue[bytes | None]] = {}
+        self._cancel_requested: set[str] = set()
+
+    def _queue(self, job_id: str) -> asyncio.Queue[bytes | None]:
+        if job_id not in self._jobs:
+            raise KeyError(job_id)
+        return self._events.setdefault(job_id, asyncio.Queue())
+
+    async def register_job(self, job_id: str) -> None:
+        self._jobs.add(job_id)
+
+    async def job_exists(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    async def publish_events(self, job_id: str, events: list[bytes | None]) -> None:
+        queue = self._queue(job_id)
+        for event in events:
+            queue.put_nowait(event)
+
+    async def read_events(self, job_id: str, *, count: int = 100, timeout: float = 0.0) -> list[bytes | None]:
+        queue = self._queue(job_id)
+        events: list[bytes | None] = []
+        if queue.empty() and timeout > 0:
+            try:
+                events.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                return events
+        while not queue.empty() and len(events) < count:
+            events.append(queue.get_nowait())
+        return events
+
+    async def request_cancel(self, job_id: str) -> None:
+        if job_id in self._jobs:
+            self._cancel_requested.add(job_id)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return job_id in self._cancel_requested
+
+    async def delete_job(self, job_id: str) -> None:
+        self._jobs.discard(job_id)
+        self._events.pop(job_id, None)
+        self._cancel_requested.discard(job_id)
+
+
+class RedisJobQueueBackend(JobQueueBackend):
+    """Backend keeping the events of each job in a Redis stream shared by all workers.
+
+    Each job has a hash holding its cancellation flag and a stream holding its events. Readers consume the
+    stream through a consumer group, so a polling client whose requests land on different workers still
+    receives every event exactly once. Both keys expire `expiration_time` seconds after the last event.
+    """
+
+    forwards_events = True
+    CONSUMER_GROUP = "readers"
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        expiration_time: int = 3600,
+        key_prefix: str = "langflow:job",
+        consumer_name: str | None = None,
+    ) -> None:
+        self._client = client
+        self.expiration_time = expiration_time
+        self.key_prefix = key_prefix
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RedisJobQueueBackend:
+        # Redis is a main dependency, no need to import check
+        from redis.asyncio import StrictRedis
+
+        if settings.redis_url:
+            client = StrictRedis.from_url(settings.redis_url)
+        else:
+            client = StrictRedis(host=settings.redis_host, port=settings.redis_port, db=settings.redis_db)
+        return cls(client, expiration_time=settings.job_queue_redis_expire)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}"
+
+    def _events_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}:events"
+
+    async def register_job(self, job_id: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job_id), mapping={"cancel": 0})
+            pipe.xgroup_create(self._events_key(job_id), self.CONSUMER_GROUP, id="0", mkstream=True)
+            pipe.expire(self._job_key(job_id), self.expiration_time)
+            pipe.expire(self._events_key(job_id), self.expiration_time)
+            await pipe.execute()
+
+    async def job_exists(self, job_id: str) -> bool:
+        return bool(await self._client.exists(self._job_key(job_id)))
+
+    async def publish_events(self, job_id: str, events: list[bytes | None]) -> None:
+        async with self._client.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(self._events_key(job_id), {"end": 1} if event is None else {"data": event})
+            pipe.expire(self._job_key(job_id), self.expiration_time)
+            pipe.expire(self._events_key(job_id), self.expiration_time)
+            await pipe.execute()
+
+    async def read_events(self, job_id: str, *, count: int = 100, timeout: float = 0.0) -> list[bytes | None]:
+        events_key = self._events_key(job_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            response = await self._client.xreadgroup(
+                self.CONSUMER_GROUP,
+                self.consumer_name,
+                {events_key: ">"},
+                count=count,
+                # Redis blocks forever on 0, so no timeout must not block at all
+                block=int(remaining * 1000) if remaining > 0 else None,
+            )
+            # Some servers and proxies return early from blocking reads, keep waiting until the deadline
+            if response or remaining <= 0:
+                break
+            await asyncio.sleep(min(self.POLL_INTERVAL, remaining))
+        events: list[bytes | None] = []
+        message_ids = []
+        for _, messages in response or []:
+            for message_id, fields in messages:
+                message_ids.append(message_id)
+                events.append(fields.get(b"data"))
+        if message_ids:
+            await self._client.xack(events_key, self.CONSUMER_GROUP, *message_ids)
+        return events
+
+    async def request_cancel(self, job_id: str) -> None:
+        # Only flag jobs that exist, so a late request does not recreate an expired job
+        if await self.job_exists(job_id):
+            await self._client.hset(self._job_key(job_id), "cancel", 1)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return await self._client.hget(self._job_key(job_id), "cancel") == b"1"
+
+    async def delete_job(self, job_id: str) -> None:
+        await self._client.delete(self._job_key(job_id), self._events_key(job_id))
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -1,11 +1,23 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
+from langflow.services.job_queue.backends import RedisJobQueueBackend
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
+    @override
+    def create(self, settings_service: SettingsService):
+        if settings_service.settings.job_queue_backend == "redis":
+            return JobQueueService(backend=RedisJobQueueBackend.from_settings(settings_service.settings))
         return JobQueueService()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+from typing import Any
 
+from lfx.events.event_manager import get_streaming_options
 from lfx.log.logger import logger
 
 from langflow.events.event_manager import EventManager
 from langflow.services.base import Service
+from langflow.services.deps import get_settings_service
+from langflow.services.job_queue.backends import InMemoryJobQueueBackend, JobQueueBackend
 
 
 class JobQueueNotFoundError(Exception):
@@ -26,6 +31,10 @@ class JobQueueService(Service):
       - Safely clean up resources by cancelling active tasks and emptying queues.
       - Automatically perform periodic cleanup of inactive or completed job queues.
 
+    Jobs are registered with a pluggable `JobQueueBackend`. When the backend forwards events, a forwarder
+    task publishes the events of each job running in this worker to the backend, and stops the job when
+    another worker requests its cancellation, so any worker sharing the backend can serve the job's events.
+
     The cleanup process follows a two-phase approach:
       1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
       2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
@@ -39,6 +48,8 @@ class JobQueueService(Service):
               * The associated EventManager instance.
               * The asyncio.Task processing the job (if any).
               * The cleanup timestamp (if any).
+        backend (JobQueueBackend): The registry and event transport of the jobs.
+        _forwarders (dict[str, asyncio.Task]): Tasks forwarding the events of local jobs to the backend.
         _cleanup_task (asyncio.Task | None): Background task for periodic cleanup.
         _closed (bool): Flag indicating whether the service is currently active.
         CLEANUP_GRACE_PERIOD (int): Number of seconds to wait after a task is marked for cleanup
@@ -47,6 +58,8 @@ class JobQueueService(Service):
               * Related systems to finish their work
               * Inspection or recovery if needed
             Default is 300 seconds (5 minutes).
+        CANCEL_POLL_INTERVAL (float): Number of seconds between two checks of the cancellation requests
+            of a forwarded job.
 
     Example:
         service = JobQueueService()
@@ -61,17 +74,30 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, backend: JobQueueBackend | None = None) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            backend (JobQueueBackend | None): The job registry and event transport. Defaults to an
+                in-memory backend.
         """
+        self.backend = backend or InMemoryJobQueueBackend()
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
+        self._forwarders: dict[str, asyncio.Task] = {}
+        self._background_tasks: set[asyncio.Task] = set()
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
         self.CLEANUP_GRACE_PERIOD = 300  # 5 minutes before cleaning up marked tasks
+        self.CANCEL_POLL_INTERVAL = 0.5
+
+    @property
+    def forwards_events(self) -> bool:
+        """Whether job events are read back from the backend instead of the local job queues."""
+        return self.backend.forwards_events
 
     def is_started(self) -> bool:
         """Check if the JobQueueService has started.
@@ -117,6 +143,7 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        await self.backend.close()
         await logger.adebug("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
@@ -184,6 +211,86 @@ class JobQueueService(Service):
         self._queues[job_id] = (main_queue, event_manager, task, None)
         logger.debug(f"New task started for job_id {job_id}")
 
+    async def register_job(self, job_id: str) -> None:
+        """Register a job created in this worker with the backend.
+
+        If the backend forwards events, also starts the task publishing the job's events to the backend.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+        """
+        if job_id not in self._queues:
+            msg = f"No queue found for job_id {job_id}"
+            raise ValueError(msg)
+        await self.backend.register_job(job_id)
+        if self.forwards_events:
+            self._forwarders[job_id] = asyncio.create_task(self._forward_events(job_id))
+
+    async def read_job_events(self, job_id: str, *, timeout: float = 0.0) -> list[bytes | None]:
+        """Consume the events of a job from the backend, on behalf of any worker.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+            timeout (float): Number of seconds to wait for an event if none is available.
+
+        Returns:
+            list[bytes | None]: The encoded events, None marking the end of the job's events.
+
+        Raises:
+            JobQueueNotFoundError: If the job_id is not registered with the backend.
+        """
+        if not await self.backend.job_exists(job_id):
+            raise JobQueueNotFoundError(job_id)
+        return await self.backend.read_events(job_id, timeout=timeout)
+
+    async def cancel_job(self, job_id: str) -> None:
+        """Cancel a job, whichever worker runs it.
+
+        Jobs running in this worker are cleaned up right away. Jobs of other workers are flagged in the
+        backend and cleaned up by their worker.
+
+        Raises:
+            JobQueueNotFoundError: If the job_id is not found.
+        """
+        if job_id in self._queues:
+            await self.cleanup_job(job_id)
+            return
+        if not self.forwards_events or not await self.backend.job_exists(job_id):
+            raise JobQueueNotFoundError(job_id)
+        await self.backend.request_cancel(job_id)
+
+    def cancel_job_soon(self, job_id: str) -> None:
+        """Schedule `cancel_job` without waiting for it, e.g. from a disconnect callback."""
+        task = asyncio.create_task(self.cancel_job(job_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _forward_events(self, job_id: str) -> None:
+        """Publish the events of a local job to the backend until its end, and watch for cancellation."""
+        main_queue, event_manager = self._queues[job_id][:2]
+        loop = asyncio.get_running_loop()
+        last_cancel_check = loop.time()
+        while True:
+            events: list[bytes | None] = []
+            with contextlib.suppress(asyncio.TimeoutError):
+                _, value, _ = await asyncio.wait_for(main_queue.get(), timeout=self.CANCEL_POLL_INTERVAL)
+                events.append(value)
+                # Publish everything already queued in one round trip
+                while events[-1] is not None and not main_queue.empty():
+                    _, value, _ = main_queue.get_nowait()
+                    events.append(value)
+            if events:
+                event_manager.notify_consumed()
+                await self.backend.publish_events(job_id, events)
+                if events[-1] is None:
+                    return
+            if loop.time() - last_cancel_check >= self.CANCEL_POLL_INTERVAL:
+                last_cancel_check = loop.time()
+                if await self.backend.is_cancel_requested(job_id):
+                    await logger.adebug(f"Cancellation of job_id {job_id} requested by another worker")
+                    await self.cleanup_job(job_id)
+                    return
+
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
@@ -208,6 +315,21 @@ class JobQueueService(Service):
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
 
+    def get_job_stats(self, job_id: str) -> dict[str, Any]:
+        """Return the event queue metrics of a job.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+
+        Returns:
+            dict[str, Any]: The queue depth and token coalescing metrics of the job's event manager.
+
+        Raises:
+            JobQueueNotFoundError: If the job_id is not found.
+        """
+        _, event_manager, _, _ = self.get_queue_data(job_id)
+        return event_manager.get_stats()
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
@@ -227,6 +349,13 @@ class JobQueueService(Service):
         await logger.adebug(f"Commencing cleanup for job_id {job_id}")
         main_queue, _event_manager, task, _ = self._queues[job_id]
 
+        forwarder = self._forwarders.pop(job_id, None)
+        if forwarder is not None and forwarder is not asyncio.current_task() and not forwarder.done():
+            forwarder.cancel()
+            await asyncio.wait([forwarder])
+        # Readers on any worker see the job disappear, like the local registry entry
+        await self.backend.delete_job(job_id)
+
         # Cancel the associated task if it is still running.
         if task and not task.done():
             await logger.adebug(f"Cancelling active task for job_id {job_id}")
@@ -311,7 +440,7 @@ class JobQueueService(Service):
         Returns:
             EventManager: The configured EventManager instance.
         """
-        manager = EventManager(queue)
+        manager = EventManager(queue, **get_streaming_options(get_settings_service().settings))
         # Registering predefined events
         event_names_types = [
             ("on_token", "token"),
@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
 import anyio
 from aiofile import async_open
 from lfx.log.logger import logger
 
-from .service import StorageService
+from .service import CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -67,6 +75,79 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def open_read(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            start: Offset of the first byte to read.
+            end: Offset of the last byte to read, inclusive. Reads to the end of the file if None.
+            chunk_size: Maximum size of each chunk.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            await logger.awarning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end - start + 1
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def open_write(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Write a file to the local storage from a stream of chunks.
+
+        The chunks go to a temporary file that replaces the target once complete, so readers
+        never see a partially written file.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The number of bytes written.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.{uuid4().hex}.part"
+
+        written = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    written += len(chunk)
+            await partial_path.rename(file_path)
+            await logger.ainfo(f"File {file_name} saved successfully in flow {flow_id}.")
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            raise
+        finally:
+            if await partial_path.exists():
+                await partial_path.unlink()
+        return written
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -104,6 +185,7 @@ class LocalStorageService(StorageService):
         """
         file_path = self.data_dir / flow_id / file_name
         if await file_path.exists():
+            await self.discard_parsed_content(flow_id, file_name)
             await file_path.unlink()
             await logger.ainfo(f"File {file_name} deleted successfully from flow {flow_id}.")
         else:
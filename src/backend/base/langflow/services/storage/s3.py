@@ -1,12 +1,32 @@
+from __future__ import annotations
+
+import contextlib
+from functools import partial
+from typing import TYPE_CHECKING
+
+import anyio
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from lfx.log.logger import logger
 
-from .service import StorageService
+from .service import CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# Size of the parts of a multipart upload, S3 requires at least 5 MiB for all but the last part
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+
+def _is_not_found(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}
 
 
 class S3StorageService(StorageService):
-    """A service class for handling operations with AWS S3 storage."""
+    """A service class for handling operations with AWS S3 storage.
+
+    boto3 is synchronous, so every call runs in a worker thread to keep the event loop free.
+    """
 
     def __init__(self, session_service, settings_service) -> None:
         """Initialize the S3 storage service with session and settings services."""
@@ -15,6 +35,9 @@ class S3StorageService(StorageService):
         self.s3_client = boto3.client("s3")
         self.set_ready()
 
+    async def _call(self, method, **kwargs):
+        return await anyio.to_thread.run_sync(partial(method, **kwargs))
+
     async def save_file(self, folder: str, file_name: str, data) -> None:
         """Save a file to the S3 bucket.
 
@@ -27,7 +50,7 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file saving.
         """
         try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
+            await self._call(self.s3_client.put_object, Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
             await logger.ainfo(f"File {file_name} saved successfully in folder {folder}.")
         except NoCredentialsError:
             await logger.aexception("Credentials not available for AWS S3.")
@@ -50,12 +73,119 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file retrieval.
         """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            await logger.ainfo(f"File {file_name} retrieved successfully from folder {folder}.")
-            return response["Body"].read()
+            response = await self._call(self.s3_client.get_object, Bucket=self.bucket, Key=f"{folder}/{file_name}")
+            content = await anyio.to_thread.run_sync(response["Body"].read)
         except ClientError:
             await logger.aexception(f"Error retrieving file {file_name} from folder {folder}")
             raise
+        await logger.ainfo(f"File {file_name} retrieved successfully from folder {folder}.")
+        return content
+
+    async def open_read(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file from the S3 bucket in chunks, using a ranged GET for partial reads.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be read.
+            start: Offset of the first byte to read.
+            end: Offset of the last byte to read, inclusive. Reads to the end of the file if None.
+            chunk_size: Maximum size of each chunk.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        params = {"Bucket": self.bucket, "Key": f"{flow_id}/{file_name}"}
+        if start or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await self._call(self.s3_client.get_object, **params)
+        except ClientError as e:
+            if _is_not_found(e):
+                msg = f"File {file_name} not found in folder {flow_id}"
+                raise FileNotFoundError(msg) from e
+            await logger.aexception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+
+        body = response["Body"]
+        try:
+            while chunk := await anyio.to_thread.run_sync(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def open_write(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Write a file to the S3 bucket from a stream of chunks.
+
+        Files up to MULTIPART_PART_SIZE are uploaded with a single request, larger ones with a
+        multipart upload that holds at most one part in memory and is aborted on failure.
+
+        Args:
+            flow_id: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The number of bytes written.
+        """
+        key = f"{flow_id}/{file_name}"
+        buffer = bytearray()
+        parts: list[dict] = []
+        upload_id = None
+        written = 0
+
+        async def upload_part() -> None:
+            response = await self._call(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+            buffer.clear()
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                written += len(chunk)
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    if upload_id is None:
+                        response = await self._call(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+                        upload_id = response["UploadId"]
+                    await upload_part()
+
+            if upload_id is None:
+                await self._call(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    await upload_part()
+                await self._call(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            if upload_id is not None:
+                with anyio.CancelScope(shield=True), contextlib.suppress(ClientError):
+                    await self._call(
+                        self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                    )
+            await logger.aexception(f"Error saving file {file_name} in folder {flow_id}")
+            raise
+
+        await logger.ainfo(f"File {file_name} saved successfully in folder {flow_id}.")
+        return written
 
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
@@ -70,7 +200,7 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file listing.
         """
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=folder)
+            response = await self._call(self.s3_client.list_objects_v2, Bucket=self.bucket, Prefix=folder)
         except ClientError:
             await logger.aexception(f"Error listing files in folder {folder}")
             raise
@@ -90,7 +220,8 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file deletion.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
+            await self.discard_parsed_content(folder, file_name)
+            await self._call(self.s3_client.delete_object, Bucket=self.bucket, Key=f"{folder}/{file_name}")
             await logger.ainfo(f"File {file_name} deleted successfully from folder {folder}.")
         except ClientError:
             await logger.aexception(f"Error deleting file {file_name} from folder {folder}")
@@ -101,4 +232,16 @@ class S3StorageService(StorageService):
         # No specific teardown actions required for S3 storage at the moment.
 
     async def get_file_size(self, flow_id: str, file_name: str):
-        raise NotImplementedError
+        """Get the size of a file in the S3 bucket.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        try:
+            response = await self._call(self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+        except ClientError as e:
+            if _is_not_found(e):
+                msg = f"File {file_name} not found in folder {flow_id}"
+                raise FileNotFoundError(msg) from e
+            raise
+        return response["ContentLength"]
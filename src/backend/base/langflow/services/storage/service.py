@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
@@ -8,10 +10,15 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from lfx.services.settings.service import SettingsService
 
     from langflow.services.session.service import SessionService
 
+# Size of the chunks yielded by StorageService.open_read
+CHUNK_SIZE = 64 * 1024
+
 
 class StorageService(Service):
     name = "storage_service"
@@ -36,6 +43,33 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def open_read(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file in chunks, optionally only the bytes from ``start`` to ``end`` inclusive.
+
+        Backends override this to read incrementally; this fallback loads the whole file first.
+        """
+        content = await self.get_file(flow_id, file_name)
+        content = content[start : None if end is None else end + 1]
+        for offset in range(0, len(content), chunk_size):
+            yield content[offset : offset + chunk_size]
+
+    async def open_write(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Write a file from a stream of chunks and return the number of bytes written.
+
+        Backends override this to write incrementally; this fallback joins the chunks first.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return len(data)
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -48,5 +82,20 @@ class StorageService(Service):
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         raise NotImplementedError
 
+    async def discard_parsed_content(self, flow_id: str, file_name: str) -> None:
+        """Remove the file parse cache entries of a file, backends call it before deleting the file."""
+        from lfx.base.data.parse_cache import get_file_parse_cache
+
+        cache = get_file_parse_cache()
+        if cache is None:
+            return
+        digest = hashlib.sha256()
+        try:
+            async for chunk in self.open_read(flow_id, file_name):
+                digest.update(chunk)
+        except FileNotFoundError:
+            return
+        await asyncio.to_thread(cache.delete_content, digest.hexdigest())
+
     async def teardown(self) -> None:
         raise NotImplementedError
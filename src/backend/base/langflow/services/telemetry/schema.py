@@ -58,3 +58,6 @@ class ComponentIndexPayload(BasePayload):
     dev_mode: bool = Field(serialization_alias="devMode")
     filtered_modules: str | None = Field(None, serialization_alias="filteredModules")  # CSV if filtering
     load_time_ms: int = Field(serialization_alias="loadTimeMs")
+    build_mode: str | None = Field(None, serialization_alias="buildMode")  # "thread" or "process" if dynamic
+    cached_modules: int | None = Field(None, serialization_alias="cachedModules")
+    slowest_modules: str | None = Field(None, serialization_alias="slowestModules")  # CSV of module:ms
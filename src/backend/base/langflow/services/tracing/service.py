@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import os
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
@@ -71,6 +75,7 @@ class TraceContext:
         project_name: str | None,
         user_id: str | None,
         session_id: str | None,
+        max_queue_size: int = 0,
     ):
         self.run_id: UUID | None = run_id
         self.run_name: str | None = run_name
@@ -81,7 +86,8 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
+        # Items are (trace_func, args, enqueued_at)
+        self.traces_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self.running = False
         self.worker_task: asyncio.Task | None = None
 
@@ -119,24 +125,85 @@ class TracingService(Service):
         3. end_tracers: end the trace for a graph run
 
     check context var in public methods.
+
+    Tracers do blocking I/O in their callbacks, so the callbacks of each run are executed in order by a
+    worker task on a thread pool shared by all runs, never on the event loop. Callbacks get a copy of the
+    inputs and outputs taken when they are queued, as the component keeps running meanwhile.
     """
 
     name = "tracing_service"
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.deactivated = self.settings_service.settings.deactivate_tracing
+        settings = self.settings_service.settings
+        self.deactivated = settings.deactivate_tracing
+        self.export_workers = max(1, settings.tracing_export_workers)
+        self.queue_max_size = max(0, settings.tracing_queue_max_size)
+        self.queue_overflow_policy = settings.tracing_queue_overflow_policy
+        self._executor: ThreadPoolExecutor | None = None
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.total_queue_lag = 0.0
+        self.max_queue_lag = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.export_workers, thread_name_prefix="tracing")
+        return self._executor
+
+    async def _run_in_executor(self, func, *args) -> None:
+        # Keep the context of the calling task, tracers may rely on context variables
+        context = contextvars.copy_context()
+        await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(context.run, func, *args))
+
+    async def _enqueue(self, trace_context: TraceContext, trace_func, args: tuple, *, droppable: bool = True) -> bool:
+        """Queue a callback of the run. Returns False if it was dropped because the queue is full.
+
+        Callbacks that are not droppable wait for room in the queue, whatever the overflow policy.
+        """
+        item = (trace_func, args, time.perf_counter())
+        if self.queue_overflow_policy == "block" or not droppable:
+            await trace_context.traces_queue.put(item)
+        else:
+            try:
+                trace_context.traces_queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                await logger.adebug(f"Tracing queue of run {trace_context.run_id} is full, dropping trace_func")
+                return False
+        self.enqueued += 1
+        return True
 
     async def _trace_worker(self, trace_context: TraceContext) -> None:
         while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
+            trace_func, args, enqueued_at = await trace_context.traces_queue.get()
+            queue_lag = time.perf_counter() - enqueued_at
+            self.total_queue_lag += queue_lag
+            self.max_queue_lag = max(self.max_queue_lag, queue_lag)
             try:
-                trace_func(*args)
+                await self._run_in_executor(trace_func, *args)
             except Exception:  # noqa: BLE001
+                self.errors += 1
                 await logger.aexception("Error processing trace_func")
             finally:
+                self.processed += 1
                 trace_context.traces_queue.task_done()
 
+    def stats(self) -> dict[str, Any]:
+        """Return the counters of the tracer callbacks, queue lags being in seconds."""
+        return {
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "pending": self.enqueued - self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "avg_queue_lag": self.total_queue_lag / self.processed if self.processed else 0.0,
+            "max_queue_lag": self.max_queue_lag,
+        }
+
     async def _start(self, trace_context: TraceContext) -> None:
         if trace_context.running or self.deactivated:
             return
@@ -238,7 +305,9 @@ class TracingService(Service):
             return
         try:
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
-            trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
+            trace_context = TraceContext(
+                run_id, run_name, project_name, user_id, session_id, max_queue_size=self.queue_max_size
+            )
             trace_context_var.set(trace_context)
             await self._start(trace_context)
             self._initialize_langsmith_tracer(trace_context)
@@ -263,14 +332,21 @@ class TracingService(Service):
         except Exception:  # noqa: BLE001
             await logger.aexception("Error stopping tracing service")
 
-    def _end_all_tracers(self, trace_context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
-        for tracer in trace_context.tracers.values():
+    def _end_all_tracers(
+        self,
+        tracers: list[BaseTracer],
+        all_inputs: dict[str, dict],
+        all_outputs: dict[str, dict],
+        outputs: dict,
+        error: Exception | None = None,
+    ) -> None:
+        for tracer in tracers:
             if tracer.ready:
                 try:
                     # why all_inputs and all_outputs? why metadata=outputs?
                     tracer.end(
-                        trace_context.all_inputs,
-                        outputs=trace_context.all_outputs,
+                        all_inputs,
+                        outputs=all_outputs,
                         error=error,
                         metadata=outputs,
                     )
@@ -289,7 +365,17 @@ class TracingService(Service):
         if trace_context is None:
             return
         await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        try:
+            await self._run_in_executor(
+                self._end_all_tracers,
+                list(trace_context.tracers.values()),
+                {name: dict(inputs) for name, inputs in trace_context.all_inputs.items()},
+                {name: dict(outputs) for name, outputs in trace_context.all_outputs.items()},
+                dict(outputs),
+                error,
+            )
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Error ending all traces")
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -311,12 +397,11 @@ class TracingService(Service):
     def _start_component_traces(
         self,
         component_trace_context: ComponentTraceContext,
-        trace_context: TraceContext,
+        tracers: list[BaseTracer],
+        inputs: dict[str, Any],
+        metadata: dict[str, Any],
     ) -> None:
-        inputs = self._cleanup_inputs(component_trace_context.inputs)
-        component_trace_context.inputs = inputs
-        component_trace_context.inputs_metadata = component_trace_context.inputs_metadata or {}
-        for tracer in trace_context.tracers.values():
+        for tracer in tracers:
             if not tracer.ready:
                 continue
             try:
@@ -325,7 +410,7 @@ class TracingService(Service):
                     component_trace_context.trace_name,
                     component_trace_context.trace_type,
                     inputs,
-                    component_trace_context.inputs_metadata,
+                    metadata,
                     component_trace_context.vertex,
                 )
             except Exception:  # noqa: BLE001
@@ -334,18 +419,20 @@ class TracingService(Service):
     def _end_component_traces(
         self,
         component_trace_context: ComponentTraceContext,
-        trace_context: TraceContext,
+        tracers: list[BaseTracer],
+        outputs: dict[str, Any],
+        logs: list[Log | dict[Any, Any]],
         error: Exception | None = None,
     ) -> None:
-        for tracer in trace_context.tracers.values():
+        for tracer in tracers:
             if tracer.ready:
                 try:
                     tracer.end_trace(
                         trace_id=component_trace_context.trace_id,
                         trace_name=component_trace_context.trace_name,
-                        outputs=trace_context.all_outputs[component_trace_context.trace_name],
+                        outputs=outputs,
                         error=error,
-                        logs=component_trace_context.logs[component_trace_context.trace_name],
+                        logs=logs,
                     )
                 except Exception:  # noqa: BLE001
                     logger.exception(f"Error ending trace {component_trace_context.trace_name}")
@@ -383,18 +470,50 @@ class TracingService(Service):
             yield self
             return
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        started = await self._enqueue(
+            trace_context,
+            self._start_component_traces,
+            (
+                component_trace_context,
+                list(trace_context.tracers.values()),
+                self._cleanup_inputs(inputs),
+                dict(component_trace_context.inputs_metadata),
+            ),
+        )
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            await self._enqueue_component_end(trace_context, component_trace_context, started=started, error=e)
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            await self._enqueue_component_end(trace_context, component_trace_context, started=started)
+
+    async def _enqueue_component_end(
+        self,
+        trace_context: TraceContext,
+        component_trace_context: ComponentTraceContext,
+        *,
+        started: bool,
+        error: Exception | None = None,
+    ) -> None:
+        if not started:
+            # The start of the trace was dropped, tracers would not know the trace to end
+            self.dropped += 1
+            return
+        trace_name = component_trace_context.trace_name
+        # Never dropped, tracers would keep the trace open otherwise
+        await self._enqueue(
+            trace_context,
+            self._end_component_traces,
+            (
+                component_trace_context,
+                list(trace_context.tracers.values()),
+                dict(trace_context.all_outputs[trace_name]),
+                list(component_trace_context.logs[trace_name]),
+                error,
+            ),
+            droppable=False,
+        )
 
     @property
     def project_name(self):
@@ -463,3 +582,9 @@ class TracingService(Service):
             if langchain_callback:
                 callbacks.append(langchain_callback)
         return callbacks
+
+    async def teardown(self) -> None:
+        if self._executor is not None:
+            # Let the pending tracer callbacks finish, they hold the spans not yet exported
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
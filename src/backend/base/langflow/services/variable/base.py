@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,24 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def prefetch_variables(
+        self,
+        user_id: UUID | str,  # noqa: ARG002
+        names: Iterable[str],  # noqa: ARG002
+        session: AsyncSession,  # noqa: ARG002
+    ) -> None:
+        """Load several variables ahead of `get_variable` calls.
+
+        Services that can fetch variables in bulk override this to warm their cache.
+        The default implementation does nothing.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+        return
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
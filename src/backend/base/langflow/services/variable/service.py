@@ -4,6 +4,7 @@ import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
 from lfx.log.logger import logger
 from sqlmodel import select
 from typing_extensions import override
@@ -15,16 +16,41 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from lfx.services.settings.service import SettingsService
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+VARIABLE_CACHE_MAX_SIZE = 4096
+
+
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # Decrypted values keyed by (user_id, name), stored with the variable type
+        cache_ttl = settings_service.settings.variable_cache_ttl
+        self._variable_cache: TTLCache | None = (
+            TTLCache(maxsize=VARIABLE_CACHE_MAX_SIZE, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+
+    def _cache_variable(self, user_id: UUID | str, variable: Variable) -> str:
+        value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if self._variable_cache is not None:
+            self._variable_cache[str(user_id), variable.name] = (variable.type, value)
+        return value
+
+    def invalidate_variable_cache(self, user_id: UUID | str, name: str | None = None) -> None:
+        """Drop cached values of a user's variable, or of all their variables if no name is given."""
+        if self._variable_cache is None:
+            return
+        user_key = str(user_id)
+        if name is not None:
+            self._variable_cache.pop((user_key, name), None)
+            return
+        for key in [key for key in list(self._variable_cache.keys()) if key[0] == user_key]:
+            self._variable_cache.pop(key, None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -59,24 +85,50 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
+        cached = self._variable_cache.get((str(user_id), name)) if self._variable_cache is not None else None
+        if cached is not None:
+            type_, value = cached
+        else:
+            # we get the credential from the database
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
+
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+            type_ = variable.type
+            value = None
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if value is None:
+            # we decrypt the value
+            value = self._cache_variable(user_id, variable)
+        return value
+
+    @override
+    async def prefetch_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> None:
+        """Fetch the named variables in a single query and cache their decrypted values."""
+        if self._variable_cache is None:
+            return
+        user_key = str(user_id)
+        missing = {name for name in names if name and (user_key, name) not in self._variable_cache}
+        if not missing:
+            return
+        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name.in_(missing))  # type: ignore[attr-defined]
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                self._cache_variable(user_id, variable)
+            except Exception as e:  # noqa: BLE001
+                # Leave it to get_variable to surface the error for the field that uses it
+                await logger.adebug(f"Could not decrypt variable '{variable.name}': {e}")
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -119,6 +171,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_variable_cache(user_id, name)
         await session.refresh(variable)
         return variable
 
@@ -131,6 +184,7 @@ class DatabaseVariableService(VariableService, Service):
     ):
         query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
         db_variable = (await session.exec(query)).one()
+        previous_name = db_variable.name
         db_variable.updated_at = datetime.now(timezone.utc)
 
         variable.value = variable.value or ""
@@ -143,6 +197,8 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_variable_cache(user_id, previous_name)
+        self.invalidate_variable_cache(user_id, db_variable.name)
         await session.refresh(db_variable)
         return db_variable
 
@@ -160,6 +216,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_variable_cache(user_id, name)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -168,8 +225,10 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
+        name = variable.name
         await session.delete(variable)
         await session.commit()
+        self.invalidate_variable_cache(user_id, name)
 
     async def create_variable(
         self,
@@ -190,5 +249,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_variable_cache(user_id, name)
         await session.refresh(variable)
         return variable
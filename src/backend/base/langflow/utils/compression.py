@@ -1,10 +1,16 @@
 import gzip
+import hashlib
 import json
 from typing import Any
 
-from fastapi import Response
+from fastapi import Request, Response, status
 from fastapi.encoders import jsonable_encoder
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
 
 def compress_response(data: Any) -> Response:
     """Compress data and return it as a FastAPI Response with appropriate headers."""
@@ -17,3 +23,79 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+def parse_accept_encoding(header: str | None) -> dict[str, float]:
+    """Parse an Accept-Encoding header into a mapping of coding to quality value."""
+    codings: dict[str, float] = {}
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, proxies may have weakened the tag
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class PrecompressedPayload:
+    """A JSON payload encoded and compressed once, then served to many requests.
+
+    Every available content coding of the payload is compressed up front, so serving a request only
+    picks one of them. Each coding has its own strong ETag, derived from the encoded JSON.
+
+    Attributes:
+        etag (str): The ETag of the uncompressed representation.
+        variants (dict[str, bytes]): The payload bytes by content coding, "identity" being uncompressed.
+    """
+
+    def __init__(self, data: Any, *, gzip_level: int = 9, brotli_quality: int = 9):
+        body = json.dumps(jsonable_encoder(data)).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.variants: dict[str, bytes] = {"identity": body, "gzip": gzip.compress(body, compresslevel=gzip_level)}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(body, quality=brotli_quality)
+
+    def etag_for(self, coding: str) -> str:
+        if coding == "identity":
+            return self.etag
+        return f'{self.etag[:-1]}-{coding}"'
+
+    def negotiate(self, accept_encoding: str | None) -> str:
+        """Return the smallest representation the client accepts."""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*")
+        candidates = [
+            coding
+            for coding in self.variants
+            if coding != "identity" and accepted.get(coding, wildcard if wildcard is not None else 0.0) > 0
+        ]
+        if not candidates:
+            return "identity"
+        return min(candidates, key=lambda coding: len(self.variants[coding]))
+
+    def response(self, request: Request, *, cache_control: str = "private, no-cache") -> Response:
+        """Serve the payload, or a 304 Not Modified if the client already holds it."""
+        coding = self.negotiate(request.headers.get("accept-encoding"))
+        etag = self.etag_for(coding)
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": cache_control}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if coding != "identity":
+            headers["Content-Encoding"] = coding
+        return Response(content=self.variants[coding], media_type="application/json", headers=headers)
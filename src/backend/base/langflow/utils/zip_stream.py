@@ -0,0 +1,120 @@
+import asyncio
+import io
+import time
+import zipfile
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+# Number of members whose chunks are fetched ahead of the one being written
+DEFAULT_PREFETCH = 4
+# Number of chunks buffered per prefetched member
+DEFAULT_QUEUE_SIZE = 8
+
+_END = object()
+
+
+@dataclass
+class ZipMember:
+    """A file to add to a streamed ZIP archive.
+
+    Attributes:
+        name (str): The path of the file inside the archive.
+        open_chunks (Callable[[], AsyncIterator[bytes]]): Opens the content of the file as a stream of chunks.
+        size (int | None): The size of the file if known, files of unknown size are always written as ZIP64.
+    """
+
+    name: str
+    open_chunks: Callable[[], AsyncIterator[bytes]]
+    size: int | None = None
+
+
+class _ZipOutput(io.RawIOBase):
+    """Unseekable sink for ZipFile that hands written bytes back to the caller.
+
+    Without seek, ZipFile writes sizes and checksums in data descriptors after each member instead
+    of going back to the local headers, so the archive can be sent as it is written.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def _prefetch(member: ZipMember, queue: asyncio.Queue) -> None:
+    try:
+        async for chunk in member.open_chunks():
+            await queue.put(chunk)
+    except Exception as e:  # noqa: BLE001
+        await queue.put(e)
+    else:
+        await queue.put(_END)
+
+
+async def stream_zip(
+    members: list[ZipMember],
+    *,
+    prefetch: int = DEFAULT_PREFETCH,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> AsyncIterator[bytes]:
+    """Stream a ZIP archive of ``members`` as it is written.
+
+    The chunks of up to ``prefetch`` members are fetched concurrently, each through a queue of at
+    most ``queue_size`` chunks, while members are written in order. Memory use is therefore bounded
+    by ``prefetch * queue_size`` chunks, whatever the size of the archive.
+
+    Raises:
+        Exception: The first error raised while reading a member, after the archive was partially sent.
+    """
+    output = _ZipOutput()
+    pending: deque[tuple[ZipMember, asyncio.Queue, asyncio.Task]] = deque()
+    remaining = iter(members)
+
+    def start_prefetch() -> None:
+        while len(pending) < max(1, prefetch):
+            member = next(remaining, None)
+            if member is None:
+                return
+            queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+            pending.append((member, queue, asyncio.create_task(_prefetch(member, queue))))
+
+    try:
+        with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as zip_file:
+            start_prefetch()
+            while pending:
+                member, queue, _ = pending[0]
+                info = zipfile.ZipInfo(member.name, date_time=time.localtime()[:6])
+                info.external_attr = 0o600 << 16
+                info.file_size = member.size or 0
+                with zip_file.open(info, "w", force_zip64=member.size is None) as entry:
+                    while (chunk := await queue.get()) is not _END:
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        entry.write(chunk)
+                        if data := output.drain():
+                            yield data
+                pending.popleft()
+                start_prefetch()
+                if data := output.drain():
+                    yield data
+        yield output.drain()
+    finally:
+        for _, _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
@@ -1,14 +1,18 @@
+import time
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage
 from langflow.memory import (
+    LCBuiltinChatMemory,
     aadd_messages,
     aadd_messagetables,
     add_messages,
     adelete_messages,
     aget_messages,
     astore_message,
+    astore_messages,
     aupdate_messages,
     delete_messages,
     get_messages,
@@ -23,6 +27,8 @@ from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.deps import session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
+from sqlalchemy import event, func
+from sqlmodel import select
 
 
 @pytest.fixture
@@ -362,3 +368,98 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+def _message_tables(count: int, session_id: str = "bulk_session_id") -> list[MessageTable]:
+    return [
+        MessageTable.from_message(
+            Message(
+                text=f"Bulk message {i}",
+                sender="User",
+                sender_name="User",
+                session_id=session_id,
+                properties={"text_color": "blue"},
+            )
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.usefixtures("client")
+async def test_aadd_messagetables_inserts_in_one_statement(async_session):
+    statements = []
+
+    def record_statement(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    sync_engine = async_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record_statement)
+    try:
+        added_messages = await aadd_messagetables(_message_tables(50), async_session)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record_statement)
+
+    assert len([statement for statement in statements if statement.startswith("INSERT")]) == 1
+    assert not [statement for statement in statements if statement.startswith("SELECT")]
+    assert len(added_messages) == 50
+    assert added_messages[0].properties.text_color == "blue"
+    count = (await async_session.exec(select(func.count()).select_from(MessageTable))).one()
+    assert count == 50
+
+
+@pytest.mark.usefixtures("client")
+async def test_astore_messages_updates_and_inserts(created_message):
+    existing = Message(**created_message.model_dump())
+    existing.text = "Updated message"
+    new = Message(text="Another message", sender="User", sender_name="User", session_id="session_id")
+
+    stored = await astore_messages([existing, new])
+
+    assert [message.text for message in stored] == ["Updated message", "Another message"]
+    messages = await aget_messages(session_id="session_id", order="ASC")
+    assert [message.text for message in messages] == ["Updated message", "Another message"]
+
+
+@pytest.mark.usefixtures("client")
+async def test_astore_messages_keeps_input_order(created_message):
+    first = Message(text="First message", sender="User", sender_name="User", session_id="session_id")
+    existing = Message(**created_message.model_dump())
+    existing.text = "Updated message"
+    last = Message(text="Last message", sender="User", sender_name="User", session_id="session_id")
+
+    stored = await astore_messages([first, existing, last])
+
+    assert [message.text for message in stored] == ["First message", "Updated message", "Last message"]
+    assert stored[1].id == created_message.id
+
+
+@pytest.mark.usefixtures("client")
+async def test_lc_builtin_chat_memory_aadd_messages():
+    memory = LCBuiltinChatMemory(flow_id=str(uuid4()), session_id="lc_session_id")
+
+    await memory.aadd_messages([HumanMessage(content="Hi"), AIMessage(content="Hello")])
+
+    messages = await memory.aget_messages()
+    assert sorted(message.content for message in messages) == ["Hello", "Hi"]
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("client")
+async def test_benchmark_aadd_messagetables_bulk_vs_per_row(async_session):
+    """Compares inserting 1k messages in one batch against adding and refreshing them one by one."""
+    per_row_messages = _message_tables(1000, session_id="per_row")
+    start_time = time.perf_counter()
+    for message in per_row_messages:
+        async_session.add(message)
+    await async_session.commit()
+    for message in per_row_messages:
+        await async_session.refresh(message)
+    per_row_time = time.perf_counter() - start_time
+
+    bulk_messages = _message_tables(1000, session_id="bulk")
+    start_time = time.perf_counter()
+    await aadd_messagetables(bulk_messages, async_session)
+    bulk_time = time.perf_counter() - start_time
+
+    print(f"\nPer row: {per_row_time:.3f}s, bulk: {bulk_time:.3f}s")  # noqa: T201
+    assert bulk_time < per_row_time
@@ -111,3 +111,47 @@ async def test_mcp_post_endpoint_server_error(client: AsyncClient, logged_in_hea
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert "Internal server error" in response.json()["detail"]
+
+
+async def test_read_resource_encodes_streamed_file(client: AsyncClient):  # noqa: ARG001
+    """Test that resources read chunk by chunk encode to the base64 of the whole file."""
+    import base64
+
+    from langflow.api.v1.mcp_utils import RESOURCE_READ_CHUNK_SIZE, handle_read_resource
+    from langflow.services.deps import get_storage_service
+
+    flow_id = str(uuid4())
+    content = bytes(range(256)) * (RESOURCE_READ_CHUNK_SIZE // 100)
+
+    async def chunks():
+        yield content
+
+    await get_storage_service().open_write(flow_id, "data.bin", chunks())
+
+    encoded = await handle_read_resource(f"http://localhost/api/v1/files/{flow_id}/data.bin")
+
+    assert len(content) > 2 * RESOURCE_READ_CHUNK_SIZE
+    assert encoded == base64.b64encode(content)
+
+
+async def test_read_resource_encodes_short_chunks(client: AsyncClient):  # noqa: ARG001
+    """Test that chunks whose size is not a multiple of 3 still encode to the base64 of the whole file."""
+    import base64
+
+    from langflow.api.v1.mcp_utils import handle_read_resource
+    from langflow.services.deps import get_storage_service
+
+    content = bytes(range(256))
+    sizes = [1, 2, 4, 5, 7, 100]
+
+    async def open_read(**kwargs):  # noqa: ARG001
+        start = 0
+        for size in sizes:
+            yield content[start : start + size]
+            start += size
+        yield content[start:]
+
+    with patch.object(get_storage_service(), "open_read", open_read):
+        encoded = await handle_read_resource(f"http://localhost/api/v1/files/{uuid4()}/data.bin")
+
+    assert encoded == base64.b64encode(content)
@@ -1,5 +1,7 @@
 import asyncio
+import io
 import tempfile
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 
@@ -156,6 +158,52 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_file_range(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    content = bytes(range(256)) * 1024
+
+    response = await files_client.post("api/v2/files", files={"file": ("data.bin", content)}, headers=headers)
+    assert response.status_code == 201
+    file_id = response.json()["id"]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(content))
+    assert response.content == content
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=1000-70999"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 1000-70999/{len(content)}"
+    assert response.content == content[1000:71000]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": "bytes=-10"})
+    assert response.status_code == 206
+    assert response.content == content[-10:]
+
+    response = await files_client.get(f"api/v2/files/{file_id}", headers={**headers, "Range": f"bytes={len(content)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(content)}"
+
+
+async def test_download_files_batch(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    contents = {"first.txt": b"first content", "second.bin": bytes(range(256)) * 1024}
+    file_ids = []
+    for name, content in contents.items():
+        response = await files_client.post("api/v2/files", files={"file": (name, content)}, headers=headers)
+        assert response.status_code == 201
+        file_ids.append(response.json()["id"])
+
+    response = await files_client.post("api/v2/files/batch/", json=file_ids, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-zip-compressed"
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.testzip() is None
+        assert {name: archive.read(name) for name in archive.namelist()} == contents
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
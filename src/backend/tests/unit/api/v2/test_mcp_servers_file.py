@@ -22,6 +22,11 @@ class FakeStorageService:  # Minimal stub for storage interactions
     async def save_file(self, flow_id: str, file_name: str, data: bytes):
         self._store[f"{flow_id}/{file_name}"] = data
 
+    async def open_write(self, flow_id: str, file_name: str, chunks):
+        data = b"".join([chunk async for chunk in chunks])
+        self._store[f"{flow_id}/{file_name}"] = data
+        return len(data)
+
     async def get_file_size(self, flow_id: str, file_name: str):
         return len(self._store.get(f"{flow_id}/{file_name}", b""))
 
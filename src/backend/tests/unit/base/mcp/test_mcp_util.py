@@ -6,9 +6,13 @@ This test suite validates the MCP utility functions including:
 - Utility functions for name sanitization and schema conversion
 """
 
+import asyncio
+import json
 import re
 import shutil
 import sys
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -121,6 +125,129 @@ class TestMCPSessionManager:
             assert session1 != session2
             assert mock_create.call_count == 2
 
+    async def test_reused_session_is_not_probed(self, session_manager):
+        """Test that handing out a pooled session does not list its tools first."""
+        mock_task = MagicMock()
+        mock_task.done = MagicMock(return_value=False)
+
+        with (
+            patch.object(session_manager, "_create_stdio_session", return_value=(AsyncMock(), mock_task)),
+            patch.object(session_manager, "_validate_session_connectivity") as mock_validate,
+        ):
+            session1 = await session_manager.get_session("context_1", MagicMock(), "stdio")
+            session2 = await session_manager.get_session("context_2", MagicMock(), "stdio")
+
+        assert session1 is session2
+        mock_validate.assert_not_called()
+        session1.list_tools.assert_not_called()
+
+    async def test_broken_session_is_replaced(self, session_manager):
+        """Test that a session whose call lost the connection is not handed out again."""
+        from anyio import ClosedResourceError
+
+        connection_params = MagicMock()
+        server_key = session_manager._get_server_key(connection_params, "stdio")
+        mock_task = MagicMock()
+        mock_task.done = MagicMock(return_value=False)
+        broken_session, fresh_session = AsyncMock(), AsyncMock()
+
+        with patch.object(
+            session_manager,
+            "_create_stdio_session",
+            side_effect=[(broken_session, mock_task), (fresh_session, mock_task)],
+        ):
+            assert await session_manager.get_session("context", connection_params, "stdio") is broken_session
+            with pytest.raises(ClosedResourceError):
+                async with util._tracked_call(server_key, broken_session):
+                    raise ClosedResourceError
+
+            assert await session_manager.get_session("context", connection_params, "stdio") is fresh_session
+
+        assert len(session_manager.sessions_by_server[server_key]["sessions"]) == 1
+        assert util.get_mcp_server_stats()[server_key]["errors"] >= 1
+
+    async def test_busy_session_opens_another(self, session_manager):
+        """Test that concurrent calls spread over sessions up to the per-server limit."""
+        connection_params = MagicMock()
+        server_key = session_manager._get_server_key(connection_params, "stdio")
+        mock_task = MagicMock()
+        mock_task.done = MagicMock(return_value=False)
+        sessions = [AsyncMock(), AsyncMock(), AsyncMock()]
+
+        with (
+            patch.dict(
+                util._mcp_settings_cache, {"mcp_session_max_concurrent_calls": 1, "mcp_max_sessions_per_server": 2}
+            ),
+            patch.object(
+                session_manager, "_create_stdio_session", side_effect=[(session, mock_task) for session in sessions]
+            ),
+        ):
+            first = await session_manager.get_session("context", connection_params, "stdio")
+            async with util._tracked_call(server_key, first):
+                second = await session_manager.get_session("context", connection_params, "stdio")
+                async with util._tracked_call(server_key, second):
+                    # Both sessions are busy and the limit is reached, so the least busy one is shared
+                    third = await session_manager.get_session("context", connection_params, "stdio")
+                # The second session is idle again and is preferred over the busy first one
+                fourth = await session_manager.get_session("context", connection_params, "stdio")
+
+        assert first is sessions[0]
+        assert second is sessions[1]
+        assert third in sessions[:2]
+        assert fourth is sessions[1]
+        assert util.get_mcp_server_stats()[server_key]["in_flight"] == 0
+
+    async def test_tool_list_is_cached_until_list_changed(self, session_manager):
+        """Test that tool lists are reused per server until the server reports a change."""
+        from mcp.types import ServerNotification, ToolListChangedNotification
+
+        connection_params = MagicMock()
+        server_key = session_manager._get_server_key(connection_params, "stdio")
+        mock_session = AsyncMock()
+        mock_session.list_tools.return_value = MagicMock(tools=["tool"])
+
+        assert await session_manager.list_tools(connection_params, "stdio", mock_session) == ["tool"]
+        assert await session_manager.list_tools(connection_params, "stdio", mock_session) == ["tool"]
+        assert mock_session.list_tools.call_count == 1
+
+        handler = session_manager._tool_list_changed_handler(server_key)
+        await handler(ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed")))
+        await session_manager.list_tools(connection_params, "stdio", mock_session)
+        assert mock_session.list_tools.call_count == 2
+
+        with patch.dict(util._mcp_settings_cache, {"mcp_tool_cache_ttl": 0}):
+            await session_manager.list_tools(connection_params, "stdio", mock_session)
+        assert mock_session.list_tools.call_count == 3
+
+    async def test_heartbeat_drops_unresponsive_sessions(self, session_manager):
+        """Test that idle sessions are pinged and dropped when the ping fails."""
+        healthy, dead = AsyncMock(), AsyncMock()
+        dead.send_ping.side_effect = ConnectionError
+        mock_task = MagicMock()
+        mock_task.done = MagicMock(return_value=False)
+        session_manager.sessions_by_server["server"] = {
+            "sessions": {
+                "healthy": {"session": healthy, "task": mock_task, "type": "stdio", "last_used": 0},
+                "dead": {"session": dead, "task": mock_task, "type": "stdio", "last_used": 0},
+            },
+            "last_cleanup": 0,
+        }
+
+        with patch.dict(util._mcp_settings_cache, {"mcp_session_heartbeat_interval": 1}):
+            await session_manager._heartbeat_sessions()
+
+        healthy.send_ping.assert_awaited_once()
+        assert list(session_manager.sessions_by_server["server"]["sessions"]) == ["healthy"]
+
+    def test_args_schema_is_reused_for_identical_input_schemas(self):
+        """Test that tools with the same input schema share one generated argument model."""
+        input_schema = {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
+
+        args_schema = util.get_args_schema(input_schema)
+
+        assert util.get_args_schema(json.loads(json.dumps(input_schema))) is args_schema
+        assert "query" in args_schema.model_fields
+
 
 class TestHeaderValidation:
     """Test the header validation functionality."""
@@ -529,7 +656,7 @@ class TestToolExecutionWithFieldConversion:
 
     def test_create_tool_func_with_camel_case_fields(self):
         """Test that create_tool_func handles camelCase field conversion."""
-        from unittest.mock import AsyncMock, MagicMock
+        from unittest.mock import AsyncMock
 
         from pydantic import Field, create_model
 
@@ -547,17 +674,12 @@ class TestToolExecutionWithFieldConversion:
         # Create tool function
         tool_func = util.create_tool_func("test_tool", test_schema, mock_client)
 
-        # Mock the event loop
-        mock_loop = MagicMock()
-        mock_loop.run_until_complete = MagicMock(return_value="tool_result")
-
-        with patch("asyncio.get_event_loop", return_value=mock_loop):
-            # Test with camelCase arguments
-            result = tool_func(weatherMain="Snow", topN=6)
+        # Test with camelCase arguments
+        result = tool_func(weatherMain="Snow", topN=6)
 
-            assert result == "tool_result"
-            # Verify that run_until_complete was called
-            mock_loop.run_until_complete.assert_called_once()
+        assert result == "tool_result"
+        # Verify that the converted arguments reached the client
+        mock_client.run_tool.assert_awaited_once_with("test_tool", arguments={"weather_main": "Snow", "top_n": 6})
 
     @pytest.mark.asyncio
     async def test_tool_coroutine_field_conversion_end_to_end(self):
@@ -669,7 +791,7 @@ class TestToolExecutionWithFieldConversion:
 
     def test_tool_func_field_conversion_sync(self):
         """Test that create_tool_func handles field conversion in sync context."""
-        from unittest.mock import AsyncMock, MagicMock
+        from unittest.mock import AsyncMock
 
         from pydantic import Field, create_model
 
@@ -686,16 +808,13 @@ class TestToolExecutionWithFieldConversion:
         # Create tool function
         tool_func = util.create_tool_func("test_tool", test_schema, mock_client)
 
-        # Mock asyncio.get_event_loop
-        mock_loop = MagicMock()
-        mock_loop.run_until_complete = MagicMock(return_value="sync_result")
+        # Test with camelCase fields
+        result = tool_func(userName="testuser", maxResults=10)
 
-        with patch("asyncio.get_event_loop", return_value=mock_loop):
-            # Test with camelCase fields
-            result = tool_func(userName="testuser", maxResults=10)
-
-            assert result == "sync_result"
-            mock_loop.run_until_complete.assert_called_once()
+        assert result == "sync_result"
+        mock_client.run_tool.assert_awaited_once_with(
+            "test_tool", arguments={"user_name": "testuser", "max_results": 10}
+        )
 
 
 class TestMCPUtilityFunctions:
@@ -1226,6 +1345,134 @@ class TestMCPSseClientUnit:
             mock_manager._cleanup_session.assert_called_once_with("test_context")
 
 
+STUB_SERVER = """
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+
+server = FastMCP("stub", log_level="WARNING")
+
+
+@server.tool()
+async def slow_echo(text: str) -> str:
+    await asyncio.sleep(0.2)
+    return text
+
+
+server.run()
+"""
+
+
+class TestMCPSyncBridge:
+    """Test synchronous MCP tool calls made through the sync bridge."""
+
+    @pytest.fixture
+    def arg_schema(self):
+        from pydantic import create_model
+
+        return create_model("EchoSchema", text=(str, ...))
+
+    async def test_sync_tool_runs_inside_a_running_loop(self, arg_schema):
+        """Test that the sync entry point works from the thread of a running event loop."""
+        client = AsyncMock()
+        client._loop = asyncio.get_running_loop()
+        client.run_tool = AsyncMock(return_value="echo")
+
+        tool_func = util.create_tool_func("echo", arg_schema, client)
+
+        assert tool_func(text="hi") == "echo"
+        client.run_tool.assert_awaited_once_with("echo", arguments={"text": "hi"})
+
+    async def test_sync_tool_from_worker_thread_uses_owner_loop(self, arg_schema):
+        """Test that calls from executor threads run on the loop that owns the client's sessions."""
+        owner_loop = asyncio.get_running_loop()
+        loops = []
+
+        async def run_tool(tool_name, arguments):  # noqa: ARG001
+            loops.append(asyncio.get_running_loop())
+            return arguments["text"]
+
+        client = MagicMock()
+        client._loop = owner_loop
+        client.run_tool = run_tool
+
+        tool_func = util.create_tool_func("echo", arg_schema, client)
+        results = await asyncio.gather(*(asyncio.to_thread(tool_func, text=str(i)) for i in range(4)))
+
+        assert results == ["0", "1", "2", "3"]
+        assert loops == [owner_loop] * 4
+
+    def test_bridge_times_out_and_bounds_pending_calls(self):
+        """Test that slow calls time out and that callers wait for a free slot."""
+        bridge = util.MCPSyncBridge(max_pending=1)
+        try:
+            with pytest.raises(TimeoutError, match="did not finish"):
+                bridge.run(asyncio.sleep(1), timeout=0.05)
+
+            blocker = threading.Thread(target=bridge.run, args=(asyncio.sleep(0.5),), kwargs={"timeout": 1})
+            blocker.start()
+            time.sleep(0.1)
+            with pytest.raises(TimeoutError, match="No slot"):
+                bridge.run(asyncio.sleep(0), timeout=0.05)
+            blocker.join()
+
+            assert bridge.run(asyncio.sleep(0, result="done"), timeout=1) == "done"
+        finally:
+            bridge.shutdown()
+
+    async def test_bridge_loop_has_its_own_session_manager(self):
+        """Test that calls on the bridge loop never share the session manager of the serving loop."""
+        bridge = util.get_mcp_sync_bridge()
+        client = MCPStdioClient()
+
+        async def get_session_manager():
+            return client._get_session_manager()
+
+        serving_manager = client._get_session_manager()
+        bridge_manager = await asyncio.to_thread(bridge.run, get_session_manager(), timeout=1)
+
+        assert bridge_manager is not serving_manager
+        assert await asyncio.to_thread(bridge.run, get_session_manager(), timeout=1) is bridge_manager
+        assert bridge.get_session_manager() is None
+
+    @pytest.mark.benchmark
+    async def test_benchmark_concurrent_sync_calls_against_stub_server(self, tmp_path):
+        """Concurrent sync tool calls to a local stub server neither serialize nor stall the event loop."""
+        server_path = tmp_path / "stub_server.py"
+        server_path.write_text(STUB_SERVER)
+        client = MCPStdioClient()
+        _, tools, _ = await util.update_tools(
+            "stub", {"command": sys.executable, "args": [str(server_path)]}, mcp_stdio_client=client
+        )
+        tool = tools[0]
+
+        max_lag = 0.0
+        running = True
+
+        async def measure_lag():
+            nonlocal max_lag
+            while running:
+                start_time = time.perf_counter()
+                await asyncio.sleep(0.01)
+                max_lag = max(max_lag, time.perf_counter() - start_time - 0.01)
+
+        lag_task = asyncio.create_task(measure_lag())
+        try:
+            calls = 8
+            start_time = time.perf_counter()
+            results = await asyncio.gather(*(asyncio.to_thread(tool.run, {"text": str(i)}) for i in range(calls)))
+            elapsed = time.perf_counter() - start_time
+        finally:
+            running = False
+            await lag_task
+            await client.disconnect()
+
+        print(f"\n{calls} concurrent sync calls of 200ms: {elapsed * 1000:.0f}ms, max loop lag {max_lag * 1000:.1f}ms")  # noqa: T201
+        assert [result.content[0].text for result in results] == [str(i) for i in range(calls)]
+        assert elapsed < calls * 0.2
+        assert max_lag < 0.1
+
+
 class TestMCPStructuredTool:
     """Test the MCPStructuredTool inner methods."""
 
@@ -1253,71 +1500,7 @@ class TestMCPStructuredTool:
     @pytest.fixture
     def mcp_tool(self, test_schema, mock_client):
         """Create an MCPStructuredTool instance for testing."""
-        import json
-
-        # Import the MCPStructuredTool class from the actual code
-        # We need to recreate it here since it's defined inline in the update_tools function
-        from langchain_core.tools import StructuredTool
-        from lfx.base.mcp.util import create_tool_coroutine, create_tool_func
-
-        class MCPStructuredTool(StructuredTool):
-            def run(self, tool_input: str | dict, config=None, **kwargs):
-                """Override the main run method to handle parameter conversion before validation."""
-                # Parse tool_input if it's a string
-                if isinstance(tool_input, str):
-                    try:
-                        parsed_input = json.loads(tool_input)
-                    except json.JSONDecodeError:
-                        parsed_input = {"input": tool_input}
-                else:
-                    parsed_input = tool_input or {}
-
-                # Convert camelCase parameters to snake_case
-                converted_input = self._convert_parameters(parsed_input)
-
-                # Call the parent run method with converted parameters
-                return super().run(converted_input, config=config, **kwargs)
-
-            async def arun(self, tool_input: str | dict, config=None, **kwargs):
-                """Override the main arun method to handle parameter conversion before validation."""
-                # Parse tool_input if it's a string
-                if isinstance(tool_input, str):
-                    try:
-                        parsed_input = json.loads(tool_input)
-                    except json.JSONDecodeError:
-                        parsed_input = {"input": tool_input}
-                else:
-                    parsed_input = tool_input or {}
-
-                # Convert camelCase parameters to snake_case
-                converted_input = self._convert_parameters(parsed_input)
-
-                # Call the parent arun method with converted parameters
-                return await super().arun(converted_input, config=config, **kwargs)
-
-            def _convert_parameters(self, input_dict):
-                if not input_dict or not isinstance(input_dict, dict):
-                    return input_dict
-
-                from lfx.base.mcp.util import _camel_to_snake
-
-                converted_dict = {}
-                original_fields = set(self.args_schema.model_fields.keys())
-
-                for key, value in input_dict.items():
-                    if key in original_fields:
-                        # Field exists as-is
-                        converted_dict[key] = value
-                    else:
-                        # Try to convert camelCase to snake_case
-                        snake_key = _camel_to_snake(key)
-                        if snake_key in original_fields:
-                            converted_dict[snake_key] = value
-                        else:
-                            # Keep original key
-                            converted_dict[key] = value
-
-                return converted_dict
+        from lfx.base.mcp.util import MCPStructuredTool, create_tool_coroutine, create_tool_func
 
         return MCPStructuredTool(
             name="test_tool",
@@ -1,4 +1,3 @@
-import json
 from unittest.mock import MagicMock, patch
 
 from langflow.io import Output
@@ -114,13 +113,13 @@ class TestFileComponentDynamicOutputs:
         assert result["advanced_mode"]["show"] is False
         assert result["advanced_mode"]["value"] is False
 
-    @patch("subprocess.run")
-    def test_process_docling_subprocess_success(self, mock_subprocess):
-        """Test successful Docling subprocess execution."""
+    @patch("lfx.components.data.file.DoclingWorkerPool.shared")
+    def test_process_docling_subprocess_success(self, mock_shared_pool):
+        """Test successful Docling worker execution."""
         component = FileComponent()
         component.markdown = False
 
-        # Mock successful subprocess response
+        # Mock successful worker response
         mock_result = {
             "ok": True,
             "mode": "structured",
@@ -129,14 +128,39 @@ class TestFileComponentDynamicOutputs:
                 {"page_no": 1, "label": "paragraph", "text": "Content here", "level": 0},
             ],
             "meta": {"file_path": "test.pdf"},
+            "timings": {"convert_seconds": 0.5, "total_seconds": 0.6},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_shared_pool.return_value = MagicMock(max_workers=1, map=MagicMock(return_value=[mock_result]))
 
         result = component._process_docling_in_subprocess("test.pdf")
 
         assert result is not None
         assert result.data["doc"] == mock_result["doc"]
         assert result.data["file_path"] == "test.pdf"
+        assert "timings" not in result.data
+
+    @patch("lfx.components.data.file.DoclingWorkerPool.shared")
+    def test_process_docling_files_in_order_on_shared_pool(self, mock_shared_pool):
+        """Test files are converted on one shared pool sized by the concurrency input."""
+        component = FileComponent(concurrency_multithreading=3, docling_worker_max_documents=7)
+        component.markdown = True
+        paths = ["a.pdf", "b;rm.pdf", "c.pdf"]
+
+        def fake_map(requests):
+            return [
+                {"ok": True, "mode": "markdown", "text": path, "meta": {"file_path": path}}
+                for path in (request["file_path"] for request in requests)
+            ]
+
+        mock_shared_pool.return_value = MagicMock(max_workers=3, map=MagicMock(side_effect=fake_map))
+
+        results = component._process_docling_files(paths)
+
+        mock_shared_pool.assert_called_once_with(max_workers=3, max_documents_per_worker=7)
+        assert [request["file_path"] for request in mock_shared_pool.return_value.map.call_args.args[0]] == [
+            "a.pdf",
+            "c.pdf",
+        ]
+        assert results[0].text == "a.pdf"
+        assert results[1].data["error"] == "Unsafe file path detected."
+        assert results[2].text == "c.pdf"
@@ -1,8 +1,9 @@
 import re
 
 import pytest
-from lfx.components.processing.batch_run import BatchRunComponent
+from lfx.components.processing.batch_run import BatchRunComponent, is_transient_error
 from lfx.schema import DataFrame
+from lfx.services.shared_component_cache.service import SharedComponentCacheService
 
 from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
@@ -102,7 +103,7 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             def with_config(self, *_, **__):
                 return self
 
-            async def abatch(self, *_):
+            async def abatch(self, *_, **__):
                 msg = "Mock error during batch processing"
                 raise AttributeError(msg)
 
@@ -131,7 +132,7 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             def with_config(self, *_, **__):
                 return self
 
-            async def abatch(self, *_):
+            async def abatch(self, *_, **__):
                 msg = "Mock error during batch processing"
                 raise AttributeError(msg)
 
@@ -256,3 +257,121 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_chunked_run_with_concurrency_limit(self):
+        calls = []
+
+        class RecordingModel:
+            def with_config(self, *_, **__):
+                return self
+
+            async def abatch(self, inputs, config=None, **__):
+                calls.append((len(inputs), config))
+                return [f"Response for {conversation[-1]['content']}" for conversation in inputs]
+
+        component = BatchRunComponent(
+            model=RecordingModel(),
+            df=DataFrame({"text": [f"row {i}" for i in range(5)]}),
+            column_name="text",
+            chunk_size=2,
+            max_concurrency=3,
+        )
+
+        result = await component.run_batch()
+
+        assert calls == [(2, {"max_concurrency": 3}), (2, {"max_concurrency": 3}), (1, {"max_concurrency": 3})]
+        assert result["model_response"].tolist() == [f"Response for row {i}" for i in range(5)]
+        assert result["batch_index"].tolist() == list(range(5))
+
+    async def test_failed_rows_are_retried_and_captured(self):
+        attempts: dict[str, int] = {}
+
+        class FlakyModel:
+            def with_config(self, *_, **__):
+                return self
+
+            async def abatch(self, inputs, *_, return_exceptions=False, **__):
+                assert return_exceptions
+                responses = []
+                for conversation in inputs:
+                    text = conversation[-1]["content"]
+                    attempts[text] = attempts.get(text, 0) + 1
+                    if text == "always" or (text == "flaky" and attempts[text] == 1):
+                        responses.append(TimeoutError(f"failed {text}"))
+                    elif text == "invalid":
+                        responses.append(ValueError(f"failed {text}"))
+                    else:
+                        responses.append(f"ok {text}")
+                return responses
+
+        component = BatchRunComponent(
+            model=FlakyModel(),
+            df=DataFrame({"text": ["fine", "flaky", "always", "invalid"]}),
+            column_name="text",
+            enable_metadata=True,
+            max_retries=2,
+        )
+        component.retry_base_delay = 0
+
+        result = await component.run_batch()
+
+        # Only the transient errors are retried
+        assert attempts == {"fine": 1, "flaky": 2, "always": 3, "invalid": 1}
+        result_dicts = result.to_dict("records")
+        assert [row["model_response"] for row in result_dicts] == ["ok fine", "ok flaky", "", ""]
+        assert result_dicts[1]["metadata"]["processing_status"] == "success"
+        assert result_dicts[2]["metadata"]["processing_status"] == "failed"
+        assert result_dicts[2]["metadata"]["error"] == "failed always"
+        assert result_dicts[3]["metadata"]["error"] == "failed invalid"
+
+    def test_transient_errors(self):
+        class RateLimitError(Exception):
+            pass
+
+        class APIStatusError(Exception):
+            def __init__(self, status_code: int):
+                super().__init__(status_code)
+                self.status_code = status_code
+
+        assert is_transient_error(TimeoutError())
+        assert is_transient_error(ConnectionResetError())
+        assert is_transient_error(RateLimitError())
+        assert is_transient_error(APIStatusError(503))
+        assert not is_transient_error(APIStatusError(400))
+        assert not is_transient_error(ValueError())
+        assert not is_transient_error(TypeError())
+
+    async def test_resume_skips_completed_chunks(self):
+        sent: list[str] = []
+
+        class InterruptedModel:
+            fail_on = "row 2"
+
+            def with_config(self, *_, **__):
+                return self
+
+            async def abatch(self, inputs, *_, **__):
+                texts = [conversation[-1]["content"] for conversation in inputs]
+                if self.fail_on in texts:
+                    msg = "connection lost"
+                    raise ConnectionError(msg)
+                sent.extend(texts)
+                return [f"ok {text}" for text in texts]
+
+        model = InterruptedModel()
+        shared_cache = SharedComponentCacheService()
+        df = DataFrame({"text": [f"row {i}" for i in range(4)]})
+        component = BatchRunComponent(model=model, df=df, column_name="text", chunk_size=2)
+        component._shared_component_cache = shared_cache
+
+        with pytest.raises(ConnectionError):
+            await component.run_batch()
+        assert sent == ["row 0", "row 1"]
+
+        model.fail_on = ""
+        resumed = BatchRunComponent(model=model, df=df, column_name="text", chunk_size=2)
+        resumed._shared_component_cache = shared_cache
+        result = await resumed.run_batch()
+
+        assert sent == ["row 0", "row 1", "row 2", "row 3"]
+        assert result["model_response"].tolist() == [f"ok row {i}" for i in range(4)]
@@ -435,3 +435,26 @@ class TestComponentLoadingFix:
             # Verify we got real langflow components
             assert isinstance(result, dict)
             assert len(result) >= 0  # Should not have langflow components
+
+    @pytest.mark.asyncio
+    async def test_whitelist_filter_is_applied_once_per_version(self, mock_settings_service, mock_langflow_components):
+        """Test that the whitelist is only re-applied when the cache is rebuilt or the whitelist changes."""
+        mock_settings_service.settings.components_path = []
+
+        with (
+            patch("lfx.interface.components.import_langflow_components", return_value=mock_langflow_components),
+            patch("lfx.core.whitelist.COMPONENT_WHITELIST", {"Component1"}) as whitelist,
+        ):
+            result = await get_and_cache_all_types_dict(mock_settings_service)
+            version = component_cache.version
+            assert result == {"category1": {"Component1": {"display_name": "Component1", "type": "category1"}}}
+
+            # Unchanged cache and whitelist, the filtered dict is reused
+            assert await get_and_cache_all_types_dict(mock_settings_service) is result
+            assert component_cache.version == version
+
+            # Components added to the whitelist are restored from the unfiltered dict
+            whitelist.add("Component3")
+            result = await get_and_cache_all_types_dict(mock_settings_service)
+            assert component_cache.version > version
+            assert set(result) == {"category1", "category2"}
@@ -4,10 +4,32 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from langflow.api.v1.schemas import ResultDataResponse, VertexBuildResponse
+from langflow.events.event_manager import EventManager, RawJSON
 from lfx.schema.log import LoggableType
 
 
+class ListQueue:
+    def __init__(self):
+        self.items = []
+
+    def put_nowait(self, item):
+        self.items.append(item)
+
+
+def _large_vertex_build_response(documents: int = 300) -> VertexBuildResponse:
+    results = {
+        f"document_{i}": {"text": "lorem ipsum " * 500, "metadata": {"page": i, "source": "file.pdf"}}
+        for i in range(documents)
+    }
+    return VertexBuildResponse(
+        id="vertex",
+        valid=True,
+        next_vertices_ids=[],
+        data=ResultDataResponse(results=results, outputs={}, logs={}, message={}, artifacts={}),
+    )
+
+
 class TestEventManager:
     # Registering an event with a valid name and callback using a mock callback function
     def test_register_event_with_valid_name_and_callback_with_mock_callback(self):
@@ -210,3 +232,52 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+class TestPreSerializedEvents:
+    def test_raw_json_payload_matches_encoded_payload(self):
+        queue = ListQueue()
+        event_manager = EventManager(queue)
+        response = _large_vertex_build_response(documents=3)
+
+        event_manager.send_event(event_type="end_vertex", data={"build_data": json.loads(response.model_dump_json())})
+        event_manager.send_event(event_type="end_vertex", data={"build_data": RawJSON.from_model(response)})
+
+        encoded, spliced = (json.loads(item[1]) for item in queue.items)
+        assert spliced == encoded
+        assert spliced["event"] == "end_vertex"
+        assert queue.items[1][1].endswith(b"}\n\n")
+
+    def test_top_level_raw_json_payload(self):
+        queue = ListQueue()
+        event_manager = EventManager(queue)
+
+        event_manager.send_event(event_type="test_type", data=RawJSON('{"key": "value"}'))
+
+        assert queue.items[0][1] == b'{"event": "test_type", "data": {"key": "value"}}\n\n'
+
+    @pytest.mark.benchmark
+    def test_benchmark_large_result_data_response(self):
+        """Compares emitting a large end_vertex event via a dict round trip and via RawJSON."""
+        response = _large_vertex_build_response()
+        iterations = 5
+
+        queue = ListQueue()
+        event_manager = EventManager(queue)
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            build_data = json.loads(response.model_dump_json())
+            event_manager.send_event(event_type="end_vertex", data={"build_data": build_data})
+        round_trip_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            event_manager.send_event(event_type="end_vertex", data={"build_data": RawJSON.from_model(response)})
+        raw_json_time = time.perf_counter() - start_time
+
+        print(  # noqa: T201
+            f"\nPayload: {len(queue.items[-1][1]) / 1024:.0f} KiB, "
+            f"round trip: {round_trip_time:.3f}s, pre-serialized: {raw_json_time:.3f}s"
+        )
+        assert json.loads(queue.items[0][1]) == json.loads(queue.items[-1][1])
+        assert raw_json_time < round_trip_time
@@ -0,0 +1,143 @@
+"""Tests for the materialized catalog of MCP tools."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from langflow.api.v1.mcp_utils import handle_list_tools
+from langflow.helpers import mcp_tool_catalog
+from langflow.helpers.mcp_tool_catalog import (
+    ToolListSubscribers,
+    ToolSchemaCache,
+    get_tool_list_subscribers,
+    get_tool_schema_cache,
+    invalidate_flow_tools,
+)
+from langflow.services.database.models.flow import Flow
+from langflow.services.database.models.folder import Folder
+from langflow.services.deps import session_scope
+
+
+class FakeSession:
+    def __init__(self, *, fail: bool = False):
+        self.fail = fail
+        self.notifications = 0
+
+    async def send_tool_list_changed(self):
+        if self.fail:
+            raise ConnectionError
+        self.notifications += 1
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog():
+    get_tool_schema_cache().clear()
+    get_tool_list_subscribers().clear()
+    yield
+    get_tool_schema_cache().clear()
+    get_tool_list_subscribers().clear()
+
+
+@pytest.fixture
+async def mcp_project(client, active_user, json_memory_chatbot_no_llm):  # noqa: ARG001
+    project = Folder(id=uuid4(), name="MCP Catalog Project", user_id=active_user.id)
+    flow = Flow(
+        id=uuid4(),
+        name="Catalog Flow",
+        data=json.loads(json_memory_chatbot_no_llm)["data"],
+        mcp_enabled=True,
+        folder_id=project.id,
+        user_id=active_user.id,
+    )
+    async with session_scope() as session:
+        session.add(project)
+        session.add(flow)
+    yield project, flow
+    async with session_scope() as session:
+        await session.delete(await session.get(Flow, flow.id))
+        await session.delete(await session.get(Folder, project.id))
+
+
+def test_schema_cache_is_keyed_by_flow_version():
+    cache = ToolSchemaCache()
+    flow_id = uuid4()
+    cache.set(flow_id, "v1", {"type": "object"})
+
+    assert cache.get(str(flow_id), "v1") == {"type": "object"}
+    assert cache.get(flow_id, "v2") is None
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 1
+
+    assert cache.invalidate_flow(flow_id)
+    assert cache.get(flow_id, "v1") is None
+    assert len(cache) == 0
+
+
+async def test_list_tools_computes_each_schema_once(mcp_project):
+    project, flow = mcp_project
+
+    with patch.object(
+        mcp_tool_catalog, "json_schema_from_flow_data", wraps=mcp_tool_catalog.json_schema_from_flow_data
+    ) as compute:
+        first = await handle_list_tools(project_id=project.id, mcp_enabled_only=True)
+        second = await handle_list_tools(project_id=project.id, mcp_enabled_only=True)
+
+        assert compute.call_count == 1
+        assert [tool.inputSchema for tool in first] == [tool.inputSchema for tool in second]
+        assert "input_value" in first[0].inputSchema["properties"]
+
+        # Saving the flow only drops the schema, the next listing computes it again
+        async with session_scope() as session:
+            db_flow = await session.get(Flow, flow.id)
+            db_flow.name = "Renamed Flow"
+            db_flow.updated_at = datetime.now(timezone.utc)
+            session.add(db_flow)
+            await session.commit()
+            invalidate_flow_tools(db_flow.id, project.id)
+        assert compute.call_count == 1
+        await handle_list_tools(project_id=project.id, mcp_enabled_only=True)
+        await handle_list_tools(project_id=project.id, mcp_enabled_only=True)
+        assert compute.call_count == 2
+
+
+async def test_update_flow_notifies_subscribed_sessions(client, mcp_project, logged_in_headers):
+    project, flow = mcp_project
+    project_session, other_session, global_session = FakeSession(), FakeSession(), FakeSession()
+    subscribers = get_tool_list_subscribers()
+    subscribers.add(project.id, project_session)
+    subscribers.add(uuid4(), other_session)
+    subscribers.add(None, global_session)
+
+    response = await client.patch(
+        f"api/v1/flows/{flow.id}", json={"description": "new description"}, headers=logged_in_headers
+    )
+    assert response.status_code == 200
+    await asyncio.sleep(0)
+
+    assert project_session.notifications == 1
+    assert global_session.notifications == 1
+    assert other_session.notifications == 0
+    assert get_tool_schema_cache().get(flow.id, mcp_tool_catalog.flow_version(flow.updated_at)) is None
+
+
+async def test_sessions_that_fail_are_dropped():
+    subscribers = ToolListSubscribers()
+    project_id = uuid4()
+    alive, gone = FakeSession(), FakeSession(fail=True)
+    subscribers.add(project_id, alive)
+    subscribers.add(project_id, gone)
+
+    assert await subscribers.notify([project_id]) == 1
+    assert await subscribers.notify([str(project_id)]) == 1
+    assert alive.notifications == 2
+
+
+async def test_invalidation_without_subscribers_schedules_nothing():
+    get_tool_schema_cache().set("flow", "v1", {})
+
+    invalidate_flow_tools("flow", uuid4())
+
+    assert get_tool_schema_cache().get("flow", "v1") is None
+    assert not get_tool_list_subscribers()._tasks
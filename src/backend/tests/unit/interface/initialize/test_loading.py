@@ -1,8 +1,12 @@
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from lfx.interface.initialize.loading import (
+    collect_load_from_db_variable_names,
+    prefetch_load_from_db_variables,
     update_params_with_load_from_db_fields,
     update_table_params_with_load_from_db_fields,
 )
@@ -523,3 +527,64 @@ async def test_update_table_params_handles_user_id_not_set_error():
             await update_table_params_with_load_from_db_fields(
                 custom_component, params, "table_data", fallback_to_env_vars=True
             )
+
+
+def _vertex(params, load_from_db_fields):
+    return SimpleNamespace(params=params, load_from_db_fields=load_from_db_fields)
+
+
+def test_collect_load_from_db_variable_names():
+    """Test that field and table column variable names are collected across vertices."""
+    vertices = [
+        _vertex({"api_key": "OPENAI_API_KEY", "empty": ""}, ["api_key", "empty"]),
+        _vertex(
+            {
+                "headers": [{"key": "auth", "value": "AUTH_TOKEN"}, {"key": "other", "value": "OPENAI_API_KEY"}],
+                "headers_load_from_db_columns": ["value"],
+            },
+            ["table:headers"],
+        ),
+    ]
+
+    assert collect_load_from_db_variable_names(vertices) == {"OPENAI_API_KEY", "AUTH_TOKEN"}
+
+
+@pytest.mark.asyncio
+async def test_prefetch_load_from_db_variables_fetches_once():
+    """Test that all variables of a run are prefetched in a single call, skipping request overrides."""
+    user_id = uuid4()
+    variable_service = MagicMock()
+    variable_service.prefetch_variables = AsyncMock()
+    vertices = [
+        _vertex({"api_key": "OPENAI_API_KEY"}, ["api_key"]),
+        _vertex({"token": "AUTH_TOKEN"}, ["token"]),
+        _vertex({"other": "OVERRIDDEN"}, ["other"]),
+    ]
+
+    with (
+        patch("lfx.interface.initialize.loading.get_variable_service", return_value=variable_service),
+        patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope,
+    ):
+        session = MagicMock()
+        mock_session_scope.return_value.__aenter__.return_value = session
+        await prefetch_load_from_db_variables(vertices, str(user_id), request_variables={"OVERRIDDEN": "value"})
+
+    variable_service.prefetch_variables.assert_awaited_once_with(
+        user_id=user_id, names={"OPENAI_API_KEY", "AUTH_TOKEN"}, session=session
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_load_from_db_variables_ignores_errors():
+    """Test that a failing prefetch does not fail the run."""
+    variable_service = MagicMock()
+    variable_service.prefetch_variables = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with (
+        patch("lfx.interface.initialize.loading.get_variable_service", return_value=variable_service),
+        patch("lfx.interface.initialize.loading.session_scope") as mock_session_scope,
+    ):
+        mock_session_scope.return_value.__aenter__.return_value = MagicMock()
+        await prefetch_load_from_db_variables([_vertex({"api_key": "KEY"}, ["api_key"])], uuid4())
+
+    variable_service.prefetch_variables.assert_awaited_once()
@@ -344,3 +344,60 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+    def test_serializer_is_resolved_once_per_type(self) -> None:
+        """Test that the serializer of a type is memoized and matches the per-instance checks."""
+        from langflow.serialization import serialization
+
+        serialization._serializer_cache.clear()
+        model = ModernModel(name="model", value=1)
+        assert serialize(model) == serialization._serialize_by_match(model, None, None)
+        assert serialization._serializer_cache[ModernModel] is serialization._serialize_pydantic
+        assert serialize([1, "a", None, 2.5, True]) == [1, "a", None, 2.5, True]
+        assert serialize({"a": "x" * 10}, max_length=5) == {"a": "xxxxx..."}
+
+        # Classes depend on their attributes and are never memoized
+        assert serialize(ModernModel) == repr(ModernModel)
+        assert ModernModel.__class__ not in serialization._serializer_cache
+
+    def test_proxy_objects_are_not_memoized(self) -> None:
+        """Test that objects reporting another class are serialized by their reported class."""
+        from unittest.mock import MagicMock
+
+        from langflow.serialization import serialization
+
+        mock_model = MagicMock(spec=ModernModel)
+        mock_model.model_dump.return_value = {"name": "model", "value": 1}
+
+        assert serialize(mock_model) == {"name": "model", "value": 1}
+        assert type(mock_model) not in serialization._serializer_cache
+
+    def test_dataframe_columns_are_serialized_like_records(self) -> None:
+        """Test that the columnar path matches serializing the records of the frame."""
+        from langflow.serialization.serialization import _serialize_by_match
+
+        test_df = pd.DataFrame(
+            {
+                "int": [1, 2, 3],
+                "float": [1.5, 2.5, 3.5],
+                "text": ["short", "x" * 50, None],
+                "when": pd.to_datetime(
+                    ["2024-01-01", "1969-12-31 23:59:59.5", "2024-03-04 05:06:07.123456789"], format="ISO8601"
+                ),
+                "zoned": pd.to_datetime(
+                    ["2024-01-01", None, "2024-01-02 00:00:00.000001"], format="ISO8601"
+                ).tz_localize("Europe/Paris"),
+                "nullable": pd.array([1, None, 3], dtype="Int64"),
+                "object": [{"a": "y" * 50}, [1, 2], np.int64(3)],
+            }
+        )
+
+        result = serialize(test_df, max_length=10, max_items=2)
+
+        records = test_df.head(2).to_dict(orient="records")
+        assert result == _serialize_by_match(records, 10, 2)
+        assert result[0]["when"] == "2024-01-01T00:00:00+00:00"
+        assert result[1]["when"] == "1969-12-31T23:59:59.500000+00:00"
+        assert result[1]["text"] == "xxxxxxxxxx..."
+        assert result[1]["zoned"] == "NaT"
+        assert result[1]["nullable"] is None
@@ -0,0 +1,72 @@
+"""Throughput of serialize over representative output, log and event payloads."""
+
+import time
+
+import pandas as pd
+import pytest
+from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from langflow.serialization.serialization import serialize
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.message import Message
+
+ROWS = 100
+
+
+def _message():
+    return Message(text="Hello " * 50, sender="User", sender_name="User", session_id="session")
+
+
+def _data_list():
+    return [Data(data={"text": f"row {i}", "score": i * 0.5, "tags": ["a", "b"]}) for i in range(ROWS)]
+
+
+def _dataframe():
+    return DataFrame(
+        {"id": range(ROWS), "text": [f"row {i}" for i in range(ROWS)], "score": [i * 0.1 for i in range(ROWS)]}
+    )
+
+
+def _nested_dict():
+    return {
+        "results": [
+            {"id": i, "name": f"item {i}", "values": list(range(20)), "meta": {"ok": True, "score": 1.5}}
+            for i in range(ROWS)
+        ]
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("make_payload", [_message, _data_list, _dataframe, _nested_dict])
+def test_benchmark_serialize_throughput(make_payload):
+    payload = make_payload()
+    iterations = 200
+
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        result = serialize(payload, MAX_TEXT_LENGTH, MAX_ITEMS_LENGTH)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"\nserialize {make_payload.__name__.lstrip('_')}: {iterations / elapsed:.0f} payloads/s")  # noqa: T201
+    assert result
+
+
+@pytest.mark.benchmark
+def test_benchmark_serialize_large_dataframe():
+    rows = 100_000
+    payload = DataFrame(
+        {
+            "id": range(rows),
+            "score": [i * 0.1 for i in range(rows)],
+            "text": [f"row {i} " * (i % 50) for i in range(rows)],
+            "created_at": pd.date_range("2024-01-01", periods=rows, freq="s"),
+            "meta": [{"row": i} for i in range(rows)],
+        }
+    )
+
+    start_time = time.perf_counter()
+    result = serialize(payload, MAX_TEXT_LENGTH, None)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"\nserialize 100k-row DataFrame: {rows / elapsed:.0f} rows/s")  # noqa: T201
+    assert len(result) == rows
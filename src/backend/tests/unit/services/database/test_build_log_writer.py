@@ -0,0 +1,191 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.build_log_writer import BuildLogWriter
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class SessionDatabaseService:
+    """Minimal database service handing out the test session."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @asynccontextmanager
+    async def with_session(self):
+        yield self.session
+
+
+@pytest.fixture
+def mock_settings():
+    return SimpleNamespace(max_vertex_builds_to_keep=5, max_vertex_builds_per_vertex=2, max_transactions_to_keep=3)
+
+
+def _vertex_build(flow_id, vertex_id, offset_seconds=0):
+    return VertexBuildBase(
+        id=vertex_id,
+        flow_id=flow_id,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=offset_seconds),
+        artifacts={},
+        valid=True,
+    )
+
+
+async def _count(session: AsyncSession, table) -> int:
+    return (await session.execute(select(func.count()).select_from(table))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_rows_are_buffered_until_flush(async_session: AsyncSession):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), flush_interval=60)
+    flow_id = uuid4()
+
+    assert writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex"))
+    assert writer.enqueue_transaction({"vertex_id": "vertex", "status": "success", "flow_id": flow_id})
+    assert writer.queue_depth == 2
+    assert await _count(async_session, VertexBuildTable) == 0
+
+    await writer.stop()
+
+    assert writer.queue_depth == 0
+    assert await _count(async_session, VertexBuildTable) == 1
+    assert await _count(async_session, TransactionTable) == 1
+    assert writer.get_stats()["written_rows"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_flush(async_session: AsyncSession):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), batch_size=3, flush_interval=60)
+    flow_id = uuid4()
+
+    for i in range(3):
+        writer.enqueue_vertex_build(_vertex_build(flow_id, f"vertex-{i}"))
+    # Let the background task pick up the flush signal
+    for _ in range(20):
+        if writer.flushes:
+            break
+        await asyncio.sleep(0.05)
+
+    assert writer.flushes == 1
+    assert await _count(async_session, VertexBuildTable) == 3
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_rows(async_session: AsyncSession):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), max_queue_size=2, flush_interval=60)
+    flow_id = uuid4()
+
+    results = [writer.enqueue_vertex_build(_vertex_build(flow_id, f"vertex-{i}")) for i in range(3)]
+
+    assert results == [True, True, False]
+    assert writer.dropped_rows == 1
+    await writer.stop()
+    assert await _count(async_session, VertexBuildTable) == 2
+
+
+@pytest.mark.asyncio
+async def test_compaction_enforces_retention(async_session: AsyncSession, mock_settings):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), flush_interval=60)
+    flow_id = uuid4()
+    for i in range(4):
+        writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex-a", i))
+    for i in range(4):
+        writer.enqueue_vertex_build(_vertex_build(flow_id, f"vertex-{i}", 10 + i))
+    for i in range(5):
+        writer.enqueue_transaction(
+            {
+                "vertex_id": "vertex-a",
+                "status": "success",
+                "flow_id": flow_id,
+                "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i),
+            }
+        )
+
+    with (
+        patch("langflow.services.database.models.vertex_builds.crud.get_settings_service") as vertex_settings,
+        patch("langflow.services.database.models.transactions.crud.get_settings_service") as transaction_settings,
+    ):
+        vertex_settings.return_value.settings = mock_settings
+        transaction_settings.return_value.settings = mock_settings
+        await writer.stop()
+
+    # vertex-a keeps its 2 newest builds, then the global limit keeps the 5 newest overall
+    assert await _count(async_session, VertexBuildTable) == 5
+    vertex_a_builds = (
+        await async_session.execute(select(VertexBuildTable).where(VertexBuildTable.id == "vertex-a"))
+    ).all()
+    assert len(vertex_a_builds) == 1
+    assert await _count(async_session, TransactionTable) == 3
+    assert writer.compactions == 1
+
+
+@pytest.mark.asyncio
+async def test_rows_from_another_loop_are_written_by_the_owner_loop(async_session: AsyncSession):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), batch_size=3, flush_interval=60)
+    flow_id = uuid4()
+    writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex-main"))
+
+    async def enqueue_from_worker_loop():
+        for i in range(2):
+            assert writer.enqueue_vertex_build(_vertex_build(flow_id, f"vertex-worker-{i}"))
+
+    await asyncio.to_thread(asyncio.run, enqueue_from_worker_loop())
+    for _ in range(20):
+        if writer.flushes:
+            break
+        await asyncio.sleep(0.05)
+
+    assert writer.flushes == 1
+    assert await _count(async_session, VertexBuildTable) == 3
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_writer_moves_to_the_caller_loop_when_its_loop_is_gone(async_session: AsyncSession):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), flush_interval=60)
+    flow_id = uuid4()
+
+    async def enqueue_on_short_lived_loop():
+        writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex-old-loop"))
+
+    await asyncio.to_thread(asyncio.run, enqueue_on_short_lived_loop())
+    writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex-current-loop"))
+
+    assert writer.is_started()
+    await writer.stop()
+    assert await _count(async_session, VertexBuildTable) == 2
+
+
+@pytest.mark.asyncio
+async def test_writer_owned_by_another_running_loop_stops_from_the_caller_loop(async_session: AsyncSession):
+    writer = BuildLogWriter(SessionDatabaseService(async_session), flush_interval=60)
+    flow_id = uuid4()
+    worker_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=worker_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def enqueue_on_worker_loop():
+        writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex-worker"))
+
+    try:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(enqueue_on_worker_loop(), worker_loop))
+        writer.enqueue_vertex_build(_vertex_build(flow_id, "vertex-main"))
+
+        await writer.stop()
+    finally:
+        worker_loop.call_soon_threadsafe(worker_loop.stop)
+        thread.join()
+        worker_loop.close()
+
+    assert not writer.is_started()
+    assert await _count(async_session, VertexBuildTable) == 2
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from langflow.services.job_queue.backends import InMemoryJobQueueBackend, RedisJobQueueBackend
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+
+
+@pytest.fixture
+def redis_server():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeServer()
+
+
+def _redis_backend(server, consumer_name="worker"):
+    from fakeredis.aioredis import FakeRedis
+
+    return RedisJobQueueBackend(FakeRedis(server=server), consumer_name=consumer_name)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return InMemoryJobQueueBackend()
+    return _redis_backend(request.getfixturevalue("redis_server"))
+
+
+class TestJobQueueBackends:
+    """Behavior shared by every job queue backend."""
+
+    async def test_publish_and_read_events(self, backend):
+        await backend.register_job("job")
+        await backend.publish_events("job", [b"first", b"second", None])
+
+        assert await backend.job_exists("job")
+        assert await backend.read_events("job") == [b"first", b"second", None]
+        assert await backend.read_events("job") == []
+
+    async def test_read_waits_for_events(self, backend):
+        await backend.register_job("job")
+
+        async def publish_later():
+            await asyncio.sleep(0.05)
+            await backend.publish_events("job", [b"late"])
+
+        publish_task = asyncio.create_task(publish_later())
+        assert await backend.read_events("job", timeout=2) == [b"late"]
+        await publish_task
+
+    async def test_read_timeout_without_events(self, backend):
+        await backend.register_job("job")
+        assert await backend.read_events("job", timeout=0.05) == []
+
+    async def test_cancel_and_delete(self, backend):
+        await backend.register_job("job")
+        assert not await backend.is_cancel_requested("job")
+
+        await backend.request_cancel("job")
+        assert await backend.is_cancel_requested("job")
+
+        await backend.delete_job("job")
+        assert not await backend.job_exists("job")
+        await backend.request_cancel("job")
+        assert not await backend.job_exists("job")
+
+
+async def test_memory_backend_is_empty_after_cleanup():
+    service = JobQueueService(backend=InMemoryJobQueueBackend())
+    service.create_queue("job")
+    service.start_job("job", asyncio.sleep(0))
+    await service.register_job("job")
+    _, _, task, _ = service.get_queue_data("job")
+    await task
+
+    await service.cleanup_job("job")
+
+    assert not service.backend._jobs
+    assert not service.backend._events
+    assert not service.backend._cancel_requested
+    await service.stop()
+
+
+async def test_redis_events_are_delivered_once_across_workers(redis_server):
+    worker_a = _redis_backend(redis_server, "worker-a")
+    worker_b = _redis_backend(redis_server, "worker-b")
+    await worker_a.register_job("job")
+    await worker_a.publish_events("job", [b"1", b"2", b"3"])
+
+    first = await worker_a.read_events("job", count=2)
+    second = await worker_b.read_events("job")
+
+    assert first + second == [b"1", b"2", b"3"]
+
+
+class TestDistributedJobQueueService:
+    """Jobs started on one worker are served and cancelled by another one sharing the Redis backend."""
+
+    @pytest.fixture
+    async def workers(self, redis_server):
+        worker_a = JobQueueService(backend=_redis_backend(redis_server, "worker-a"))
+        worker_b = JobQueueService(backend=_redis_backend(redis_server, "worker-b"))
+        worker_a.CANCEL_POLL_INTERVAL = 0.05
+        yield worker_a, worker_b
+        await worker_a.stop()
+        await worker_b.stop()
+
+    async def test_other_worker_reads_events(self, workers):
+        worker_a, worker_b = workers
+        queue, event_manager = worker_a.create_queue("job")
+
+        async def build():
+            event_manager.on_build_start(data={"id": "vertex"})
+            event_manager.on_end(data={})
+            await queue.put((None, None, 0))
+
+        worker_a.start_job("job", build())
+        await worker_a.register_job("job")
+
+        events = []
+        while not events or events[-1] is not None:
+            events += await worker_b.read_job_events("job", timeout=1)
+
+        assert [event[:21] for event in events[:-1]] == [b'{"event": "build_star', b'{"event": "end", "dat']
+
+    async def test_other_worker_cancels_job(self, workers):
+        worker_a, worker_b = workers
+        worker_a.create_queue("job")
+        worker_a.start_job("job", asyncio.sleep(60))
+        await worker_a.register_job("job")
+        _, _, task, _ = worker_a.get_queue_data("job")
+
+        await worker_b.cancel_job("job")
+        for _ in range(100):
+            if task.done():
+                break
+            await asyncio.sleep(0.02)
+
+        assert task.cancelled()
+        with pytest.raises(JobQueueNotFoundError):
+            await worker_b.read_job_events("job")
+
+    async def test_unknown_job(self, workers):
+        _, worker_b = workers
+        with pytest.raises(JobQueueNotFoundError):
+            await worker_b.read_job_events("missing")
+        with pytest.raises(JobQueueNotFoundError):
+            await worker_b.cancel_job("missing")
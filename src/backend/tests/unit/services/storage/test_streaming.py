@@ -0,0 +1,162 @@
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import ANY, Stubber
+from langflow.services.storage import s3
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.s3 import S3StorageService
+
+
+async def chunked(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+def settings_service(tmp_path):
+    return SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    return LocalStorageService(MagicMock(), settings_service(tmp_path))
+
+
+@pytest.fixture
+def s3_storage(tmp_path, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    storage = S3StorageService(MagicMock(), settings_service(tmp_path))
+    with Stubber(storage.s3_client) as stubber:
+        storage.stubber = stubber
+        yield storage
+        stubber.assert_no_pending_responses()
+
+
+def body(data: bytes) -> StreamingBody:
+    return StreamingBody(io.BytesIO(data), len(data))
+
+
+async def test_local_open_write_and_ranged_open_read(local_storage, tmp_path):
+    data = bytes(range(256)) * 100
+
+    written = await local_storage.open_write("flow", "data.bin", chunked(data, 1000))
+
+    assert written == len(data)
+    assert sorted(path.name for path in (tmp_path / "flow").iterdir()) == ["data.bin"]
+    chunks = [chunk async for chunk in local_storage.open_read("flow", "data.bin", chunk_size=4096)]
+    assert b"".join(chunks) == data
+    assert max(len(chunk) for chunk in chunks) == 4096
+    ranged = [
+        chunk async for chunk in local_storage.open_read("flow", "data.bin", start=100, end=9099, chunk_size=4096)
+    ]
+    assert b"".join(ranged) == data[100:9100]
+    tail = [chunk async for chunk in local_storage.open_read("flow", "data.bin", start=len(data) - 10)]
+    assert b"".join(tail) == data[-10:]
+
+
+async def test_local_failed_write_leaves_no_file(local_storage, tmp_path):
+    async def failing_chunks():
+        yield b"partial"
+        msg = "client went away"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await local_storage.open_write("flow", "data.bin", failing_chunks())
+
+    assert list((tmp_path / "flow").iterdir()) == []
+    with pytest.raises(FileNotFoundError):
+        async for _ in local_storage.open_read("flow", "data.bin"):
+            pass
+
+
+async def test_s3_open_read_uses_ranged_get(s3_storage):
+    data = b"0123456789" * 10
+    s3_storage.stubber.add_response(
+        "get_object",
+        {"Body": body(data[10:20])},
+        {"Bucket": "langflow", "Key": "flow/data.bin", "Range": "bytes=10-19"},
+    )
+    s3_storage.stubber.add_response("get_object", {"Body": body(data)}, {"Bucket": "langflow", "Key": "flow/data.bin"})
+
+    ranged = [chunk async for chunk in s3_storage.open_read("flow", "data.bin", start=10, end=19)]
+    chunks = [chunk async for chunk in s3_storage.open_read("flow", "data.bin", chunk_size=30)]
+
+    assert b"".join(ranged) == data[10:20]
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+
+
+async def test_s3_missing_file_raises_file_not_found(s3_storage):
+    s3_storage.stubber.add_client_error("get_object", service_error_code="NoSuchKey", http_status_code=404)
+    s3_storage.stubber.add_client_error("head_object", service_error_code="404", http_status_code=404)
+
+    with pytest.raises(FileNotFoundError):
+        async for _ in s3_storage.open_read("flow", "missing.bin"):
+            pass
+    with pytest.raises(FileNotFoundError):
+        await s3_storage.get_file_size("flow", "missing.bin")
+
+
+async def test_s3_open_write_uses_multipart_upload_for_large_files(s3_storage, monkeypatch):
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 10)
+    key = {"Bucket": "langflow", "Key": "flow/data.bin"}
+    stubber = s3_storage.stubber
+    stubber.add_response("create_multipart_upload", {"UploadId": "upload"}, key)
+    for part_number, part in enumerate([b"a" * 10, b"b" * 10, b"c" * 5], start=1):
+        stubber.add_response(
+            "upload_part",
+            {"ETag": f"etag{part_number}"},
+            {**key, "UploadId": "upload", "PartNumber": part_number, "Body": part},
+        )
+    stubber.add_response(
+        "complete_multipart_upload",
+        {},
+        {
+            **key,
+            "UploadId": "upload",
+            "MultipartUpload": {"Parts": [{"ETag": f"etag{n}", "PartNumber": n} for n in (1, 2, 3)]},
+        },
+    )
+    stubber.add_response("put_object", {}, {"Bucket": "langflow", "Key": "flow/small.bin", "Body": b"small"})
+
+    assert await s3_storage.open_write("flow", "data.bin", chunked(b"a" * 10 + b"b" * 10 + b"c" * 5, 5)) == 25
+    assert await s3_storage.open_write("flow", "small.bin", chunked(b"small", 2)) == 5
+
+
+async def test_s3_failed_multipart_upload_is_aborted(s3_storage, monkeypatch):
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 4)
+
+    async def failing_chunks():
+        yield b"abcd"
+        msg = "client went away"
+        raise ConnectionError(msg)
+
+    stubber = s3_storage.stubber
+    stubber.add_response("create_multipart_upload", {"UploadId": "upload"})
+    stubber.add_response("upload_part", {"ETag": "etag1"})
+    stubber.add_response("abort_multipart_upload", {}, {"Bucket": "langflow", "Key": "flow/data.bin", "UploadId": ANY})
+
+    with pytest.raises(ConnectionError):
+        await s3_storage.open_write("flow", "data.bin", failing_chunks())
+
+
+async def test_local_delete_file_discards_parse_cache_entries(local_storage, tmp_path, monkeypatch):
+    from lfx.base.data import parse_cache
+    from lfx.base.data.parse_cache import FileParseCache
+
+    cache = FileParseCache(tmp_path / "parse_cache", max_size_bytes=1024 * 1024)
+    monkeypatch.setattr(parse_cache, "get_file_parse_cache", lambda: cache)
+    await local_storage.save_file("flow", "doc.txt", b"secret")
+    await local_storage.save_file("flow", "other.txt", b"other")
+    content_hash = parse_cache.hash_file(tmp_path / "flow" / "doc.txt")
+    cache.set(cache.make_key(content_hash, {"pipeline": "standard"}), [{"text": "secret"}])
+    cache.set(cache.make_key(content_hash, {"pipeline": "vlm"}), [{"text": "secret"}])
+    other_key = cache.make_key(parse_cache.hash_file(tmp_path / "flow" / "other.txt"), {"pipeline": "standard"})
+    cache.set(other_key, [{"text": "other"}])
+
+    await local_storage.delete_file("flow", "doc.txt")
+
+    assert [path.stem for path in cache.cache_dir.iterdir()] == [other_key]
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -435,7 +437,7 @@ async def test_trace_worker_with_exception(tracing_service):
 
         # Get trace_context and add failing trace function to queue
         trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
+        await tracing_service._enqueue(trace_context, failing_trace_func, ())
 
         # Wait for async queue processing
         await asyncio.sleep(0.1)
@@ -531,3 +533,143 @@ async def test_concurrent_tracing(tracing_service, mock_component):
     assert tracer2.session_id == "session_id2"
     assert dict(tracer2.outputs_param.get("run_id2 trace_name1")) == {"output_key": "task2_run_id2 component1_output"}
     assert dict(tracer2.outputs_param.get("run_id2 trace_name2")) == {"output_key": "task2_run_id2 component2_output"}
+
+
+class BlockingTracer(MockTracer):
+    """A tracer doing blocking I/O in its callbacks, like the tracers exporting spans over HTTP."""
+
+    delay = 0.2
+
+    def add_trace(self, *args, **kwargs) -> None:
+        self.add_trace_thread = threading.get_ident()
+        time.sleep(self.delay)
+        super().add_trace(*args, **kwargs)
+
+    def end_trace(self, *args, **kwargs) -> None:
+        time.sleep(self.delay)
+        super().end_trace(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_tracer_callbacks_do_not_block_the_event_loop(tracing_service, mock_component):
+    """Test that blocking tracer callbacks run on the export threads, in order, without stalling the loop."""
+    gaps = []
+
+    async def ticker(stop: asyncio.Event):
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    with patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=BlockingTracer):
+        await tracing_service.start_tracers(uuid.uuid4(), "run", "user", "session", "project")
+        trace_context = trace_context_var.get()
+        for name in list(trace_context.tracers):
+            if name != "langsmith":
+                del trace_context.tracers[name]
+
+        stop = asyncio.Event()
+        ticker_task = asyncio.create_task(ticker(stop))
+        async with tracing_service.trace_component(mock_component, "trace_name", {"input": "value"}):
+            pass
+        await tracing_service.end_tracers({})
+        stop.set()
+        await ticker_task
+
+    tracer = trace_context.tracers["langsmith"]
+    assert tracer.add_trace_thread != threading.get_ident()
+    assert len(tracer.add_trace_list) == 1
+    assert len(tracer.end_trace_list) == 1
+    assert tracer.end_called
+    assert max(gaps) < BlockingTracer.delay
+    stats = tracing_service.stats()
+    assert stats["processed"] == stats["enqueued"] == 2
+    assert stats["pending"] == 0
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_full_tracing_queue_drops_callbacks(mock_settings_service, mock_component):
+    """Test that a component trace is dropped and counted as a whole when the queue of a run is full."""
+    mock_settings_service.settings.tracing_queue_max_size = 1
+    tracing_service = TracingService(mock_settings_service)
+    release = threading.Event()
+
+    await tracing_service.start_tracers(uuid.uuid4(), "run", "user", "session", "project")
+    trace_context = trace_context_var.get()
+    # Hold the worker on a callback and fill the queue, so the start of the trace is dropped
+    await tracing_service._enqueue(trace_context, release.wait, ())
+    await asyncio.sleep(0.05)
+    await tracing_service._enqueue(trace_context, lambda: None, ())
+
+    async with tracing_service.trace_component(mock_component, "trace_name", {}):
+        pass
+
+    assert tracing_service.stats()["dropped"] == 2
+    release.set()
+    await tracing_service.end_tracers({})
+    stats = tracing_service.stats()
+    assert stats["enqueued"] == stats["processed"] == 2
+    assert stats["max_queue_lag"] > 0
+    tracer = trace_context.tracers["langsmith"]
+    assert tracer.add_trace_list == []
+    assert tracer.end_trace_list == []
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_full_tracing_queue_keeps_end_of_started_trace(mock_settings_service, mock_component):
+    """Test that the end of a started trace waits for room instead of being dropped."""
+    mock_settings_service.settings.tracing_queue_max_size = 1
+    tracing_service = TracingService(mock_settings_service)
+    release = threading.Event()
+
+    await tracing_service.start_tracers(uuid.uuid4(), "run", "user", "session", "project")
+    trace_context = trace_context_var.get()
+    await tracing_service._enqueue(trace_context, release.wait, ())
+    await asyncio.sleep(0.05)
+
+    async def failing_build():
+        async with tracing_service.trace_component(mock_component, "trace_name", {}):
+            # The start fills the queue, the error callback has to wait for the worker
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            msg = "component failed"
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="component failed"):
+        await failing_build()
+
+    await tracing_service.end_tracers({})
+    tracer = trace_context.tracers["langsmith"]
+    assert len(tracer.add_trace_list) == 1
+    assert str(tracer.end_trace_list[0]["error"]) == "component failed"
+    stats = tracing_service.stats()
+    assert stats["dropped"] == 0
+    assert stats["enqueued"] == stats["processed"] == 3
+    await tracing_service.teardown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_callbacks_get_outputs_at_enqueue_time(tracing_service, mock_component):
+    """Test that tracers get the outputs of a component as they were when its trace ended."""
+    release = threading.Event()
+
+    await tracing_service.start_tracers(uuid.uuid4(), "run", "user", "session", "project")
+    trace_context = trace_context_var.get()
+    await tracing_service._enqueue(trace_context, release.wait, ())
+
+    async with tracing_service.trace_component(mock_component, "trace_name", {"input": "value"}):
+        tracing_service.set_outputs("trace_name", {"output": "first"})
+    # Changed while the callbacks of the trace are still queued
+    trace_context.all_outputs["trace_name"]["output"] = "second"
+    release.set()
+    await tracing_service.end_tracers({})
+
+    tracer = trace_context.tracers["langsmith"]
+    assert tracer.end_trace_list[0]["outputs"] == {"output": "first"}
+    await tracing_service.teardown()
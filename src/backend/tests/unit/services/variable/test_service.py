@@ -19,6 +19,13 @@ def service():
     return DatabaseVariableService(settings_service)
 
 
+@pytest.fixture
+def cached_service(monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "variable_cache_ttl", 30.0)
+    return DatabaseVariableService(settings_service)
+
+
 @pytest.fixture
 async def session():
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
@@ -240,3 +247,66 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_prefetch_variables_serves_get_variable_from_cache(cached_service, session: AsyncSession):
+    user_id = uuid4()
+    await cached_service.create_variable(user_id, "first", "value1", session=session)
+    await cached_service.create_variable(user_id, "second", "value2", session=session)
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_mock:
+        await cached_service.prefetch_variables(user_id, ["first", "second", "missing"], session=session)
+        assert exec_mock.await_count == 1
+
+        assert await cached_service.get_variable(user_id, "first", "", session=session) == "value1"
+        assert await cached_service.get_variable(user_id, "second", "", session=session) == "value2"
+        assert exec_mock.await_count == 1
+
+    with pytest.raises(ValueError, match=r"missing variable not found\."):
+        await cached_service.get_variable(user_id, "missing", "", session=session)
+
+
+async def test_cached_credential_still_rejected_in_session_id(cached_service, session: AsyncSession):
+    user_id = uuid4()
+    await cached_service.create_variable(user_id, "name", "value", type_=CREDENTIAL_TYPE, session=session)
+    await cached_service.prefetch_variables(user_id, ["name"], session=session)
+
+    with pytest.raises(TypeError, match="purpose is to prevent the exposure of value"):
+        await cached_service.get_variable(user_id, "name", "session_id", session=session)
+
+
+async def test_variable_cache_is_invalidated_on_update_and_delete(cached_service, session: AsyncSession):
+    user_id = uuid4()
+    await cached_service.create_variable(user_id, "name", "value", session=session)
+    assert await cached_service.get_variable(user_id, "name", "", session=session) == "value"
+
+    await cached_service.update_variable(user_id, "name", "new_value", session=session)
+    assert await cached_service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+    await cached_service.delete_variable(user_id, "name", session=session)
+    with pytest.raises(ValueError, match=r"name variable not found\."):
+        await cached_service.get_variable(user_id, "name", "", session=session)
+
+
+async def test_variable_cache_is_per_user(cached_service, session: AsyncSession):
+    user_id = uuid4()
+    other_user_id = uuid4()
+    await cached_service.create_variable(user_id, "name", "value", session=session)
+    await cached_service.prefetch_variables(user_id, ["name"], session=session)
+
+    with pytest.raises(ValueError, match=r"name variable not found\."):
+        await cached_service.get_variable(other_user_id, "name", "", session=session)
+
+
+async def test_variables_are_not_cached_by_default(service, session: AsyncSession):
+    user_id = uuid4()
+    # Another worker, with its own service, deletes the variable
+    other_worker = DatabaseVariableService(get_settings_service())
+    await service.create_variable(user_id, "name", "value", session=session)
+    await service.prefetch_variables(user_id, ["name"], session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
+
+    await other_worker.delete_variable(user_id, "name", session=session)
+
+    with pytest.raises(ValueError, match=r"name variable not found\."):
+        await service.get_variable(user_id, "name", "", session=session)
@@ -1,13 +1,21 @@
 import asyncio
 import json
 import uuid
+from unittest.mock import patch
 from uuid import UUID
 
 import pytest
 from httpx import codes
+from langflow.api.utils import get_cached_graph
 from langflow.services.database.models.flow import FlowUpdate
+from langflow.services.deps import get_chat_service, get_settings_service
+from lfx.components.helpers.id_generator import IDGeneratorComponent
+from lfx.components.input_output import ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph.graph.base import Graph
 from lfx.log.logger import logger
 from lfx.memory import aget_messages
+from lfx.services.cache.utils import CacheMiss
 
 from tests.unit.build_utils import build_flow, consume_and_assert_stream, create_flow, get_build_events
 
@@ -104,6 +112,139 @@ async def test_build_flow_invalid_job_id(client, logged_in_headers):
     assert "Job not found" in response.json()["detail"]
 
 
+async def test_build_flow_stats(client, json_memory_chatbot_no_llm, logged_in_headers):
+    """Test getting the event queue metrics of a build job."""
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    job_id = (await build_flow(client, flow_id, logged_in_headers))["job_id"]
+
+    events_response = await get_build_events(client, job_id, logged_in_headers)
+    await consume_and_assert_stream(events_response, job_id)
+
+    response = await client.get(f"api/v1/build/{job_id}/stats", headers=logged_in_headers)
+    assert response.status_code == codes.OK
+    stats = response.json()
+    assert stats["events_sent"] > 0
+    assert stats["queue_depth"] == 0
+    assert {"max_queue_depth", "tokens_received", "token_frames_sent", "coalescing_ratio"} <= stats.keys()
+
+    response = await client.get(f"api/v1/build/{uuid.uuid4()}/stats", headers=logged_in_headers)
+    assert response.status_code == codes.NOT_FOUND
+
+
+async def test_build_flow_with_delta_checkpoints(client, json_memory_chatbot_no_llm, logged_in_headers, monkeypatch):
+    """Test that a build in delta checkpoint mode can be rehydrated from its checkpoints."""
+    monkeypatch.setattr(get_settings_service().settings, "graph_checkpoint_mode", "delta")
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    job_id = (await build_flow(client, flow_id, logged_in_headers))["job_id"]
+
+    events_response = await get_build_events(client, job_id, logged_in_headers)
+    await consume_and_assert_stream(events_response, job_id)
+
+    chat_service = get_chat_service()
+    assert isinstance(await chat_service.get_cache(str(flow_id)), CacheMiss)
+    graph = await Graph.load_checkpoint(str(flow_id), chat_service.get_cache)
+    assert graph is not None
+    assert graph.run_id
+    assert {vertex.id for vertex in graph.vertices} == {
+        node["id"] for node in json.loads(json_memory_chatbot_no_llm)["data"]["nodes"]
+    }
+    # The completed run is compacted into a single delta, which clearing the cache removes
+    assert graph._checkpointer.sequence == 1
+    assert isinstance(await chat_service.get_cache(f"{flow_id}:checkpoint:2"), CacheMiss)
+    await chat_service.clear_cache(str(flow_id))
+    assert await Graph.load_checkpoint(str(flow_id), chat_service.get_cache) is None
+    assert isinstance(await chat_service.get_cache(f"{flow_id}:checkpoint:1"), CacheMiss)
+
+
+async def test_cached_graph_prefers_checkpoint_over_stale_snapshot(client, json_memory_chatbot_no_llm, monkeypatch):  # noqa: ARG001
+    """Test that a full snapshot left over from an earlier run does not shadow a newer checkpoint."""
+    monkeypatch.setattr(get_settings_service().settings, "graph_checkpoint_mode", "delta")
+    chat_service = get_chat_service()
+    key = str(uuid.uuid4())
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"], flow_id=key)
+    graph.set_run_id(str(uuid.uuid4()))
+    await graph.save_checkpoint(chat_service.set_cache, key)
+    await chat_service.set_cache(key, "stale snapshot")
+
+    cached = await get_cached_graph(key, chat_service)
+
+    assert isinstance(cached["result"], Graph)
+    assert cached["result"].run_id == graph.run_id
+    # The rehydrated graph is kept for the run instead of being built again
+    assert (await get_cached_graph(key, chat_service))["result"] is cached["result"]
+    await chat_service.clear_cache(key)
+
+
+async def test_cached_graph_skips_checkpoint_in_full_mode(client, monkeypatch):  # noqa: ARG001
+    """Test that the checkpoint is not read when graphs are cached whole."""
+    monkeypatch.setattr(get_settings_service().settings, "graph_checkpoint_mode", "full")
+    chat_service = get_chat_service()
+    key = str(uuid.uuid4())
+    await chat_service.set_cache(key, "snapshot")
+
+    with patch.object(Graph, "load_checkpoint") as load_checkpoint:
+        cached = await get_cached_graph(key, chat_service)
+
+    load_checkpoint.assert_not_called()
+    assert cached["result"] == "snapshot"
+    await chat_service.clear_cache(key)
+
+
+async def test_build_flow_updates_graph_of_previous_build(
+    client, json_memory_chatbot_no_llm, logged_in_headers, monkeypatch
+):
+    """Test that a playground rebuild updates the cached graph of the previous build instead of replacing it."""
+    monkeypatch.setattr(get_settings_service().settings, "incremental_playground_builds", True)
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    chat_service = get_chat_service()
+
+    async def build(**kwargs):
+        job_id = (await build_flow(client, flow_id, logged_in_headers, **kwargs))["job_id"]
+        events_response = await get_build_events(client, job_id, logged_in_headers)
+        await consume_and_assert_stream(events_response, job_id)
+        return (await chat_service.get_cache(str(flow_id)))["result"]
+
+    graph = await build()
+    assert not graph.run_manager.vertices_being_run
+
+    response = await client.get(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+    flow_data = response.json()["data"]
+    for node in flow_data["nodes"]:
+        node["position"] = {"x": 0, "y": 0}
+    assert await build(json={"data": flow_data}) is graph
+
+    monkeypatch.setattr(get_settings_service().settings, "incremental_playground_builds", False)
+    assert await build(json={"data": flow_data}) is not graph
+
+
+async def test_build_flow_runs_non_deterministic_source_again(client, logged_in_headers):
+    """Test that by default a playground rebuild runs again a source whose result changes on every run."""
+    id_generator = IDGeneratorComponent(_id="id_generator")
+    combined = CombineTextComponent(_id="combined").set(text1=id_generator.generate_id, text2="", delimiter="")
+    chat_output = ChatOutput(_id="chat_output").set(input_value=combined.combine_texts)
+    flow = Graph(id_generator, chat_output).dump(name="Generated ID")
+    flow_id = await create_flow(client, json.dumps(flow), logged_in_headers)
+    chat_service = get_chat_service()
+
+    async def build_generated_id(flow_data: dict) -> str:
+        job_id = (await build_flow(client, flow_id, logged_in_headers, json={"data": flow_data}))["job_id"]
+        events_response = await get_build_events(client, job_id, logged_in_headers)
+        events = [json.loads(line) async for line in events_response.aiter_lines() if line]
+        assert events[-1]["event"] == "end"
+        graph = (await chat_service.get_cache(str(flow_id)))["result"]
+        return graph.get_vertex("id_generator").results["id"].text
+
+    first_id = await build_generated_id(flow["data"])
+    # Only a component downstream of the source changes
+    for node in flow["data"]["nodes"]:
+        if node["id"] == "chat_output":
+            node["data"]["node"]["template"]["sender_name"]["value"] = "Bot"
+    second_id = await build_generated_id(flow["data"])
+
+    assert first_id
+    assert second_id != first_id
+
+
 @pytest.mark.benchmark
 async def test_build_flow_invalid_flow_id(client, logged_in_headers):
     """Test starting a build with an invalid flow ID."""
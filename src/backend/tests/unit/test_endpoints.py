@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from uuid import UUID, uuid4
 
 import orjson
@@ -149,6 +150,76 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "ChatOutput" in json_response["input_output"]
 
 
+async def test_get_all_is_served_with_etag(client: AsyncClient, logged_in_headers):
+    from lfx.interface.components import component_cache
+
+    response = await client.get("api/v1/all", headers=logged_in_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Clients that do not accept compression still get the catalog
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.json() == component_cache.all_types_dict
+
+    # A change of the catalog yields a new representation
+    all_types_dict = component_cache.all_types_dict
+    component_cache.all_types_dict = {"input_output": dict(list(all_types_dict["input_output"].items())[:1])}
+    try:
+        response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json() == component_cache.all_types_dict
+    finally:
+        component_cache.all_types_dict = all_types_dict
+
+
+@pytest.mark.benchmark
+async def test_benchmark_get_all_requests_per_second(client: AsyncClient, logged_in_headers, monkeypatch):
+    """Compares /all throughput with the precompressed catalog against compressing it on every request."""
+    from langflow.api.v1 import endpoints
+    from langflow.utils.compression import compress_response
+    from lfx.interface.components import component_cache
+
+    requests = 50
+    response = await client.get("api/v1/all", headers=logged_in_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    async def requests_per_second(headers) -> float:
+        start_time = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get("api/v1/all", headers=headers)
+            assert response.status_code in {200, 304}
+        return requests / (time.perf_counter() - start_time)
+
+    precompressed = await requests_per_second(logged_in_headers)
+    not_modified = await requests_per_second({**logged_in_headers, "If-None-Match": etag})
+
+    class _CompressPerRequest:
+        @staticmethod
+        def response(_request):
+            return compress_response(component_cache.all_types_dict)
+
+    async def compress_per_request(_settings_service):
+        return _CompressPerRequest()
+
+    monkeypatch.setattr(endpoints, "get_component_catalog", compress_per_request)
+    uncached = await requests_per_second(logged_in_headers)
+    print(  # noqa: T201
+        f"\n/all compressed per request: {uncached:.0f} req/s, precompressed: {precompressed:.0f} req/s, "
+        f"304 Not Modified: {not_modified:.0f} req/s"
+    )
+    assert precompressed > uncached
+
+
 @pytest.mark.usefixtures("active_user")
 async def test_post_validate_code(client: AsyncClient, logged_in_headers):
     # Test case with a valid import and function
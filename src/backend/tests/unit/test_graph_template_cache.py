@@ -0,0 +1,144 @@
+import copy
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import orjson
+import pytest
+from fastapi import status
+from langflow.processing.graph_template_cache import GraphTemplateCache, get_graph_template_cache
+from langflow.processing.process import process_tweaks
+from langflow.services.database.models.flow.model import Flow
+from lfx.graph.graph.base import Graph
+
+
+@pytest.fixture
+def simple_flow(json_simple_api_test):
+    data = orjson.loads(json_simple_api_test)["data"]
+    return Flow(id=uuid4(), name="Simple API Test", data=data, updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+@pytest.fixture
+def template_cache():
+    cache = get_graph_template_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_template_is_reused_until_the_flow_changes(simple_flow):
+    cache = GraphTemplateCache()
+    flow_data = copy.deepcopy(simple_flow.data)
+
+    template = cache.get_or_create(simple_flow, {})
+    assert cache.get_or_create(simple_flow, {}) is template
+    assert cache.get_or_create(simple_flow, {}, stream=True) is not template
+    assert cache.get_or_create(simple_flow, {"input_value": "hi"}) is not template
+    # Tweaks are applied to a copy of the flow data
+    assert simple_flow.data == flow_data
+
+    simple_flow.updated_at += timedelta(seconds=1)
+    assert cache.get_or_create(simple_flow, {}) is not template
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 4
+
+
+def test_invalidate_and_evict(simple_flow):
+    cache = GraphTemplateCache(max_entries=2)
+    other_flow = simple_flow.model_copy(update={"id": uuid4()})
+
+    cache.get_or_create(simple_flow, {})
+    cache.get_or_create(simple_flow, {}, stream=True)
+    cache.get_or_create(other_flow, {})
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.invalidate_flow(simple_flow.id) == 1
+    assert cache.invalidate_flow(other_flow.id) == 1
+    assert len(cache) == 0
+
+
+def test_disabled_cache_still_builds(simple_flow):
+    cache = GraphTemplateCache(max_entries=0)
+
+    graph = cache.get_or_create(simple_flow, {}).build()
+
+    assert len(cache) == 0
+    assert graph.vertices
+
+
+def test_builds_are_independent(simple_flow):
+    template = GraphTemplateCache().get_or_create(simple_flow, {})
+
+    first, second = template.build(user_id="user"), template.build(user_id="user")
+
+    assert [vertex.id for vertex in first.vertices] == [vertex.id for vertex in second.vertices]
+    for first_vertex, second_vertex in zip(first.vertices, second.vertices, strict=True):
+        assert first_vertex is not second_vertex
+        assert first_vertex.data is not second_vertex.data
+        assert first_vertex.custom_component is not second_vertex.custom_component
+
+
+async def test_run_uses_cached_template(client, simple_api_test, created_api_key, logged_in_headers, template_cache):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+
+    for _ in range(2):
+        response = await client.post(f"/api/v1/run/{flow_id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+    assert template_cache.stats()["misses"] == 1
+    assert template_cache.stats()["hits"] == 1
+
+    response = await client.patch(f"api/v1/flows/{flow_id}", json={"description": "Updated"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert len(template_cache) == 0
+
+
+def _percentiles(latencies: list[float]) -> tuple[float, float]:
+    quantiles = statistics.quantiles(latencies, n=100)
+    return quantiles[49] * 1000, quantiles[98] * 1000
+
+
+@pytest.mark.benchmark
+async def test_benchmark_run_latency_with_and_without_template_cache(
+    client, simple_api_test, created_api_key, template_cache
+):
+    """Compares /run request latency and graph preparation time with and without the template cache."""
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    requests = 50
+
+    async def run_requests() -> list[float]:
+        latencies = []
+        for _ in range(requests):
+            start_time = time.perf_counter()
+            response = await client.post(f"/api/v1/run/{flow_id}", headers=headers)
+            latencies.append(time.perf_counter() - start_time)
+            assert response.status_code == status.HTTP_200_OK, response.text
+        return latencies
+
+    template_cache.max_entries = 0
+    uncached_p50, uncached_p99 = _percentiles(await run_requests())
+    template_cache.max_entries = 128
+    cached_p50, cached_p99 = _percentiles(await run_requests())
+    print(  # noqa: T201
+        f"\n/run without cache: p50 {uncached_p50:.1f}ms p99 {uncached_p99:.1f}ms, "
+        f"with cache: p50 {cached_p50:.1f}ms p99 {cached_p99:.1f}ms"
+    )
+
+    # Graph preparation in isolation, which is what the cache removes from the request path
+    flow_data = simple_api_test["data"]
+    template = template_cache.get_or_create(
+        Flow(id=uuid4(), name="Simple API Test", data=flow_data, updated_at=datetime.now(timezone.utc)), {}
+    )
+    start_time = time.perf_counter()
+    for _ in range(requests):
+        Graph.from_payload(process_tweaks(flow_data.copy(), {}), flow_id=flow_id)
+    uncached_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for _ in range(requests):
+        template.build()
+    cached_time = time.perf_counter() - start_time
+    print(f"Graph preparation without cache: {uncached_time:.3f}s, with cache: {cached_time:.3f}s")  # noqa: T201
+    assert cached_time < uncached_time
@@ -293,6 +293,8 @@ async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
 
         content = await flow_file.read_text(encoding="utf-8")
         fs_flow = Flow.model_validate_json(content)
+        async with session_scope() as session:
+            created_at = (await session.get(Flow, uuid.UUID(str(fs_flow.id)))).updated_at
         fs_flow.name = "new name"
         fs_flow.description = "new description"
         fs_flow.data = {"nodes": {}, "edges": {}}
@@ -312,5 +314,8 @@ async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
         assert result["description"] == "new description"
         assert result["data"] == {"nodes": {}, "edges": {}}
         assert result["locked"] is True
+        # Caches keyed by the flow version see the change on every worker
+        async with session_scope() as session:
+            assert (await session.get(Flow, uuid.UUID(str(fs_flow.id)))).updated_at != created_at
     finally:
         await flow_file.unlink(missing_ok=True)
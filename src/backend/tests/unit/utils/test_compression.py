@@ -3,8 +3,8 @@ import json
 from datetime import date, datetime, timezone
 from unittest.mock import patch
 
-from fastapi import Response
-from langflow.utils.compression import compress_response
+from fastapi import Request, Response
+from langflow.utils.compression import PrecompressedPayload, compress_response
 
 
 class TestCompressResponse:
@@ -286,3 +286,67 @@ class TestCompressResponse:
         except (TypeError, ValueError):
             # Expected behavior if jsonable_encoder can't handle the object
             pass
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        }
+    )
+
+
+class TestPrecompressedPayload:
+    """Test cases for PrecompressedPayload."""
+
+    def test_variants_decode_to_the_payload(self):
+        data = {"message": "hello", "items": list(range(100))}
+
+        payload = PrecompressedPayload(data)
+
+        assert json.loads(payload.variants["identity"]) == data
+        assert json.loads(gzip.decompress(payload.variants["gzip"])) == data
+
+    def test_etag_depends_on_the_content(self):
+        assert PrecompressedPayload({"a": 1}).etag == PrecompressedPayload({"a": 1}).etag
+        assert PrecompressedPayload({"a": 1}).etag != PrecompressedPayload({"a": 2}).etag
+
+    def test_negotiate(self):
+        payload = PrecompressedPayload({"message": "hello" * 100})
+
+        assert payload.negotiate(None) == "identity"
+        assert payload.negotiate("gzip, deflate") == "gzip"
+        assert payload.negotiate("gzip;q=0, identity") == "identity"
+        assert payload.negotiate("*") != "identity"
+
+    def test_response_is_compressed_for_the_client(self):
+        payload = PrecompressedPayload({"message": "hello" * 100})
+
+        response = payload.response(_request({"Accept-Encoding": "gzip"}))
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["ETag"] == payload.etag_for("gzip")
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.body == payload.variants["gzip"]
+
+        response = payload.response(_request({}))
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["ETag"] == payload.etag
+        assert response.body == payload.variants["identity"]
+
+    def test_not_modified(self):
+        payload = PrecompressedPayload({"message": "hello"})
+        etag = payload.etag_for("gzip")
+
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            response = payload.response(_request({"Accept-Encoding": "gzip", "If-None-Match": if_none_match}))
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+            assert response.body == b""
+
+        response = payload.response(_request({"Accept-Encoding": "gzip", "If-None-Match": '"other"'}))
+        assert response.status_code == 200
@@ -0,0 +1,170 @@
+import asyncio
+import io
+import time
+import tracemalloc
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+from langflow.utils.zip_stream import ZipMember, stream_zip
+
+CHUNK = 64 * 1024
+
+
+def chunked(content: bytes, chunk_size: int = 1024):
+    async def open_chunks():
+        for i in range(0, len(content), chunk_size):
+            await asyncio.sleep(0)
+            yield content[i : i + chunk_size]
+
+    return open_chunks
+
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+async def test_stream_zip_round_trips_members():
+    contents = {"a.txt": b"hello", "empty.txt": b"", "nested/b.bin": bytes(range(256)) * 100}
+    members = [ZipMember(name, chunked(content), size=len(content)) for name, content in contents.items()]
+
+    data = await collect(stream_zip(members, prefetch=2, queue_size=2))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == list(contents)
+        assert {name: archive.read(name) for name in contents} == contents
+
+
+async def test_stream_zip_without_sizes_uses_zip64():
+    data = await collect(stream_zip([ZipMember("unknown.txt", chunked(b"x" * 5000))]))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.read("unknown.txt") == b"x" * 5000
+
+
+async def test_stream_zip_bounds_prefetch():
+    active = 0
+    peak = 0
+
+    def tracked(content: bytes):
+        async def open_chunks():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                async for chunk in chunked(content)():
+                    yield chunk
+            finally:
+                active -= 1
+
+        return open_chunks
+
+    members = [ZipMember(f"{i}.txt", tracked(b"y" * 10_000)) for i in range(10)]
+    stream = stream_zip(members, prefetch=3, queue_size=1)
+
+    first = await anext(stream)
+    await asyncio.sleep(0.01)
+    assert first
+    assert 0 < active <= 3
+
+    await collect(stream)
+    assert peak <= 3
+    assert active == 0
+
+
+async def test_stream_zip_emits_before_reading_everything():
+    reads = 0
+
+    async def open_chunks():
+        nonlocal reads
+        for _ in range(100):
+            reads += 1
+            yield b"z" * CHUNK
+
+    stream = stream_zip([ZipMember("big.bin", open_chunks, size=100 * CHUNK)], queue_size=2)
+    assert await anext(stream)
+    assert reads < 10
+    await stream.aclose()
+
+
+async def test_stream_zip_propagates_read_errors_and_cancels_prefetch():
+    cancelled = asyncio.Event()
+
+    async def failing():
+        yield b"partial"
+        msg = "storage unavailable"
+        raise OSError(msg)
+
+    async def slow():
+        try:
+            yield b"a"
+            await asyncio.sleep(10)
+            yield b"b"
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    members = [ZipMember("bad.txt", failing), ZipMember("slow.txt", slow)]
+    with pytest.raises(OSError, match="storage unavailable"):
+        await collect(stream_zip(members))
+    assert cancelled.is_set()
+
+
+def _build_in_memory(contents: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in contents.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    ("file_count", "file_size"),
+    [(500, 16 * 1024), (1, 64 * 1024 * 1024)],
+    ids=["many-files", "large-file"],
+)
+async def test_benchmark_stream_zip_from_storage(tmp_path, file_count, file_size):
+    storage = LocalStorageService(MagicMock(), SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path))))
+    folder = tmp_path / "user"
+    folder.mkdir()
+    names = [f"file_{i}.bin" for i in range(file_count)]
+    for name in names:
+        (folder / name).write_bytes(b"\xab" * file_size)
+    total = file_count * file_size
+
+    members = [
+        ZipMember(name, lambda name=name: storage.open_read(flow_id="user", file_name=name), size=file_size)
+        for name in names
+    ]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_byte = None
+    archive_size = 0
+    async for chunk in stream_zip(members):
+        first_byte = first_byte or time.perf_counter() - start
+        archive_size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, streamed_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    buffered_size = len(_build_in_memory({name: (folder / name).read_bytes() for name in names}))
+    buffered_elapsed = time.perf_counter() - start
+    _, buffered_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(  # noqa: T201
+        f"\n{file_count} x {file_size} B: streamed {archive_size} B in {elapsed:.3f}s "
+        f"(first byte {first_byte * 1000:.1f}ms, peak {streamed_peak / 1024:.0f} KiB), "
+        f"in memory {buffered_size} B in {buffered_elapsed:.3f}s (peak {buffered_peak / 1024:.0f} KiB)"
+    )
+    assert archive_size >= total
+    # Memory stays bounded by the prefetch window instead of growing with the archive
+    assert streamed_peak < 8 * 1024 * 1024
+    assert streamed_peak < buffered_peak
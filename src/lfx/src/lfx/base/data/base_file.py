@@ -10,6 +10,7 @@ from zipfile import ZipFile, is_zipfile
 import orjson
 import pandas as pd
 
+from lfx.base.data.parse_cache import get_file_parse_cache, hash_file
 from lfx.custom.custom_component.component import Component
 from lfx.io import BoolInput, FileInput, HandleInput, Output, StrInput
 from lfx.schema.data import Data
@@ -214,8 +215,8 @@ class BaseFileComponent(Component, ABC):
             # Step 3: Final validation of file types
             final_files = self._filter_and_mark_files(all_files)
 
-            # Step 4: Process files
-            processed_files = self.process_files(final_files)
+            # Step 4: Process files, reusing cached results for unchanged files
+            processed_files = self._process_files_cached(final_files)
 
             # Extract and flatten Data objects to return
             return [data for file in processed_files for data in file.data if file.data]
@@ -232,6 +233,74 @@ class BaseFileComponent(Component, ABC):
                     else:
                         file.path.unlink()
 
+    def parse_cache_options(self, file_list: list[BaseFile]) -> dict[str, Any] | None:  # noqa: ARG002
+        """Return the options that determine how `file_list` is parsed, or None to disable the parse cache.
+
+        Subclasses opt into the file parse cache by returning every setting that changes the
+        parsed output. The cache key combines these options with the content hash of each file.
+        """
+        return None
+
+    def _process_files_cached(self, file_list: list[BaseFile]) -> list[BaseFile]:
+        """Process files, serving files whose content and parse options are unchanged from the parse cache."""
+        options = self.parse_cache_options(file_list) if file_list else None
+        cache = get_file_parse_cache() if options is not None else None
+        if cache is None:
+            return self.process_files(file_list)
+
+        cache_options = {"component": f"{type(self).__module__}.{type(self).__qualname__}", **options}
+        keys: dict[str, str] = {}
+        cached_rows: dict[str, list[dict[str, Any]]] = {}
+        for file in file_list:
+            path = str(file.path)
+            try:
+                keys[path] = cache.make_key(hash_file(file.path), cache_options)
+            except OSError as e:
+                self.log(f"Could not hash {file.path.name} for the parse cache: {e}")
+                continue
+            rows = cache.get(keys[path])
+            if rows is not None:
+                cached_rows[path] = rows
+
+        misses = [file for file in file_list if str(file.path) not in cached_rows]
+        # The parse options may depend on the whole batch; only split it when the misses parse the same way.
+        if misses and cached_rows and self.parse_cache_options(misses) != options:
+            misses, cached_rows = file_list, {}
+
+        parsed: dict[str, list[Data]] = {}
+        for processed in self.process_files(misses) if misses else []:
+            parsed.setdefault(str(processed.path), []).extend(processed.data)
+
+        for file in misses:
+            path = str(file.path)
+            rows = parsed.get(path, [])
+            if path in keys and rows and not any("error" in row.data for row in rows):
+                cache.set(keys[path], [row.data for row in rows])
+
+        result: list[BaseFileComponent.BaseFile] = []
+        for file in file_list:
+            path = str(file.path)
+            if path in cached_rows:
+                data = file.merge_data(
+                    [Data(data={**row, self.SERVER_FILE_PATH_FIELDNAME: path}) for row in cached_rows[path]]
+                )
+            else:
+                data = parsed.get(path, [])
+            result.append(
+                BaseFileComponent.BaseFile(
+                    data=data,
+                    path=file.path,
+                    delete_after_processing=file.delete_after_processing,
+                )
+            )
+
+        stats = cache.stats()
+        self.log(
+            f"File parse cache: {len(cached_rows)}/{len(file_list)} files served from cache "
+            f"(hit rate {stats['hit_rate']:.0%}, {stats['size_bytes']} bytes cached)."
+        )
+        return result
+
     def load_files_core(self) -> list[Data]:
         """Load files and return as Data objects.
 
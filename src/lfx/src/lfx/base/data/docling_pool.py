@@ -0,0 +1,391 @@
+"""Long-lived Docling worker processes for the File component.
+
+Each worker is a separate ``python -c`` process that imports Docling once and keeps its
+``DocumentConverter`` (and OCR models) warm between files. Requests and results are
+exchanged as JSON lines over stdin/stdout, so nothing has to be pickled. Workers are
+recycled after a fixed number of documents to bound the memory native libraries leak.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
+
+from lfx.log.logger import logger
+
+DEFAULT_MAX_DOCUMENTS_PER_WORKER = 50
+
+DOCLING_WORKER_SCRIPT = textwrap.dedent(
+    r"""
+    import json, sys, time
+
+    _IMPORTS = None
+    _CONVERTERS = {}
+
+    def try_imports():
+        global _IMPORTS
+        if _IMPORTS is None:
+            from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
+            from docling.document_converter import DocumentConverter  # type: ignore
+            from docling_core.types.doc import ImageRefMode  # type: ignore
+            _IMPORTS = (ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest")
+        return _IMPORTS
+
+    def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
+        # --- Standard PDF/IMAGE pipeline, with optional OCR ---
+        if pipeline == "standard":
+            try:
+                from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
+                from docling.document_converter import PdfFormatOption  # type: ignore
+
+                pipe = PdfPipelineOptions()
+                pipe.do_ocr = False
+
+                if ocr_engine:
+                    try:
+                        from docling.models.factories import get_ocr_factory  # type: ignore
+                        pipe.do_ocr = True
+                        fac = get_ocr_factory(allow_external_plugins=False)
+                        pipe.ocr_options = fac.create_options(kind=ocr_engine)
+                    except Exception:
+                        # If OCR setup fails, disable it
+                        pipe.do_ocr = False
+
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
+
+                return DocumentConverter(format_options=fmt)
+            except Exception:
+                return DocumentConverter()
+
+        # --- Vision-Language Model (VLM) pipeline ---
+        if pipeline == "vlm":
+            from docling.datamodel.pipeline_options import VlmPipelineOptions
+            from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
+            from docling.document_converter import PdfFormatOption
+            from docling.pipeline.vlm_pipeline import VlmPipeline
+
+            vl_pipe = VlmPipelineOptions(
+                vlm_options=GRANITEDOCLING_TRANSFORMERS,
+            )
+
+            if sys.platform == "darwin":
+                import mlx_vlm
+                vl_pipe.vlm_options = GRANITEDOCLING_MLX
+
+            # VLM paths generally don't need OCR; keep OCR off by default here.
+            fmt = {}
+            if hasattr(input_format, "PDF"):
+                fmt[getattr(input_format, "PDF")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+            if hasattr(input_format, "IMAGE"):
+                fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+
+            return DocumentConverter(format_options=fmt)
+
+        # --- Fallback: default converter with no special options ---
+        return DocumentConverter()
+
+    def get_converter(pipeline, ocr_engine):
+        # Converters are expensive to build (model loading), so keep one per configuration.
+        key = (pipeline, ocr_engine)
+        if key not in _CONVERTERS:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            _CONVERTERS[key] = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
+        return _CONVERTERS[key]
+
+    def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
+        try:
+            mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
+            return document.export_to_markdown(
+                image_mode=mode,
+                image_placeholder=img_ph,
+                page_break_placeholder=pg_ph,
+            )
+        except Exception:
+            try:
+                return document.export_to_text()
+            except Exception:
+                return str(document)
+
+    def to_rows(doc_dict):
+        rows = []
+        for t in doc_dict.get("texts", []):
+            prov = t.get("prov") or []
+            page_no = None
+            if prov and isinstance(prov, list) and isinstance(prov[0], dict):
+                page_no = prov[0].get("page_no")
+            rows.append({
+                "page_no": page_no,
+                "label": t.get("label"),
+                "text": t.get("text"),
+                "level": t.get("level"),
+            })
+        return rows
+
+    def convert(cfg):
+        file_path = cfg["file_path"]
+        meta = {"file_path": file_path}
+
+        try:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            converter = get_converter(cfg["pipeline"], cfg.get("ocr_engine"))
+            try:
+                res = converter.convert(file_path)
+            except Exception as e:
+                return {"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}
+
+            ok = False
+            if hasattr(res, "status"):
+                try:
+                    ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
+                except Exception:
+                    ok = (str(res.status).lower() == "success")
+            if not ok and hasattr(res, "document"):
+                ok = getattr(res, "document", None) is not None
+            if not ok:
+                return {"ok": False, "error": "Docling conversion failed", "meta": meta}
+
+            doc = getattr(res, "document", None)
+            if doc is None:
+                return {"ok": False, "error": "Docling produced no document", "meta": meta}
+
+            if cfg["markdown"]:
+                text = export_markdown(
+                    doc, ImageRefMode, cfg["image_mode"], cfg["md_image_placeholder"], cfg["md_page_break_placeholder"]
+                )
+                return {"ok": True, "mode": "markdown", "text": text, "meta": meta}
+
+            # structured
+            try:
+                doc_dict = doc.export_to_dict()
+            except Exception as e:
+                return {"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}
+
+            return {"ok": True, "mode": "structured", "doc": to_rows(doc_dict), "meta": meta}
+        except Exception as e:
+            return {"ok": False, "error": f"Docling processing error: {e}", "meta": meta}
+
+    def serve():
+        # stdout is the result channel; anything the libraries print goes to stderr instead.
+        channel = sys.stdout
+        sys.stdout = sys.stderr
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            cfg = json.loads(line)
+            started = time.perf_counter()
+            result = convert(cfg)
+            result["convert_seconds"] = time.perf_counter() - started
+            channel.write(json.dumps(result) + "\n")
+            channel.flush()
+
+    if __name__ == "__main__":
+        serve()
+    """
+)
+
+
+class _DoclingWorker:
+    """A single warm Docling process that converts one file at a time."""
+
+    _STDERR_TAIL_LINES = 50
+
+    def __init__(self) -> None:
+        self.documents_processed = 0
+        self._broken = False
+        self._stderr_tail: deque[str] = deque(maxlen=self._STDERR_TAIL_LINES)
+        self.process = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-u", "-c", DOCLING_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        # Drain stderr continuously so a chatty worker never blocks on a full pipe.
+        threading.Thread(target=self._drain_stderr, name="docling-worker-stderr", daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        return not self._broken and self.process.poll() is None
+
+    def _drain_stderr(self) -> None:
+        if self.process.stderr is None:
+            return
+        for line in self.process.stderr:
+            self._stderr_tail.append(line)
+
+    def _failure(self, file_path: str, reason: str) -> dict[str, Any]:
+        # The request/response stream is out of sync now, so the worker cannot be reused.
+        self._broken = True
+        stderr = "".join(self._stderr_tail).strip() or "no output from worker process"
+        return {
+            "ok": False,
+            "error": f"Docling subprocess error: {reason}. stderr={stderr}",
+            "meta": {"file_path": file_path},
+        }
+
+    def convert(self, args: dict[str, Any]) -> dict[str, Any]:
+        """Send one conversion request and wait for its result line."""
+        if self.process.stdin is None or self.process.stdout is None:
+            return self._failure(args["file_path"], "worker pipes are closed")
+        try:
+            self.process.stdin.write(json.dumps(args) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            return self._failure(args["file_path"], f"worker is not accepting requests ({e})")
+
+        self.documents_processed += 1
+        while True:
+            line = self.process.stdout.readline()
+            if not line:
+                return self._failure(args["file_path"], "worker exited before returning a result")
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                # Native code writing straight to fd 1; not part of the protocol.
+                continue
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self.process.stdin is not None:
+            with contextlib.suppress(OSError):
+                self.process.stdin.close()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class DoclingWorkerPool:
+    """A bounded pool of warm Docling worker processes.
+
+    Workers are started lazily, reused across files and flow runs, and replaced once they
+    have converted ``max_documents_per_worker`` files or have died.
+    """
+
+    _shared: ClassVar[dict[tuple[int, int], DoclingWorkerPool]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, max_workers: int = 1, max_documents_per_worker: int = DEFAULT_MAX_DOCUMENTS_PER_WORKER) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_documents_per_worker = max(1, max_documents_per_worker)
+        self._condition = threading.Condition()
+        self._idle: list[_DoclingWorker] = []
+        self._size = 0
+        self._closed = False
+
+    @classmethod
+    def shared(
+        cls, max_workers: int = 1, max_documents_per_worker: int = DEFAULT_MAX_DOCUMENTS_PER_WORKER
+    ) -> DoclingWorkerPool:
+        """Return the process-wide pool with these limits, creating it on first use.
+
+        Callers asking for other limits get a pool of their own, so they never stop each other's workers.
+        """
+        limits = (max(1, max_workers), max(1, max_documents_per_worker))
+        with cls._shared_lock:
+            pool = cls._shared.get(limits)
+            if pool is None:
+                pool = cls._shared[limits] = cls(*limits)
+            return pool
+
+    @classmethod
+    def shutdown_shared(cls) -> None:
+        with cls._shared_lock:
+            pools = list(cls._shared.values())
+            cls._shared.clear()
+        for pool in pools:
+            pool.shutdown()
+
+    def _acquire(self) -> _DoclingWorker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    msg = "Docling worker pool is shut down"
+                    raise RuntimeError(msg)
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.max_workers:
+                    self._size += 1
+                    break
+                self._condition.wait()
+        try:
+            return _DoclingWorker()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, worker: _DoclingWorker) -> None:
+        retire = not worker.alive or worker.documents_processed >= self.max_documents_per_worker
+        with self._condition:
+            retire = retire or self._closed
+            if retire:
+                self._size -= 1
+            else:
+                self._idle.append(worker)
+            self._condition.notify()
+        if retire:
+            logger.debug(f"Recycling Docling worker after {worker.documents_processed} documents")
+            worker.close()
+
+    def convert(self, args: dict[str, Any]) -> dict[str, Any]:
+        """Convert one file on a pooled worker.
+
+        The result carries a ``timings`` entry with the time spent converting inside the
+        worker and the total time including waiting for a free worker.
+        """
+        started = time.perf_counter()
+        worker = self._acquire()
+        try:
+            result = worker.convert(args)
+        finally:
+            self._release(worker)
+        result["timings"] = {
+            "convert_seconds": result.pop("convert_seconds", None),
+            "total_seconds": time.perf_counter() - started,
+        }
+        return result
+
+    def map(self, args_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Convert several files in parallel, returning results in input order."""
+        if len(args_list) <= 1 or self.max_workers == 1:
+            return [self.convert(args) for args in args_list]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(args_list)), thread_name_prefix="docling-pool"
+        ) as executor:
+            return list(executor.map(self.convert, args_list))
+
+    def shutdown(self) -> None:
+        """Stop idle workers; busy workers are stopped as soon as they are released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for worker in idle:
+            worker.close()
+
+
+atexit.register(DoclingWorkerPool.shutdown_shared)
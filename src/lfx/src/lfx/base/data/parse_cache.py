@@ -0,0 +1,202 @@
+"""On-disk cache of parsed file contents for file loading components.
+
+Entries are keyed by the SHA-256 of the file content plus the parser options, so an
+unchanged file referenced again (even through another upload path) is not parsed again.
+Each entry holds the parsed ``Data`` rows as zlib-compressed JSON. The cache is bounded
+in size and evicts the least recently used entries first. The entries of a content hash
+can be removed together, e.g. when the file they were parsed from is deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from lfx.log.logger import logger
+
+_FORMAT_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+_ENTRY_SUFFIX = ".bin"
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileParseCache:
+    """Size-bounded LRU cache of parsed file rows stored in a directory.
+
+    Recency is tracked through the modification time of the entry files, which is
+    refreshed on every hit, so it survives restarts and is shared by processes that
+    use the same directory.
+    """
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size_bytes: int | None = None
+
+    @staticmethod
+    def make_key(content_hash: str, options: dict[str, Any]) -> str:
+        """Combine a content hash and the parser options into a cache key."""
+        payload = orjson.dumps([_FORMAT_VERSION, options], option=orjson.OPT_SORT_KEYS)
+        return f"{content_hash}-{hashlib.sha256(payload).hexdigest()}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return [path for path in self.cache_dir.iterdir() if path.suffix == _ENTRY_SUFFIX]
+
+    def _current_size(self) -> int:
+        if self._size_bytes is None:
+            self._size_bytes = sum(path.stat().st_size for path in self._entries())
+        return self._size_bytes
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Return the cached rows for a key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            rows = orjson.loads(zlib.decompress(path.read_bytes()))
+            os.utime(path)
+        except FileNotFoundError:
+            rows = None
+        except (OSError, zlib.error, orjson.JSONDecodeError) as e:
+            logger.debug(f"Discarding unreadable file parse cache entry {path.name}: {e}")
+            self._discard(path)
+            rows = None
+        with self._lock:
+            if rows is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return rows
+
+    def set(self, key: str, rows: list[dict[str, Any]]) -> bool:
+        """Store rows for a key. Returns False if the rows cannot be serialized or stored."""
+        try:
+            payload = zlib.compress(orjson.dumps(rows))
+        except TypeError as e:
+            logger.debug(f"Not caching parsed file rows that are not JSON serializable: {e}")
+            return False
+        if len(payload) > self.max_size_bytes:
+            return False
+
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+            with self._lock:
+                previous = path.stat().st_size if path.exists() else 0
+                size = self._current_size()
+                tmp_path.replace(path)
+                self._size_bytes = size - previous + len(payload)
+        except OSError as e:
+            logger.debug(f"Could not write file parse cache entry {path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+        self._evict()
+        return True
+
+    def _discard(self, path: Path) -> None:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            if self._size_bytes is not None:
+                self._size_bytes -= size
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits its size bound."""
+        with self._lock:
+            if self._current_size() <= self.max_size_bytes:
+                return
+            entries = []
+            for path in self._entries():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+            entries.sort()
+            size = sum(entry_size for _, entry_size, _ in entries)
+            for _, entry_size, path in entries:
+                if size <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                size -= entry_size
+            self._size_bytes = size
+
+    def delete_content(self, content_hash: str) -> int:
+        """Remove the entries of a file content, whatever its parser options. Returns the number removed."""
+        paths = list(self.cache_dir.glob(f"{content_hash}-*{_ENTRY_SUFFIX}")) if self.cache_dir.is_dir() else []
+        for path in paths:
+            self._discard(path)
+        return len(paths)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+            self._size_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters of this process and the current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size_bytes": self._current_size(),
+                "max_size_bytes": self.max_size_bytes,
+            }
+
+
+_caches: dict[tuple[Path, int], FileParseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _default_cache_dir(config_dir: str | None = None) -> Path:
+    if config_dir:
+        return Path(config_dir) / "file_parse_cache"
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("lfx", "langflow")) / "file_parse_cache"
+
+
+def get_file_parse_cache() -> FileParseCache | None:
+    """Return the file parse cache configured in the settings, or None if it is disabled."""
+    from lfx.services.deps import get_settings_service
+
+    settings_service = get_settings_service()
+    settings = settings_service.settings if settings_service else None
+    if settings is not None and not settings.file_parse_cache:
+        return None
+
+    cache_dir = Path(settings.file_parse_cache_dir) if settings and settings.file_parse_cache_dir else None
+    max_size_mb = settings.file_parse_cache_max_size_mb if settings else 512
+    key = (cache_dir or _default_cache_dir(settings.config_dir if settings else None), max_size_mb * 1024 * 1024)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = FileParseCache(*key)
+        return _caches[key]
@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import contextlib
 import inspect
 import json
@@ -6,8 +7,13 @@ import os
 import platform
 import re
 import shutil
+import threading
+import time
 import unicodedata
+import weakref
+from collections import OrderedDict, deque
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
@@ -18,6 +24,7 @@ from httpx import codes as httpx_codes
 from langchain_core.tools import StructuredTool
 from mcp import ClientSession
 from mcp.shared.exceptions import McpError
+from mcp.types import ServerNotification, ToolListChangedNotification
 from pydantic import BaseModel
 
 from lfx.log.logger import logger
@@ -62,6 +69,165 @@ def get_session_cleanup_interval() -> int:
     return _get_mcp_setting("mcp_session_cleanup_interval")
 
 
+def get_session_heartbeat_interval() -> int:
+    """Get the interval in seconds after which an unused session is pinged, 0 to disable."""
+    return _get_mcp_setting("mcp_session_heartbeat_interval", 60)
+
+
+def get_session_max_concurrent_calls() -> int:
+    """Get the number of concurrent calls on a session before another one is opened."""
+    return _get_mcp_setting("mcp_session_max_concurrent_calls", 8)
+
+
+def get_tool_cache_ttl() -> int:
+    """Get how long in seconds the tool list of a server is reused, 0 to disable."""
+    return _get_mcp_setting("mcp_tool_cache_ttl", 300)
+
+
+def get_sync_tool_timeout() -> int:
+    """Get how long in seconds a synchronous tool call waits for its result."""
+    return _get_mcp_setting("mcp_sync_tool_timeout", 120)
+
+
+def get_sync_tool_max_pending() -> int:
+    """Get the number of synchronous tool calls that may be pending at once."""
+    return _get_mcp_setting("mcp_sync_tool_max_pending", 64)
+
+
+# Seconds to wait for the ping of a heartbeat
+HEARTBEAT_TIMEOUT = 5.0
+# Number of recent tool call latencies kept per server for percentiles
+LATENCY_WINDOW = 256
+# Number of generated tool argument schemas kept
+ARGS_SCHEMA_CACHE_SIZE = 512
+
+
+@dataclass
+class MCPServerStats:
+    """Tool call metrics of one MCP server, across all of its pooled sessions."""
+
+    calls: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    total_latency: float = 0.0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    tool_list_hits: int = 0
+    tool_list_misses: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] if latencies else 0.0
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "mean_latency": self.total_latency / self.calls if self.calls else 0.0,
+            "p50_latency": percentile(0.5),
+            "p95_latency": percentile(0.95),
+            "tool_list_hits": self.tool_list_hits,
+            "tool_list_misses": self.tool_list_misses,
+        }
+
+
+# Process-wide state of pooled sessions, shared by every MCPSessionManager
+_server_stats: dict[str, MCPServerStats] = {}
+_session_in_flight: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+_session_last_ok: weakref.WeakKeyDictionary[Any, float] = weakref.WeakKeyDictionary()
+_broken_sessions: weakref.WeakSet[Any] = weakref.WeakSet()
+_args_schema_cache: OrderedDict[str, type[BaseModel]] = OrderedDict()
+# Sessions of different event loops (e.g. the sync tool bridge) update the same server stats
+_stats_lock = threading.Lock()
+
+
+def get_mcp_server_stats() -> dict[str, dict[str, Any]]:
+    """Return the tool call metrics of every MCP server, by server key."""
+    with _stats_lock:
+        return {server_key: stats.snapshot() for server_key, stats in _server_stats.items()}
+
+
+def _get_server_stats(server_key: str) -> MCPServerStats:
+    with _stats_lock:
+        return _server_stats.setdefault(server_key, MCPServerStats())
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    return (
+        isinstance(error, ClosedResourceError | ConnectionError)
+        or (isinstance(error, McpError) and "Connection closed" in str(error))
+        or "ClosedResourceError" in str(type(error))
+    )
+
+
+@contextlib.asynccontextmanager
+async def _tracked_call(server_key: str, session):
+    """Record the latency and outcome of a call on a pooled session.
+
+    Calls that fail with a connection error mark the session as broken so the
+    session manager replaces it, instead of probing sessions before every use.
+    """
+    stats = _get_server_stats(server_key)
+    with _stats_lock:
+        stats.in_flight += 1
+    _session_in_flight[session] = _session_in_flight.get(session, 0) + 1
+    start_time = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        with _stats_lock:
+            stats.errors += 1
+        if _is_connection_error(e):
+            _broken_sessions.add(session)
+        raise
+    else:
+        _session_last_ok[session] = asyncio.get_event_loop().time()
+    finally:
+        latency = time.perf_counter() - start_time
+        with _stats_lock:
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.latencies.append(latency)
+            stats.in_flight -= 1
+        _session_in_flight[session] = max(0, _session_in_flight.get(session, 1) - 1)
+
+
+def get_args_schema(input_schema: dict) -> type[BaseModel]:
+    """Return the argument model of a tool, reusing the one generated for an identical input schema."""
+    key = json.dumps(input_schema, sort_keys=True, default=str)
+    args_schema = _args_schema_cache.get(key)
+    if args_schema is None:
+        args_schema = create_input_schema_from_json_schema(input_schema)
+        if args_schema:
+            _args_schema_cache[key] = args_schema
+            if len(_args_schema_cache) > ARGS_SCHEMA_CACHE_SIZE:
+                _args_schema_cache.popitem(last=False)
+    else:
+        _args_schema_cache.move_to_end(key)
+    return args_schema
+
+
+def get_server_key(connection_params, transport_type: str) -> str:
+    """Generate a consistent server key based on connection parameters."""
+    if transport_type == "stdio":
+        if hasattr(connection_params, "command"):
+            # Include command, args, and environment for uniqueness
+            command_str = f"{connection_params.command} {' '.join(connection_params.args or [])}"
+            env_str = str(sorted((connection_params.env or {}).items()))
+            key_input = f"{command_str}|{env_str}"
+            return f"stdio_{hash(key_input)}"
+    elif transport_type == "streamable_http" and (isinstance(connection_params, dict) and "url" in connection_params):
+        # Include URL and headers for uniqueness
+        url = connection_params["url"]
+        headers = str(sorted((connection_params.get("headers", {})).items()))
+        key_input = f"{url}|{headers}"
+        return f"streamable_http_{hash(key_input)}"
+
+    # Fallback to a generic key
+    return f"{transport_type}_{hash(str(connection_params))}"
+
+
 # RFC 7230 compliant header name pattern: token = 1*tchar
 # tchar = "!" / "#" / "$" / "%" / "&" / "'" / "*" / "+" / "-" / "." /
 #         "^" / "_" / "`" / "|" / "~" / DIGIT / ALPHA
@@ -334,6 +500,117 @@ def create_tool_coroutine(tool_name: str, arg_schema: type[BaseModel], client) -
     return tool_coroutine
 
 
+class MCPSyncBridge:
+    """Run MCP coroutines for synchronous callers without blocking the event loop that serves requests.
+
+    A call is submitted to the event loop that owns the client's sessions when that loop runs in
+    another thread. Otherwise it runs on a dedicated event loop in a daemon thread, so a synchronous
+    tool call never needs ``run_until_complete`` on a running loop. At most ``max_pending`` calls are
+    submitted at a time; further callers wait for a slot within their timeout.
+
+    Calls running on the dedicated loop use a session manager of their own, so the state of a session
+    manager is only ever used from the thread of the loop it belongs to.
+    """
+
+    def __init__(self, max_pending: int):
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._session_manager: MCPSessionManager | None = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run_loop, name="mcp-sync-bridge", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                # The sessions of a previous loop cannot be used from the new one
+                self._session_manager = None
+            return self._loop
+
+    def get_session_manager(self) -> "MCPSessionManager | None":
+        """Return the session manager of the dedicated loop when called from it, None otherwise."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        if self._loop is None or running_loop is not self._loop:
+            return None
+        if self._session_manager is None:
+            self._session_manager = MCPSessionManager()
+        return self._session_manager
+
+    def _select_loop(self, owner_loop: asyncio.AbstractEventLoop | None) -> asyncio.AbstractEventLoop:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        # Waiting on the owner loop from its own thread would deadlock, so only other threads use it
+        if (
+            isinstance(owner_loop, asyncio.AbstractEventLoop)
+            and owner_loop.is_running()
+            and owner_loop is not running_loop
+        ):
+            return owner_loop
+        return self._get_loop()
+
+    def run(self, coro: Awaitable, *, timeout: float, owner_loop: asyncio.AbstractEventLoop | None = None):
+        """Run ``coro`` on an event loop other than the caller's and return its result.
+
+        Raises:
+            TimeoutError: If no slot frees up or the call does not finish within ``timeout`` seconds
+        """
+        deadline = time.monotonic() + timeout
+        if not self._slots.acquire(timeout=timeout):
+            coro.close()
+            msg = f"No slot for a synchronous MCP call became free within {timeout} seconds"
+            raise TimeoutError(msg)
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, self._select_loop(owner_loop))
+            try:
+                return future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except concurrent.futures.TimeoutError as e:
+                future.cancel()
+                msg = f"Synchronous MCP call did not finish within {timeout} seconds"
+                raise TimeoutError(msg) from e
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """Stop the dedicated event loop and wait for its thread to exit."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._session_manager = None
+        if loop is not None and thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+_sync_bridge: MCPSyncBridge | None = None
+_sync_bridge_lock = threading.Lock()
+
+
+def get_mcp_sync_bridge() -> MCPSyncBridge:
+    """Return the process-wide bridge used by synchronous MCP tool calls."""
+    global _sync_bridge  # noqa: PLW0603
+    with _sync_bridge_lock:
+        if _sync_bridge is None:
+            _sync_bridge = MCPSyncBridge(get_sync_tool_max_pending())
+        return _sync_bridge
+
+
 def create_tool_func(tool_name: str, arg_schema: type[BaseModel], client) -> Callable[..., str]:
     def tool_func(*args, **kwargs):
         field_names = list(arg_schema.model_fields.keys())
@@ -351,8 +628,11 @@ def create_tool_func(tool_name: str, arg_schema: type[BaseModel], client) -> Cal
             _handle_tool_validation_error(e, tool_name, provided_args, arg_schema)
 
         try:
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(client.run_tool(tool_name, arguments=validated.model_dump()))
+            return get_mcp_sync_bridge().run(
+                client.run_tool(tool_name, arguments=validated.model_dump()),
+                timeout=get_sync_tool_timeout(),
+                owner_loop=getattr(client, "_loop", None),
+            )
         except Exception as e:
             logger.error(f"Tool '{tool_name}' execution failed: {e}")
             # Re-raise with more context
@@ -465,6 +745,16 @@ class MCPSessionManager:
     3. Idle timeout for automatic session cleanup
     4. Periodic cleanup of stale sessions
     5. Transport preference caching to avoid retrying failed transports
+
+    Session health is tracked passively: calls that fail with a connection error
+    mark their session as broken, and sessions left unused for a while are pinged
+    by the background task, so a session is never probed before it is handed out.
+    Concurrent calls share the least busy session of a server, and tool lists are
+    cached per server until they expire or the server sends tools/list_changed.
+
+    Sessions are bound to the event loop that created them. A loop only reuses its
+    own sessions, and synchronous tool calls served by MCPSyncBridge on its own loop
+    use a manager of their own, so a manager is never used from two threads.
     """
 
     def __init__(self):
@@ -478,6 +768,11 @@ class MCPSessionManager:
         # Cache which transport works for each server to avoid retrying failed transports
         # server_key -> "streamable_http" | "sse"
         self._transport_preference: dict[str, str] = {}
+        # (server_key, event loop) -> lock serializing session selection and creation
+        self._server_locks: dict[tuple[str, asyncio.AbstractEventLoop], asyncio.Lock] = {}
+        # server_key -> (monotonic time listed, tools)
+        self._tool_lists: dict[str, tuple[float, list]] = {}
+        self._session_counter = 0
         self._cleanup_task = None
         self._start_cleanup_task()
 
@@ -494,6 +789,7 @@ class MCPSessionManager:
             try:
                 await asyncio.sleep(get_session_cleanup_interval())
                 await self._cleanup_idle_sessions()
+                await self._heartbeat_sessions()
             except asyncio.CancelledError:
                 break
             except (RuntimeError, KeyError, ClosedResourceError, ValueError, asyncio.TimeoutError) as e:
@@ -526,26 +822,33 @@ class MCPSessionManager:
         for server_key in servers_to_remove:
             del self.sessions_by_server[server_key]
 
+    async def _heartbeat_sessions(self):
+        """Ping sessions that have not completed a call recently and drop those that do not answer."""
+        heartbeat_interval = get_session_heartbeat_interval()
+        if not heartbeat_interval:
+            return
+        current_time = asyncio.get_event_loop().time()
+        current_loop = asyncio.get_running_loop()
+
+        for server_key, server_data in list(self.sessions_by_server.items()):
+            for session_id, session_info in list(server_data.get("sessions", {}).items()):
+                if session_info.get("loop", current_loop) is not current_loop:
+                    continue
+                session = session_info["session"]
+                last_seen = max(session_info["last_used"], _session_last_ok.get(session, 0.0))
+                if _session_in_flight.get(session, 0) or current_time - last_seen < heartbeat_interval:
+                    continue
+                try:
+                    await asyncio.wait_for(session.send_ping(), timeout=HEARTBEAT_TIMEOUT)
+                except Exception as e:  # noqa: BLE001
+                    await logger.ainfo(f"Session {session_id} for server {server_key} failed heartbeat: {e}")
+                    await self._cleanup_session_by_id(server_key, session_id)
+                else:
+                    _session_last_ok[session] = asyncio.get_event_loop().time()
+
     def _get_server_key(self, connection_params, transport_type: str) -> str:
         """Generate a consistent server key based on connection parameters."""
-        if transport_type == "stdio":
-            if hasattr(connection_params, "command"):
-                # Include command, args, and environment for uniqueness
-                command_str = f"{connection_params.command} {' '.join(connection_params.args or [])}"
-                env_str = str(sorted((connection_params.env or {}).items()))
-                key_input = f"{command_str}|{env_str}"
-                return f"stdio_{hash(key_input)}"
-        elif transport_type == "streamable_http" and (
-            isinstance(connection_params, dict) and "url" in connection_params
-        ):
-            # Include URL and headers for uniqueness
-            url = connection_params["url"]
-            headers = str(sorted((connection_params.get("headers", {})).items()))
-            key_input = f"{url}|{headers}"
-            return f"streamable_http_{hash(key_input)}"
-
-        # Fallback to a generic key
-        return f"{transport_type}_{hash(str(connection_params))}"
+        return get_server_key(connection_params, transport_type)
 
     async def _validate_session_connectivity(self, session) -> bool:
         """Validate that the session is actually usable by testing a simple operation."""
@@ -598,61 +901,59 @@ class MCPSessionManager:
         This prevents creating a new subprocess for each unique context.
         """
         server_key = self._get_server_key(connection_params, transport_type)
+        lock = self._server_locks.setdefault((server_key, asyncio.get_running_loop()), asyncio.Lock())
+
+        async with lock:
+            return await self._get_or_create_pooled_session(server_key, context_id, connection_params, transport_type)
 
+    async def _get_or_create_pooled_session(self, server_key: str, context_id: str, connection_params, transport_type):
         # Ensure server entry exists
         if server_key not in self.sessions_by_server:
             self.sessions_by_server[server_key] = {"sessions": {}, "last_cleanup": asyncio.get_event_loop().time()}
 
-        server_data = self.sessions_by_server[server_key]
-        sessions = server_data["sessions"]
+        sessions = self.sessions_by_server[server_key]["sessions"]
+        current_loop = asyncio.get_running_loop()
 
-        # Try to find a healthy existing session
+        # Drop sessions whose task ended or whose calls failed with a connection error
         for session_id, session_info in list(sessions.items()):
-            session = session_info["session"]
-            task = session_info["task"]
-
-            # Check if session is still alive
-            if not task.done():
-                # Update last used time
-                session_info["last_used"] = asyncio.get_event_loop().time()
-
-                # Quick health check
-                if await self._validate_session_connectivity(session):
-                    await logger.adebug(f"Reusing existing session {session_id} for server {server_key}")
-                    # record mapping & bump ref-count for backwards compatibility
-                    self._context_to_session[context_id] = (server_key, session_id)
-                    self._session_refcount[(server_key, session_id)] = (
-                        self._session_refcount.get((server_key, session_id), 0) + 1
-                    )
-                    return session
-                await logger.ainfo(f"Session {session_id} for server {server_key} failed health check, cleaning up")
-                await self._cleanup_session_by_id(server_key, session_id)
-            else:
-                # Task is done, clean up
-                await logger.ainfo(f"Session {session_id} for server {server_key} task is done, cleaning up")
+            if session_info["task"].done() or session_info["session"] in _broken_sessions:
+                await logger.ainfo(f"Session {session_id} for server {server_key} is no longer usable, cleaning up")
                 await self._cleanup_session_by_id(server_key, session_id)
 
-        # Check if we've reached the maximum number of sessions for this server
-        if len(sessions) >= get_max_sessions_per_server():
-            # Remove the oldest session
-            oldest_session_id = min(sessions.keys(), key=lambda x: sessions[x]["last_used"])
-            await logger.ainfo(
-                f"Maximum sessions reached for server {server_key}, removing oldest session {oldest_session_id}"
+        # Reuse the least busy session of this loop, unless it is saturated and another one may still be opened
+        loop_sessions = {
+            session_id: session_info
+            for session_id, session_info in sessions.items()
+            if session_info.get("loop", current_loop) is current_loop
+        }
+        if loop_sessions:
+            session_id, session_info = min(
+                loop_sessions.items(), key=lambda item: _session_in_flight.get(item[1]["session"], 0)
             )
-            await self._cleanup_session_by_id(server_key, oldest_session_id)
+            in_flight = _session_in_flight.get(session_info["session"], 0)
+            if in_flight < get_session_max_concurrent_calls() or len(loop_sessions) >= get_max_sessions_per_server():
+                await logger.adebug(f"Reusing existing session {session_id} for server {server_key}")
+                session_info["last_used"] = asyncio.get_event_loop().time()
+                # record mapping & bump ref-count for backwards compatibility
+                self._context_to_session[context_id] = (server_key, session_id)
+                self._session_refcount[(server_key, session_id)] = (
+                    self._session_refcount.get((server_key, session_id), 0) + 1
+                )
+                return session_info["session"]
 
         # Create new session
-        session_id = f"{server_key}_{len(sessions)}"
+        self._session_counter += 1
+        session_id = f"{server_key}_{self._session_counter}"
         await logger.ainfo(f"Creating new session {session_id} for server {server_key}")
 
         if transport_type == "stdio":
-            session, task = await self._create_stdio_session(session_id, connection_params)
+            session, task = await self._create_stdio_session(session_id, connection_params, server_key=server_key)
             actual_transport = "stdio"
         elif transport_type == "streamable_http":
             # Pass the cached transport preference if available
             preferred_transport = self._transport_preference.get(server_key)
             session, task, actual_transport = await self._create_streamable_http_session(
-                session_id, connection_params, preferred_transport
+                session_id, connection_params, preferred_transport, server_key=server_key
             )
             # Cache the transport that worked for future connections
             self._transport_preference[server_key] = actual_transport
@@ -666,6 +967,7 @@ class MCPSessionManager:
             "task": task,
             "type": actual_transport,
             "last_used": asyncio.get_event_loop().time(),
+            "loop": current_loop,
         }
 
         # register mapping & initial ref-count for the new session
@@ -674,7 +976,40 @@ class MCPSessionManager:
 
         return session
 
-    async def _create_stdio_session(self, session_id: str, connection_params):
+    async def list_tools(self, connection_params, transport_type: str, session) -> list:
+        """List the tools of a server, reusing the last listing until it expires or the server changes it."""
+        server_key = self._get_server_key(connection_params, transport_type)
+        stats = _get_server_stats(server_key)
+        ttl = get_tool_cache_ttl()
+        cached = self._tool_lists.get(server_key)
+        if ttl and cached and time.monotonic() - cached[0] < ttl:
+            stats.tool_list_hits += 1
+            return cached[1]
+
+        stats.tool_list_misses += 1
+        response = await session.list_tools()
+        if ttl:
+            self._tool_lists[server_key] = (time.monotonic(), response.tools)
+        return response.tools
+
+    def invalidate_tools(self, server_key: str | None = None) -> None:
+        """Forget the cached tool list of a server, or of every server."""
+        if server_key is None:
+            self._tool_lists.clear()
+        else:
+            self._tool_lists.pop(server_key, None)
+
+    def _tool_list_changed_handler(self, server_key: str | None):
+        """Build a ClientSession message handler that drops the cached tools when the server changes them."""
+
+        async def message_handler(message) -> None:
+            if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+                await logger.adebug(f"Tool list of server {server_key} changed")
+                self.invalidate_tools(server_key)
+
+        return message_handler
+
+    async def _create_stdio_session(self, session_id: str, connection_params, *, server_key: str | None = None):
         """Create a new stdio session as a background task to avoid context issues."""
         import asyncio
 
@@ -687,7 +1022,7 @@ class MCPSessionManager:
             """Background task that keeps the session alive."""
             try:
                 async with stdio_client(connection_params) as (read, write):
-                    session = ClientSession(read, write)
+                    session = ClientSession(read, write, message_handler=self._tool_list_changed_handler(server_key))
                     async with session:
                         await session.initialize()
                         # Signal that session is ready
@@ -729,7 +1064,12 @@ class MCPSessionManager:
         return session, task
 
     async def _create_streamable_http_session(
-        self, session_id: str, connection_params, preferred_transport: str | None = None
+        self,
+        session_id: str,
+        connection_params,
+        preferred_transport: str | None = None,
+        *,
+        server_key: str | None = None,
     ):
         """Create a new Streamable HTTP session with SSE fallback as a background task to avoid context issues.
 
@@ -737,6 +1077,7 @@ class MCPSessionManager:
             session_id: Unique identifier for this session
             connection_params: Connection parameters including URL, headers, timeouts, verify_ssl
             preferred_transport: If set to "sse", skip Streamable HTTP and go directly to SSE
+            server_key: Server whose cached tool list is dropped when the server changes its tools
 
         Returns:
             tuple: (session, task, transport_used) where transport_used is "streamable_http" or "sse"
@@ -780,7 +1121,9 @@ class MCPSessionManager:
                         timeout=connection_params["timeout_seconds"],
                         httpx_client_factory=custom_httpx_factory,
                     ) as (read, write, _):
-                        session = ClientSession(read, write)
+                        session = ClientSession(
+                            read, write, message_handler=self._tool_list_changed_handler(server_key)
+                        )
                         async with session:
                             # Initialize with a timeout to fail fast
                             await asyncio.wait_for(session.initialize(), timeout=2.0)
@@ -821,7 +1164,9 @@ class MCPSessionManager:
                         sse_read_timeout,
                         httpx_client_factory=custom_httpx_factory,
                     ) as (read, write):
-                        session = ClientSession(read, write)
+                        session = ClientSession(
+                            read, write, message_handler=self._tool_list_changed_handler(server_key)
+                        )
                         async with session:
                             await session.initialize()
                             used_transport.append("sse")
@@ -903,6 +1248,14 @@ class MCPSessionManager:
             return
 
         session_info = sessions[session_id]
+        session_loop = session_info.get("loop")
+        if session_loop is not None and session_loop is not asyncio.get_running_loop():
+            # The session belongs to another event loop, so its task is cancelled there
+            sessions.pop(session_id, None)
+            if not session_loop.is_closed():
+                session_loop.call_soon_threadsafe(session_info["task"].cancel)
+            return
+
         try:
             # First try to properly close the session if it exists
             if "session" in session_info:
@@ -951,7 +1304,7 @@ class MCPSessionManager:
             await logger.awarning(f"Error cleaning up session {session_id}: {e}")
         finally:
             # Remove from sessions dict
-            del sessions[session_id]
+            sessions.pop(session_id, None)
 
     async def cleanup_all(self):
         """Clean up all sessions."""
@@ -980,6 +1333,7 @@ class MCPSessionManager:
         # Clear compatibility maps
         self._context_to_session.clear()
         self._session_refcount.clear()
+        self._tool_lists.clear()
 
         # Clear all background tasks
         for task in list(self._background_tasks):
@@ -1025,6 +1379,8 @@ class MCPStdioClient:
         self._connected = False
         self._session_context: str | None = None
         self._component_cache = component_cache
+        # Event loop that connected the client, where synchronous tool calls are sent
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def _connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
         """Connect to MCP server using stdio transport (SDK style)."""
@@ -1051,6 +1407,7 @@ class MCPStdioClient:
 
         # Store connection parameters for later use in run_tool
         self._connection_params = server_params
+        self._loop = asyncio.get_running_loop()
 
         # If no session context is set, create a default one
         if not self._session_context:
@@ -1062,9 +1419,9 @@ class MCPStdioClient:
 
         # Get or create a persistent session
         session = await self._get_or_create_session()
-        response = await session.list_tools()
+        tools = await self._get_session_manager().list_tools(self._connection_params, "stdio", session)
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
         """Connect to MCP server using stdio transport (SDK style)."""
@@ -1078,6 +1435,10 @@ class MCPStdioClient:
 
     def _get_session_manager(self) -> MCPSessionManager:
         """Get or create session manager from component cache."""
+        # Calls served on the sync bridge loop keep their sessions apart from the loop serving requests
+        bridge_session_manager = get_mcp_sync_bridge().get_session_manager()
+        if bridge_session_manager is not None:
+            return bridge_session_manager
         if not self._component_cache:
             # Fallback to instance-level session manager if no cache
             if not hasattr(self, "_session_manager"):
@@ -1136,10 +1497,11 @@ class MCPStdioClient:
                 # Get or create persistent session
                 session = await self._get_or_create_session()
 
-                result = await asyncio.wait_for(
-                    session.call_tool(tool_name, arguments=arguments),
-                    timeout=30.0,  # 30 second timeout
-                )
+                async with _tracked_call(get_server_key(self._connection_params, "stdio"), session):
+                    result = await asyncio.wait_for(
+                        session.call_tool(tool_name, arguments=arguments),
+                        timeout=30.0,  # 30 second timeout
+                    )
             except Exception as e:
                 current_error_type = type(e).__name__
                 await logger.awarning(f"Tool '{tool_name}' failed on attempt {attempt + 1}: {current_error_type} - {e}")
@@ -1238,9 +1600,15 @@ class MCPStreamableHttpClient:
         self._connected = False
         self._session_context: str | None = None
         self._component_cache = component_cache
+        # Event loop that connected the client, where synchronous tool calls are sent
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     def _get_session_manager(self) -> MCPSessionManager:
         """Get or create session manager from component cache."""
+        # Calls served on the sync bridge loop keep their sessions apart from the loop serving requests
+        bridge_session_manager = get_mcp_sync_bridge().get_session_manager()
+        if bridge_session_manager is not None:
+            return bridge_session_manager
         if not self._component_cache:
             # Fallback to instance-level session manager if no cache
             if not hasattr(self, "_session_manager"):
@@ -1300,6 +1668,7 @@ class MCPStreamableHttpClient:
             }
         elif headers:
             self._connection_params["headers"] = validated_headers
+        self._loop = asyncio.get_running_loop()
 
         # If no session context is set, create a default one
         if not self._session_context:
@@ -1311,9 +1680,9 @@ class MCPStreamableHttpClient:
 
         # Get or create a persistent session (will try Streamable HTTP, then SSE fallback)
         session = await self._get_or_create_session()
-        response = await session.list_tools()
+        tools = await self._get_session_manager().list_tools(self._connection_params, "streamable_http", session)
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(
         self,
@@ -1408,10 +1777,11 @@ class MCPStreamableHttpClient:
                 # Get or create persistent session
                 session = await self._get_or_create_session()
 
-                result = await asyncio.wait_for(
-                    session.call_tool(tool_name, arguments=arguments),
-                    timeout=30.0,  # 30 second timeout
-                )
+                async with _tracked_call(get_server_key(self._connection_params, "streamable_http"), session):
+                    result = await asyncio.wait_for(
+                        session.call_tool(tool_name, arguments=arguments),
+                        timeout=30.0,  # 30 second timeout
+                    )
             except Exception as e:
                 current_error_type = type(e).__name__
                 await logger.awarning(f"Tool '{tool_name}' failed on attempt {attempt + 1}: {current_error_type} - {e}")
@@ -1511,6 +1881,66 @@ class MCPStreamableHttpClient:
 MCPSseClient = MCPStreamableHttpClient
 
 
+class MCPStructuredTool(StructuredTool):
+    """StructuredTool that converts camelCase arguments to the snake_case fields of its schema before validation."""
+
+    def run(self, tool_input: str | dict, config=None, **kwargs):
+        """Override the main run method to handle parameter conversion before validation."""
+        # Parse tool_input if it's a string
+        if isinstance(tool_input, str):
+            try:
+                parsed_input = json.loads(tool_input)
+            except json.JSONDecodeError:
+                parsed_input = {"input": tool_input}
+        else:
+            parsed_input = tool_input or {}
+
+        # Convert camelCase parameters to snake_case
+        converted_input = self._convert_parameters(parsed_input)
+
+        # Call the parent run method with converted parameters
+        return super().run(converted_input, config=config, **kwargs)
+
+    async def arun(self, tool_input: str | dict, config=None, **kwargs):
+        """Override the main arun method to handle parameter conversion before validation."""
+        # Parse tool_input if it's a string
+        if isinstance(tool_input, str):
+            try:
+                parsed_input = json.loads(tool_input)
+            except json.JSONDecodeError:
+                parsed_input = {"input": tool_input}
+        else:
+            parsed_input = tool_input or {}
+
+        # Convert camelCase parameters to snake_case
+        converted_input = self._convert_parameters(parsed_input)
+
+        # Call the parent arun method with converted parameters
+        return await super().arun(converted_input, config=config, **kwargs)
+
+    def _convert_parameters(self, input_dict):
+        if not input_dict or not isinstance(input_dict, dict):
+            return input_dict
+
+        converted_dict = {}
+        original_fields = set(self.args_schema.model_fields.keys())
+
+        for key, value in input_dict.items():
+            if key in original_fields:
+                # Field exists as-is
+                converted_dict[key] = value
+            else:
+                # Try to convert camelCase to snake_case
+                snake_key = _camel_to_snake(key)
+                if snake_key in original_fields:
+                    converted_dict[snake_key] = value
+                else:
+                    # Keep original key
+                    converted_dict[key] = value
+
+        return converted_dict
+
+
 async def update_tools(
     server_name: str,
     server_config: dict,
@@ -1575,69 +2005,11 @@ async def update_tools(
         if not tool or not hasattr(tool, "name"):
             continue
         try:
-            args_schema = create_input_schema_from_json_schema(tool.inputSchema)
+            args_schema = get_args_schema(tool.inputSchema)
             if not args_schema:
                 logger.warning(f"Could not create schema for tool '{tool.name}' from server '{server_name}'")
                 continue
 
-            # Create a custom StructuredTool that bypasses schema validation
-            class MCPStructuredTool(StructuredTool):
-                def run(self, tool_input: str | dict, config=None, **kwargs):
-                    """Override the main run method to handle parameter conversion before validation."""
-                    # Parse tool_input if it's a string
-                    if isinstance(tool_input, str):
-                        try:
-                            parsed_input = json.loads(tool_input)
-                        except json.JSONDecodeError:
-                            parsed_input = {"input": tool_input}
-                    else:
-                        parsed_input = tool_input or {}
-
-                    # Convert camelCase parameters to snake_case
-                    converted_input = self._convert_parameters(parsed_input)
-
-                    # Call the parent run method with converted parameters
-                    return super().run(converted_input, config=config, **kwargs)
-
-                async def arun(self, tool_input: str | dict, config=None, **kwargs):
-                    """Override the main arun method to handle parameter conversion before validation."""
-                    # Parse tool_input if it's a string
-                    if isinstance(tool_input, str):
-                        try:
-                            parsed_input = json.loads(tool_input)
-                        except json.JSONDecodeError:
-                            parsed_input = {"input": tool_input}
-                    else:
-                        parsed_input = tool_input or {}
-
-                    # Convert camelCase parameters to snake_case
-                    converted_input = self._convert_parameters(parsed_input)
-
-                    # Call the parent arun method with converted parameters
-                    return await super().arun(converted_input, config=config, **kwargs)
-
-                def _convert_parameters(self, input_dict):
-                    if not input_dict or not isinstance(input_dict, dict):
-                        return input_dict
-
-                    converted_dict = {}
-                    original_fields = set(self.args_schema.model_fields.keys())
-
-                    for key, value in input_dict.items():
-                        if key in original_fields:
-                            # Field exists as-is
-                            converted_dict[key] = value
-                        else:
-                            # Try to convert camelCase to snake_case
-                            snake_key = _camel_to_snake(key)
-                            if snake_key in original_fields:
-                                converted_dict[snake_key] = value
-                            else:
-                                # Keep original key
-                                converted_dict[key] = value
-
-                    return converted_dict
-
             tool_obj = MCPStructuredTool(
                 name=tool.name,
                 description=tool.description or "",
@@ -2,22 +2,21 @@
 
 Notes:
 -----
-- ALL Docling parsing/export runs in a separate OS process to prevent memory
+- ALL Docling parsing/export runs in separate OS processes to prevent memory
   growth and native library state from impacting the main Langflow process.
+  The processes are pooled and kept warm across files and runs, and recycled
+  after a configurable number of documents.
 - Standard text/structured parsing continues to use existing BaseFileComponent
   utilities (and optional threading via `parallel_load_data`).
 """
 
 from __future__ import annotations
 
-import json
-import subprocess
-import sys
-import textwrap
 from copy import deepcopy
 from typing import Any
 
 from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.docling_pool import DEFAULT_MAX_DOCUMENTS_PER_WORKER, DoclingWorkerPool
 from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from lfx.inputs.inputs import DropdownInput, MessageTextInput, StrInput
 from lfx.io import BoolInput, FileInput, IntInput, Output
@@ -27,7 +26,7 @@ from lfx.schema.message import Message
 
 
 class FileComponent(BaseFileComponent):
-    """File component with optional Docling processing (isolated in a subprocess)."""
+    """File component with optional Docling processing (isolated in worker processes)."""
 
     display_name = "Read File"
     description = "Loads content from one or more files."
@@ -65,6 +64,16 @@ class FileComponent(BaseFileComponent):
     EXPORT_FORMAT = "Markdown"
     IMAGE_MODE = "placeholder"
 
+    # Inputs that only apply to advanced (Docling) processing.
+    DOCLING_FIELDS = (
+        "pipeline",
+        "ocr_engine",
+        "doc_key",
+        "md_image_placeholder",
+        "md_page_break_placeholder",
+        "docling_worker_max_documents",
+    )
+
     _base_inputs = deepcopy(BaseFileComponent.get_base_inputs())
 
     for input_item in _base_inputs:
@@ -127,6 +136,17 @@ class FileComponent(BaseFileComponent):
             advanced=True,
             show=False,
         ),
+        IntInput(
+            name="docling_worker_max_documents",
+            display_name="Docling Documents per Worker",
+            info=(
+                "Number of files a Docling worker process converts before it is restarted to release memory. "
+                "Workers stay loaded between files, so higher values avoid repeated model start-up."
+            ),
+            value=DEFAULT_MAX_DOCUMENTS_PER_WORKER,
+            advanced=True,
+            show=False,
+        ),
         # Deprecated input retained for backward-compatibility.
         BoolInput(
             name="use_multithreading",
@@ -176,13 +196,13 @@ class FileComponent(BaseFileComponent):
             build_config["advanced_mode"]["show"] = allow_advanced
             if not allow_advanced:
                 build_config["advanced_mode"]["value"] = False
-                for f in ("pipeline", "ocr_engine", "doc_key", "md_image_placeholder", "md_page_break_placeholder"):
+                for f in self.DOCLING_FIELDS:
                     if f in build_config:
                         build_config[f]["show"] = False
 
         # Docling Processing
         elif field_name == "advanced_mode":
-            for f in ("pipeline", "ocr_engine", "doc_key", "md_image_placeholder", "md_page_break_placeholder"):
+            for f in self.DOCLING_FIELDS:
                 if f in build_config:
                     build_config[f]["show"] = bool(field_value)
                     if f == "pipeline":
@@ -282,16 +302,23 @@ class FileComponent(BaseFileComponent):
         )
         return file_path.lower().endswith(docling_exts)
 
-    def _process_docling_in_subprocess(self, file_path: str) -> Data | None:
-        """Run Docling in a separate OS process and map the result to a Data object.
-
-        We avoid multiprocessing pickling by launching `python -c "<script>"` and
-        passing JSON config via stdin. The child prints a JSON result to stdout.
-        """
-        if not file_path:
-            return None
+    def parse_cache_options(self, file_list: list[BaseFileComponent.BaseFile]) -> dict[str, Any] | None:
+        """Return the settings that change the parsed output of `file_list` for the parse cache."""
+        advanced = bool(self.advanced_mode) and all(self._is_docling_compatible(str(f.path)) for f in file_list)
+        if not advanced:
+            return {"advanced_mode": False}
+        return {
+            "advanced_mode": True,
+            "markdown": bool(self.markdown),
+            "pipeline": str(self.pipeline),
+            "ocr_engine": str(self.ocr_engine) if self.pipeline != "vlm" else None,
+            "md_image_placeholder": str(self.md_image_placeholder),
+            "md_page_break_placeholder": str(self.md_page_break_placeholder),
+        }
 
-        args: dict[str, Any] = {
+    def _docling_args(self, file_path: str) -> dict[str, Any]:
+        """Build the conversion request sent to a Docling worker for one file."""
+        return {
             "file_path": file_path,
             "markdown": bool(self.markdown),
             "image_mode": str(self.IMAGE_MODE),
@@ -303,209 +330,8 @@ class FileComponent(BaseFileComponent):
             ),
         }
 
-        self.log(f"Starting Docling subprocess for file: {file_path}")
-        self.log(args)
-
-        # Child script for isolating the docling processing
-        child_script = textwrap.dedent(
-            r"""
-            import json, sys
-
-            def try_imports():
-                try:
-                    from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
-                    from docling.document_converter import DocumentConverter  # type: ignore
-                    from docling_core.types.doc import ImageRefMode  # type: ignore
-                    return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
-                except Exception as e:
-                    raise e
-
-            def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
-                # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
-                if pipeline == "standard":
-                    try:
-                        from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
-                        from docling.document_converter import PdfFormatOption  # type: ignore
-
-                        pipe = PdfPipelineOptions()
-                        pipe.do_ocr = False
-
-                        if ocr_engine:
-                            try:
-                                from docling.models.factories import get_ocr_factory  # type: ignore
-                                pipe.do_ocr = True
-                                fac = get_ocr_factory(allow_external_plugins=False)
-                                pipe.ocr_options = fac.create_options(kind=ocr_engine)
-                            except Exception:
-                                # If OCR setup fails, disable it
-                                pipe.do_ocr = False
-
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception:
-                        return DocumentConverter()
-
-                # --- Vision-Language Model (VLM) pipeline ---
-                if pipeline == "vlm":
-                    try:
-                        from docling.datamodel.pipeline_options import VlmPipelineOptions
-                        from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
-                        from docling.document_converter import PdfFormatOption
-                        from docling.pipeline.vlm_pipeline import VlmPipeline
-
-                        vl_pipe = VlmPipelineOptions(
-                            vlm_options=GRANITEDOCLING_TRANSFORMERS,
-                        )
-
-                        if sys.platform == "darwin":
-                            try:
-                                import mlx_vlm
-                                vl_pipe.vlm_options = GRANITEDOCLING_MLX
-                            except ImportError as e:
-                                raise e
-
-                        # VLM paths generally don't need OCR; keep OCR off by default here.
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception as e:
-                        raise e
-
-                # --- Fallback: default converter with no special options ---
-                return DocumentConverter()
-
-            def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
-                try:
-                    mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
-                    return document.export_to_markdown(
-                        image_mode=mode,
-                        image_placeholder=img_ph,
-                        page_break_placeholder=pg_ph,
-                    )
-                except Exception:
-                    try:
-                        return document.export_to_text()
-                    except Exception:
-                        return str(document)
-
-            def to_rows(doc_dict):
-                rows = []
-                for t in doc_dict.get("texts", []):
-                    prov = t.get("prov") or []
-                    page_no = None
-                    if prov and isinstance(prov, list) and isinstance(prov[0], dict):
-                        page_no = prov[0].get("page_no")
-                    rows.append({
-                        "page_no": page_no,
-                        "label": t.get("label"),
-                        "text": t.get("text"),
-                        "level": t.get("level"),
-                    })
-                return rows
-
-            def main():
-                cfg = json.loads(sys.stdin.read())
-                file_path = cfg["file_path"]
-                markdown = cfg["markdown"]
-                image_mode = cfg["image_mode"]
-                img_ph = cfg["md_image_placeholder"]
-                pg_ph = cfg["md_page_break_placeholder"]
-                pipeline = cfg["pipeline"]
-                ocr_engine = cfg.get("ocr_engine")
-                meta = {"file_path": file_path}
-
-                try:
-                    ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
-                    converter = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
-                    try:
-                        res = converter.convert(file_path)
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}))
-                        return
-
-                    ok = False
-                    if hasattr(res, "status"):
-                        try:
-                            ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
-                        except Exception:
-                            ok = (str(res.status).lower() == "success")
-                    if not ok and hasattr(res, "document"):
-                        ok = getattr(res, "document", None) is not None
-                    if not ok:
-                        print(json.dumps({"ok": False, "error": "Docling conversion failed", "meta": meta}))
-                        return
-
-                    doc = getattr(res, "document", None)
-                    if doc is None:
-                        print(json.dumps({"ok": False, "error": "Docling produced no document", "meta": meta}))
-                        return
-
-                    if markdown:
-                        text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
-                        print(json.dumps({"ok": True, "mode": "markdown", "text": text, "meta": meta}))
-                        return
-
-                    # structured
-                    try:
-                        doc_dict = doc.export_to_dict()
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}))
-                        return
-
-                    rows = to_rows(doc_dict)
-                    print(json.dumps({"ok": True, "mode": "structured", "doc": rows, "meta": meta}))
-                except Exception as e:
-                    print(
-                        json.dumps({
-                            "ok": False,
-                            "error": f"Docling processing error: {e}",
-                            "meta": {"file_path": file_path},
-                        })
-                    )
-
-            if __name__ == "__main__":
-                main()
-            """
-        )
-
-        # Validate file_path to avoid command injection or unsafe input
-        if not isinstance(args["file_path"], str) or any(c in args["file_path"] for c in [";", "|", "&", "$", "`"]):
-            return Data(data={"error": "Unsafe file path detected.", "file_path": args["file_path"]})
-
-        proc = subprocess.run(  # noqa: S603
-            [sys.executable, "-u", "-c", child_script],
-            input=json.dumps(args).encode("utf-8"),
-            capture_output=True,
-            check=False,
-        )
-
-        if not proc.stdout:
-            err_msg = proc.stderr.decode("utf-8", errors="replace") or "no output from child process"
-            return Data(data={"error": f"Docling subprocess error: {err_msg}", "file_path": file_path})
-
-        try:
-            result = json.loads(proc.stdout.decode("utf-8"))
-        except Exception as e:  # noqa: BLE001
-            err_msg = proc.stderr.decode("utf-8", errors="replace")
-            return Data(
-                data={"error": f"Invalid JSON from Docling subprocess: {e}. stderr={err_msg}", "file_path": file_path},
-            )
-
+    def _docling_result_to_data(self, result: dict[str, Any]) -> Data:
+        """Map a Docling worker result to a Data object."""
         if not result.get("ok"):
             return Data(data={"error": result.get("error", "Unknown Docling error"), **result.get("meta", {})})
 
@@ -520,13 +346,51 @@ class FileComponent(BaseFileComponent):
         rows = list(result.get("doc", []))
         return Data(data={"doc": rows, "export_format": self.EXPORT_FORMAT, **meta})
 
+    def _process_docling_files(self, file_paths: list[str]) -> list[Data]:
+        """Convert files on the shared pool of warm Docling worker processes.
+
+        Files are converted in parallel on up to 'Processing Concurrency' workers. Each
+        worker keeps its converter and OCR models loaded and is recycled after
+        'Docling Documents per Worker' files.
+        """
+        results: dict[int, Data] = {}
+        requests: dict[int, dict[str, Any]] = {}
+        for idx, file_path in enumerate(file_paths):
+            # Validate file_path to avoid passing unsafe input to the worker
+            if any(c in file_path for c in [";", "|", "&", "$", "`"]):
+                results[idx] = Data(data={"error": "Unsafe file path detected.", "file_path": file_path})
+            else:
+                requests[idx] = self._docling_args(file_path)
+
+        if requests:
+            pool = DoclingWorkerPool.shared(
+                max_workers=max(1, self.concurrency_multithreading or 1),
+                max_documents_per_worker=self.docling_worker_max_documents or DEFAULT_MAX_DOCUMENTS_PER_WORKER,
+            )
+            self.log(f"Converting {len(requests)} files with Docling on up to {pool.max_workers} worker processes.")
+            for idx, result in zip(requests, pool.map(list(requests.values())), strict=True):
+                timings = result.get("timings") or {}
+                self.log(
+                    {"file_path": file_paths[idx], "ok": bool(result.get("ok")), **timings},
+                    name="Docling timings",
+                )
+                results[idx] = self._docling_result_to_data(result)
+
+        return [results[idx] for idx in range(len(file_paths))]
+
+    def _process_docling_in_subprocess(self, file_path: str) -> Data | None:
+        """Run Docling for a single file in a worker process and map the result to a Data object."""
+        if not file_path:
+            return None
+        return self._process_docling_files([file_path])[0]
+
     def process_files(
         self,
         file_list: list[BaseFileComponent.BaseFile],
     ) -> list[BaseFileComponent.BaseFile]:
         """Process input files.
 
-        - advanced_mode => Docling in a separate process.
+        - advanced_mode => Docling in pooled worker processes.
         - Otherwise => standard parsing in current process (optionally threaded).
         """
         if not file_list:
@@ -552,10 +416,8 @@ class FileComponent(BaseFileComponent):
         # Advanced path: Check if ALL files are compatible with Docling
         if self.advanced_mode and docling_compatible:
             final_return: list[BaseFileComponent.BaseFile] = []
-            for file in file_list:
-                file_path = str(file.path)
-                advanced_data: Data | None = self._process_docling_in_subprocess(file_path)
-
+            file_paths = [str(file.path) for file in file_list]
+            for file_path, advanced_data in zip(file_paths, self._process_docling_files(file_paths), strict=True):
                 # --- UNNEST: expand each element in `doc` to its own Data row
                 payload = getattr(advanced_data, "data", {}) or {}
                 doc_rows = payload.get("doc")
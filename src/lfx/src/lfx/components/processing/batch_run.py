@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 from typing import TYPE_CHECKING, Any, cast
 
 import toml  # type: ignore[import-untyped]
 
-from lfx.custom.custom_component.component import Component
-from lfx.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from lfx.custom.custom_component.component_with_cache import ComponentWithCache
+from lfx.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from lfx.log.logger import logger
 from lfx.schema.dataframe import DataFrame
+from lfx.services.cache.utils import CacheMiss
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
 
+# Errors of the model provider clients (openai, anthropic, httpx...) worth re-sending a row for. They are
+# matched by class name so that none of these packages has to be installed.
+TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "RateLimitError",
+        "InternalServerError",
+        "ServiceUnavailableError",
+        "TimeoutException",
+        "NetworkError",
+    }
+)
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
 
-class BatchRunComponent(Component):
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether a failed model call may succeed if sent again, e.g. a timeout or a rate limit."""
+    if isinstance(error, TimeoutError | asyncio.TimeoutError | ConnectionError):
+        return True
+    if any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__):
+        return True
+    return getattr(error, "status_code", None) in TRANSIENT_STATUS_CODES
+
+
+class BatchRunComponent(ComponentWithCache):
     display_name = "Batch Run"
     description = "Runs an LLM on each row of a DataFrame column. If no column is specified, all columns are used."
     documentation: str = "https://docs.langflow.org/components-processing#batch-run"
     icon = "List"
 
+    # Base delay in seconds before re-sending failed rows; doubled on every retry.
+    retry_base_delay: float = 1.0
+
     inputs = [
         HandleInput(
             name="model",
@@ -65,6 +96,36 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info=(
+                "Number of rows sent to the model per chunk. Progress is reported and saved after every chunk, "
+                "so a re-run after a failure skips rows that already completed. Use 0 to send all rows at once."
+            ),
+            value=100,
+            required=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of concurrent model calls within a chunk. Use 0 for no limit.",
+            value=8,
+            required=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info=(
+                "Number of times a row failing with a timeout, connection or rate limit error is re-sent "
+                "before its error is recorded in the output. Other errors are recorded right away."
+            ),
+            value=2,
+            required=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -110,9 +171,78 @@ class BatchRunComponent(Component):
                 "processing_status": "failed",
             }
 
+    def _response_text(self, response: Any) -> str:
+        """Extract the text of a model response."""
+        return response.content if hasattr(response, "content") else str(response)
+
+    def _checkpoint_key(self, model: Runnable, system_msg: str, user_texts: list[str]) -> str:
+        """Build the shared cache key that identifies this batch for resuming."""
+        model_type = type(model)
+        model_name = getattr(model, "model_name", None) or getattr(model, "model", None)
+        payload = json.dumps(
+            [f"{model_type.__module__}.{model_type.__qualname__}", str(model_name), system_msg, user_texts]
+        )
+        return f"batch_run:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    def _load_checkpoint(self, key: str) -> dict[int, str]:
+        """Return the responses of rows completed by a previous, interrupted run."""
+        if self._shared_component_cache is None:
+            return {}
+        completed = self._shared_component_cache.get(key)
+        if isinstance(completed, CacheMiss) or not isinstance(completed, dict):
+            return {}
+        return dict(completed)
+
+    def _save_checkpoint(self, key: str, completed: dict[int, str]) -> None:
+        if self._shared_component_cache is not None:
+            self._shared_component_cache.set(key, dict(completed))
+
+    def _clear_checkpoint(self, key: str) -> None:
+        if self._shared_component_cache is not None:
+            self._shared_component_cache.delete(key)
+
+    async def _run_chunk(
+        self, model: Runnable, conversations: list[list[dict[str, str]]], indices: list[int]
+    ) -> dict[int, str | Exception]:
+        """Send one chunk of rows to the model, re-sending only the rows that failed with a transient error.
+
+        Returns a mapping of row index to the response text, or to the last exception
+        raised for that row once its retries are exhausted.
+        """
+        config = {"max_concurrency": self.max_concurrency} if (self.max_concurrency or 0) > 0 else None
+        max_retries = max(0, self.max_retries or 0)
+        results: dict[int, str | Exception] = {}
+        pending = indices
+        for attempt in range(max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_base_delay * 2 ** (attempt - 1))
+            batch = [conversations[idx] for idx in pending]
+            responses = await model.abatch(batch, config=config, return_exceptions=True)
+            failed: list[int] = []
+            for idx, response in zip(pending, responses, strict=True):
+                if isinstance(response, Exception):
+                    results[idx] = response
+                    if is_transient_error(response):
+                        failed.append(idx)
+                else:
+                    results[idx] = self._response_text(response)
+            if not failed:
+                break
+            await logger.awarning(
+                f"{len(failed)} rows failed with a transient error on attempt {attempt + 1}/{max_retries + 1}"
+            )
+            pending = failed
+        return results
+
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are sent in chunks of ``chunk_size`` with at most ``max_concurrency`` concurrent
+        model calls. Rows that fail are retried up to ``max_retries`` times and, if they still
+        fail, their error is recorded in the output instead of aborting the batch. Completed
+        rows are checkpointed after every chunk so re-running the same batch after an
+        interruption only sends the rows that have not completed yet.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - All original columns
@@ -139,13 +269,12 @@ class BatchRunComponent(Component):
             raise ValueError(msg)
 
         try:
+            records = cast("list[dict[str, Any]]", df.to_dict(orient="records"))
             # Determine text input for each row
             if col_name:
                 user_texts = df[col_name].astype(str).tolist()
             else:
-                user_texts = [
-                    self._format_row_as_toml(cast("dict[str, Any]", row)) for row in df.to_dict(orient="records")
-                ]
+                user_texts = [self._format_row_as_toml(row) for row in records]
 
             total_rows = len(user_texts)
             await logger.ainfo(f"Processing {total_rows} rows with batch run")
@@ -158,6 +287,11 @@ class BatchRunComponent(Component):
                 for text in user_texts
             ]
 
+            checkpoint_key = self._checkpoint_key(model, system_msg, user_texts)
+            completed = self._load_checkpoint(checkpoint_key)
+            if completed:
+                await logger.ainfo(f"Resuming batch run with {len(completed)}/{total_rows} rows already completed")
+
             # Configure the model with project info and callbacks
             model = model.with_config(
                 {
@@ -166,35 +300,42 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
 
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            chunk_size = self.chunk_size if (self.chunk_size or 0) > 0 else max(1, total_rows)
+            errors: dict[int, Exception] = {}
+            for chunk_start in range(0, total_rows, chunk_size):
+                indices = [
+                    idx for idx in range(chunk_start, min(chunk_start + chunk_size, total_rows)) if idx not in completed
+                ]
+                if indices:
+                    for idx, result in (await self._run_chunk(model, conversations, indices)).items():
+                        if isinstance(result, Exception):
+                            errors[idx] = result
+                        else:
+                            completed[idx] = result
+                    self._save_checkpoint(checkpoint_key, completed)
+
+                processed = min(chunk_start + chunk_size, total_rows)
+                progress = f"Processed {processed}/{total_rows} rows ({len(errors)} failed)"
+                self.log(progress, name="Batch Run Progress")
+                await logger.ainfo(progress)
 
             # Build the final data with enhanced metadata
             rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
-                row = self._create_base_row(
-                    cast("dict[str, Any]", original_row), model_response=response_text, batch_index=idx
-                )
-                self._add_metadata(row, success=True, system_msg=system_msg)
+            for idx, original_row in enumerate(records):
+                if idx in errors:
+                    row = self._create_base_row(original_row, model_response="", batch_index=idx)
+                    self._add_metadata(row, success=False, error=str(errors[idx]))
+                else:
+                    row = self._create_base_row(original_row, model_response=completed[idx], batch_index=idx)
+                    self._add_metadata(row, success=True, system_msg=system_msg)
                 rows.append(row)
 
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    await logger.ainfo(f"Processed {idx + 1}/{total_rows} rows")
-
-            await logger.ainfo("Batch processing completed successfully")
+            self._clear_checkpoint(checkpoint_key)
+            if errors:
+                await logger.awarning(f"Batch processing completed with {len(errors)} failed rows")
+            else:
+                await logger.ainfo("Batch processing completed successfully")
             return DataFrame(rows)
 
         except (KeyError, AttributeError) as e:
@@ -0,0 +1,196 @@
+"""Process-wide cache of compiled custom component classes.
+
+Building a vertex evaluates the component's source code through
+``validate.create_class``, which parses the AST, prepares the global scope and
+executes the class body. The resulting class only depends on the source code,
+so it is cached here keyed by the component code hash and reused across runs.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+CLASS_CACHE_MODULE_NAME = "custom_component"
+
+
+class ComponentClassCache:
+    """A bounded LRU cache of component classes keyed by code hash.
+
+    The cache is bounded both by number of entries and by an approximate memory
+    budget. The size of each entry is estimated from the size of its source code,
+    which is proportional to the AST, code objects and class namespace it produces.
+
+    Attributes:
+        max_entries (int): Maximum number of classes to keep.
+        max_memory_bytes (int): Approximate memory budget for cached entries.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required compiling the class.
+        evictions (int): Number of entries dropped to respect the bounds.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES):
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self._entries: OrderedDict[str, tuple[str, type, int]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def hash_code(code: str) -> str:
+        """Return the cache key for a piece of component source code."""
+        from lfx.custom.utils import _generate_code_hash
+
+        return _generate_code_hash(code, CLASS_CACHE_MODULE_NAME)
+
+    @staticmethod
+    def _estimate_size(code: str) -> int:
+        # Source text, AST and code objects scale roughly linearly with the code length.
+        return len(code) * 8
+
+    def get(self, code: str) -> type | None:
+        """Return the cached class for ``code`` or None if it is not cached."""
+        key = self.hash_code(code)
+        with self._lock:
+            entry = self._entries.get(key)
+            # The hash is truncated, so compare the full source to rule out collisions
+            if entry is None or entry[0] != code:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, code: str, class_object: type) -> None:
+        """Store the class compiled from ``code``, evicting old entries if needed."""
+        key = self.hash_code(code)
+        size = self._estimate_size(code)
+        if self.max_entries <= 0 or size > self.max_memory_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (code, class_object, size)
+            self._memory_bytes += size
+            while len(self._entries) > self.max_entries or self._memory_bytes > self.max_memory_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_create(self, code: str, factory: Callable[[str], type]) -> type:
+        """Return the cached class for ``code``, compiling it with ``factory`` on a miss.
+
+        Errors raised by ``factory`` are propagated and nothing is cached.
+        """
+        if (class_object := self.get(code)) is not None:
+            return class_object
+        class_object = factory(code)
+        self.set(code, class_object)
+        return class_object
+
+    def _pop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._memory_bytes -= entry[2]
+        return True
+
+    def invalidate(self, code: str) -> bool:
+        """Drop the class compiled from ``code``. Returns True if it was cached."""
+        key = self.hash_code(code)
+        with self._lock:
+            return self._pop(key)
+
+    def clear(self) -> None:
+        """Drop all cached classes and reset the metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "max_entries": self.max_entries,
+                "max_memory_bytes": self.max_memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __contains__(self, code: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(self.hash_code(code))
+            return entry is not None and entry[0] == code
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_class_cache: ComponentClassCache | None = None
+_class_cache_lock = threading.Lock()
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    """Return the process-wide component class cache, creating it from the settings on first use."""
+    global _class_cache  # noqa: PLW0603
+    if _class_cache is None:
+        with _class_cache_lock:
+            if _class_cache is None:
+                max_entries, max_memory_bytes = DEFAULT_MAX_ENTRIES, DEFAULT_MAX_MEMORY_BYTES
+                try:
+                    from lfx.services.deps import get_settings_service
+
+                    settings_service = get_settings_service()
+                    if settings_service is not None:
+                        max_entries = settings_service.settings.component_class_cache_max_entries
+                        max_memory_bytes = settings_service.settings.component_class_cache_max_memory_mb * 1024 * 1024
+                except Exception:  # noqa: BLE001
+                    logger.debug("Could not read component class cache settings, using defaults", exc_info=True)
+                _class_cache = ComponentClassCache(max_entries=max_entries, max_memory_bytes=max_memory_bytes)
+    return _class_cache
+
+
+def _iter_flow_codes(flow_data: dict | None) -> Iterable[str]:
+    if not flow_data:
+        return
+    for node in flow_data.get("nodes", []):
+        template = node.get("data", {}).get("node", {}).get("template", {})
+        code_field = template.get("code") if isinstance(template, dict) else None
+        if isinstance(code_field, dict) and isinstance(code_field.get("value"), str) and code_field["value"]:
+            yield code_field["value"]
+
+
+def invalidate_flow_component_classes(old_flow_data: dict | None, new_flow_data: dict | None = None) -> int:
+    """Evict the classes of components that were removed or edited in a flow.
+
+    Entries are content addressed, so an edited component never hits a stale class;
+    this only releases memory held by code that the flow no longer uses.
+
+    Args:
+        old_flow_data: The flow data before the change.
+        new_flow_data: The flow data after the change. None when the flow was deleted.
+
+    Returns:
+        The number of evicted classes.
+    """
+    stale_codes = set(_iter_flow_codes(old_flow_data)) - set(_iter_flow_codes(new_flow_data))
+    cache = get_component_class_cache()
+    return sum(cache.invalidate(code) for code in stale_codes)
@@ -4,7 +4,7 @@ import ast
 import asyncio
 import inspect
 from collections.abc import AsyncIterator, Iterator
-from copy import deepcopy
+from copy import copy, deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
 from uuid import UUID
@@ -69,6 +69,27 @@ def get_component_toolkit():
 
 BACKWARDS_COMPATIBLE_ATTRIBUTES = ["user_id", "vertex", "tracing_service"]
 CONFIG_ATTRIBUTES = ["_display_name", "_description", "_icon", "_name", "_metadata"]
+IMMUTABLE_FIELD_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _copy_input(input_: InputTypes) -> InputTypes:
+    """Deep-copy an input, sharing its immutable field values instead of deep-copying each of them.
+
+    Most fields of an input are strings, numbers and flags, and every component instance copies
+    all of its inputs, so skipping deepcopy for them makes instantiating components much cheaper.
+    """
+    if not isinstance(input_, BaseModel):
+        return deepcopy(input_)
+    copied = copy(input_)
+    fields = copied.__dict__
+    for name, value in fields.items():
+        if type(value) not in IMMUTABLE_FIELD_TYPES:
+            fields[name] = deepcopy(value)
+    if copied.__pydantic_extra__:
+        object.__setattr__(copied, "__pydantic_extra__", deepcopy(copied.__pydantic_extra__))
+    if copied.__pydantic_private__:
+        object.__setattr__(copied, "__pydantic_private__", deepcopy(copied.__pydantic_private__))
+    return copied
 
 
 class PlaceholderGraph(NamedTuple):
@@ -533,7 +554,7 @@ class Component(CustomComponent):
                 msg = self.build_component_error_message("Input name cannot be None")
                 raise ValueError(msg)
             try:
-                self._inputs[input_.name] = deepcopy(input_)
+                self._inputs[input_.name] = _copy_input(input_)
             except TypeError:
                 self._inputs[input_.name] = input_
 
@@ -6,7 +6,16 @@ if TYPE_CHECKING:
     from lfx.custom.custom_component.custom_component import CustomComponent
 
 
-def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+def _create_class_from_code(code: str) -> type["CustomComponent"]:
     class_name = validate.extract_class_name(code)
     return validate.create_class(code, class_name)
+
+
+def eval_custom_component_code(code: str) -> type["CustomComponent"]:
+    """Evaluate custom component code.
+
+    Classes are cached by code hash so identical code is only parsed and executed once per process.
+    """
+    from lfx.custom.class_cache import get_component_class_cache
+
+    return get_component_class_cache().get_or_create(code, _create_class_from_code)
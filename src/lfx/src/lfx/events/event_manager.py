@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
+import threading
 import time
 import uuid
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 from fastapi.encoders import jsonable_encoder
 from typing_extensions import Protocol
@@ -13,9 +15,44 @@ from typing_extensions import Protocol
 from lfx.log.logger import logger
 
 if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from lfx.services.settings.base import Settings
+
     # Lightweight type stub for log types
     LoggableType = dict | str | int | float | bool | list | None
 
+TokenOverflowPolicy = Literal["block", "drop_merge"]
+
+
+class RawJSON:
+    """A payload that is already encoded as JSON.
+
+    Event data containing a RawJSON, either directly or as a value of the data dict, is
+    spliced into the event envelope as is instead of being encoded again.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str | bytes):
+        self.value = value.encode("utf-8") if isinstance(value, str) else value
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> RawJSON:
+        """Encode a pydantic model once, with the same output as `model_dump_json`."""
+        return cls(model.__pydantic_serializer__.to_json(model))
+
+
+def _encode_json(data: Any) -> bytes:
+    if isinstance(data, RawJSON):
+        return data.value
+    if isinstance(data, dict) and any(isinstance(value, RawJSON) for value in data.values()):
+        items = b", ".join(
+            json.dumps(str(key)).encode("utf-8") + b": " + _encode_json(value) for key, value in data.items()
+        )
+        return b"{" + items + b"}"
+    return json.dumps(jsonable_encoder(data)).encode("utf-8")
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -26,9 +63,62 @@ class PartialEventCallback(Protocol):
 
 
 class EventManager:
-    def __init__(self, queue):
+    """Registers event callbacks and writes the events of a job to its queue.
+
+    By default every event is encoded and queued as soon as it is sent. Token events can
+    optionally be coalesced: consecutive tokens of the same message are merged into a single
+    frame that is emitted once `token_coalesce_interval` seconds have passed or
+    `token_coalesce_max_chars` characters are pending. Any other event flushes the pending
+    frame first, so the order of events is preserved.
+
+    When coalescing is enabled and `max_queue_size` is set, token events are held back while the
+    queue holds that many events. With the "block" policy, producers running in worker threads
+    wait up to `block_timeout` seconds for the consumer to catch up, which consumers signal with
+    `notify_consumed`; with "drop_merge", or when the producer runs on the event loop and cannot
+    block, the tokens are merged into the pending frame instead of being queued individually.
+    Other events are never held back.
+    """
+
+    def __init__(
+        self,
+        queue,
+        *,
+        token_coalesce_interval: float = 0.0,
+        token_coalesce_max_chars: int = 1024,
+        max_queue_size: int = 0,
+        overflow_policy: TokenOverflowPolicy = "block",
+        block_timeout: float = 1.0,
+    ):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.token_coalesce_interval = token_coalesce_interval
+        self.token_coalesce_max_chars = token_coalesce_max_chars
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self._token_lock = threading.Lock()
+        self._capacity = threading.Condition()
+        self._waiting_producers = 0
+        self._pending_token: dict | None = None
+        self._pending_chunks: list[str] = []
+        self._pending_chars = 0
+        self._pending_since = 0.0
+        self._flush_scheduled = False
+        self._block_timed_out = False
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self.events_sent = 0
+        self.tokens_received = 0
+        self.token_frames_sent = 0
+        self.tokens_merged_on_overflow = 0
+        self.producer_wait_time = 0.0
+        self.max_queue_depth = 0
+
+    @property
+    def coalesces_tokens(self) -> bool:
+        return self.token_coalesce_interval > 0
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -63,7 +153,7 @@ class EventManager:
             callback_ = partial(callback, manager=self, event_type=event_type)
         self.events[name] = callback_
 
-    def send_event(self, *, event_type: str, data: LoggableType):
+    def send_event(self, *, event_type: str, data: LoggableType | RawJSON):
         try:
             # Simple event creation without heavy dependencies
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
@@ -71,16 +161,154 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
+        if self.coalesces_tokens:
+            if event_type == "token" and self._buffer_token(data):
+                return
+            self.flush_tokens()
+        self._put_event(event_type, data)
+
+    def _put_event(self, event_type: str, data: LoggableType | RawJSON) -> None:
+        # Same bytes as json.dumps({"event": event_type, "data": data}), without re-encoding RawJSON payloads
+        event_data = b'{"event": ' + json.dumps(event_type).encode("utf-8") + b', "data": ' + _encode_json(data)
+        event_data += b"}\n\n"
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
         if self.queue:
             try:
-                self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+                self.queue.put_nowait((event_id, event_data, time.time()))
+                self.events_sent += 1
+                if self.coalesces_tokens:
+                    self.max_queue_depth = max(self.max_queue_depth, self._queue_depth())
             except Exception:  # noqa: BLE001
                 logger.debug("Queue not available for event")
 
+    def _queue_depth(self) -> int:
+        qsize = getattr(self.queue, "qsize", None)
+        return qsize() if callable(qsize) else 0
+
+    def _queue_is_full(self) -> bool:
+        return self.max_queue_size > 0 and self._queue_depth() >= self.max_queue_size
+
+    def _can_block(self) -> bool:
+        # Producers on the event loop cannot block without stalling the consumer
+        if self.overflow_policy != "block" or self._block_timed_out:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+
+    def _wait_for_queue_capacity(self) -> None:
+        """Block the calling worker thread until the queue has room or `block_timeout` passes."""
+        start_time = time.monotonic()
+        with self._capacity:
+            self._waiting_producers += 1
+            try:
+                self._capacity.wait_for(lambda: not self._queue_is_full(), timeout=self.block_timeout)
+            finally:
+                self._waiting_producers -= 1
+        self.producer_wait_time += time.monotonic() - start_time
+
+    def notify_consumed(self) -> None:
+        """Wake the producers waiting for room in the queue. Consumers call it after taking events."""
+        if self._waiting_producers:
+            with self._capacity:
+                self._capacity.notify_all()
+
+    def _buffer_token(self, data: LoggableType) -> bool:
+        """Add a token to the pending frame. Returns False if the token cannot be coalesced."""
+        if not isinstance(data, dict) or not isinstance(data.get("chunk"), str):
+            return False
+        with self._token_lock:
+            self.tokens_received += 1
+            if self._pending_token is not None and self._pending_token.get("id") != data.get("id"):
+                self._emit_pending_token()
+            if self._pending_token is None:
+                self._pending_since = time.monotonic()
+            self._pending_token = data
+            self._pending_chunks.append(data["chunk"])
+            self._pending_chars += len(data["chunk"])
+
+            frame_ready = (
+                self._pending_chars >= self.token_coalesce_max_chars
+                or time.monotonic() - self._pending_since >= self.token_coalesce_interval
+            )
+            if frame_ready and not self._queue_is_full():
+                self._emit_pending_token()
+                return True
+            if not frame_ready or not self._can_block():
+                if frame_ready:
+                    self.tokens_merged_on_overflow += 1
+                self._schedule_flush()
+                return True
+
+        # Wait outside of the lock so other events can still be sent meanwhile
+        self._wait_for_queue_capacity()
+        with self._token_lock:
+            if self._queue_is_full():
+                # The consumer is stalled, merge tokens until it catches up instead of waiting again
+                self._block_timed_out = True
+                self.tokens_merged_on_overflow += 1
+                self._schedule_flush()
+            else:
+                self._emit_pending_token()
+        return True
+
+    def _emit_pending_token(self) -> None:
+        if self._pending_token is None:
+            return
+        data = {**self._pending_token, "chunk": "".join(self._pending_chunks)}
+        self._pending_token = None
+        self._block_timed_out = False
+        self._pending_chunks = []
+        self._pending_chars = 0
+        self._put_event("token", data)
+        self.token_frames_sent += 1
+
+    def _schedule_flush(self) -> None:
+        # Make sure the last tokens of a stream are sent even if no other event follows them
+        if self._flush_scheduled or self._loop is None or self._loop.is_closed():
+            return
+        self._flush_scheduled = True
+        delay = max(self.token_coalesce_interval, 0.01)
+        try:
+            self._loop.call_soon_threadsafe(self._loop.call_later, delay, self._scheduled_flush)
+        except RuntimeError:
+            self._flush_scheduled = False
+
+    def _scheduled_flush(self) -> None:
+        self._flush_scheduled = False
+        if not self._token_lock.acquire(blocking=False):
+            self._schedule_flush()
+            return
+        try:
+            if self._pending_token is None:
+                return
+            if self._queue_is_full():
+                self._schedule_flush()
+                return
+            self._emit_pending_token()
+        finally:
+            self._token_lock.release()
+
+    def flush_tokens(self) -> None:
+        """Send the pending token frame, if any."""
+        with self._token_lock:
+            self._emit_pending_token()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the queue and token coalescing metrics of this event manager."""
+        return {
+            "queue_depth": self._queue_depth(),
+            "max_queue_depth": self.max_queue_depth,
+            "events_sent": self.events_sent,
+            "tokens_received": self.tokens_received,
+            "token_frames_sent": self.token_frames_sent,
+            "coalescing_ratio": self.tokens_received / self.token_frames_sent if self.token_frames_sent else 0.0,
+            "tokens_merged_on_overflow": self.tokens_merged_on_overflow,
+            "producer_wait_time": self.producer_wait_time,
+        }
+
     def noop(self, *, data: LoggableType) -> None:
         pass
 
@@ -88,8 +316,18 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue=None):
-    manager = EventManager(queue)
+def get_streaming_options(settings: Settings) -> dict[str, Any]:
+    """Return the EventManager token streaming options configured in the settings."""
+    return {
+        "token_coalesce_interval": settings.event_token_coalesce_interval,
+        "token_coalesce_max_chars": settings.event_token_coalesce_max_chars,
+        "max_queue_size": settings.event_queue_max_size,
+        "overflow_policy": settings.event_queue_overflow_policy,
+    }
+
+
+def create_default_event_manager(queue=None, **options):
+    manager = EventManager(queue, **options)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -102,8 +340,8 @@ def create_default_event_manager(queue=None):
     return manager
 
 
-def create_stream_tokens_event_manager(queue=None):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue=None, **options):
+    manager = EventManager(queue, **options)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
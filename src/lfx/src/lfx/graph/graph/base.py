@@ -9,15 +9,18 @@ import queue
 import threading
 import traceback
 import uuid
+import weakref
 from collections import defaultdict, deque
 from datetime import datetime, timezone
 from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
+from lfx.graph.graph.checkpoint import GraphCheckpointer, load_graph_checkpoint
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
+from lfx.graph.graph.diff import GraphDiff, diff_graph_data
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from lfx.graph.graph.state_model import create_state_model_from_graph
@@ -34,11 +37,12 @@ from lfx.graph.utils import log_vertex_build
 from lfx.graph.vertex.base import Vertex, VertexStates
 from lfx.graph.vertex.schema import NodeData, NodeTypeEnum
 from lfx.graph.vertex.vertex_types import ComponentVertex, InterfaceVertex, StateVertex
+from lfx.interface.initialize.loading import prefetch_load_from_db_variables
 from lfx.log.logger import LogConfig, configure, logger
 from lfx.schema.dotdict import dotdict
 from lfx.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from lfx.services.cache.utils import CacheMiss
-from lfx.services.deps import get_chat_service, get_tracing_service
+from lfx.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from lfx.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -50,9 +54,31 @@ if TYPE_CHECKING:
     from lfx.graph.edge.schema import EdgeData
     from lfx.graph.schema import ResultData
     from lfx.schema.schema import InputValueRequest
-    from lfx.services.chat.schema import GetCache, SetCache
+    from lfx.services.chat.schema import DeleteCache, GetCache, SetCache
     from lfx.services.tracing.service import TracingService
 
+GraphScheduler = Literal["layered", "dataflow"]
+
+# One semaphore per event loop, shared by every graph processed in this worker
+_worker_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+# Set while a vertex build holds a worker slot, so graphs processed from inside that build (subflows,
+# agents running flows as tools) reuse the slot instead of waiting on one their parent may never release
+_holds_worker_slot: contextvars.ContextVar[bool] = contextvars.ContextVar("graph_holds_worker_slot", default=False)
+
+
+def _get_worker_semaphore(max_concurrency: int) -> asyncio.Semaphore | None:
+    """Returns the worker-wide semaphore limiting concurrent vertex builds, or None if unlimited."""
+    if max_concurrency <= 0:
+        return None
+    loop = asyncio.get_running_loop()
+    semaphore = _worker_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        _worker_semaphores[loop] = semaphore
+    return semaphore
+
 
 class Graph:
     """A class representing a graph of vertices and edges."""
@@ -105,7 +131,14 @@ class Graph:
         # Conditional routing system (separate from ACTIVE/INACTIVE cycle management)
         self.conditionally_excluded_vertices: set = set()  # Vertices excluded by conditional routing
         self.conditional_exclusion_sources: dict[str, set[str]] = {}  # Maps source vertex -> excluded vertices
-        self.edges: list[CycleEdge] = []
+        # Edges are indexed by source, target and (source, target) pair; see the `edges` property.
+        self._graph_edges: list[CycleEdge] = []
+        self._edges_by_source: dict[str, list[CycleEdge]] = {}
+        self._edges_by_target: dict[str, list[CycleEdge]] = {}
+        self._edges_by_vertex: dict[str, list[CycleEdge]] = {}
+        self._edge_by_pair: dict[tuple[str, str], CycleEdge] = {}
+        self._traversal_cache: dict[tuple[str, str, bool], list[Vertex]] = {}
+        self._traversal_maps_key: tuple[int, int] | None = None
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
@@ -126,6 +159,12 @@ class Graph:
         self._cycle_vertices: set[str] | None = None
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
+        self._changed_vertex_ids: set[str] = set()
+        # Vertices whose results can be reused by the next run after an update, see `update_from_payload`
+        self._reusable_vertex_ids: set[str] = set()
+        # Vertices that activated, deactivated or excluded branches when they were built
+        self._routing_vertex_ids: set[str] = set()
+        self._checkpointer: GraphCheckpointer | None = None
         self._end_trace_tasks: set[asyncio.Task] = set()
 
         if context and not isinstance(context, dict):
@@ -142,6 +181,59 @@ class Graph:
             msg = "You must provide both input and output components"
             raise ValueError(msg)
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        """The edges of the graph.
+
+        Assigning a new list re-indexes it. Use `_append_edge` to add edges one by one, so
+        the adjacency indexes stay consistent without a full rebuild.
+        """
+        return self._graph_edges
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._graph_edges = list(edges)
+        self._reindex_edges()
+
+    def _reindex_edges(self) -> None:
+        """Rebuilds the edge indexes from `self.edges`."""
+        self._edges_by_source = {}
+        self._edges_by_target = {}
+        self._edges_by_vertex = {}
+        self._edge_by_pair = {}
+        for edge in self._graph_edges:
+            self._index_edge(edge)
+        self._invalidate_topology()
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        self._edges_by_source.setdefault(edge.source_id, []).append(edge)
+        self._edges_by_target.setdefault(edge.target_id, []).append(edge)
+        self._edges_by_vertex.setdefault(edge.source_id, []).append(edge)
+        if edge.target_id != edge.source_id:
+            self._edges_by_vertex.setdefault(edge.target_id, []).append(edge)
+        self._edge_by_pair.setdefault((edge.source_id, edge.target_id), edge)
+
+    def _append_edge(self, edge: CycleEdge) -> None:
+        """Adds an edge to the graph and to the edge indexes."""
+        self._graph_edges.append(edge)
+        self._index_edge(edge)
+        self._invalidate_topology()
+
+    def _has_edge(self, edge: CycleEdge) -> bool:
+        return edge in self._edges_by_source.get(edge.source_id, ())
+
+    def _invalidate_topology(self) -> None:
+        """Drops cached traversals after the vertices, edges or adjacency maps change."""
+        self._traversal_cache.clear()
+
+    def _get_traversal_cache(self) -> dict[tuple[str, str, bool], list[Vertex]]:
+        # Traversals follow the adjacency maps, so replacing either map also invalidates the cache
+        maps_key = (id(self.predecessor_map), id(self.successor_map))
+        if self._traversal_maps_key != maps_key:
+            self._traversal_cache.clear()
+            self._traversal_maps_key = maps_key
+        return self._traversal_cache
+
     @property
     def lock(self):
         """Lazy initialization of asyncio.Lock to avoid event loop binding issues."""
@@ -250,7 +342,17 @@ class Graph:
         graph_dict["endpoint_name"] = str(endpoint_name)
         return graph_dict
 
-    def add_nodes_and_edges(self, nodes: list[NodeData], edges: list[EdgeData]) -> None:
+    def add_nodes_and_edges(
+        self, nodes: list[NodeData], edges: list[EdgeData], *, processed_graph_data: GraphData | None = None
+    ) -> None:
+        """Adds the nodes and edges of a flow payload and builds the graph.
+
+        Args:
+            nodes: The nodes of the flow.
+            edges: The edges of the flow.
+            processed_graph_data: The result of ``process_flow`` on the nodes and edges, if it was already
+                computed. It is used as is, so it must not be shared with another graph.
+        """
         self._vertices = nodes
         self._edges = edges
         self.raw_graph_data = {"nodes": nodes, "edges": edges}
@@ -260,7 +362,9 @@ class Graph:
                 self.top_level_vertices.append(vertex_id)
             if vertex_id in self.cycle_vertices:
                 self.run_manager.add_to_cycle_vertices(vertex_id)
-        self._graph_data = process_flow(self.raw_graph_data)
+        if processed_graph_data is None:
+            processed_graph_data = process_flow(self.raw_graph_data)
+        self._graph_data = processed_graph_data
 
         self._vertices = self._graph_data["nodes"]
         self._edges = self._graph_data["edges"]
@@ -495,6 +599,7 @@ class Graph:
         self.successor_map[source_id].append(target_id)
         self.in_degree_map[target_id] += 1
         self.parent_child_map[source_id].append(target_id)
+        self._invalidate_topology()
 
     def add_node(self, node: NodeData) -> None:
         self._vertices.append(node)
@@ -650,6 +755,9 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await prefetch_load_from_db_variables(
+            self.vertices, self.user_id, request_variables=self.context.get("request_variables")
+        )
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -912,6 +1020,7 @@ class Graph:
 
         self.in_degree_map = self.build_in_degree(edges)
         self.parent_child_map = self.build_parent_child_map(vertices)
+        self._invalidate_topology()
 
     def reset_inactivated_vertices(self) -> None:
         """Resets the inactivated vertices in the graph."""
@@ -955,6 +1064,7 @@ class Graph:
         return visited
 
     def mark_branch(self, vertex_id: str, state: str, output_name: str | None = None) -> None:
+        self._routing_vertex_ids.add(vertex_id)
         visited = self._mark_branch(vertex_id=vertex_id, state=state, output_name=output_name)
         new_predecessor_map, _ = self.build_adjacency_maps(self.edges)
         new_predecessor_map = {k: v for k, v in new_predecessor_map.items() if k in visited}
@@ -984,6 +1094,7 @@ class Graph:
             vertex_id: The source vertex making the exclusion decision
             output_name: The output name to follow when excluding downstream vertices
         """
+        self._routing_vertex_ids.add(vertex_id)
         # Clear any previous exclusions from this source vertex
         if vertex_id in self.conditional_exclusion_sources:
             previous_exclusions = self.conditional_exclusion_sources[vertex_id]
@@ -1024,10 +1135,7 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+        return self._edge_by_pair.get((source_id, target_id))
 
     def build_parent_child_map(self, vertices: list[Vertex]):
         parent_child_map = defaultdict(list)
@@ -1114,8 +1222,16 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges", [])
         self.__dict__.update(state)
+        self._traversal_cache = {}
+        self._traversal_maps_key = None
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._changed_vertex_ids = set()
+        self._reusable_vertex_ids = set()
+        self._routing_vertex_ids = set()
+        self._checkpointer = None
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
 
@@ -1171,11 +1287,8 @@ class Graph:
 
     def update_edges_from_vertex(self, other_vertex: Vertex) -> None:
         """Updates the edges of a vertex in the Graph."""
-        new_edges = []
-        for edge in self.edges:
-            if other_vertex.id in {edge.source_id, edge.target_id}:
-                continue
-            new_edges.append(edge)
+        stale_edges = {id(edge) for edge in self._edges_by_vertex.get(other_vertex.id, ())}
+        new_edges = [edge for edge in self.edges if id(edge) not in stale_edges]
         new_edges += other_vertex.edges
         self.edges = new_edges
 
@@ -1193,53 +1306,181 @@ class Graph:
         return all(edge in other_vertex.edges for edge in vertex.edges)
 
     def update(self, other: Graph) -> Graph:
-        # Existing vertices in self graph
-        existing_vertex_ids = {vertex.id for vertex in self.vertices}
-        # Vertex IDs in the other graph
-        other_vertex_ids = set(other.vertex_map.keys())
-
-        # Find vertices that are in other but not in self (new vertices)
-        new_vertex_ids = other_vertex_ids - existing_vertex_ids
-
-        # Find vertices that are in self but not in other (removed vertices)
-        removed_vertex_ids = existing_vertex_ids - other_vertex_ids
-
-        # Remove vertices that are not in the other graph
-        for vertex_id in removed_vertex_ids:
-            with contextlib.suppress(ValueError):
-                self.remove_vertex(vertex_id)
-
-        # The order here matters because adding the vertex is required
-        # if any of them have edges that point to any of the new vertices
-        # By adding them first, them adding the edges we ensure that the
-        # edges have valid vertices to point to
-
-        # Add new vertices
-        for vertex_id in new_vertex_ids:
-            new_vertex = other.get_vertex(vertex_id)
-            self._add_vertex(new_vertex)
-
-        # Now update the edges
-        for vertex_id in new_vertex_ids:
-            new_vertex = other.get_vertex(vertex_id)
-            self._update_edges(new_vertex)
-            # Graph is set at the end because the edges come from the graph
-            # and the other graph is where the new edges and vertices come from
-            new_vertex.graph = self
-
-        # Update existing vertices that have changed
-        for vertex_id in existing_vertex_ids.intersection(other_vertex_ids):
-            self_vertex = self.get_vertex(vertex_id)
-            other_vertex = other.get_vertex(vertex_id)
-            # If the vertices are not identical, update the vertex
-            if not self.vertex_data_is_identical(self_vertex, other_vertex):
-                self.update_vertex_from_another(self_vertex, other_vertex)
-
-        self.build_graph_maps()
-        self.define_vertices_lists()
-        self.increment_update_count()
+        """Updates this graph in place to match `other`.
+
+        Works like `update_from_payload`, except that added and changed vertices are taken from
+        `other` instead of being created again.
+        """
+        raw_graph_data = other.raw_graph_data
+        if raw_graph_data == {"nodes": [], "edges": []}:
+            raw_graph_data = {"nodes": other._vertices, "edges": other._edges}
+        self._apply_graph_data(
+            raw_graph_data,
+            {"nodes": other._vertices, "edges": other._edges},
+            new_vertices=other.vertex_map,
+        )
         return self
 
+    def update_from_payload(self, payload: dict) -> GraphDiff:
+        """Updates the graph in place to match a new version of its flow payload.
+
+        Only the vertices that were added or whose data changed are created, and the edges are
+        rebuilt only if the connections changed. Every other vertex keeps its component and its
+        results: only the changed vertices and the vertices downstream of them are reset, and
+        the next run reuses the results of the rest (see `build_vertex`).
+
+        Args:
+            payload: The flow data, with ``nodes`` and ``edges``, optionally under ``data``.
+
+        Returns:
+            GraphDiff: What changed, including the vertices that were reset.
+        """
+        if "data" in payload:
+            payload = payload["data"]
+        raw_graph_data: GraphData = {"nodes": payload["nodes"], "edges": payload["edges"]}
+        return self._apply_graph_data(raw_graph_data, process_flow(raw_graph_data))
+
+    def _apply_graph_data(
+        self,
+        raw_graph_data: GraphData,
+        graph_data: GraphData,
+        new_vertices: dict[str, Vertex] | None = None,
+    ) -> GraphDiff:
+        diff = diff_graph_data(self._vertices, self._edges, graph_data["nodes"], graph_data["edges"])
+        nodes_by_id = {node["id"]: node for node in graph_data["nodes"]}
+        self.raw_graph_data = raw_graph_data
+        self._graph_data = graph_data
+        self._vertices = graph_data["nodes"]
+        self._edges = graph_data["edges"]
+        self.top_level_vertices = [node["id"] for node in raw_graph_data["nodes"] if node.get("id")]
+
+        # Changed vertices are replaced, so they get a new component built from their new data
+        replaced_vertex_ids = diff.added_vertex_ids | diff.changed_vertex_ids
+        if replaced_vertex_ids or diff.removed_vertex_ids:
+            kept_vertices = {vertex.id: vertex for vertex in self.vertices if vertex.id not in diff.removed_vertex_ids}
+            for vertex_id in replaced_vertex_ids:
+                if new_vertices is not None and vertex_id in new_vertices:
+                    vertex = new_vertices[vertex_id]
+                    vertex.graph = self
+                    vertex.set_top_level(self.top_level_vertices)
+                else:
+                    vertex = self._create_vertex(nodes_by_id[vertex_id])
+                kept_vertices[vertex_id] = vertex
+            self.vertices = [kept_vertices[node_id] for node_id in nodes_by_id if node_id in kept_vertices]
+            self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+            self._state_model = None
+
+        if diff.topology_changed or (replaced_vertex_ids and self.is_cyclic):
+            # Edge objects depend on which vertices are in a cycle, so they are all rebuilt
+            self._is_cyclic = self._cycles = self._cycle_vertices = None
+            for vertex in self.vertices:
+                vertex.has_cycle_edges = False
+                vertex.reset_edge_cache()
+            self.edges = self._build_edges()
+            self.build_graph_maps()
+            for vertex_id in self.cycle_vertices:
+                self.run_manager.add_to_cycle_vertices(vertex_id)
+
+        targets_of_changed_edges = {edge["target"] for edge in (*diff.added_edges, *diff.removed_edges)}
+        diff.invalidated_vertex_ids = self._get_downstream_vertex_ids(replaced_vertex_ids | targets_of_changed_edges)
+        for vertex_id in diff.invalidated_vertex_ids:
+            vertex = self.vertex_map[vertex_id]
+            if vertex_id not in replaced_vertex_ids and not vertex.frozen:
+                vertex.built = False
+                vertex.result = None
+                vertex.artifacts = {}
+            # The params point at the source vertices, which may have been replaced
+            vertex.params = {}
+            vertex.build_params()
+        for vertex_id in replaced_vertex_ids:
+            self.vertex_map[vertex_id].instantiate_component(self.user_id)
+
+        if not diff.is_empty:
+            self._set_cache_to_vertices_in_cycle()
+            self._set_cache_if_listen_notify_components()
+            self._is_input_vertices = []
+            self._is_output_vertices = []
+            self.has_session_id_vertices = []
+            self._is_state_vertices = None
+            self.define_vertices_lists()
+            self._sorted_vertices_layers = []
+        self._reusable_vertex_ids = self._find_reusable_vertex_ids()
+        self.increment_update_count()
+        return diff
+
+    def _get_downstream_vertex_ids(self, vertex_ids: set[str]) -> set[str]:
+        """Returns the given vertices and every vertex reachable from them."""
+        downstream = set()
+        stack = [vertex_id for vertex_id in vertex_ids if vertex_id in self.vertex_map]
+        while stack:
+            vertex_id = stack.pop()
+            if vertex_id in downstream:
+                continue
+            downstream.add(vertex_id)
+            stack.extend(self.successor_map.get(vertex_id, ()))
+        return downstream
+
+    def _vertex_result_is_reusable(self, vertex: Vertex) -> bool:
+        """Whether the next run can use the result a vertex got in a previous run instead of building it.
+
+        Inputs, outputs and components that use the session or state get new values on every run,
+        and routing components decide which branches run, so they are always built again.
+        """
+        if not vertex.built or vertex.frozen or vertex.id in self._routing_vertex_ids:
+            return False
+        if vertex.is_input or vertex.is_output or vertex.is_interface_component:
+            return False
+        if vertex.has_session_id or vertex.is_state or vertex.custom_component is None:
+            return False
+        component = vertex.custom_component
+        outputs = component.get_outputs_map().values() if getattr(component, "outputs", None) else ()
+        return all(output.cache for output in outputs)
+
+    def _find_reusable_vertex_ids(self) -> set[str]:
+        if self.is_cyclic:
+            return set()
+        reusable = {vertex.id for vertex in self.vertices if self._vertex_result_is_reusable(vertex)}
+        # Vertices that are built again may give a different result, so what is downstream of them is too
+        rebuilt = {
+            vertex.id for vertex in self.vertices if vertex.id not in reusable and not (vertex.frozen and vertex.built)
+        }
+        return reusable - self._get_downstream_vertex_ids(rebuilt)
+
+    @property
+    def reusable_vertex_ids(self) -> set[str]:
+        """The vertices whose results from a previous run the next run uses instead of building them."""
+        return set(self._reusable_vertex_ids)
+
+    def invalidate_vertices(self, vertex_ids: set[str]) -> None:
+        """Makes the next run build the given vertices, and everything downstream of them, again."""
+        self._reusable_vertex_ids -= self._get_downstream_vertex_ids(vertex_ids)
+
+    def reset_run_state(self) -> None:
+        """Clears the state left by a previous run, so the graph can be sorted and run again."""
+        self.run_manager = RunnableVerticesManager()
+        for vertex_id in self.cycle_vertices:
+            self.run_manager.add_to_cycle_vertices(vertex_id)
+        self._run_queue = deque()
+        self._first_layer = []
+        self.vertices_layers = []
+        self.vertices_to_run = set()
+        self.inactivated_vertices = set()
+        self.activated_vertices = []
+        self.stop_vertex = None
+        self.conditionally_excluded_vertices = set()
+        self.conditional_exclusion_sources = {}
+        self._call_order = []
+        self._snapshots = []
+        self._changed_vertex_ids = set()
+        self._checkpointer = None
+        self._start_time = datetime.now(timezone.utc)
+        for vertex in self.vertices:
+            vertex.state = VertexStates.ACTIVE
+        for edge in self.edges:
+            if isinstance(edge, CycleEdge):
+                edge.is_fulfilled = False
+                edge.result = None
+
     def update_vertex_from_another(self, vertex: Vertex, other_vertex: Vertex) -> None:
         """Updates a vertex from another vertex.
 
@@ -1276,6 +1517,7 @@ class Graph:
         """Adds a vertex to the graph."""
         self.vertices.append(vertex)
         self.vertex_map[vertex.id] = vertex
+        self._invalidate_topology()
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Adds a new vertex to the graph."""
@@ -1286,8 +1528,8 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if not self._has_edge(edge) and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1349,7 +1591,8 @@ class Graph:
             return
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
-        self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        removed_edges = {id(edge) for edge in self._edges_by_vertex.get(vertex_id, ())}
+        self.edges = [edge for edge in self.edges if id(edge) not in removed_edges]
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1443,10 +1686,120 @@ class Graph:
         self.reset_activated_vertices()
 
         if chat_service is not None:
-            await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+            await self.cache_run_state(chat_service.set_cache)
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
+    async def cache_run_state(self, set_cache: SetCache, key: str | None = None) -> None:
+        """Caches the state of the current run.
+
+        Depending on the ``graph_checkpoint_mode`` setting, either the whole graph is cached under `key`
+        or an incremental checkpoint is written that can be rehydrated with `load_checkpoint`.
+
+        Args:
+            set_cache (SetCache): A coroutine to set the cache.
+            key (str | None): The cache key. Defaults to the flow ID, or the run ID if there is none.
+        """
+        key = key or str(self.flow_id or self._run_id)
+        settings_service = get_settings_service()
+        checkpoint_mode = settings_service.settings.graph_checkpoint_mode if settings_service is not None else "full"
+        if checkpoint_mode == "delta":
+            await self.save_checkpoint(set_cache, key)
+        else:
+            await set_cache(key, self)
+
+    async def save_checkpoint(self, set_cache: SetCache, key: str | None = None) -> dict[str, Any]:
+        """Writes an incremental checkpoint of the current run.
+
+        The first checkpoint of a run also writes the graph definition. Every checkpoint holds the run
+        state and the outputs of the vertices built since the previous one.
+
+        Args:
+            set_cache (SetCache): A coroutine to set the cache.
+            key (str | None): The cache key. Defaults to the flow ID, or the run ID if there is none.
+
+        Returns:
+            dict[str, Any]: The delta that was written.
+        """
+        key = key or str(self.flow_id or self._run_id)
+        checkpointer = self._checkpointer
+        if checkpointer is None or checkpointer.key != key or checkpointer.run_id != self._run_id:
+            checkpointer = self._checkpointer = GraphCheckpointer(key, self._run_id)
+            # A new checkpoint must carry every output built so far
+            self._changed_vertex_ids.update(vertex.id for vertex in self.vertices if vertex.built)
+        return await checkpointer.save(self, set_cache)
+
+    @classmethod
+    async def load_checkpoint(cls, key: str, get_cache: GetCache, graph: Graph | None = None) -> Graph | None:
+        """Rehydrates a graph from the incremental checkpoints written under `key`.
+
+        A `graph` already rehydrated from, or saved to, the same run is brought up to date with the deltas
+        written since, rather than built again.
+
+        Returns:
+            Graph | None: The graph, or None if there is no complete checkpoint.
+        """
+        loaded = await load_graph_checkpoint(key, get_cache, graph)
+        if loaded is None:
+            return None
+        graph, checkpointer = loaded
+        graph.set_checkpointer(checkpointer)
+        return graph
+
+    async def compact_checkpoint(self, set_cache: SetCache, delete_cache: DeleteCache) -> None:
+        """Collapses the incremental checkpoints of the current run into one, once the run is complete.
+
+        Does nothing if the run was not checkpointed incrementally.
+        """
+        if self._checkpointer is not None:
+            await self._checkpointer.compact(self, set_cache, delete_cache)
+
+    def set_checkpointer(self, checkpointer: GraphCheckpointer) -> None:
+        """Sets the checkpointer that `save_checkpoint` extends."""
+        self._checkpointer = checkpointer
+
+    def get_checkpointer(self) -> GraphCheckpointer | None:
+        """Returns the checkpointer that `save_checkpoint` extends, if the run was checkpointed."""
+        return self._checkpointer
+
+    def pop_changed_vertex_ids(self) -> set[str]:
+        """Returns the IDs of the vertices built since the last call and resets them."""
+        changed_vertex_ids, self._changed_vertex_ids = self._changed_vertex_ids, set()
+        return changed_vertex_ids
+
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns a copy of the state of the current run, excluding the vertex outputs."""
+        return {
+            "run_manager": copy.deepcopy(self.run_manager.to_dict()),
+            "run_queue": list(self._run_queue),
+            "first_layer": list(self._first_layer),
+            "vertices_layers": copy.deepcopy(self.vertices_layers),
+            "vertices_to_run": set(self.vertices_to_run),
+            "inactivated_vertices": set(self.inactivated_vertices),
+            "activated_vertices": list(self.activated_vertices),
+            "stop_vertex": self.stop_vertex,
+            "conditionally_excluded_vertices": set(self.conditionally_excluded_vertices),
+            "conditional_exclusion_sources": copy.deepcopy(self.conditional_exclusion_sources),
+            "vertex_states": {
+                vertex.id: vertex.state.name for vertex in self.vertices if vertex.state != VertexStates.ACTIVE
+            },
+        }
+
+    def set_run_state(self, run_state: dict[str, Any]) -> None:
+        """Restores a run state returned by `get_run_state`."""
+        self.run_manager = RunnableVerticesManager.from_dict(copy.deepcopy(run_state["run_manager"]))
+        self._run_queue = deque(run_state["run_queue"])
+        self._first_layer = list(run_state["first_layer"])
+        self.vertices_layers = copy.deepcopy(run_state["vertices_layers"])
+        self.vertices_to_run = set(run_state["vertices_to_run"])
+        self.inactivated_vertices = set(run_state["inactivated_vertices"])
+        self.activated_vertices = list(run_state["activated_vertices"])
+        self.stop_vertex = run_state["stop_vertex"]
+        self.conditionally_excluded_vertices = set(run_state["conditionally_excluded_vertices"])
+        self.conditional_exclusion_sources = copy.deepcopy(run_state["conditional_exclusion_sources"])
+        for vertex in self.vertices:
+            vertex.state = VertexStates[run_state["vertex_states"].get(vertex.id, VertexStates.ACTIVE.name)]
+
     def get_snapshot(self):
         return copy.deepcopy(
             {
@@ -1519,7 +1872,10 @@ class Graph:
         try:
             params = ""
             should_build = False
-            if not vertex.frozen:
+            if vertex_id in self._reusable_vertex_ids:
+                # Built by a previous run and not affected by the update since, see `update_from_payload`
+                self._reusable_vertex_ids.discard(vertex_id)
+            elif not vertex.frozen:
                 should_build = True
             else:
                 # Check the cache for the vertex
@@ -1575,6 +1931,7 @@ class Graph:
                 await logger.aexception("Error building Component")
             raise
 
+        self._changed_vertex_ids.add(vertex_id)
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
             valid = True
@@ -1597,10 +1954,13 @@ class Graph:
     ) -> list[CycleEdge]:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
-        # or both
+        # or both, in the order they were added to the graph
+        edges = self._edges_by_vertex.get(vertex_id, [])
+        if is_source is not False and is_target is not False:
+            return list(edges)
         return [
             edge
-            for edge in self.edges
+            for edge in edges
             if (edge.source_id == vertex_id and is_source is not False)
             or (edge.target_id == vertex_id and is_target is not False)
         ]
@@ -1608,12 +1968,11 @@ class Graph:
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._edges_by_target.get(vertex_id, ()):
+            vertex = self.get_vertex(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
     async def process(
@@ -1622,8 +1981,29 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: GraphScheduler | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph running independent vertices in parallel.
+
+        Args:
+            fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            start_component_id (str | None): The ID of the component to start from.
+            event_manager (EventManager | None): The event manager for the graph.
+            scheduler (GraphScheduler | None): "layered" runs the graph layer by layer, waiting for the whole
+                layer to finish, while "dataflow" starts each vertex as soon as its predecessors are fulfilled.
+                Defaults to the ``graph_scheduler`` setting.
+            max_concurrency (int | None): Maximum number of vertices of this graph built at the same time by
+                the dataflow scheduler. 0 means no limit. Defaults to the ``graph_max_concurrency`` setting.
+        """
+        settings_service = get_settings_service()
+        settings = settings_service.settings if settings_service is not None else None
+        if scheduler is None:
+            scheduler = settings.graph_scheduler if settings is not None else "layered"
+        if max_concurrency is None:
+            max_concurrency = settings.graph_max_concurrency if settings is not None else 0
+        worker_max_concurrency = settings.graph_worker_max_concurrency if settings is not None else 0
+
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
@@ -1645,6 +2025,20 @@ class Graph:
 
         await self.initialize_run()
         lock = asyncio.Lock()
+        if scheduler == "dataflow":
+            await self._process_dataflow(
+                first_layer,
+                lock=lock,
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=get_cache_func,
+                set_cache=set_cache_func,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+                max_concurrency=max_concurrency,
+                worker_max_concurrency=worker_max_concurrency,
+            )
+            await logger.adebug("Graph processing complete")
+            return self
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1682,6 +2076,90 @@ class Graph:
         await logger.adebug("Graph processing complete")
         return self
 
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        fallback_to_env_vars: bool,
+        get_cache: GetCache,
+        set_cache: SetCache,
+        event_manager: EventManager | None,
+        has_webhook_component: bool,
+        max_concurrency: int,
+        worker_max_concurrency: int,
+    ) -> None:
+        """Runs the graph as a dataflow, launching each vertex as soon as its predecessors are fulfilled.
+
+        Unlike the layered execution, a slow vertex only delays its own successors instead of every
+        vertex in the next layer.
+        """
+        graph_semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        worker_semaphore = _get_worker_semaphore(worker_max_concurrency)
+        vertex_task_run_count: dict[str, int] = {}
+        pending: set[asyncio.Task] = set()
+
+        async def build_with_limits(vertex_id: str) -> VertexBuildResult:
+            async with contextlib.AsyncExitStack() as stack:
+                if graph_semaphore is not None:
+                    await stack.enter_async_context(graph_semaphore)
+                if worker_semaphore is not None and not _holds_worker_slot.get():
+                    await stack.enter_async_context(worker_semaphore)
+                    stack.callback(_holds_worker_slot.reset, _holds_worker_slot.set(True))
+                return await self.build_vertex(
+                    vertex_id=vertex_id,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=get_cache,
+                    set_cache=set_cache,
+                    event_manager=event_manager,
+                )
+
+        def launch(vertex_id: str) -> None:
+            run_count = vertex_task_run_count.get(vertex_id, 0)
+            task = asyncio.create_task(build_with_limits(vertex_id), name=f"{vertex_id} Run {run_count}")
+            vertex_task_run_count[vertex_id] = run_count + 1
+            pending.add(task)
+
+        for vertex_id in first_layer:
+            launch(vertex_id)
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                next_runnable_vertices: set[str] = set()
+                for task in done:
+                    task_name = task.get_name()
+                    vertex_id = task_name.split(" ")[0]
+                    if (exc := task.exception()) is not None:
+                        await logger.aerror(f"Task {task_name} failed with exception: {exc}")
+                        if has_webhook_component and isinstance(exc, Exception):
+                            await self._log_vertex_build_from_exception(vertex_id, exc)
+                        raise exc
+                    result = task.result()
+                    if self.flow_id is not None:
+                        await log_vertex_build(
+                            flow_id=self.flow_id,
+                            vertex_id=result.vertex.id,
+                            valid=result.valid,
+                            params=result.params,
+                            data=result.result_dict,
+                            artifacts=result.artifacts,
+                        )
+                    self.run_manager.remove_vertex_from_runnables(result.vertex.id)
+                    next_runnable_vertices.update(
+                        await self.get_next_runnable_vertices(lock, vertex=result.vertex, cache=False)
+                    )
+                for vertex_id in sorted(next_runnable_vertices):
+                    launch(vertex_id)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
@@ -1881,6 +2359,16 @@ class Graph:
         Returns:
             A list of successor vertices, either flat or nested depending on the `flat` parameter.
         """
+        if visited is None and flat:
+            # Top-level flat traversals only depend on the topology, so they are cached until it changes
+            traversal_cache = self._get_traversal_cache()
+            cache_key = ("successors", vertex.id, recursive)
+            if cache_key not in traversal_cache:
+                traversal_cache[cache_key] = self.get_all_successors(
+                    vertex, recursive=recursive, flat=flat, visited=set()
+                )
+            return list(traversal_cache[cache_key])
+
         if visited is None:
             visited = set()
 
@@ -1929,7 +2417,13 @@ class Graph:
 
         If `recursive` is True, returns both direct and indirect predecessors by
         traversing the graph recursively. If False, returns only the immediate predecessors.
+        Results are cached until the topology changes, so shared ancestors are only walked once.
         """
+        traversal_cache = self._get_traversal_cache()
+        cache_key = ("predecessors", vertex.id, recursive)
+        if cache_key in traversal_cache:
+            return list(traversal_cache[cache_key])
+
         _predecessors = self.predecessor_map.get(vertex.id, [])
         predecessors = [self.get_vertex(v_id) for v_id in _predecessors]
         if recursive:
@@ -1937,7 +2431,8 @@ class Graph:
                 predecessors.extend(self.get_all_predecessors(self.get_vertex(predecessor), recursive=recursive))
         else:
             predecessors.extend([self.get_vertex(predecessor) for predecessor in _predecessors])
-        return predecessors
+        traversal_cache[cache_key] = predecessors
+        return list(predecessors)
 
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns a dictionary mapping each direct neighbor of a vertex to the count of connecting edges.
@@ -1946,7 +2441,7 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._edges_by_vertex.get(vertex.id, ()):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
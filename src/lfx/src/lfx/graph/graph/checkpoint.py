@@ -0,0 +1,240 @@
+"""Incremental checkpoints of a graph run.
+
+Caching the whole graph after every step serializes every vertex, including the
+components and results of vertices that did not change. A checkpointed run is
+instead stored as:
+
+* a base, written once per run, holding the graph definition;
+* one delta per step, holding the run state and the outputs of the vertices
+  built since the previous delta;
+* a head pointing to the latest delta.
+
+A graph is rehydrated by building it from the base definition and replaying the
+deltas in order. When a run completes, its deltas are compacted into a single one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import TYPE_CHECKING, Any
+
+from lfx.services.cache.utils import CacheMiss
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+    from lfx.services.chat.schema import DeleteCache, GetCache, SetCache
+
+VERTEX_OUTPUT_ATTRIBUTES = (
+    "built",
+    "built_object",
+    "built_result",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "result",
+    "results",
+    "outputs_logs",
+    "logs",
+    "use_result",
+)
+
+
+def _head_key(key: str) -> str:
+    return f"{key}:checkpoint"
+
+
+def _base_key(key: str) -> str:
+    return f"{key}:checkpoint:base"
+
+
+def _delta_key(key: str, sequence: int) -> str:
+    return f"{key}:checkpoint:{sequence}"
+
+
+def _vertex_outputs(graph: Graph, vertex_ids) -> dict[str, dict[str, Any]]:
+    outputs = {}
+    for vertex_id in vertex_ids:
+        vertex = graph.get_vertex(vertex_id)
+        outputs[vertex_id] = {name: getattr(vertex, name) for name in VERTEX_OUTPUT_ATTRIBUTES}
+    return outputs
+
+
+def _unwrap(cached: Any) -> Any:
+    # ChatService.set_cache wraps values in {"result": ..., "type": ...}
+    if isinstance(cached, CacheMiss):
+        return None
+    if isinstance(cached, dict) and "result" in cached:
+        return cached["result"]
+    return cached
+
+
+class GraphCheckpointer:
+    """Writes the checkpoints of a single graph run.
+
+    Attributes:
+        key (str): The cache key the checkpoints are stored under.
+        run_id (str): The run the checkpoints belong to.
+        sequence (int): The sequence number of the last delta written.
+        compacted (bool): Whether the deltas were compacted into a single one.
+    """
+
+    def __init__(self, key: str, run_id: str, sequence: int = 0, *, compacted: bool = False):
+        self.key = key
+        self.run_id = run_id
+        self.sequence = sequence
+        self.compacted = compacted
+        self._base_written = sequence > 0
+        self._lock = asyncio.Lock()
+
+    def get_head(self) -> dict[str, Any]:
+        return {"run_id": self.run_id, "sequence": self.sequence, "compacted": self.compacted}
+
+    def get_base(self, graph: Graph) -> dict[str, Any]:
+        return {
+            "graph_data": copy.deepcopy(graph.dump()["data"]),
+            "flow_id": graph.flow_id,
+            "flow_name": graph.flow_name,
+            "user_id": graph.user_id,
+            "run_id": self.run_id,
+        }
+
+    def get_delta(self, graph: Graph) -> dict[str, Any]:
+        return {
+            "sequence": self.sequence + 1,
+            "run_state": graph.get_run_state(),
+            "vertex_outputs": _vertex_outputs(graph, graph.pop_changed_vertex_ids()),
+        }
+
+    async def save(self, graph: Graph, set_cache: SetCache) -> dict[str, Any]:
+        """Write the base if needed, then a delta with the changes since the previous call.
+
+        Returns:
+            The delta that was written.
+        """
+        # Steps of a run can finish concurrently, deltas must still be written in sequence
+        async with self._lock:
+            if not self._base_written:
+                await set_cache(_base_key(self.key), self.get_base(graph))
+                self._base_written = True
+            delta = self.get_delta(graph)
+            await set_cache(_delta_key(self.key, delta["sequence"]), delta)
+            self.sequence = delta["sequence"]
+            await set_cache(_head_key(self.key), self.get_head())
+            return delta
+
+    async def compact(self, graph: Graph, set_cache: SetCache, delete_cache: DeleteCache) -> None:
+        """Replace the deltas written so far with a single delta holding every output built in the run."""
+        async with self._lock:
+            if self.sequence <= 1:
+                return
+            previous_sequence = self.sequence
+            graph.pop_changed_vertex_ids()
+            delta = {
+                "sequence": 1,
+                "run_state": graph.get_run_state(),
+                "vertex_outputs": _vertex_outputs(graph, [vertex.id for vertex in graph.vertices if vertex.built]),
+            }
+            # The head still points to the old chain until the compacted delta is written, readers replaying
+            # it on top of the compacted delta end up in the same state
+            await set_cache(_delta_key(self.key, 1), delta)
+            self.sequence = 1
+            self.compacted = True
+            await set_cache(_head_key(self.key), self.get_head())
+            for sequence in range(2, previous_sequence + 1):
+                await delete_cache(_delta_key(self.key, sequence))
+
+
+def apply_checkpoint_delta(graph: Graph, delta: dict[str, Any]) -> None:
+    """Restore the run state and vertex outputs recorded in a delta."""
+    for vertex_id, outputs in delta["vertex_outputs"].items():
+        vertex = graph.get_vertex(vertex_id)
+        for name, value in outputs.items():
+            setattr(vertex, name, value)
+    graph.set_run_state(delta["run_state"])
+
+
+def graph_from_checkpoint(base: dict[str, Any], deltas: list[dict[str, Any]]) -> Graph:
+    """Build a graph from its base definition and replay the deltas on it."""
+    from lfx.graph.graph.base import Graph
+
+    graph = Graph.from_payload(
+        copy.deepcopy(base["graph_data"]),
+        flow_id=base["flow_id"],
+        flow_name=base["flow_name"],
+        user_id=base["user_id"],
+    )
+    graph.prepare()
+    if base["run_id"]:
+        graph.set_run_id(base["run_id"])
+    for delta in deltas:
+        apply_checkpoint_delta(graph, delta)
+    graph.pop_changed_vertex_ids()
+    return graph
+
+
+async def clear_graph_checkpoint(key: str, get_cache: GetCache, delete_cache: DeleteCache) -> bool:
+    """Delete the head, base and deltas of the checkpoint written under `key`.
+
+    Returns:
+        True if there was a checkpoint to delete.
+    """
+    head = _unwrap(await get_cache(_head_key(key)))
+    if head is None:
+        return False
+    # Without a head the rest of the checkpoint is never read, even if deleting it fails halfway
+    await delete_cache(_head_key(key))
+    for sequence in range(1, head["sequence"] + 1):
+        await delete_cache(_delta_key(key, sequence))
+    await delete_cache(_base_key(key))
+    return True
+
+
+def _can_catch_up(checkpointer: GraphCheckpointer | None, head: dict[str, Any]) -> bool:
+    # A graph can replay the newer deltas of its own run, unless they were compacted since it last saw them
+    if checkpointer is None or checkpointer.run_id != head["run_id"] or checkpointer.sequence > head["sequence"]:
+        return False
+    return not head.get("compacted") or (checkpointer.compacted and checkpointer.sequence == head["sequence"])
+
+
+async def load_graph_checkpoint(
+    key: str, get_cache: GetCache, graph: Graph | None = None
+) -> tuple[Graph, GraphCheckpointer] | None:
+    """Rehydrate the graph checkpointed under `key`.
+
+    If `graph` was rehydrated from, or saved to, the same run before, only the deltas written since are
+    replayed on it instead of building the graph again.
+
+    Returns:
+        The graph and a checkpointer that extends the same checkpoint, or None if there is no complete checkpoint.
+    """
+    head = _unwrap(await get_cache(_head_key(key)))
+    if head is None:
+        return None
+    checkpointer = graph.get_checkpointer() if graph is not None else None
+    if checkpointer is not None and checkpointer.key == key and _can_catch_up(checkpointer, head):
+        deltas = []
+        for sequence in range(checkpointer.sequence + 1, head["sequence"] + 1):
+            delta = _unwrap(await get_cache(_delta_key(key, sequence)))
+            if delta is None:
+                return None
+            deltas.append(delta)
+        for delta in deltas:
+            apply_checkpoint_delta(graph, delta)
+        if deltas:
+            graph.pop_changed_vertex_ids()
+        checkpointer.sequence = head["sequence"]
+        return graph, checkpointer
+    base = _unwrap(await get_cache(_base_key(key)))
+    if base is None or base["run_id"] != head["run_id"]:
+        return None
+    deltas = []
+    for sequence in range(1, head["sequence"] + 1):
+        delta = _unwrap(await get_cache(_delta_key(key, sequence)))
+        if delta is None:
+            return None
+        deltas.append(delta)
+    checkpointer = GraphCheckpointer(
+        key, head["run_id"], sequence=head["sequence"], compacted=head.get("compacted", False)
+    )
+    return graph_from_checkpoint(base, deltas), checkpointer
@@ -0,0 +1,84 @@
+"""Differences between two versions of the nodes and edges of a flow.
+
+`Graph.update_from_payload` uses them to rebuild only the vertices and edges that
+changed instead of building a new graph.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from lfx.graph.vertex.schema import NodeTypeEnum
+
+if TYPE_CHECKING:
+    from lfx.graph.edge.schema import EdgeData
+    from lfx.graph.vertex.schema import NodeData
+
+# Keys of a node that affect how it is built. Everything else (position, size, selection) is layout.
+NODE_BUILD_KEYS = ("type", "data", "parent_node_id")
+
+
+@dataclass
+class GraphDiff:
+    """The changes between two versions of a graph's nodes and edges."""
+
+    added_vertex_ids: set[str] = field(default_factory=set)
+    removed_vertex_ids: set[str] = field(default_factory=set)
+    changed_vertex_ids: set[str] = field(default_factory=set)
+    added_edges: list[EdgeData] = field(default_factory=list)
+    removed_edges: list[EdgeData] = field(default_factory=list)
+    invalidated_vertex_ids: set[str] = field(default_factory=set)
+    """The vertices whose results were reset: the changed ones and everything downstream of them."""
+
+    @property
+    def topology_changed(self) -> bool:
+        """Whether vertices or edges were added or removed."""
+        return bool(self.added_vertex_ids or self.removed_vertex_ids or self.added_edges or self.removed_edges)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.topology_changed or self.changed_vertex_ids)
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def edge_key(edge: EdgeData) -> tuple[str, str, str, str]:
+    """Identifies an edge by its endpoints and handles, which is what its `Edge` object is built from."""
+    data = edge.get("data") or {}
+    source_handle = data.get("sourceHandle", edge.get("sourceHandle"))
+    target_handle = data.get("targetHandle", edge.get("targetHandle"))
+    return edge["source"], edge["target"], _canonical(source_handle), _canonical(target_handle)
+
+
+def node_changed(node: NodeData, other_node: NodeData) -> bool:
+    return any(node.get(key) != other_node.get(key) for key in NODE_BUILD_KEYS)
+
+
+def _vertex_nodes(nodes: list[NodeData]) -> dict[str, NodeData]:
+    # Notes are not vertices
+    return {node["id"]: node for node in nodes if node.get("type") != NodeTypeEnum.NoteNode}
+
+
+def diff_graph_data(
+    nodes: list[NodeData], edges: list[EdgeData], new_nodes: list[NodeData], new_edges: list[EdgeData]
+) -> GraphDiff:
+    """Compares two versions of the processed nodes and edges of a flow."""
+    nodes_by_id = _vertex_nodes(nodes)
+    new_nodes_by_id = _vertex_nodes(new_nodes)
+    edge_keys = {edge_key(edge) for edge in edges}
+    new_edge_keys = {edge_key(edge) for edge in new_edges}
+    return GraphDiff(
+        added_vertex_ids=new_nodes_by_id.keys() - nodes_by_id.keys(),
+        removed_vertex_ids=nodes_by_id.keys() - new_nodes_by_id.keys(),
+        changed_vertex_ids={
+            vertex_id
+            for vertex_id in nodes_by_id.keys() & new_nodes_by_id.keys()
+            if node_changed(nodes_by_id[vertex_id], new_nodes_by_id[vertex_id])
+        },
+        added_edges=[edge for edge in new_edges if edge_key(edge) not in edge_keys],
+        removed_edges=[edge for edge in edges if edge_key(edge) not in new_edge_keys],
+    )
@@ -0,0 +1,73 @@
+"""Reusable definitions of a graph for repeated runs of the same flow.
+
+Building a graph from a flow payload copies the payload, ungroups group nodes
+and only then creates the vertices. When the same flow is run many times with
+the same tweaks, that preparation always yields the same result. A template
+keeps the prepared payload serialized, so each run instance only decodes a
+private copy of it before building its vertices. The raw payload is only read
+after the graph is built, so run instances share it.
+
+Vertices and components hold the state of a run, so they are still created for
+every run instance.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from lfx.graph.graph.utils import process_flow
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+    from lfx.graph.graph.schema import GraphData
+
+
+def _freeze(data: GraphData) -> bytes | GraphData:
+    try:
+        return orjson.dumps(data)
+    except TypeError:
+        # Payloads with values that are not JSON serializable are kept as is and deep-copied on use
+        return copy.deepcopy(data)
+
+
+def _thaw(frozen: bytes | GraphData) -> GraphData:
+    if isinstance(frozen, bytes):
+        return orjson.loads(frozen)
+    return copy.deepcopy(frozen)
+
+
+class GraphTemplate:
+    """A prepared flow payload from which run instances of the graph are built.
+
+    Attributes:
+        flow_id (str | None): The ID of the flow.
+        flow_name (str | None): The name of the flow.
+    """
+
+    def __init__(self, payload: dict[str, Any], *, flow_id: str | None = None, flow_name: str | None = None):
+        if "data" in payload:
+            payload = payload["data"]
+        try:
+            raw_graph_data: GraphData = {"nodes": payload["nodes"], "edges": payload["edges"]}
+        except KeyError as exc:
+            msg = f"Invalid payload. Expected keys 'nodes' and 'edges'. Found {list(payload.keys())}"
+            raise ValueError(msg) from exc
+        self.flow_id = flow_id
+        self.flow_name = flow_name
+        self._raw_graph_data = raw_graph_data
+        self._processed_graph_data = _freeze(process_flow(raw_graph_data))
+
+    def build(self, *, user_id: str | None = None, context: dict | None = None) -> Graph:
+        """Build a new graph, ready to run, from the template."""
+        from lfx.graph.graph.base import Graph
+
+        graph = Graph(flow_id=self.flow_id, flow_name=self.flow_name, user_id=user_id, context=context)
+        graph.add_nodes_and_edges(
+            self._raw_graph_data["nodes"],
+            self._raw_graph_data["edges"],
+            processed_graph_data=_thaw(self._processed_graph_data),
+        )
+        return graph
@@ -109,12 +109,13 @@ async def log_transaction(
     flow_id: str | UUID,
     source: Vertex,
     status,
-    target: Vertex | None = None,  # noqa: ARG001
-    error=None,  # noqa: ARG001
+    target: Vertex | None = None,
+    error=None,
 ) -> None:
     """Asynchronously logs a transaction record for a vertex in a flow if transaction storage is enabled.
 
-    This is a lightweight implementation that only logs if database service is available.
+    This is a lightweight implementation that only logs if database service is available. When the
+    database service provides a build log writer, the transaction is buffered there to be persisted.
     """
     try:
         settings_service = get_settings_service()
@@ -132,6 +133,20 @@ async def log_transaction(
             else:
                 return
 
+        build_log_writer = getattr(db_service, "build_log_writer", None)
+        if build_log_writer is not None:
+            build_log_writer.enqueue_transaction(
+                {
+                    "vertex_id": source.id,
+                    "target_id": target.id if target else None,
+                    "inputs": _vertex_to_primitive_dict(source),
+                    "outputs": _vertex_to_primitive_dict(target) if target else None,
+                    "status": status,
+                    "error": str(error) if error else None,
+                    "flow_id": flow_id,
+                }
+            )
+
         # Log basic transaction info - concrete implementation should be in langflow
         logger.debug(f"Transaction logged: vertex={source.id}, flow={flow_id}, status={status}")
     except Exception as exc:  # noqa: BLE001
@@ -143,13 +158,14 @@ async def log_vertex_build(
     flow_id: str | UUID,
     vertex_id: str,
     valid: bool,
-    params: Any,  # noqa: ARG001
-    data: dict | Any,  # noqa: ARG001
-    artifacts: dict | None = None,  # noqa: ARG001
+    params: Any,
+    data: dict | Any,
+    artifacts: dict | None = None,
 ) -> None:
     """Asynchronously logs a vertex build record if vertex build storage is enabled.
 
-    This is a lightweight implementation that only logs if database service is available.
+    This is a lightweight implementation that only logs if database service is available. When the
+    database service provides a build log writer, the build is buffered there to be persisted.
     """
     try:
         settings_service = get_settings_service()
@@ -168,6 +184,19 @@ async def log_vertex_build(
             logger.debug(f"Invalid flow_id passed to log_vertex_build: {flow_id!r}")
             return
 
+        build_log_writer = getattr(db_service, "build_log_writer", None)
+        if build_log_writer is not None:
+            build_log_writer.enqueue_vertex_build(
+                {
+                    "id": vertex_id,
+                    "valid": valid,
+                    "params": str(params) if params else None,
+                    "data": data.model_dump() if hasattr(data, "model_dump") else data,
+                    "artifacts": artifacts,
+                    "flow_id": flow_id,
+                }
+            )
+
         # Log basic vertex build info - concrete implementation should be in langflow
         logger.debug(f"Vertex build logged: vertex={vertex_id}, flow={flow_id}, valid={valid}")
     except Exception:  # noqa: BLE001
@@ -192,15 +192,20 @@ class Vertex:
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
         if self._outgoing_edges is None:
-            self._outgoing_edges = [edge for edge in self.edges if edge.source_id == self.id]
+            self._outgoing_edges = self.graph.get_vertex_edges(self.id, is_target=False)
         return self._outgoing_edges
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
         if self._incoming_edges is None:
-            self._incoming_edges = [edge for edge in self.edges if edge.target_id == self.id]
+            self._incoming_edges = self.graph.get_vertex_edges(self.id, is_source=False)
         return self._incoming_edges
 
+    def reset_edge_cache(self) -> None:
+        """Drops the cached incoming and outgoing edges, after the edges of the graph changed."""
+        self._incoming_edges = None
+        self._outgoing_edges = None
+
     # Get edge connected to an output of a certain name
     def get_incoming_edge_by_target_param(self, target_param: str) -> str | None:
         return next((edge.source_id for edge in self.incoming_edges if edge.target_param == target_param), None)
@@ -224,6 +229,7 @@ class Vertex:
     def __getstate__(self):
         state = self.__dict__.copy()
         state["_lock"] = None  # Locks are not serializable
+        state["log_transaction_tasks"] = set()  # Nor are pending tasks
         state["built_object"] = None if isinstance(self.built_object, UnbuiltObject) else self.built_object
         state["built_result"] = None if isinstance(self.built_result, UnbuiltResult) else self.built_result
         return state
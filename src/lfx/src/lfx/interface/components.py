@@ -1,11 +1,15 @@
 import asyncio
 import hashlib
 import importlib
+import importlib.util
 import inspect
 import json
+import multiprocessing
 import os
 import pkgutil
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -20,6 +24,7 @@ if TYPE_CHECKING:
 
 MIN_MODULE_PARTS = 2
 EXPECTED_RESULT_LENGTH = 2  # Expected length of the tuple returned by _process_single_module
+TELEMETRY_SLOWEST_MODULES = 20  # Number of module load times reported in the component index telemetry
 
 
 # Create a class to manage component cache instead of using globals
@@ -29,8 +34,28 @@ class ComponentCache:
 
         Creates empty storage for all component types and tracking of fully loaded components.
         """
-        self.all_types_dict: dict[str, Any] | None = None
+        self._all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Incremented whenever the cached types change, so derived data such as encoded responses can be reused
+        self.version = 0
+        # The whitelist the cached types were filtered with, and the types before filtering
+        self.whitelist: frozenset[str] | None = None
+        self.unfiltered_types_dict: dict[str, Any] | None = None
+
+    @property
+    def all_types_dict(self) -> dict[str, Any] | None:
+        return self._all_types_dict
+
+    @all_types_dict.setter
+    def all_types_dict(self, value: dict[str, Any] | None) -> None:
+        self._all_types_dict = value
+        self.whitelist = None
+        self.unfiltered_types_dict = None
+        self.version += 1
+
+    def mark_changed(self) -> None:
+        """Record an in-place change of the cached types."""
+        self.version += 1
 
 
 # Singleton instance
@@ -210,6 +235,147 @@ def _save_generated_index(modules_dict: dict) -> None:
         logger.debug(f"Failed to save generated index to cache: {e}")
 
 
+class ComponentModuleCache:
+    """On-disk cache of the component templates built from each module.
+
+    Each module has its own entry, so only the entries of changed modules are rewritten. An entry is valid
+    while the module file keeps its mtime and size, or else while its SHA256 still matches. Templates also
+    depend on the base classes they inherit from and on the packages the modules import, so every entry is
+    invalidated when the lfx sources outside `lfx.components` change or when packages are installed, removed
+    or upgraded.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.fingerprint = hashlib.sha256(
+            f"{_get_lfx_sources_fingerprint()}:{_get_installed_packages_fingerprint()}".encode()
+        ).hexdigest()
+
+    def _entry_path(self, modname: str) -> Path:
+        return self.cache_dir / f"{modname}.json"
+
+    def get(self, modname: str) -> tuple[str, dict] | None:
+        """Return the cached (top_level, components) of a module, or None if missing or stale."""
+        source = _get_module_source(modname)
+        entry_path = self._entry_path(modname)
+        if source is None or not entry_path.exists():
+            return None
+        try:
+            entry = orjson.loads(entry_path.read_bytes())
+        except orjson.JSONDecodeError:
+            return None
+        if entry.get("fingerprint") != self.fingerprint:
+            return None
+        stat = source.stat()
+        if (entry.get("mtime_ns"), entry.get("size")) != (stat.st_mtime_ns, stat.st_size):
+            if entry.get("sha256") != hashlib.sha256(source.read_bytes()).hexdigest():
+                return None
+            # Touched but unchanged, refresh the stat so the next start skips hashing
+            self._write_entry(modname, source, entry["top_level"], entry["components"])
+        return entry["top_level"], entry["components"]
+
+    def set(self, modname: str, result: tuple[str, dict]) -> None:
+        """Store the (top_level, components) built from a module."""
+        source = _get_module_source(modname)
+        if source is None:
+            return
+        top_level, components = result
+        self._write_entry(modname, source, top_level, components)
+
+    def _write_entry(self, modname: str, source: Path, top_level: str, components: dict) -> None:
+        stat = source.stat()
+        entry = {
+            "fingerprint": self.fingerprint,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(source.read_bytes()).hexdigest(),
+            "top_level": top_level,
+            "components": components,
+        }
+        self._entry_path(modname).write_bytes(orjson.dumps(entry))
+
+
+def _get_module_cache_dir() -> Path:
+    """Get the directory of the incremental component module cache."""
+    cache_dir = _get_cache_path().parent / "component_modules"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def _get_module_source(modname: str) -> Path | None:
+    """Get the source file of a module without importing it."""
+    try:
+        spec = importlib.util.find_spec(modname)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    return Path(spec.origin)
+
+
+def _get_lfx_sources_fingerprint() -> str:
+    """Hash the paths, mtimes and sizes of the lfx sources outside `lfx.components`."""
+    import lfx
+
+    pkg_dir = Path(inspect.getfile(lfx)).parent
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(pkg_dir):
+        if Path(root) == pkg_dir:
+            dirs[:] = [d for d in dirs if d not in {"components", "_assets"}]
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.endswith(".py"):
+                continue
+            path = Path(root) / filename
+            stat = path.stat()
+            digest.update(f"{path.relative_to(pkg_dir)}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _get_installed_packages_fingerprint() -> str:
+    """Hash the names of the package metadata directories on sys.path, which carry the package versions.
+
+    Listing the directories is much cheaper than reading the metadata of every distribution.
+    """
+    digest = hashlib.sha256()
+    for path in sys.path:
+        try:
+            with os.scandir(path or ".") as entries:
+                names = sorted(entry.name for entry in entries if entry.name.endswith((".dist-info", ".egg-info")))
+        except OSError:
+            continue
+        digest.update(f"{path}:{','.join(names)}\n".encode())
+    return digest.hexdigest()
+
+
+def _load_cached_modules(module_names: list[str]) -> tuple[ComponentModuleCache | None, dict[str, tuple[str, dict]]]:
+    """Open the incremental module cache and return the valid entries of the given modules."""
+    try:
+        module_cache = ComponentModuleCache(_get_module_cache_dir())
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Component module cache unavailable: {e}")
+        return None, {}
+    cached_results = {}
+    for modname in module_names:
+        try:
+            result = module_cache.get(modname)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Failed to read cached components of {modname}: {e}")
+            continue
+        if result is not None:
+            cached_results[modname] = result
+    return module_cache, cached_results
+
+
+def _save_cached_modules(module_cache: ComponentModuleCache, results: dict[str, tuple[str, dict]]) -> None:
+    """Store the freshly built modules in the incremental module cache."""
+    for modname, result in results.items():
+        try:
+            module_cache.set(modname, result)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Failed to cache components of {modname}: {e}")
+
+
 async def _send_telemetry(
     telemetry_service: Any,
     index_source: str,
@@ -217,6 +383,10 @@ async def _send_telemetry(
     dev_mode: bool,  # noqa: FBT001
     target_modules: list[str] | None,
     start_time_ms: int,
+    *,
+    build_mode: str | None = None,
+    module_load_times_ms: dict[str, int] | None = None,
+    cached_modules: int | None = None,
 ) -> None:
     """Send telemetry about component index loading.
 
@@ -227,6 +397,9 @@ async def _send_telemetry(
         dev_mode: Whether dev mode is enabled
         target_modules: List of filtered modules if any
         start_time_ms: Start time in milliseconds
+        build_mode: How the modules were imported when built dynamically ("thread" or "process")
+        module_load_times_ms: Time taken to import each module, in milliseconds
+        cached_modules: Number of modules loaded from the incremental cache
     """
     if not telemetry_service:
         return
@@ -237,6 +410,13 @@ async def _send_telemetry(
         num_components = sum(len(components) for components in modules_dict.values())
         load_time_ms = int(time.time() * 1000) - start_time_ms
         filtered_modules = ",".join(target_modules) if target_modules else None
+        slowest_modules = None
+        if module_load_times_ms:
+            slowest = sorted(module_load_times_ms.items(), key=lambda item: item[1], reverse=True)
+            slowest_modules = ",".join(
+                f"{modname.removeprefix('lfx.components.')}:{load_time}"
+                for modname, load_time in slowest[:TELEMETRY_SLOWEST_MODULES]
+            )
 
         # Import the payload class dynamically to avoid circular imports
         from langflow.services.telemetry.schema import ComponentIndexPayload
@@ -248,6 +428,9 @@ async def _send_telemetry(
             dev_mode=dev_mode,
             filtered_modules=filtered_modules,
             load_time_ms=load_time_ms,
+            build_mode=build_mode,
+            cached_modules=cached_modules,
+            slowest_modules=slowest_modules,
         )
 
         await telemetry_service.log_component_index(payload)
@@ -367,22 +550,37 @@ async def import_langflow_components(
     if not module_names:
         return {"components": modules_dict}
 
-    # Create tasks for parallel module processing
-    tasks = [asyncio.to_thread(_process_single_module, modname) for modname in module_names]
+    build_mode, max_workers, use_module_cache = _get_index_build_options(settings_service)
+
+    # Modules unchanged since the previous build are loaded from the incremental cache
+    module_cache = None
+    cached_results: dict[str, tuple[str, dict]] = {}
+    if use_module_cache:
+        module_cache, cached_results = await asyncio.to_thread(_load_cached_modules, module_names)
+        await logger.adebug(f"Loaded {len(cached_results)} of {len(module_names)} modules from the module cache")
+    modules_to_import = [modname for modname in module_names if modname not in cached_results]
 
-    # Wait for all modules to be processed
+    # Import the remaining modules in parallel
     try:
-        module_results = await asyncio.gather(*tasks, return_exceptions=True)
+        module_outcomes = await _process_modules(modules_to_import, build_mode, max_workers)
     except Exception as e:  # noqa: BLE001
         await logger.aerror(f"Error during parallel module processing: {e}", exc_info=True)
         return {"components": modules_dict}
 
-    # Merge results from all modules
-    for result in module_results:
-        if isinstance(result, Exception):
-            await logger.awarning(f"Module processing failed: {result}")
+    module_results = list(cached_results.values())
+    module_load_times_ms: dict[str, int] = {}
+    fresh_results: dict[str, tuple[str, dict]] = {}
+    for modname, outcome in zip(modules_to_import, module_outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            await logger.awarning(f"Module processing failed: {outcome}")
             continue
+        result, module_load_times_ms[modname] = outcome
+        module_results.append(result)
+        if result and isinstance(result, tuple) and len(result) == EXPECTED_RESULT_LENGTH:
+            fresh_results[modname] = result
 
+    # Merge results from all modules
+    for result in module_results:
         if result and isinstance(result, tuple) and len(result) == EXPECTED_RESULT_LENGTH:
             top_level, components = result
             if top_level and components:
@@ -390,6 +588,9 @@ async def import_langflow_components(
                     modules_dict[top_level] = {}
                 modules_dict[top_level].update(components)
 
+    if module_cache is not None and fresh_results:
+        await asyncio.to_thread(_save_cached_modules, module_cache, fresh_results)
+
     # Save the generated index to cache if needed (production mode with missing index)
     if should_save_index and modules_dict:
         await logger.adebug("Saving generated component index to cache")
@@ -398,12 +599,86 @@ async def import_langflow_components(
     # Send telemetry for dynamic loading
     index_source = "dynamic"
     await _send_telemetry(
-        telemetry_service, index_source, modules_dict, dev_mode_enabled, target_modules, start_time_ms
+        telemetry_service,
+        index_source,
+        modules_dict,
+        dev_mode_enabled,
+        target_modules,
+        start_time_ms,
+        build_mode=build_mode,
+        module_load_times_ms=module_load_times_ms,
+        cached_modules=len(cached_results),
     )
 
     return {"components": modules_dict}
 
 
+def _get_index_build_options(settings_service: Optional["SettingsService"]) -> tuple[str, int, bool]:
+    """Get the build mode, number of worker processes and whether to use the module cache."""
+    if settings_service is None:
+        return "thread", 0, True
+    settings = settings_service.settings
+    return (
+        settings.components_index_build_mode,
+        settings.components_index_build_workers,
+        settings.components_incremental_cache,
+    )
+
+
+async def _process_modules(module_names: list[str], build_mode: str, max_workers: int) -> list[Any]:
+    """Process modules in parallel, in a thread or process pool depending on `build_mode`.
+
+    Returns:
+        For each module, the (result, load_time_ms) tuple returned by `_timed_process_single_module`,
+        or the exception raised while processing it.
+    """
+    if not module_names:
+        return []
+    if build_mode == "process":
+        try:
+            # Forking a process running an event loop and threads is unsafe, so workers are spawned
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers or None, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError) as e:
+            await logger.awarning(f"Cannot start the component index process pool, falling back to threads: {e}")
+        else:
+            loop = asyncio.get_running_loop()
+            with executor:
+                tasks = [
+                    loop.run_in_executor(executor, _timed_process_single_module_to_json, modname)
+                    for modname in module_names
+                ]
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            return [
+                outcome if isinstance(outcome, BaseException) else _load_json_outcome(*outcome) for outcome in outcomes
+            ]
+    tasks = [asyncio.to_thread(_timed_process_single_module, modname) for modname in module_names]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _timed_process_single_module(modname: str) -> tuple[tuple[str, dict] | None, int]:
+    """Process a single module and measure how long it took, in milliseconds."""
+    start_time = time.perf_counter()
+    result = _process_single_module(modname)
+    return result, int((time.perf_counter() - start_time) * 1000)
+
+
+def _timed_process_single_module_to_json(modname: str) -> tuple[bytes, int]:
+    """Process a single module in a worker process.
+
+    Templates can hold values of classes created from component code, which cannot be pickled back to the
+    parent process, so the result is sent as JSON, the same way the prebuilt index stores it.
+    """
+    result, load_time_ms = _timed_process_single_module(modname)
+    return orjson.dumps(result), load_time_ms
+
+
+def _load_json_outcome(result_json: bytes, load_time_ms: int) -> tuple[tuple[str, dict] | None, int]:
+    result = orjson.loads(result_json)
+    return (tuple(result) if result is not None else None), load_time_ms
+
+
 def _process_single_module(modname: str) -> tuple[str, dict] | None:
     """Process a single module and return its components.
 
@@ -534,16 +809,25 @@ async def get_and_cache_all_types_dict(
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.values())
         await logger.adebug(f"Loaded {component_count} components")
 
-    # 在返回前应用白名单过滤
-    if component_cache.all_types_dict:
-        from ..core.whitelist import apply_whitelist_filter
-        component_cache.all_types_dict = apply_whitelist_filter(
-            component_cache.all_types_dict
-        )
+    # 在返回前应用白名单过滤, 仅在缓存重建或白名单变化时重新过滤
+    _apply_component_whitelist()
 
     return component_cache.all_types_dict
 
 
+def _apply_component_whitelist() -> None:
+    from lfx.core.whitelist import COMPONENT_WHITELIST, apply_whitelist_filter
+
+    whitelist = frozenset(COMPONENT_WHITELIST)
+    if not component_cache.all_types_dict or component_cache.whitelist == whitelist:
+        return
+    # Filter from the unfiltered types, so components added to the whitelist show up again
+    unfiltered_types_dict = component_cache.unfiltered_types_dict or component_cache.all_types_dict
+    component_cache.all_types_dict = apply_whitelist_filter(unfiltered_types_dict)
+    component_cache.unfiltered_types_dict = unfiltered_types_dict
+    component_cache.whitelist = whitelist
+
+
 async def aget_all_types_dict(components_paths: list[str]):
     """Get all types dictionary with full component loading."""
     return await abuild_custom_components(components_paths=components_paths)
@@ -717,6 +1001,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.mark_changed()
             await logger.adebug(f"Component {component_type}:{component_name} fully loaded")
         else:
             await logger.awarning(f"Failed to fully load component {component_type}:{component_name}")
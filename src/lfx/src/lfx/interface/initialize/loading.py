@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import os
+import uuid
 import warnings
 from typing import TYPE_CHECKING, Any
 
@@ -12,10 +13,12 @@ from lfx.custom.eval import eval_custom_component_code
 from lfx.log.logger import logger
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
-from lfx.services.deps import get_settings_service, session_scope
+from lfx.services.deps import get_settings_service, get_variable_service, session_scope
 from lfx.services.session import NoopSession
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from lfx.custom.custom_component.component import Component
     from lfx.custom.custom_component.custom_component import CustomComponent
     from lfx.graph.vertex.base import Vertex
@@ -126,6 +129,53 @@ def load_from_env_vars(params, load_from_db_fields):
     return params
 
 
+def collect_load_from_db_variable_names(vertices: Iterable[Vertex]) -> set[str]:
+    """Collect the names of the Global Variables referenced by the load_from_db fields of the vertices."""
+    names: set[str] = set()
+    for vertex in vertices:
+        params = vertex.params
+        for field in vertex.load_from_db_fields:
+            if field.startswith("table:"):
+                table_field_name = field[6:]
+                columns = params.get(f"{table_field_name}_load_from_db_columns") or []
+                for row in params.get(table_field_name) or []:
+                    if isinstance(row, dict):
+                        names.update(row[column] for column in columns if isinstance(row.get(column), str))
+            elif isinstance(params.get(field), str):
+                names.add(params[field])
+    names.discard("")
+    return names
+
+
+async def prefetch_load_from_db_variables(
+    vertices: Iterable[Vertex],
+    user_id: str | uuid.UUID | None,
+    request_variables: dict | None = None,
+) -> None:
+    """Resolve every load_from_db variable of a run with a single lookup.
+
+    The variable service caches the decrypted values, so the per-field `get_variable`
+    calls made while building the vertices do not hit the database again.
+    Failures are logged and left to the per-field lookups to report.
+    """
+    if not user_id:
+        return
+    names = collect_load_from_db_variable_names(vertices) - set(request_variables or {})
+    if not names:
+        return
+    prefetch_variables = getattr(get_variable_service(), "prefetch_variables", None)
+    if prefetch_variables is None:
+        return
+    try:
+        user_id = uuid.UUID(user_id) if isinstance(user_id, str) else user_id
+        async with session_scope() as session:
+            if isinstance(session, NoopSession):
+                return
+            await prefetch_variables(user_id=user_id, names=names, session=session)
+    except Exception as e:  # noqa: BLE001
+        await logger.adebug(f"Could not prefetch variables: {e}")
+
+
 async def update_table_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params: dict,
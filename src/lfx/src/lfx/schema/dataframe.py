@@ -5,6 +5,7 @@ from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
 
 from lfx.schema.data import Data
+from lfx.serialization.dataframe import dataframe_to_records
 
 if TYPE_CHECKING:
     from lfx.schema.message import Message
@@ -90,7 +91,7 @@ class DataFrame(pandas_DataFrame):
 
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
-        list_of_dicts = self.to_dict(orient="records")
+        list_of_dicts = dataframe_to_records(self)
         # suggested change: [Data(**row) for row in list_of_dicts]
         return [Data(data=row) for row in list_of_dicts]
 
@@ -152,7 +153,7 @@ class DataFrame(pandas_DataFrame):
         Returns:
             list[Document]: The converted list of Documents.
         """
-        list_of_dicts = self.to_dict(orient="records")
+        list_of_dicts = dataframe_to_records(self)
         documents = []
         for row in list_of_dicts:
             data_copy = row.copy()
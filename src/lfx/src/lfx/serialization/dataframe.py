@@ -0,0 +1,102 @@
+"""Columnar conversion of pandas DataFrames to records.
+
+``DataFrame.to_dict(orient="records")`` boxes every cell in Python, and serializing the records then
+visits every cell again. The functions here convert each column in bulk with pandas and numpy instead,
+and only visit the cells of the columns holding arbitrary objects.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+def _records(df: pd.DataFrame, columns: list[list[Any]]) -> list[dict]:
+    names = list(df.columns)
+    if not names:
+        return []
+    return [dict(zip(names, row, strict=True)) for row in zip(*columns, strict=True)]
+
+
+def _column_values(series: pd.Series) -> list[Any]:
+    """Return the values of a column boxed as ``to_dict`` boxes them."""
+    values = series.tolist()
+    if isinstance(series.dtype, np.dtype) and not pd.api.types.is_object_dtype(series.dtype):
+        return values
+    # Numpy scalars of object and extension columns are unboxed, missing values of extension columns become None
+    return [None if value is pd.NA else value.item() if isinstance(value, np.generic) else value for value in values]
+
+
+def dataframe_to_records(df: pd.DataFrame) -> list[dict]:
+    """Return the rows of a frame as dicts, like ``df.to_dict(orient="records")``."""
+    if not df.columns.is_unique:
+        return df.to_dict(orient="records")
+    return _records(df, [_column_values(series) for _, series in df.items()])
+
+
+def _truncate_strings(series: pd.Series, max_length: int | None) -> list[Any]:
+    values = series.tolist()
+    if max_length is None:
+        return values
+    too_long = (series.str.len() > max_length).to_numpy()
+    for index in np.flatnonzero(too_long):
+        values[index] = values[index][:max_length] + "..."
+    return values
+
+
+def _isoformat_datetimes(series: pd.Series) -> list[str]:
+    """Format datetimes like ``_serialize_datetime``, which replaces their timezone with UTC."""
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        series = series.dt.tz_localize(None)
+    values = series.to_numpy(dtype="datetime64[ns]")
+    nanoseconds = values.view("int64") % NANOSECONDS_PER_SECOND
+    seconds = np.datetime_as_string(values.astype("datetime64[s]"), unit="s")
+    # isoformat only shows the fraction of a second when there is one, with 6 or 9 digits
+    fraction = np.where(
+        nanoseconds % 1000 != 0,
+        np.char.add(".", np.char.zfill(nanoseconds.astype(str), 9)),
+        np.where(nanoseconds != 0, np.char.add(".", np.char.zfill((nanoseconds // 1000).astype(str), 6)), ""),
+    )
+    formatted = np.char.add(np.char.add(seconds, fraction), "+00:00")
+    return np.where(np.isnat(values), "NaT", formatted).tolist()
+
+
+def _serialize_column(
+    series: pd.Series,
+    max_length: int | None,
+    max_items: int | None,
+    serialize_cell: Callable[[Any, int | None, int | None], Any],
+) -> list[Any]:
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufc":
+        return series.tolist()
+    if (isinstance(dtype, np.dtype) and dtype.kind == "M") or isinstance(dtype, pd.DatetimeTZDtype):
+        try:
+            return _isoformat_datetimes(series)
+        except (OverflowError, ValueError, TypeError):
+            pass
+    elif pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(series, skipna=True) == "string":
+        return _truncate_strings(series, max_length)
+    return [serialize_cell(value, max_length, max_items) for value in _column_values(series)]
+
+
+def serialize_dataframe_records(
+    df: pd.DataFrame,
+    max_length: int | None,
+    max_items: int | None,
+    serialize_cell: Callable[[Any, int | None, int | None], Any],
+) -> list[dict] | None:
+    """Serialize the rows of a frame column by column.
+
+    Numeric columns are converted in bulk, datetime columns are formatted with numpy and string columns are
+    truncated after a vectorized length check. Cells of the other columns are passed to ``serialize_cell``.
+
+    Returns:
+        The serialized records, or None if the frame has duplicate column names.
+    """
+    if not df.columns.is_unique:
+        return None
+    return _records(df, [_serialize_column(series, max_length, max_items, serialize_cell) for _, series in df.items()])
@@ -1,6 +1,7 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
+from types import NoneType
 from typing import Any, cast
 from uuid import UUID
 
@@ -12,6 +13,7 @@ from pydantic.v1 import BaseModel as BaseModelV1
 
 from lfx.log.logger import logger
 from lfx.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from lfx.serialization.dataframe import serialize_dataframe_records
 
 
 def get_max_text_length() -> int:
@@ -34,6 +36,11 @@ class _UnserializableSentinel:
 
 UNSERIALIZABLE_SENTINEL = _UnserializableSentinel()
 
+Serializer = Callable[[Any, int | None, int | None], Any]
+
+# Types whose values are returned as is, checked by exact type in the hot loops of lists and dicts
+_PASSTHROUGH_TYPES = frozenset({NoneType, bool, int, float, complex})
+
 
 def _serialize_str(obj: str, max_length: int | None, _) -> str:
     """Truncates a string to the specified maximum length, appending an ellipsis if truncation occurs.
@@ -99,9 +106,17 @@ def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items:
     return serialize(obj.dict(), max_length, max_items)
 
 
+def _is_passthrough(value: Any, max_length: int | None) -> bool:
+    value_type = type(value)
+    if value_type in _PASSTHROUGH_TYPES:
+        return True
+    return value_type is str and (max_length is None or len(value) <= max_length)
+
+
 def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
     """Recursively process dictionary values."""
-    return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
+    # Primitive values are returned unchanged, skip the call to serialize for them
+    return {k: v if _is_passthrough(v, max_length) else serialize(v, max_length, max_items) for k, v in obj.items()}
 
 
 def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
@@ -110,7 +125,7 @@ def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items:
         truncated = list(obj)[:max_items]
         truncated.append(f"... [truncated {len(obj) - max_items} items]")
         obj = truncated
-    return [serialize(item, max_length, max_items) for item in obj]
+    return [item if _is_passthrough(item, max_length) else serialize(item, max_length, max_items) for item in obj]
 
 
 def _serialize_primitive(obj: Any, *_) -> Any:
@@ -139,6 +154,11 @@ def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: i
     if max_items is not None and len(obj) > max_items:
         obj = obj.head(max_items)
 
+    records = serialize_dataframe_records(obj, max_length, max_items, serialize)
+    if records is not None:
+        return records
+
+    # Duplicate column names, keep the last column of each name like to_dict
     data = obj.to_dict(orient="records")
 
     return serialize(data, max_length, max_items)
@@ -181,8 +201,65 @@ def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | Non
     return UNSERIALIZABLE_SENTINEL
 
 
+def _serialize_passthrough(obj: Any, *_) -> Any:
+    return obj
+
+
+# Serializers by base type, in the order of the checks of _serialize_by_match
+_TYPE_SERIALIZERS: tuple[tuple[type | tuple[type, ...], Serializer], ...] = (
+    ((NoneType, int, float, bool, complex), _serialize_passthrough),
+    (str, _serialize_str),
+    (bytes, _serialize_bytes),
+    (datetime, _serialize_datetime),
+    (Decimal, _serialize_decimal),
+    (UUID, _serialize_uuid),
+    (Document, _serialize_document),
+    ((AsyncIterator, Generator, Iterator), _serialize_iterator),
+    (BaseModel, _serialize_pydantic),
+    (BaseModelV1, _serialize_pydantic_v1),
+    (dict, _serialize_dict),
+    (pd.DataFrame, _serialize_dataframe),
+    (pd.Series, _serialize_series),
+    ((list, tuple), _serialize_list_tuple),
+)
+
+_SERIALIZER_CACHE_MAX_SIZE = 4096
+_serializer_cache: dict[type, Serializer] = {}
+
+
+def _resolve_serializer(cls: type) -> Serializer | None:
+    """Return the serializer of the instances of a type, or None if it depends on the instance."""
+    for base, serializer in _TYPE_SERIALIZERS:
+        if issubclass(cls, base):
+            return serializer
+    if getattr(cls, "__module__", None) == np.__name__:
+        return _serialize_numpy_type
+    if issubclass(cls, type):
+        # Classes are serialized depending on their attributes
+        return None
+    return _serialize_instance
+
+
 def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
-    """Dispatch object to appropriate serializer."""
+    """Dispatch object to appropriate serializer.
+
+    The serializer is resolved once per concrete type and memoized, so each value only costs a dict lookup.
+    """
+    cls = type(obj)
+    serializer = _serializer_cache.get(cls)
+    if serializer is None:
+        # Proxies and mocks report another class, isinstance checks then depend on the instance
+        serializer = _resolve_serializer(cls) if obj.__class__ is cls else None
+        if serializer is None:
+            return _serialize_by_match(obj, max_length, max_items)
+        if len(_serializer_cache) >= _SERIALIZER_CACHE_MAX_SIZE:
+            _serializer_cache.clear()
+        _serializer_cache[cls] = serializer
+    return serializer(obj, max_length, max_items)
+
+
+def _serialize_by_match(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
+    """Dispatch object to appropriate serializer with isinstance checks on the instance."""
     # Handle primitive types first
     if obj is None:
         return obj
@@ -8,3 +8,7 @@ class GetCache(Protocol):
 
 class SetCache(Protocol):
     async def __call__(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool: ...
+
+
+class DeleteCache(Protocol):
+    async def __call__(self, key: str, lock: asyncio.Lock | None = None) -> Any: ...
@@ -108,6 +108,27 @@ class Settings(BaseSettings):
     """Frequency (in seconds) at which the background cleanup task wakes up to
     reap idle sessions."""
 
+    mcp_session_heartbeat_interval: int = 60  # seconds
+    """Pooled MCP sessions that have not completed a call for this long are pinged
+    by the background task, and dropped if the ping fails. Set to 0 to disable."""
+
+    mcp_session_max_concurrent_calls: int = 8
+    """Number of concurrent tool calls on a pooled MCP session before another
+    session to the same server is opened, up to mcp_max_sessions_per_server."""
+
+    mcp_tool_cache_ttl: int = 300  # seconds
+    """How long (in seconds) the tool list of an MCP server is reused before it is
+    listed again. Servers that send tools/list_changed are listed again right away.
+    Set to 0 to list the tools on every build."""
+
+    mcp_sync_tool_timeout: int = 120  # seconds
+    """How long (in seconds) a synchronous MCP tool call, e.g. from a sync agent executor,
+    waits for its result."""
+
+    mcp_sync_tool_max_pending: int = 64
+    """Maximum number of synchronous MCP tool calls in flight at once. Further calls wait
+    for a slot within mcp_sync_tool_timeout."""
+
     # sqlite configuration
     sqlite_pragmas: dict | None = {"synchronous": "NORMAL", "journal_mode": "WAL"}
     """SQLite pragmas to use when connecting to the database."""
@@ -149,6 +170,13 @@ class Settings(BaseSettings):
     """The cache expire in seconds."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    component_class_cache_max_entries: int = 512
+    """Maximum number of compiled component classes kept in memory. Set to 0 to disable the cache."""
+    component_class_cache_max_memory_mb: int = 64
+    """Approximate memory budget in MB for the compiled component class cache."""
+    graph_template_cache_max_entries: int = 128
+    """Maximum number of prepared flow definitions kept in memory to build graphs for the run and webhook
+    endpoints. Set to 0 to disable the cache."""
 
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
@@ -165,6 +193,24 @@ class Settings(BaseSettings):
     Set to a file path (e.g., '/path/to/index.json') or URL (e.g., 'https://example.com/index.json')
     to use a custom index.
     """
+    components_index_build_mode: Literal["thread", "process"] = "thread"
+    """How component modules are imported when the index is built dynamically (dev mode or missing index).
+    'thread' imports them in a thread pool, 'process' in a pool of worker processes, which avoids serializing
+    the imports and template generation on the GIL."""
+    components_index_build_workers: int = 0
+    """Number of worker processes used by the 'process' index build mode. 0 means one per CPU."""
+    components_incremental_cache: bool = True
+    """If set to True, the templates of each component module built dynamically are cached on disk, keyed by the
+    module source, so only modules changed since the previous start are imported again."""
+    file_parse_cache: bool = False
+    """If set to True, file loading components that support it cache the parsed content of each file on disk,
+    keyed by the file content and the parser options, so unchanged files are not parsed again. The entries of
+    a file are removed when it is deleted from the storage. Entries are not scoped per user, so only enable it
+    where every user may read the parsed content of the others' files."""
+    file_parse_cache_dir: str | None = None
+    """Directory of the file parse cache. Defaults to a folder in the config directory."""
+    file_parse_cache_max_size_mb: int = 512
+    """Maximum size of the file parse cache. The least recently used entries are evicted first."""
     langchain_cache: str = "InMemoryCache"
     load_flows_path: str | None = None
     bundle_urls: list[str] = []
@@ -176,6 +222,14 @@ class Settings(BaseSettings):
     redis_url: str | None = None
     redis_cache_expire: int = 3600
 
+    # Job queue
+    job_queue_backend: Literal["memory", "redis"] = "memory"
+    """Where the events of flow build jobs are kept. 'memory' keeps them in the worker that runs the job, so
+    the events must be requested from that worker. 'redis' forwards them to Redis streams, so any worker
+    connected to the same Redis can serve the events of any job and cancel it."""
+    job_queue_redis_expire: int = 3600
+    """Number of seconds the Redis streams of a build job are kept after its last event."""
+
     # Sentry
     sentry_dsn: str | None = None
     sentry_traces_sample_rate: float | None = 1.0
@@ -198,6 +252,10 @@ class Settings(BaseSettings):
     """Whether to store environment variables as Global Variables in the database."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
+    variable_cache_ttl: float = 0.0
+    """Time in seconds that decrypted Global Variable values are cached per user. 0 disables the cache. The cache
+    is local to each worker, so a variable updated or deleted through one worker can still be read from the
+    others for up to this long."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
     frontend_timeout: int = 0
@@ -259,12 +317,28 @@ class Settings(BaseSettings):
     """The maximum file size for the upload in MB."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_export_workers: int = 4
+    """Number of threads shared by all runs to execute the tracer callbacks, off the event loop."""
+    tracing_queue_max_size: int = 1000
+    """Maximum number of tracer callbacks queued for a single run. 0 means no limit."""
+    tracing_queue_overflow_policy: Literal["block", "drop"] = "drop"
+    """What to do with a tracer callback when the queue of its run is full. 'block' makes the component wait
+    for the tracers to catch up, 'drop' discards the start of the component trace and counts it, along with its
+    end, as dropped. The end of a trace whose start was queued is never dropped."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    build_log_batch_size: int = 100
+    """Number of buffered vertex builds and transactions that triggers a batched write to the database."""
+    build_log_flush_interval: float = 1.0
+    """Maximum time in seconds vertex builds and transactions stay buffered before being written."""
+    build_log_max_queue_size: int = 10000
+    """Maximum number of buffered vertex builds and transactions. New rows are dropped when the buffer is full."""
+    build_log_compaction_interval: float = 60.0
+    """Interval in seconds at which old vertex builds and transactions are pruned to the retention limits."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -305,6 +379,33 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    event_token_coalesce_interval: float = 0.0
+    """Time window in seconds in which consecutive token events of a message are merged into a single event.
+    0 disables coalescing."""
+    event_token_coalesce_max_chars: int = 1024
+    """Number of pending characters that sends a coalesced token event before the time window ends."""
+    event_queue_max_size: int = 1000
+    """Maximum number of events queued for a job before coalesced token events are held back. Only applies
+    when event_token_coalesce_interval is set. 0 means no limit."""
+    event_queue_overflow_policy: Literal["block", "drop_merge"] = "block"
+    """What to do with token events when the event queue is full. 'block' makes the producer wait for the
+    client to catch up, 'drop_merge' merges the tokens into the next queued event."""
+    graph_scheduler: Literal["layered", "dataflow"] = "layered"
+    """How Graph.process schedules vertices. 'layered' runs the graph layer by layer and waits for each layer
+    to finish, 'dataflow' starts each vertex as soon as all of its predecessors have finished."""
+    graph_checkpoint_mode: Literal["full", "delta"] = "full"
+    """How a graph run is cached after each step. 'full' caches the whole graph, 'delta' writes an incremental
+    checkpoint holding only the run state and the outputs of the vertices built since the previous step."""
+    incremental_playground_builds: bool = False
+    """If enabled, a playground build updates the graph of the previous build of the flow with what changed and
+    reuses the results of the components that are not affected. Only works with the 'full' graph_checkpoint_mode.
+    Components are assumed to give the same result for the same inputs, so sources such as API calls, dates or
+    generated IDs keep their previous result until they or their inputs change."""
+    graph_max_concurrency: int = 0
+    """Maximum number of vertices of a single graph built concurrently by the dataflow scheduler. 0 means no limit."""
+    graph_worker_max_concurrency: int = 0
+    """Maximum number of vertices built concurrently by the dataflow scheduler across all graphs running in
+    this worker. 0 means no limit."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
@@ -0,0 +1,94 @@
+"""Tests for the pooled Docling worker processes."""
+
+import textwrap
+
+import pytest
+from lfx.base.data import docling_pool
+from lfx.base.data.docling_pool import DoclingWorkerPool
+
+# Stands in for Docling: echoes the request back with the worker's pid.
+FAKE_WORKER_SCRIPT = textwrap.dedent(
+    """
+    import json, os, sys
+
+    for line in sys.stdin:
+        cfg = json.loads(line)
+        if cfg["file_path"] == "crash.pdf":
+            sys.exit(1)
+        print("noise from a native library")
+        result = {"ok": True, "mode": "markdown", "text": str(os.getpid()), "meta": {"file_path": cfg["file_path"]}}
+        result["convert_seconds"] = 0.01
+        sys.stdout.write(json.dumps(result) + "\\n")
+        sys.stdout.flush()
+    """
+)
+
+
+@pytest.fixture
+def fake_worker(monkeypatch):
+    monkeypatch.setattr(docling_pool, "DOCLING_WORKER_SCRIPT", FAKE_WORKER_SCRIPT)
+
+
+@pytest.fixture
+def pool(fake_worker):  # noqa: ARG001
+    pool = DoclingWorkerPool(max_workers=2, max_documents_per_worker=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_is_reused_and_recycled(pool):
+    pool.max_workers = 1
+    pids = [pool.convert({"file_path": f"{i}.pdf"})["text"] for i in range(4)]
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
+
+
+def test_map_preserves_order_and_reports_timings(pool):
+    results = pool.map([{"file_path": f"{i}.pdf"} for i in range(5)])
+
+    assert [result["meta"]["file_path"] for result in results] == [f"{i}.pdf" for i in range(5)]
+    assert all(result["ok"] for result in results)
+    assert all(result["timings"]["convert_seconds"] == 0.01 for result in results)
+    assert all(result["timings"]["total_seconds"] >= 0 for result in results)
+    assert len({result["text"] for result in results}) <= 4
+
+
+def test_crashed_worker_returns_error_and_is_replaced(pool):
+    failed = pool.convert({"file_path": "crash.pdf"})
+    recovered = pool.convert({"file_path": "ok.pdf"})
+
+    assert failed["ok"] is False
+    assert "worker exited" in failed["error"]
+    assert failed["meta"] == {"file_path": "crash.pdf"}
+    assert recovered["ok"] is True
+
+
+def test_shared_pools_are_kept_per_limits(fake_worker):  # noqa: ARG001
+    try:
+        first = DoclingWorkerPool.shared(max_workers=1, max_documents_per_worker=10)
+        assert DoclingWorkerPool.shared(max_workers=1, max_documents_per_worker=10) is first
+
+        second = DoclingWorkerPool.shared(max_workers=3, max_documents_per_worker=10)
+        assert second is not first
+        assert DoclingWorkerPool.shared(max_workers=1, max_documents_per_worker=10) is first
+    finally:
+        DoclingWorkerPool.shutdown_shared()
+
+
+def test_pools_with_other_limits_keep_their_warm_workers(fake_worker):  # noqa: ARG001
+    try:
+        first = DoclingWorkerPool.shared(max_workers=1, max_documents_per_worker=10)
+        first.convert({"file_path": "warm.pdf"})
+        warm_worker = first._idle[0]
+
+        DoclingWorkerPool.shared(max_workers=2, max_documents_per_worker=10).convert({"file_path": "a.pdf"})
+        result = first.convert({"file_path": "b.pdf"})
+
+        assert result["ok"] is True
+        assert warm_worker.alive
+        assert first._idle == [warm_worker]
+    finally:
+        DoclingWorkerPool.shutdown_shared()
+    assert warm_worker.process.poll() is not None
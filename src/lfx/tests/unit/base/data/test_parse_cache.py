@@ -0,0 +1,175 @@
+"""Tests for the on-disk file parse cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.parse_cache import FileParseCache, hash_file
+from lfx.schema.data import Data
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FileParseCache(tmp_path / "cache", max_size_bytes=1024 * 1024)
+
+
+class TestFileParseCache:
+    def test_round_trip_and_hit_rate(self, cache):
+        key = cache.make_key("abc", {"advanced_mode": False})
+
+        assert cache.get(key) is None
+        assert cache.set(key, [{"text": "hello", "file_path": "/tmp/a.txt"}])
+        assert cache.get(key) == [{"text": "hello", "file_path": "/tmp/a.txt"}]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["size_bytes"] > 0
+
+    def test_key_depends_on_content_and_options(self, tmp_path):
+        file_a = tmp_path / "a.txt"
+        file_b = tmp_path / "b.txt"
+        file_a.write_text("same")
+        file_b.write_text("same")
+
+        assert hash_file(file_a) == hash_file(file_b)
+        key = FileParseCache.make_key(hash_file(file_a), {"pipeline": "standard", "ocr_engine": "easyocr"})
+        assert key == FileParseCache.make_key(hash_file(file_b), {"ocr_engine": "easyocr", "pipeline": "standard"})
+        assert key != FileParseCache.make_key(hash_file(file_a), {"pipeline": "vlm", "ocr_engine": "easyocr"})
+
+    def test_evicts_least_recently_used_entries(self, tmp_path):
+        cache = FileParseCache(tmp_path / "cache", max_size_bytes=3000)
+        rows = [{"text": os.urandom(1000).hex()}]
+        for name in ("first", "second"):
+            assert cache.set(name, rows)
+        # Make "first" the most recently used entry
+        second = cache.cache_dir / "second.bin"
+        os.utime(second, ns=(1, 1))
+        assert cache.get("first") == rows
+
+        assert cache.set("third", rows)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == rows
+        assert cache.get("third") == rows
+        assert cache.stats()["size_bytes"] <= 3000
+
+    def test_delete_content_removes_every_option_of_a_file(self, cache):
+        for options in ({"pipeline": "standard"}, {"pipeline": "vlm"}):
+            assert cache.set(cache.make_key("deleted", options), [{"text": "hello"}])
+        kept = cache.make_key("kept", {"pipeline": "standard"})
+        assert cache.set(kept, [{"text": "hello"}])
+
+        assert cache.delete_content("deleted") == 2
+
+        assert cache.get(cache.make_key("deleted", {"pipeline": "standard"})) is None
+        assert cache.get(kept) == [{"text": "hello"}]
+        assert cache.stats()["size_bytes"] == (cache.cache_dir / f"{kept}.bin").stat().st_size
+
+    def test_unserializable_rows_are_not_cached(self, cache):
+        assert not cache.set("key", [{"value": object()}])
+        assert cache.get("key") is None
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        assert cache.set("key", [{"text": "hello"}])
+        (cache.cache_dir / "key.bin").write_bytes(b"not zlib")
+
+        assert cache.get("key") is None
+        assert not (cache.cache_dir / "key.bin").exists()
+
+
+class CachingFileComponent(BaseFileComponent):
+    VALID_EXTENSIONS = ["txt"]
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self.parsed: list[str] = []
+        self.set_attributes(
+            {
+                "path": [],
+                "file_path": None,
+                "separator": "\n\n",
+                "silent_errors": False,
+                "delete_server_file_after_processing": True,
+                "ignore_unsupported_extensions": True,
+                "ignore_unspecified_files": False,
+            }
+        )
+
+    def parse_cache_options(self, file_list):  # noqa: ARG002
+        return {"upper": True}
+
+    def process_files(self, file_list):
+        self.parsed.extend(file.path.name for file in file_list)
+        rows = [Data(data={"text": file.path.read_text().upper(), "file_path": str(file.path)}) for file in file_list]
+        return self.rollup_data(file_list, rows)
+
+
+class UncachedFileComponent(CachingFileComponent):
+    def parse_cache_options(self, file_list):  # noqa: ARG002
+        return None
+
+
+class FailingFileComponent(CachingFileComponent):
+    def process_files(self, file_list):
+        self.parsed.extend(file.path.name for file in file_list)
+        rows = [Data(data={"error": "parse failed", "file_path": str(file.path)}) for file in file_list]
+        return self.rollup_data(file_list, rows)
+
+
+class TestProcessFilesCached:
+    def test_unchanged_files_are_served_from_cache(self, tmp_path, cache):
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        copy = tmp_path / "copy.txt"
+        first.write_text("one")
+        second.write_text("two")
+        copy.write_text("one")
+
+        component = CachingFileComponent()
+        with patch("lfx.base.data.base_file.get_file_parse_cache", return_value=cache):
+            component.path = [str(first), str(second)]
+            assert [row.text for row in component.load_files_base()] == ["ONE", "TWO"]
+
+            second.write_text("changed")
+            component.path = [str(copy), str(second)]
+            result = component.load_files_base()
+
+        assert component.parsed == ["first.txt", "second.txt", "second.txt"]
+        assert [row.text for row in result] == ["ONE", "CHANGED"]
+        assert result[0].data["file_path"] == str(copy)
+
+    def test_cache_is_skipped_without_options(self, tmp_path, cache):
+        text_file = tmp_path / "file.txt"
+        text_file.write_text("one")
+        component = UncachedFileComponent()
+        component.path = [str(text_file)]
+
+        with patch("lfx.base.data.base_file.get_file_parse_cache", return_value=cache):
+            component.load_files_base()
+            component.load_files_base()
+
+        assert component.parsed == ["file.txt", "file.txt"]
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+    def test_error_rows_are_not_cached(self, tmp_path, cache):
+        text_file = tmp_path / "file.txt"
+        text_file.write_text("one")
+        component = FailingFileComponent()
+        component.path = [str(text_file)]
+
+        with patch("lfx.base.data.base_file.get_file_parse_cache", return_value=cache):
+            component.load_files_base()
+            component.load_files_base()
+
+        assert component.parsed == ["file.txt", "file.txt"]
+
+
+def test_hash_file_reads_in_chunks(tmp_path):
+    large = Path(tmp_path / "large.bin")
+    large.write_bytes(b"x" * (3 * 1024 * 1024 + 5))
+
+    assert len(hash_file(large)) == 64
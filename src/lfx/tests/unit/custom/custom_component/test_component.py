@@ -26,6 +26,17 @@ def test_set_invalid_output():
         chatoutput.set(input_value=chatinput.build_config)
 
 
+def test_inputs_are_copied_per_instance():
+    class_input = next(input_ for input_ in ChatInput.inputs if input_.name == "files")
+    first, second = ChatInput(), ChatInput()
+
+    first._inputs["files"].file_types.append("custom")
+
+    assert "custom" not in second._inputs["files"].file_types
+    assert "custom" not in class_input.file_types
+    assert second._inputs["files"] == class_input
+
+
 @pytest.mark.xfail(reason="CrewAI is not outdated")
 def test_set_component():
     from lfx.components.crewai import CrewAIAgentComponent, SequentialTaskComponent
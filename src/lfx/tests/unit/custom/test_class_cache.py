@@ -0,0 +1,137 @@
+"""Tests for the compiled component class cache."""
+
+from unittest.mock import patch
+
+import pytest
+from lfx.custom import validate
+from lfx.custom.class_cache import ComponentClassCache, get_component_class_cache, invalidate_flow_component_classes
+from lfx.custom.eval import eval_custom_component_code
+
+COMPONENT_CODE = """
+from lfx.custom.custom_component.component import Component
+
+
+class CachedComponent(Component):
+    display_name = "Cached"
+"""
+
+
+def _flow_with_codes(*codes):
+    return {"nodes": [{"data": {"node": {"template": {"code": {"value": code}}}}} for code in codes]}
+
+
+@pytest.fixture(autouse=True)
+def clear_class_cache():
+    get_component_class_cache().clear()
+    yield
+    get_component_class_cache().clear()
+
+
+class TestComponentClassCache:
+    """Test the ComponentClassCache bounds and metrics."""
+
+    def test_get_or_create_compiles_once(self):
+        cache = ComponentClassCache()
+        calls = []
+
+        def factory(code):
+            calls.append(code)
+            return type("A", (), {})
+
+        first = cache.get_or_create("class A: pass", factory)
+        second = cache.get_or_create("class A: pass", factory)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_factory_errors_are_not_cached(self):
+        cache = ComponentClassCache()
+
+        def factory(_code):
+            msg = "boom"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="boom"):
+            cache.get_or_create("class A: pass", factory)
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = ComponentClassCache(max_entries=2)
+        cache.set("class A: pass", type("A", (), {}))
+        cache.set("class B: pass", type("B", (), {}))
+        cache.get("class A: pass")
+        cache.set("class C: pass", type("C", (), {}))
+
+        assert "class A: pass" in cache
+        assert "class B: pass" not in cache
+        assert "class C: pass" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_memory(self):
+        code = "class A: pass"
+        cache = ComponentClassCache(max_memory_bytes=ComponentClassCache._estimate_size(code) + 1)
+        cache.set(code, type("A", (), {}))
+        cache.set("class B: pass", type("B", (), {}))
+
+        assert len(cache) == 1
+        assert cache.stats()["memory_bytes"] <= cache.max_memory_bytes
+
+    def test_disabled_cache(self):
+        cache = ComponentClassCache(max_entries=0)
+        cache.set("class A: pass", type("A", (), {}))
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = ComponentClassCache()
+        cache.set("class A: pass", type("A", (), {}))
+        assert cache.invalidate("class A: pass")
+        assert not cache.invalidate("class A: pass")
+        assert cache.stats()["memory_bytes"] == 0
+
+
+class TestEvalCustomComponentCode:
+    """Test that eval_custom_component_code goes through the class cache."""
+
+    def test_repeated_eval_skips_compilation(self):
+        with patch.object(validate, "create_class", wraps=validate.create_class) as create_class:
+            first = eval_custom_component_code(COMPONENT_CODE)
+            second = eval_custom_component_code(COMPONENT_CODE)
+
+        assert first is second
+        assert first.__name__ == "CachedComponent"
+        assert create_class.call_count == 1
+
+    def test_changed_code_compiles_new_class(self):
+        first = eval_custom_component_code(COMPONENT_CODE)
+        second = eval_custom_component_code(COMPONENT_CODE.replace('"Cached"', '"Edited"'))
+
+        assert first is not second
+        assert second.display_name == "Edited"
+
+
+class TestInvalidateFlowComponentClasses:
+    """Test the flow change invalidation hook."""
+
+    def test_evicts_only_removed_code(self):
+        edited_code = COMPONENT_CODE.replace('"Cached"', '"Edited"')
+        cache = get_component_class_cache()
+        cache.set(COMPONENT_CODE, type("A", (), {}))
+        cache.set("class Kept: pass", type("Kept", (), {}))
+
+        evicted = invalidate_flow_component_classes(
+            _flow_with_codes(COMPONENT_CODE, "class Kept: pass"),
+            _flow_with_codes(edited_code, "class Kept: pass"),
+        )
+
+        assert evicted == 1
+        assert COMPONENT_CODE not in cache
+        assert "class Kept: pass" in cache
+
+    def test_deleted_flow_evicts_all_codes(self):
+        cache = get_component_class_cache()
+        cache.set(COMPONENT_CODE, type("A", (), {}))
+
+        assert invalidate_flow_component_classes(_flow_with_codes(COMPONENT_CODE)) == 1
+        assert len(cache) == 0
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 from lfx.events.event_manager import (
     EventManager,
+    RawJSON,
     create_default_event_manager,
     create_stream_tokens_event_manager,
 )
@@ -211,6 +212,16 @@ class TestEventManager:
 
         assert parsed_data["data"] == complex_data
 
+    def test_send_event_splices_raw_json(self):
+        """Test that RawJSON payloads are embedded without being encoded again."""
+        queue = MagicMock()
+        manager = EventManager(queue)
+
+        manager.send_event(event_type="end_vertex", data={"build_data": RawJSON(b'{"id":"v1"}'), "extra": [1]})
+
+        _, data_bytes, _ = queue.put_nowait.call_args[0][0]
+        assert data_bytes == b'{"event": "end_vertex", "data": {"build_data": {"id":"v1"}, "extra": [1]}}\n\n'
+
 
 class TestEventManagerFactories:
     """Test cases for EventManager factory functions."""
@@ -368,3 +379,137 @@ class TestEventManagerAsync:
         for sent, received in zip(events_to_send, received_events, strict=False):
             assert sent[0] == received[0]  # event type
             assert sent[1] == received[1]  # data
+
+
+def _drain(queue: asyncio.Queue) -> list[tuple[str, dict]]:
+    events = []
+    while not queue.empty():
+        _, data_bytes, _ = queue.get_nowait()
+        parsed_data = json.loads(data_bytes.decode("utf-8").strip())
+        events.append((parsed_data["event"], parsed_data["data"]))
+    return events
+
+
+class TestTokenCoalescing:
+    """Test cases for token coalescing and queue backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_merged_until_next_event(self):
+        """Test that consecutive tokens are sent as one frame before the next event."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, token_coalesce_interval=10)
+
+        for chunk in ["Hel", "lo", " world"]:
+            manager.on_token(data={"chunk": chunk, "id": "msg-1"})
+        assert queue.empty()
+
+        manager.on_end(data={})
+
+        assert _drain(queue) == [("token", {"chunk": "Hello world", "id": "msg-1"}), ("end", {})]
+        stats = manager.get_stats()
+        assert stats["tokens_received"] == 3
+        assert stats["token_frames_sent"] == 1
+        assert stats["coalescing_ratio"] == 3
+
+    @pytest.mark.asyncio
+    async def test_max_chars_and_message_change_emit_frames(self):
+        """Test that a full frame or a token of another message flushes the pending frame."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, token_coalesce_interval=10, token_coalesce_max_chars=4)
+
+        manager.on_token(data={"chunk": "ab", "id": "msg-1"})
+        manager.on_token(data={"chunk": "cd", "id": "msg-1"})
+        manager.on_token(data={"chunk": "x", "id": "msg-1"})
+        manager.on_token(data={"chunk": "y", "id": "msg-2"})
+        manager.flush_tokens()
+
+        assert [data for _, data in _drain(queue)] == [
+            {"chunk": "abcd", "id": "msg-1"},
+            {"chunk": "x", "id": "msg-1"},
+            {"chunk": "y", "id": "msg-2"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pending_frame_is_flushed_after_interval(self):
+        """Test that the last tokens are sent even if no other event follows them."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, token_coalesce_interval=0.02)
+
+        manager.on_token(data={"chunk": "a", "id": "msg-1"})
+        manager.on_token(data={"chunk": "b", "id": "msg-1"})
+        await asyncio.sleep(0.1)
+
+        assert _drain(queue) == [("token", {"chunk": "ab", "id": "msg-1"})]
+
+    @pytest.mark.asyncio
+    async def test_drop_merge_policy_merges_tokens_when_queue_is_full(self):
+        """Test that tokens are merged instead of queued while the queue is full."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(
+            queue,
+            token_coalesce_interval=10,
+            token_coalesce_max_chars=1,
+            max_queue_size=2,
+            overflow_policy="drop_merge",
+        )
+        manager.on_build_start(data={"id": "a"})
+        manager.on_build_start(data={"id": "b"})
+
+        for chunk in ["1", "2", "3"]:
+            manager.on_token(data={"chunk": chunk, "id": "msg-1"})
+        assert queue.qsize() == 2
+        assert manager.get_stats()["tokens_merged_on_overflow"] == 3
+
+        _drain(queue)
+        manager.on_token(data={"chunk": "4", "id": "msg-1"})
+
+        assert _drain(queue) == [("token", {"chunk": "1234", "id": "msg-1"})]
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_consumer(self):
+        """Test that producers in worker threads wait for the consumer when the queue is full."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(
+            queue,
+            token_coalesce_interval=10,
+            token_coalesce_max_chars=1,
+            max_queue_size=1,
+            overflow_policy="block",
+            block_timeout=5,
+        )
+        manager.on_build_start(data={"id": "a"})
+
+        async def consume():
+            await asyncio.sleep(0.05)
+            event = await queue.get()
+            manager.notify_consumed()
+            return event
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.to_thread(manager.on_token, data={"chunk": "a", "id": "msg-1"})
+        await consumer
+
+        assert _drain(queue) == [("token", {"chunk": "a", "id": "msg-1"})]
+        # The consumer wakes the producer instead of letting it wait for the timeout
+        assert 0 < manager.get_stats()["producer_wait_time"] < 1
+
+    def test_queue_limit_alone_does_not_coalesce_tokens(self):
+        """Test that tokens are queued one by one unless a coalescing interval is set."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, max_queue_size=1, overflow_policy="drop_merge")
+
+        manager.on_token(data={"chunk": "a", "id": "msg-1"})
+        manager.on_token(data={"chunk": "b", "id": "msg-1"})
+
+        assert not manager.coalesces_tokens
+        assert [data for _, data in _drain(queue)] == [{"chunk": "a", "id": "msg-1"}, {"chunk": "b", "id": "msg-1"}]
+
+    def test_control_events_are_never_held_back(self):
+        """Test that non-token events are queued even when the queue is full."""
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, max_queue_size=1, overflow_policy="drop_merge")
+
+        manager.on_build_start(data={"id": "a"})
+        manager.on_error(data={"text": "boom"})
+
+        assert queue.qsize() == 2
@@ -0,0 +1,217 @@
+import dill
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput, TextInputComponent
+from lfx.graph import Graph
+from lfx.graph.graph.checkpoint import GraphCheckpointer, clear_graph_checkpoint
+from lfx.services.cache.utils import CacheMiss
+
+
+class DictCache:
+    """In-memory stand-in for the chat service cache that stores pickled values, like Redis does."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.bytes_written = 0
+
+    async def get_cache(self, key, lock=None):  # noqa: ARG002
+        if key not in self.data:
+            return CacheMiss()
+        return {"result": dill.loads(self.data[key])}  # noqa: S301
+
+    async def set_cache(self, key, data, lock=None) -> bool:  # noqa: ARG002
+        self.data[key] = dill.dumps(data, recurse=True)
+        self.bytes_written += len(self.data[key])
+        return True
+
+    async def delete_cache(self, key, lock=None):  # noqa: ARG002
+        self.data.pop(key, None)
+
+
+def build_chain_graph(length: int) -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    previous = TextInputComponent(_id="text_0").set(input_value=chat_input.message_response)
+    for i in range(1, length - 2):
+        previous = TextInputComponent(_id=f"text_{i}").set(input_value=previous.text_response)
+    chat_output = ChatOutput(_id="chat_output").set(input_value=previous.text_response)
+    graph = Graph(chat_input, chat_output, flow_id="flow", flow_name="Chain")
+    graph.set_run_id("run")
+    return graph
+
+
+async def _step(graph: Graph) -> None:
+    await graph.astep(inputs=None)
+
+
+async def test_checkpoint_round_trip():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+
+    for _ in range(3):
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+
+    restored = await Graph.load_checkpoint("flow", cache.get_cache)
+
+    assert restored is not None
+    assert restored.run_id == "run"
+    assert list(restored._run_queue) == list(graph._run_queue)
+    assert restored.run_manager.to_dict() == graph.run_manager.to_dict()
+    for vertex in graph.vertices:
+        restored_vertex = restored.get_vertex(vertex.id)
+        assert restored_vertex.built == vertex.built
+        if vertex.built:
+            assert restored_vertex.results.keys() == vertex.results.keys()
+
+
+async def test_restored_graph_continues_run():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    for _ in range(2):
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+
+    restored = await Graph.load_checkpoint("flow", cache.get_cache)
+    while graph._run_queue:
+        await _step(restored)
+        await restored.save_checkpoint(cache.set_cache)
+        await _step(graph)
+
+    assert restored._checkpointer.sequence == len(graph.vertices)
+    assert restored.get_vertex("chat_output").built
+    final = await Graph.load_checkpoint("flow", cache.get_cache)
+    assert final.get_vertex("chat_output").built
+
+
+async def test_loaded_graph_only_replays_new_deltas():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    await _step(graph)
+    await graph.save_checkpoint(cache.set_cache)
+    restored = await Graph.load_checkpoint("flow", cache.get_cache)
+
+    # Another worker advances the run
+    for _ in range(2):
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+    del cache.data["flow:checkpoint:base"]
+    del cache.data["flow:checkpoint:1"]
+
+    caught_up = await Graph.load_checkpoint("flow", cache.get_cache, restored)
+
+    assert caught_up is restored
+    assert restored._checkpointer.sequence == 3
+    assert restored.run_manager.to_dict() == graph.run_manager.to_dict()
+    assert restored.get_vertex("text_1").built
+
+
+async def test_loaded_graph_is_rebuilt_after_compaction_elsewhere():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    await _step(graph)
+    await graph.save_checkpoint(cache.set_cache)
+    restored = await Graph.load_checkpoint("flow", cache.get_cache)
+    while graph._run_queue:
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+    await graph.compact_checkpoint(cache.set_cache, cache.delete_cache)
+
+    final = await Graph.load_checkpoint("flow", cache.get_cache, restored)
+
+    assert final is not restored
+    assert final.get_vertex("chat_output").built
+
+
+async def test_deltas_only_carry_changed_vertices():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+
+    await _step(graph)
+    first = await graph.save_checkpoint(cache.set_cache)
+    await _step(graph)
+    second = await graph.save_checkpoint(cache.set_cache)
+
+    assert list(first["vertex_outputs"]) == ["chat_input"]
+    assert list(second["vertex_outputs"]) == ["text_0"]
+
+
+async def test_new_run_starts_new_checkpoint():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    await _step(graph)
+    await graph.save_checkpoint(cache.set_cache)
+
+    graph.set_run_id("other_run")
+    delta = await graph.save_checkpoint(cache.set_cache)
+
+    assert delta["sequence"] == 1
+    assert "chat_input" in delta["vertex_outputs"]
+    assert (await Graph.load_checkpoint("flow", cache.get_cache)).run_id == "other_run"
+
+
+async def test_incomplete_checkpoint_is_ignored():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    for _ in range(2):
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+
+    del cache.data["flow:checkpoint:1"]
+
+    assert await Graph.load_checkpoint("flow", cache.get_cache) is None
+    assert await Graph.load_checkpoint("missing", cache.get_cache) is None
+
+
+async def test_completed_run_is_compacted_into_one_delta():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    while graph._run_queue:
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+
+    await graph.compact_checkpoint(cache.set_cache, cache.delete_cache)
+
+    assert sorted(cache.data) == ["flow:checkpoint", "flow:checkpoint:1", "flow:checkpoint:base"]
+    restored = await Graph.load_checkpoint("flow", cache.get_cache)
+    assert restored.run_manager.to_dict() == graph.run_manager.to_dict()
+    assert all(restored.get_vertex(vertex.id).built for vertex in graph.vertices)
+
+    # The compacted checkpoint is extended like any other
+    await restored.save_checkpoint(cache.set_cache)
+    assert restored._checkpointer.sequence == 2
+
+
+async def test_clear_graph_checkpoint_deletes_every_key():
+    graph = build_chain_graph(5)
+    cache = DictCache()
+    for _ in range(3):
+        await _step(graph)
+        await graph.save_checkpoint(cache.set_cache)
+
+    assert await clear_graph_checkpoint("flow", cache.get_cache, cache.delete_cache)
+
+    assert not cache.data
+    assert not await clear_graph_checkpoint("flow", cache.get_cache, cache.delete_cache)
+
+
+@pytest.mark.benchmark
+async def test_benchmark_bytes_written_per_step():
+    """Compares bytes written per step when caching the whole graph and when writing deltas on a 50-vertex flow."""
+    full_graph = build_chain_graph(50)
+    full_cache = DictCache()
+    delta_graph = build_chain_graph(50)
+    delta_cache = DictCache()
+
+    steps = 0
+    while full_graph._run_queue:
+        await _step(full_graph)
+        await full_cache.set_cache("flow", full_graph)
+        await _step(delta_graph)
+        await delta_graph.save_checkpoint(delta_cache.set_cache)
+        steps += 1
+
+    full_per_step = full_cache.bytes_written / steps
+    delta_per_step = delta_cache.bytes_written / steps
+    print(f"\nFull: {full_per_step:.0f} bytes/step, delta: {delta_per_step:.0f} bytes/step")  # noqa: T201
+    assert steps == 50
+    assert delta_per_step < full_per_step
+    assert isinstance(delta_graph._checkpointer, GraphCheckpointer)
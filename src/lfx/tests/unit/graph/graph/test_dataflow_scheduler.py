@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import pytest
+from lfx.custom.custom_component.component import Component
+from lfx.graph import Graph
+from lfx.inputs.inputs import FloatInput, MessageTextInput
+from lfx.schema.message import Message
+from lfx.services.deps import get_settings_service
+from lfx.template import Output
+
+
+class DelayComponent(Component):
+    display_name = "DelayComponent"
+    inputs = [
+        MessageTextInput(name="input_value", value=""),
+        FloatInput(name="delay", value=0.0),
+    ]
+    outputs = [Output(name="output", method="delayed_output")]
+
+    async def delayed_output(self) -> Message:
+        await asyncio.sleep(self.delay)
+        return Message(text=f"{self.input_value}>{self._id}")
+
+
+def _connect(graph: Graph, source: DelayComponent, target: DelayComponent) -> None:
+    graph.add_component_edge(source.get_id(), ("output", "input_value"), target.get_id())
+
+
+def build_uneven_fan_out_graph(*, width: int, slow_delay: float, fast_delay: float, fast_depth: int) -> Graph:
+    """Builds a graph with one slow branch and ``width - 1`` chains of ``fast_depth`` fast vertices."""
+    graph = Graph()
+    root = DelayComponent(_id="root")
+    graph.add_component(root)
+    slow = DelayComponent(_id="slow", delay=slow_delay)
+    graph.add_component(slow)
+    _connect(graph, root, slow)
+    for branch in range(width - 1):
+        previous = root
+        for depth in range(fast_depth):
+            fast = DelayComponent(_id=f"fast_{branch}_{depth}", delay=fast_delay)
+            graph.add_component(fast)
+            _connect(graph, previous, fast)
+            previous = fast
+    graph.prepare()
+    return graph
+
+
+async def _timed_process(graph: Graph, **kwargs) -> float:
+    start_time = time.perf_counter()
+    await graph.process(fallback_to_env_vars=False, **kwargs)
+    return time.perf_counter() - start_time
+
+
+@pytest.mark.parametrize("scheduler", ["layered", "dataflow"])
+async def test_process_builds_every_vertex(scheduler):
+    graph = build_uneven_fan_out_graph(width=4, slow_delay=0.01, fast_delay=0.0, fast_depth=3)
+
+    await graph.process(fallback_to_env_vars=False, scheduler=scheduler)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert graph.get_vertex("fast_0_2").results["output"].text == ">root>fast_0_0>fast_0_1>fast_0_2"
+
+
+async def test_dataflow_does_not_wait_for_slow_sibling():
+    graph = build_uneven_fan_out_graph(width=2, slow_delay=0.5, fast_delay=0.0, fast_depth=2)
+    finished_order: list[str] = []
+    original_build_vertex = graph.build_vertex
+
+    async def recording_build_vertex(*args, **kwargs):
+        result = await original_build_vertex(*args, **kwargs)
+        finished_order.append(result.vertex.id)
+        return result
+
+    graph.build_vertex = recording_build_vertex
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow")
+
+    assert finished_order.index("fast_0_1") < finished_order.index("slow")
+
+
+async def test_dataflow_respects_max_concurrency():
+    graph = build_uneven_fan_out_graph(width=6, slow_delay=0.02, fast_delay=0.02, fast_depth=1)
+    running = 0
+    max_running = 0
+    original_build_vertex = graph.build_vertex
+
+    async def counting_build_vertex(*args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        try:
+            return await original_build_vertex(*args, **kwargs)
+        finally:
+            running -= 1
+
+    graph.build_vertex = counting_build_vertex
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=2)
+
+    assert max_running == 2
+    assert all(vertex.built for vertex in graph.vertices)
+
+
+class NestedGraphComponent(Component):
+    display_name = "NestedGraphComponent"
+    inputs = [MessageTextInput(name="input_value", value="")]
+    outputs = [Output(name="output", method="run_child_graph")]
+
+    async def run_child_graph(self) -> Message:
+        child = build_uneven_fan_out_graph(width=2, slow_delay=0.0, fast_delay=0.0, fast_depth=1)
+        await child.process(fallback_to_env_vars=False, scheduler="dataflow")
+        return Message(text=child.get_vertex("fast_0_0").results["output"].text)
+
+
+async def test_dataflow_nested_graph_reuses_worker_slot(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "graph_worker_max_concurrency", 1)
+    graph = Graph()
+    root = DelayComponent(_id="root")
+    graph.add_component(root)
+    for index in range(2):
+        nested = NestedGraphComponent(_id=f"nested_{index}")
+        graph.add_component(nested)
+        graph.add_component_edge(root.get_id(), ("output", "input_value"), nested.get_id())
+    graph.prepare()
+
+    # Each nested graph runs while its parent vertex holds the only worker slot
+    await asyncio.wait_for(graph.process(fallback_to_env_vars=False, scheduler="dataflow"), timeout=5)
+
+    assert graph.get_vertex("nested_1").results["output"].text == ">root>fast_0_0"
+
+
+async def test_dataflow_propagates_errors():
+    graph = build_uneven_fan_out_graph(width=3, slow_delay=1.0, fast_delay=0.0, fast_depth=1)
+
+    async def failing_output(_self) -> Message:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    graph.get_vertex("fast_0_0").custom_component.delayed_output = failing_output.__get__(
+        graph.get_vertex("fast_0_0").custom_component
+    )
+
+    start_time = time.perf_counter()
+    with pytest.raises(Exception, match="boom"):
+        await graph.process(fallback_to_env_vars=False, scheduler="dataflow")
+    # The slow sibling is cancelled instead of awaited
+    assert time.perf_counter() - start_time < 1.0
+
+
+@pytest.mark.benchmark
+async def test_benchmark_wide_fan_out_dataflow_vs_layered():
+    """Compares wall-clock time of layered and dataflow execution on a wide, uneven fan-out flow."""
+    params = {"width": 20, "slow_delay": 0.3, "fast_delay": 0.1, "fast_depth": 3}
+
+    layered_time = await _timed_process(build_uneven_fan_out_graph(**params), scheduler="layered")
+    dataflow_time = await _timed_process(build_uneven_fan_out_graph(**params), scheduler="dataflow")
+
+    print(f"\nLayered: {layered_time:.3f}s, dataflow: {dataflow_time:.3f}s")  # noqa: T201
+    # Layered waits for the slow vertex before starting the next layer (~0.5s),
+    # dataflow finishes when the slowest branch does (~0.3s)
+    assert dataflow_time < layered_time
@@ -0,0 +1,42 @@
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.graph import Graph
+from lfx.graph.graph.template import GraphTemplate
+
+
+def build_payload() -> dict:
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output").set(input_value=chat_input.message_response)
+    return Graph(chat_input, chat_output).dump(name="Chat")
+
+
+def test_build_matches_from_payload():
+    payload = build_payload()
+
+    graph = GraphTemplate(payload, flow_id="flow", flow_name="Chat").build(user_id="user")
+    expected = Graph.from_payload(build_payload(), flow_id="flow", flow_name="Chat", user_id="user")
+
+    assert [vertex.id for vertex in graph.vertices] == [vertex.id for vertex in expected.vertices]
+    assert graph.predecessor_map == expected.predecessor_map
+    assert graph.flow_id == "flow"
+    assert graph.user_id == "user"
+
+
+def test_builds_do_not_share_run_state():
+    template = GraphTemplate(build_payload())
+    first, second = template.build(), template.build()
+
+    first.get_vertex("chat_input").update_raw_params({"input_value": "changed"}, overwrite=True)
+    first.get_vertex("chat_input").data["node"]["template"]["input_value"]["value"] = "changed"
+
+    assert second.get_vertex("chat_input").raw_params.get("input_value") != "changed"
+    assert template.build().get_vertex("chat_input").data["node"]["template"]["input_value"]["value"] != "changed"
+    assert first.get_vertex("chat_input").custom_component is not second.get_vertex("chat_input").custom_component
+
+
+async def test_built_graph_runs():
+    graph = GraphTemplate(build_payload()).build()
+
+    results = [result async for result in graph.async_start(inputs=[{"input_value": "hello"}])]
+
+    assert graph.get_vertex("chat_output").built
+    assert results
@@ -0,0 +1,151 @@
+"""Edge indexes and cached traversals of Graph on synthetic graphs."""
+
+import random
+import time
+
+import pytest
+from lfx.graph import Graph
+
+
+class FakeEdge:
+    def __init__(self, source_id: str, target_id: str):
+        self.source_id = source_id
+        self.target_id = target_id
+
+    def __repr__(self) -> str:
+        return f"{self.source_id}->{self.target_id}"
+
+
+class FakeVertex:
+    def __init__(self, graph: Graph, vertex_id: str, edges: list[FakeEdge] | None = None):
+        self.graph = graph
+        self.id = vertex_id
+        self.edges = edges or []
+
+    @property
+    def successors(self):
+        return self.graph.get_successors(self)
+
+
+def build_graph(num_vertices: int, edges_per_vertex: int = 3, seed: int = 0) -> Graph:
+    """Builds a random DAG whose edges always point from a lower to a higher vertex index."""
+    rng = random.Random(seed)  # noqa: S311
+    graph = Graph()
+    vertices = [FakeVertex(graph, f"v{i}") for i in range(num_vertices)]
+    graph.vertices = vertices
+    graph.vertex_map = {vertex.id: vertex for vertex in vertices}
+    edges = []
+    for i in range(1, num_vertices):
+        edges.extend(FakeEdge(f"v{source}", f"v{i}") for source in {rng.randrange(i) for _ in range(edges_per_vertex)})
+    graph.edges = edges
+    graph.build_graph_maps()
+    return graph
+
+
+def scan_vertex_edges(graph: Graph, vertex_id: str) -> list[FakeEdge]:
+    return [edge for edge in graph.edges if vertex_id in {edge.source_id, edge.target_id}]
+
+
+def assert_indexes_match_scan(graph: Graph) -> None:
+    for vertex in graph.vertices:
+        assert graph.get_vertex_edges(vertex.id) == scan_vertex_edges(graph, vertex.id)
+        assert graph.get_vertex_edges(vertex.id, is_target=False) == [
+            edge for edge in graph.edges if edge.source_id == vertex.id
+        ]
+        assert graph.get_vertices_with_target(vertex.id) == [
+            graph.get_vertex(edge.source_id) for edge in graph.edges if edge.target_id == vertex.id
+        ]
+    for edge in graph.edges:
+        first = next(e for e in graph.edges if (e.source_id, e.target_id) == (edge.source_id, edge.target_id))
+        assert graph.get_edge(edge.source_id, edge.target_id) is first
+
+
+def test_indexes_match_linear_scan():
+    graph = build_graph(100)
+
+    assert_indexes_match_scan(graph)
+    assert graph.get_edge("v99", "v0") is None
+    assert graph.get_vertex_edges("missing") == []
+
+
+def test_indexes_follow_add_and_remove_vertex():
+    graph = build_graph(50)
+    new_vertex = FakeVertex(graph, "new", [FakeEdge("v1", "new"), FakeEdge("new", "v2"), FakeEdge("new", "ghost")])
+
+    graph.add_vertex(new_vertex)
+
+    assert graph.get_edge("v1", "new") is new_vertex.edges[0]
+    assert graph.get_edge("new", "v2") is new_vertex.edges[1]
+    # Edges to vertices that are not in the graph are not added
+    assert graph.get_edge("new", "ghost") is None
+    assert_indexes_match_scan(graph)
+
+    graph.remove_vertex("v1")
+
+    assert graph.get_vertex_edges("v1") == []
+    assert graph.get_edge("v1", "new") is None
+    assert all("v1" not in {edge.source_id, edge.target_id} for edge in graph.edges)
+    assert_indexes_match_scan(graph)
+
+
+def test_returned_edge_lists_are_copies():
+    graph = build_graph(10)
+    edges = graph.get_vertex_edges("v1")
+    edges.append(FakeEdge("v1", "v9"))
+
+    assert graph.get_vertex_edges("v1") == scan_vertex_edges(graph, "v1")
+
+
+def test_traversals_are_invalidated_when_topology_changes():
+    graph = build_graph(30)
+    # v1 can only be reached from v0
+    assert [vertex.id for vertex in graph.get_all_predecessors(graph.get_vertex("v1"))] == ["v0"]
+    successors_of_v0 = {vertex.id for vertex in graph.get_all_successors(graph.get_vertex("v0"))}
+
+    root = FakeVertex(graph, "root", [FakeEdge("root", "v0")])
+    graph.add_vertex(root)
+    graph.build_graph_maps()
+
+    assert {vertex.id for vertex in graph.get_all_predecessors(graph.get_vertex("v1"))} == {"v0", "root"}
+    assert {vertex.id for vertex in graph.get_all_successors(root)} == successors_of_v0 | {"v0"}
+
+    graph.remove_vertex("root")
+    graph.build_graph_maps()
+
+    assert [vertex.id for vertex in graph.get_all_predecessors(graph.get_vertex("v1"))] == ["v0"]
+
+
+@pytest.mark.benchmark
+def test_benchmark_topology_lookups_scale():
+    timings = {}
+    for num_vertices in (250, 1000):
+        graph = build_graph(num_vertices)
+        start_time = time.perf_counter()
+        for vertex in graph.vertices:
+            graph.get_vertex_edges(vertex.id)
+            graph.get_vertices_with_target(vertex.id)
+        for edge in graph.edges:
+            graph.get_edge(edge.source_id, edge.target_id)
+        indexed = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for vertex in graph.vertices:
+            scan_vertex_edges(graph, vertex.id)
+        scanned = time.perf_counter() - start_time
+
+        for vertex in graph.vertices:
+            graph.get_all_successors(vertex)
+        start_time = time.perf_counter()
+        for vertex in graph.vertices:
+            graph.get_all_successors(vertex)
+        traversals = time.perf_counter() - start_time
+
+        timings[num_vertices] = indexed
+        print(  # noqa: T201
+            f"\n{num_vertices} vertices / {len(graph.edges)} edges: indexed lookups {indexed * 1000:.1f}ms, "
+            f"linear scans {scanned * 1000:.1f}ms, cached successor traversals {traversals * 1000:.1f}ms"
+        )
+        assert indexed < scanned
+
+    # Lookups are O(degree), so 4x the vertices should cost far less than the 16x of a quadratic scan
+    assert timings[1000] < timings[250] * 10
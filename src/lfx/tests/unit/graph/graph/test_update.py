@@ -0,0 +1,148 @@
+"""Diff-based updates of a graph from a new version of its flow payload."""
+
+import copy
+import time
+
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.schema.schema import InputValueRequest
+
+
+def build_payload() -> dict:
+    chat_input = ChatInput(_id="chat_input")
+    static = CombineTextComponent(_id="static").set(text1="a", text2="b", delimiter="-")
+    combined = CombineTextComponent(_id="combined").set(
+        text1=static.combine_texts, text2=chat_input.message_response, delimiter="+"
+    )
+    chat_output = ChatOutput(_id="chat_output").set(input_value=combined.combine_texts)
+    return Graph(chat_input, chat_output).dump(name="Combine")
+
+
+def set_value(payload: dict, vertex_id: str, field: str, value: str) -> dict:
+    payload = copy.deepcopy(payload)
+    node = next(node for node in payload["data"]["nodes"] if node["id"] == vertex_id)
+    node["data"]["node"]["template"][field]["value"] = value
+    return payload
+
+
+async def run(graph: Graph, input_value: str) -> str:
+    graph.reset_run_state()
+    async for _ in graph.async_start(inputs=InputValueRequest(input_value=input_value)):
+        pass
+    return graph.get_vertex("combined").results["combined_text"].text
+
+
+def test_unchanged_payload_keeps_everything():
+    payload = build_payload()
+    graph = Graph.from_payload(payload)
+    vertices = {vertex.id: vertex for vertex in graph.vertices}
+    components = {vertex.id: vertex.custom_component for vertex in graph.vertices}
+
+    moved = copy.deepcopy(payload)
+    for node in moved["data"]["nodes"]:
+        node["position"] = {"x": 100, "y": 100}
+    diff = graph.update_from_payload(moved)
+
+    assert diff.is_empty
+    assert diff.invalidated_vertex_ids == set()
+    assert {vertex.id: vertex for vertex in graph.vertices} == vertices
+    assert {vertex.id: vertex.custom_component for vertex in graph.vertices} == components
+
+
+async def test_only_changed_vertices_and_their_successors_are_invalidated():
+    payload = build_payload()
+    graph = Graph.from_payload(payload)
+    assert await run(graph, "x") == "a-b+x"
+    chat_input = graph.get_vertex("chat_input")
+    old_static = graph.get_vertex("static")
+
+    diff = graph.update_from_payload(set_value(payload, "static", "text2", "c"))
+
+    assert diff.changed_vertex_ids == {"static"}
+    assert not diff.topology_changed
+    assert diff.invalidated_vertex_ids == {"static", "combined", "chat_output"}
+    assert graph.get_vertex("chat_input") is chat_input
+    assert chat_input.built
+    assert graph.get_vertex("static") is not old_static
+    assert not graph.get_vertex("combined").built
+    assert await run(graph, "x") == "a-c+x"
+
+
+async def test_next_run_reuses_results_of_unaffected_vertices():
+    payload = build_payload()
+    graph = Graph.from_payload(payload)
+    await run(graph, "x")
+    static_result = graph.get_vertex("static").results["combined_text"]
+
+    graph.update_from_payload(set_value(payload, "chat_output", "sender_name", "Bot"))
+
+    # Inputs and outputs always run again, everything downstream of them too
+    assert graph.reusable_vertex_ids == {"static"}
+    assert await run(graph, "y") == "a-b+y"
+    assert graph.get_vertex("static").results["combined_text"] is static_result
+
+    graph.update_from_payload(set_value(payload, "chat_output", "sender_name", "Bot"))
+    graph.invalidate_vertices({"static"})
+    await run(graph, "y")
+    assert graph.get_vertex("static").results["combined_text"] is not static_result
+
+
+def test_topology_changes_match_a_new_graph():
+    payload = build_payload()
+    graph = Graph.from_payload(payload)
+
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output").set(input_value=chat_input.message_response)
+    new_payload = Graph(chat_input, chat_output).dump(name="Chat")
+    diff = graph.update_from_payload(new_payload)
+    expected = Graph.from_payload(new_payload)
+
+    assert diff.removed_vertex_ids == {"static", "combined"}
+    assert diff.invalidated_vertex_ids == {"chat_output"}
+    assert sorted(vertex.id for vertex in graph.vertices) == sorted(vertex.id for vertex in expected.vertices)
+    assert set(graph.edges) == set(expected.edges)
+    assert graph.predecessor_map == expected.predecessor_map
+    assert graph.get_vertex("chat_output").incoming_edges == expected.get_vertex("chat_output").incoming_edges
+
+    diff = graph.update_from_payload(payload)
+
+    assert diff.added_vertex_ids == {"static", "combined"}
+    assert graph.get_vertex("static").custom_component is not None
+    assert graph.predecessor_map == Graph.from_payload(payload).predecessor_map
+
+
+def test_update_takes_new_vertices_from_the_other_graph():
+    payload = build_payload()
+    graph = Graph.from_payload(payload)
+    other = Graph.from_payload(set_value(payload, "static", "text1", "z"))
+
+    assert graph.update(other) is graph
+    assert graph.get_vertex("static") is other.get_vertex("static")
+    assert graph.get_vertex("static").graph is graph
+    assert graph.get_vertex("chat_input") is not other.get_vertex("chat_input")
+
+
+@pytest.mark.benchmark
+def test_benchmark_update_against_rebuild():
+    chat_input = ChatInput(_id="chat_input")
+    previous = chat_input.message_response
+    for i in range(40):
+        previous = CombineTextComponent(_id=f"step{i}").set(text1=previous, text2=str(i)).combine_texts
+    payload = Graph(chat_input, ChatOutput(_id="chat_output").set(input_value=previous)).dump(name="Chain")
+    graph = Graph.from_payload(payload)
+    versions = [set_value(payload, "step39", "text2", f"changed{i}") for i in range(5)]
+
+    rebuild = update = float("inf")
+    for version in versions:
+        start_time = time.perf_counter()
+        Graph.from_payload(version)
+        rebuild = min(rebuild, time.perf_counter() - start_time)
+        start_time = time.perf_counter()
+        diff = graph.update_from_payload(version)
+        update = min(update, time.perf_counter() - start_time)
+        assert diff.invalidated_vertex_ids == {"step39", "chat_output"}
+
+    print(f"\n42 vertices: rebuild {rebuild * 1000:.1f}ms, diff update {update * 1000:.1f}ms")  # noqa: T201
+    assert update < rebuild
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from langchain_core.documents import Document
@@ -29,6 +30,23 @@ class TestDataFrameSchema:
         assert data_list[0].data["name"] == "John"
         assert data_list[0].data["text"] == "name is John"
 
+    def test_to_data_list_matches_records(self):
+        """Test that the rows are boxed like to_dict(orient="records")."""
+        data_frame = DataFrame(
+            {
+                "count": pd.array([1, None], dtype="Int64"),
+                "label": pd.array(["a", None], dtype="string"),
+                "value": pd.Series([np.int64(1), {"a": 1}], dtype=object),
+                "when": pd.to_datetime(["2024-01-01", None]),
+            }
+        )
+
+        data_list = data_frame.to_data_list()
+
+        assert [data.data for data in data_list] == pd.DataFrame(data_frame).to_dict(orient="records")
+        assert data_list[1].data["count"] is None
+        assert type(data_list[0].data["value"]) is int
+
     def test_add_row(self, sample_dataframe):
         """Test adding a single row to DataFrame."""
         data_frame = DataFrame(sample_dataframe)
@@ -1,12 +1,15 @@
 """Unit tests for component index system."""
 
 import hashlib
+import os
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import orjson
 import pytest
 from lfx.interface.components import (
+    ComponentModuleCache,
     _get_cache_path,
     _parse_dev_mode,
     _read_component_index,
@@ -296,6 +299,63 @@ class TestSaveGeneratedIndex:
         assert len(saved_index["entries"]) == 0
 
 
+class TestComponentModuleCache:
+    """Tests for the incremental per-module cache."""
+
+    @pytest.fixture
+    def module_source(self, tmp_path, monkeypatch):
+        source = tmp_path / "module.py"
+        source.write_text("class A: pass\n")
+        monkeypatch.setattr("lfx.interface.components._get_module_source", lambda _modname: source)
+        return source
+
+    def test_get_missing_entry(self, tmp_path, module_source):  # noqa: ARG002
+        cache = ComponentModuleCache(tmp_path)
+        assert cache.get("lfx.components.category1.module") is None
+
+    def test_set_then_get(self, tmp_path, module_source):  # noqa: ARG002
+        cache = ComponentModuleCache(tmp_path)
+        cache.set("lfx.components.category1.module", ("category1", {"comp1": {"template": {}}}))
+
+        assert cache.get("lfx.components.category1.module") == ("category1", {"comp1": {"template": {}}})
+
+    def test_changed_source_invalidates_entry(self, tmp_path, module_source):
+        cache = ComponentModuleCache(tmp_path)
+        cache.set("lfx.components.category1.module", ("category1", {"comp1": {}}))
+
+        module_source.write_text("class B: pass\n")
+
+        assert cache.get("lfx.components.category1.module") is None
+
+    def test_touched_source_keeps_entry(self, tmp_path, module_source):
+        cache = ComponentModuleCache(tmp_path)
+        cache.set("lfx.components.category1.module", ("category1", {"comp1": {}}))
+
+        stat = module_source.stat()
+        os.utime(module_source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get("lfx.components.category1.module") == ("category1", {"comp1": {}})
+
+    def test_changed_lfx_sources_invalidate_entries(self, tmp_path, module_source):  # noqa: ARG002
+        cache = ComponentModuleCache(tmp_path)
+        cache.set("lfx.components.category1.module", ("category1", {"comp1": {}}))
+
+        cache.fingerprint = "changed"
+
+        assert cache.get("lfx.components.category1.module") is None
+
+    def test_upgraded_package_invalidates_entries(self, tmp_path, module_source, monkeypatch):  # noqa: ARG002
+        site_packages = tmp_path / "site-packages"
+        (site_packages / "somepackage-1.0.dist-info").mkdir(parents=True)
+        monkeypatch.setattr("sys.path", [*sys.path, str(site_packages)])
+        ComponentModuleCache(tmp_path).set("lfx.components.category1.module", ("category1", {"comp1": {}}))
+        assert ComponentModuleCache(tmp_path).get("lfx.components.category1.module") == ("category1", {"comp1": {}})
+
+        (site_packages / "somepackage-1.0.dist-info").rename(site_packages / "somepackage-2.0.dist-info")
+
+        assert ComponentModuleCache(tmp_path).get("lfx.components.category1.module") is None
+
+
 @pytest.mark.asyncio
 class TestImportLangflowComponents:
     """Tests for import_langflow_components() async function."""
@@ -413,3 +473,67 @@ class TestImportLangflowComponents:
         # Should return empty dict, not raise
         assert "components" in result
         assert len(result["components"]) == 0
+
+    async def test_import_only_reimports_changed_modules(self, tmp_path, monkeypatch):
+        """Test that unchanged modules are loaded from the incremental cache on the next import."""
+        monkeypatch.setenv("LFX_DEV", "1")
+        monkeypatch.setattr("lfx.interface.components._get_cache_path", lambda: tmp_path / "component_index.json")
+        sources = {}
+        for name in ("module1", "module2"):
+            sources[f"lfx.components.category1.{name}"] = tmp_path / f"{name}.py"
+            sources[f"lfx.components.category1.{name}"].write_text(f"# {name}\n")
+        monkeypatch.setattr("lfx.interface.components._get_module_source", sources.get)
+
+        def process_single_module(modname):
+            return ("category1", {modname.rsplit(".", 1)[-1]: {"template": {}}})
+
+        with (
+            patch("lfx.interface.components._process_single_module", side_effect=process_single_module) as mock_process,
+            patch("lfx.interface.components.pkgutil.walk_packages") as mock_walk,
+        ):
+            mock_walk.return_value = [(None, modname, False) for modname in sources]
+
+            first = await import_langflow_components()
+            sources["lfx.components.category1.module2"].write_text("# module2 changed\n")
+            second = await import_langflow_components()
+
+        assert first == second
+        assert set(second["components"]["category1"]) == {"module1", "module2"}
+        processed = [call.args[0] for call in mock_process.call_args_list]
+        assert processed.count("lfx.components.category1.module1") == 1
+        assert processed.count("lfx.components.category1.module2") == 2
+
+    async def test_import_reports_module_load_times(self, monkeypatch):
+        """Test that per-module load times are sent with the telemetry."""
+        monkeypatch.setenv("LFX_DEV", "1")
+
+        with (
+            patch("lfx.interface.components._process_single_module") as mock_process,
+            patch("lfx.interface.components.pkgutil.walk_packages") as mock_walk,
+            patch("lfx.interface.components._send_telemetry") as mock_telemetry,
+        ):
+            mock_process.return_value = ("category1", {"comp1": {"template": {}}})
+            mock_walk.return_value = [(None, "lfx.components.category1", False)]
+
+            await import_langflow_components()
+
+        kwargs = mock_telemetry.call_args.kwargs
+        assert kwargs["build_mode"] == "thread"
+        assert set(kwargs["module_load_times_ms"]) == {"lfx.components.category1"}
+        assert kwargs["cached_modules"] == 0
+
+    async def test_import_in_process_mode(self, tmp_path, monkeypatch):
+        """Test that the process pool build mode produces the same components as the thread mode."""
+        monkeypatch.setenv("LFX_DEV", "input_output")
+        monkeypatch.setattr("lfx.interface.components._get_cache_path", lambda: tmp_path / "component_index.json")
+        settings_service = Mock()
+        settings_service.settings.components_index_build_mode = "process"
+        settings_service.settings.components_index_build_workers = 2
+        settings_service.settings.components_incremental_cache = False
+
+        in_processes = await import_langflow_components(settings_service)
+        settings_service.settings.components_index_build_mode = "thread"
+        in_threads = await import_langflow_components(settings_service)
+
+        assert in_processes["components"]["input_output"]
+        assert in_processes == in_threads